@@ -49,8 +49,13 @@ Submodules
 .. toctree::
 
    bezier.curve
+   bezier.curve_batch
+   bezier.curve_collection
    bezier.curved_polygon
+   bezier.evaluation_plan
+   bezier.parallel
    bezier.triangle
+   bezier.workspace
 """
 DESIRED_TEMPLATE = """\
 bezier package
@@ -64,8 +69,13 @@ Submodules
 .. toctree::
 
    bezier.curve
+   bezier.curve_batch
+   bezier.curve_collection
    bezier.curved_polygon
+   bezier.evaluation_plan
+   bezier.parallel
    bezier.triangle
+   bezier.workspace
 
 Subpackages
 -----------
@@ -30,13 +30,12 @@ module curve_intersection
   private &
        newton_routine, MAX_INTERSECT_SUBDIVISIONS, MIN_INTERVAL_WIDTH, &
        MAX_CANDIDATES, ZERO_THRESHOLD, NEWTON_ERROR_RATIO, &
-       CANDIDATES_ODD, CANDIDATES_EVEN, &
-       POLYGON1, POLYGON2, make_candidates, prune_candidates, elevate_helper
+       make_candidates, prune_candidates, elevate_helper
   public &
        BoxIntersectionType_INTERSECTION, BoxIntersectionType_TANGENT, &
        BoxIntersectionType_DISJOINT, Subdivide_FIRST, Subdivide_SECOND, &
        Subdivide_BOTH, Subdivide_NEITHER, LINEARIZATION_THRESHOLD, &
-       INTERSECTIONS_WORKSPACE, linearization_error, segment_intersection, &
+       linearization_error, segment_intersection, &
        newton_refine_intersect, bbox_intersect, parallel_lines_parameters, &
        line_line_collide, convex_hull_collide, newton_simple_root, &
        newton_double_root, newton_iterate, full_newton_nonzero, full_newton, &
@@ -44,7 +43,8 @@ module curve_intersection
        bbox_line_intersect, check_lines, add_intersection, &
        add_from_linearized, endpoint_check, tangent_bbox_intersection, &
        add_candidates, intersect_one_round, make_same_degree, &
-       add_coincident_parameters, all_intersections, all_intersections_abi, &
+       add_coincident_parameters, all_intersections_workspace, &
+       all_intersections, all_intersections_abi, all_intersections_batch_abi, &
        free_curve_intersections_workspace
 
   ! Interface for ``newton_iterate()``.
@@ -80,14 +80,9 @@ module curve_intersection
   ! Point under which values are considered to be "near zero".
   real(c_double), parameter :: ZERO_THRESHOLD = 0.5_dp**10
   real(c_double), parameter :: NEWTON_ERROR_RATIO = 0.5_dp**36
-  ! Long-lived workspaces for ``all_intersections()`` and
-  ! ``all_intersections_abi()``. If multiple threads are used, each of these
-  ! **should** be thread-local.
-  type(CurveData), allocatable :: CANDIDATES_ODD(:, :)
-  type(CurveData), allocatable :: CANDIDATES_EVEN(:, :)
-  real(c_double), allocatable :: INTERSECTIONS_WORKSPACE(:, :)
-  real(c_double), allocatable :: POLYGON1(:, :)
-  real(c_double), allocatable :: POLYGON2(:, :)
+  ! NOTE: There are no module-level workspaces. The scratch space used by
+  !       ``all_intersections_workspace()`` is owned by the caller, so the
+  !       ABI routines can be invoked from multiple threads at once.
 
 contains
 
@@ -360,40 +355,20 @@ contains
   end subroutine line_line_collide
 
   subroutine convex_hull_collide( &
-       num_nodes1, nodes1, polygon1, &
-       num_nodes2, nodes2, polygon2, collision)
+       num_nodes1, nodes1, num_nodes2, nodes2, collision)
 
     ! NOTE: This subroutine is not part of the C ABI for this module,
     !       but it is (for now) public, so that it can be tested.
 
     integer(c_int), intent(in) :: num_nodes1
     real(c_double), intent(in) :: nodes1(2, num_nodes1)
-    real(c_double), allocatable, intent(inout) :: polygon1(:, :)
     integer(c_int), intent(in) :: num_nodes2
     real(c_double), intent(in) :: nodes2(2, num_nodes2)
-    real(c_double), allocatable, intent(inout) :: polygon2(:, :)
     logical(c_bool), intent(out) :: collision
     ! Variables outside of signature.
+    real(c_double) :: polygon1(2, num_nodes1), polygon2(2, num_nodes2)
     integer(c_int) :: polygon_size1, polygon_size2
 
-    if (allocated(polygon1)) then
-       if (size(polygon1, 2) < num_nodes1) then
-          deallocate(polygon1)
-          allocate(polygon1(2, num_nodes1))
-       end if
-    else
-       allocate(polygon1(2, num_nodes1))
-    end if
-
-    if (allocated(polygon2)) then
-       if (size(polygon2, 2) < num_nodes2) then
-          deallocate(polygon2)
-          allocate(polygon2(2, num_nodes2))
-       end if
-    else
-       allocate(polygon2(2, num_nodes2))
-    end if
-
     call convex_hull( &
          num_nodes1, nodes1, polygon_size1, polygon1)
     call convex_hull( &
@@ -832,8 +807,7 @@ contains
 
     if (bad_parameters) then
        call convex_hull_collide( &
-            num_nodes1, curve1%nodes, POLYGON1, &
-            num_nodes2, curve2%nodes, POLYGON2, success)
+            num_nodes1, curve1%nodes, num_nodes2, curve2%nodes, success)
        ! In the unlikely case that we have parallel segments or segments
        ! that intersect outside of [0, 1] x [0, 1], we can still exit
        ! if the convex hulls don't intersect.
@@ -1458,8 +1432,8 @@ contains
        !       ``N x 2``.
        num_nodes2 = size(candidates(2, i)%nodes, 2)
        call convex_hull_collide( &
-            num_nodes1, candidates(1, i)%nodes, POLYGON1, &
-            num_nodes2, candidates(2, i)%nodes, POLYGON2, collision)
+            num_nodes1, candidates(1, i)%nodes, &
+            num_nodes2, candidates(2, i)%nodes, collision)
 
        if (collision) then
           accepted = accepted + 1
@@ -1756,12 +1730,15 @@ contains
 
   end subroutine add_coincident_parameters
 
-  subroutine all_intersections( &
+  subroutine all_intersections_workspace( &
        num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       candidates_odd, candidates_even, &
        intersections, num_intersections, coincident, status)
 
-    ! NOTE: This is **explicitly** not intended for C inter-op, but
-    !       a C compatible interface is exposed as ``all_intersections_abi``.
+    ! NOTE: This is **explicitly** not intended for C inter-op. The
+    !       candidate arrays are scratch space owned by the caller; they
+    !       are only grown (never shrunk) so they can be re-used across
+    !       calls without re-allocating.
 
     ! Possible error states:
     ! * Status_SUCCESS         : On success.
@@ -1775,6 +1752,8 @@ contains
     real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
     integer(c_int), intent(in) :: num_nodes_second
     real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    type(CurveData), allocatable, intent(inout) :: candidates_odd(:, :)
+    type(CurveData), allocatable, intent(inout) :: candidates_even(:, :)
     real(c_double), allocatable, intent(inout) :: intersections(:, :)
     integer(c_int), intent(out) :: num_intersections
     logical(c_bool), intent(out) :: coincident
@@ -1800,28 +1779,28 @@ contains
     ! First iteration is odd (i.e. ``index_ == 1``).
     num_candidates = 1
     call make_candidates( &
-         nodes_first, nodes_second, CANDIDATES_ODD)
+         nodes_first, nodes_second, candidates_odd)
 
     is_even = .TRUE.  ! At zero.
     do index_ = 1, MAX_INTERSECT_SUBDIVISIONS
        is_even = .NOT. is_even  ! Switch parity.
 
        if (is_even) then
-          ! Since ``index_`` is even, we READ from ``CANDIDATES_EVEN``
-          ! and WRITE to ``CANDIDATES_ODD``.
+          ! Since ``index_`` is even, we READ from ``candidates_even``
+          ! and WRITE to ``candidates_odd``.
           call intersect_one_round( &
                nodes_first, nodes_second, &
-               num_candidates, CANDIDATES_EVEN, &
+               num_candidates, candidates_even, &
                num_intersections, intersections, &
-               CANDIDATES_ODD, num_next_candidates, intersect_status)
+               candidates_odd, num_next_candidates, intersect_status)
        else
-          ! Since ``index_`` is odd, we READ from ``CANDIDATES_ODD``
-          ! and WRITE to ``CANDIDATES_EVEN``.
+          ! Since ``index_`` is odd, we READ from ``candidates_odd``
+          ! and WRITE to ``candidates_even``.
           call intersect_one_round( &
                nodes_first, nodes_second, &
-               num_candidates, CANDIDATES_ODD, &
+               num_candidates, candidates_odd, &
                num_intersections, intersections, &
-               CANDIDATES_EVEN, num_next_candidates, intersect_status)
+               candidates_even, num_next_candidates, intersect_status)
        end if
 
        ! NOTE: This only checks for two error statuses from
@@ -1838,9 +1817,9 @@ contains
        ! Bail out of there are too many candidates.
        if (num_candidates > MAX_CANDIDATES) then
           if (is_even) then
-             call prune_candidates(CANDIDATES_ODD, num_candidates)
+             call prune_candidates(candidates_odd, num_candidates)
           else
-             call prune_candidates(CANDIDATES_EVEN, num_candidates)
+             call prune_candidates(candidates_even, num_candidates)
           end if
           ! If pruning didn't fix anything, we check if the curves are
           ! coincident and "fail" if they aren't.
@@ -1876,6 +1855,42 @@ contains
     ! ``MAX_INTERSECT_SUBDIVISIONS``.
     status = Status_NO_CONVERGE
 
+  end subroutine all_intersections_workspace
+
+  subroutine all_intersections( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       intersections, num_intersections, coincident, status)
+
+    ! NOTE: This is **explicitly** not intended for C inter-op, but
+    !       a C compatible interface is exposed as ``all_intersections_abi``.
+
+    ! NOTE: This uses scratch space that is local to this call. Callers that
+    !       intersect many pairs of curves should instead re-use the
+    !       scratch space via ``all_intersections_workspace()``.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_NO_CONVERGE     : Via ``all_intersections_workspace()``.
+    ! * (N >= MAX_CANDIDATES)  : Via ``all_intersections_workspace()``.
+    ! * Status_BAD_MULTIPLICITY: Via ``all_intersections_workspace()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), allocatable, intent(inout) :: intersections(:, :)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    type(CurveData), allocatable :: candidates_odd(:, :)
+    type(CurveData), allocatable :: candidates_even(:, :)
+
+    call all_intersections_workspace( &
+         num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+         candidates_odd, candidates_even, &
+         intersections, num_intersections, coincident, status)
+
   end subroutine all_intersections
 
   subroutine all_intersections_abi( &
@@ -1910,10 +1925,12 @@ contains
     integer(c_int), intent(out) :: num_intersections
     logical(c_bool), intent(out) :: coincident
     integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double), allocatable :: workspace(:, :)
 
     call all_intersections( &
          num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
-         INTERSECTIONS_WORKSPACE, num_intersections, coincident, status)
+         workspace, num_intersections, coincident, status)
 
     if (status /= Status_SUCCESS) then
        return
@@ -1922,41 +1939,112 @@ contains
     if (num_intersections > intersections_size) then
        status = Status_INSUFFICIENT_SPACE
     else if (num_intersections > 0) then
-       ! NOTE: This assumes, but doesn't check that
-       !       ``INTERSECTIONS_WORKSPACE`` has been allocated
-       !       and that is has 2 rows, just like ``intersections``.
+       ! NOTE: This assumes, but doesn't check that ``workspace`` has been
+       !       allocated and that is has 2 rows, just like ``intersections``.
        intersections(:, :num_intersections) = ( &
-            INTERSECTIONS_WORKSPACE(:, :num_intersections))
+            workspace(:, :num_intersections))
     end if
 
   end subroutine all_intersections_abi
 
-  subroutine free_curve_intersections_workspace() &
-       bind(c, name='BEZ_free_curve_intersections_workspace')
+  subroutine all_intersections_batch_abi( &
+       num_pairs, offsets_first, nodes_first, offsets_second, nodes_second, &
+       intersections_size, intersections, pair_indices, num_intersections, &
+       coincident, status) &
+       bind(c, name='BEZ_curve_intersections_batch')
 
-    ! NOTE: This **should** be run during clean-up for any code which
-    !       invokes ``all_intersections()``.
+    ! NOTE: The control points for each curve are packed (column-wise) into
+    !       ``nodes_first`` and ``nodes_second``. The ``offsets_*`` arrays
+    !       index into these (starting from 0), so that the curve in pair
+    !       ``j`` uses columns ``offsets(j) + 1`` to ``offsets(j + 1)``.
 
-    if (allocated(CANDIDATES_ODD)) then
-       deallocate(CANDIDATES_ODD)
-    end if
+    ! NOTE: As with ``all_intersections_abi()``, if ``intersections`` is not
+    !       large enough then the intersections that do not fit are not
+    !       stored, but **all** pairs are still processed so that
+    !       ``num_intersections`` will be accurate and ``intersections`` can
+    !       be re-sized by the caller to accommodate.
 
-    if (allocated(CANDIDATES_EVEN)) then
-       deallocate(CANDIDATES_EVEN)
-    end if
+    ! NOTE: The scratch space (candidates and intersections) is shared by
+    !       all of the pairs, so it is only allocated when it needs to grow.
 
-    if (allocated(INTERSECTIONS_WORKSPACE)) then
-       deallocate(INTERSECTIONS_WORKSPACE)
-    end if
+    ! Possible error states:
+    ! * Status_SUCCESS           : On success.
+    ! * Status_INSUFFICIENT_SPACE: If ``intersections_size`` is smaller than
+    !                              the total number of intersections.
+    ! * Status_NO_CONVERGE       : Via ``all_intersections()``.
+    ! * (N >= MAX_CANDIDATES)    : Via ``all_intersections()``.
+    ! * Status_BAD_MULTIPLICITY  : Via ``all_intersections()``.
 
-    if (allocated(POLYGON1)) then
-       deallocate(POLYGON1)
-    end if
+    integer(c_int), intent(in) :: num_pairs
+    integer(c_int), intent(in) :: offsets_first(num_pairs + 1)
+    real(c_double), intent(in) :: &
+         nodes_first(2, offsets_first(num_pairs + 1))
+    integer(c_int), intent(in) :: offsets_second(num_pairs + 1)
+    real(c_double), intent(in) :: &
+         nodes_second(2, offsets_second(num_pairs + 1))
+    integer(c_int), intent(in) :: intersections_size
+    real(c_double), intent(out) :: intersections(2, intersections_size)
+    integer(c_int), intent(out) :: pair_indices(intersections_size)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident(num_pairs)
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double), allocatable :: workspace(:, :)
+    type(CurveData), allocatable :: candidates_odd(:, :)
+    type(CurveData), allocatable :: candidates_even(:, :)
+    integer(c_int) :: pair_index, start1, end1, start2, end2
+    integer(c_int) :: num_pair_intersections, stored, first, last
 
-    if (allocated(POLYGON2)) then
-       deallocate(POLYGON2)
+    status = Status_SUCCESS  ! Default.
+    num_intersections = 0
+    coincident = .FALSE.
+    do pair_index = 1, num_pairs
+       start1 = offsets_first(pair_index) + 1
+       end1 = offsets_first(pair_index + 1)
+       start2 = offsets_second(pair_index) + 1
+       end2 = offsets_second(pair_index + 1)
+       call all_intersections_workspace( &
+            end1 - start1 + 1, nodes_first(:, start1:end1), &
+            end2 - start2 + 1, nodes_second(:, start2:end2), &
+            candidates_odd, candidates_even, &
+            workspace, num_pair_intersections, &
+            coincident(pair_index), status)
+       if (status /= Status_SUCCESS) then
+          return
+       end if
+
+       if (num_pair_intersections > 0) then
+          ! Only copy over the intersections that fit in ``intersections``.
+          stored = min( &
+               num_pair_intersections, &
+               intersections_size - num_intersections)
+          if (stored > 0) then
+             ! NOTE: This assumes, but doesn't check that ``workspace`` has
+             !       been allocated and that is has 2 rows, just like
+             !       ``intersections``.
+             first = num_intersections + 1
+             last = num_intersections + stored
+             intersections(:, first:last) = workspace(:, :stored)
+             pair_indices(first:last) = pair_index
+          end if
+          num_intersections = num_intersections + num_pair_intersections
+       end if
+    end do
+
+    if (num_intersections > intersections_size) then
+       status = Status_INSUFFICIENT_SPACE
     end if
 
+  end subroutine all_intersections_batch_abi
+
+  subroutine free_curve_intersections_workspace() &
+       bind(c, name='BEZ_free_curve_intersections_workspace')
+
+    ! NOTE: There is no module-level scratch space (the ABI routines own
+    !       their scratch space for the duration of a call), so there is
+    !       nothing to free. This is retained so that existing callers of the
+    !       ABI continue to work.
+
   end subroutine free_curve_intersections_workspace
 
 end module curve_intersection
@@ -36,6 +36,11 @@ void BEZ_curve_intersections(const int* num_nodes_first,
     const double* nodes_second, const int* intersections_size,
     double* intersections, const int* num_intersections, bool* coincident,
     Status* status);
+void BEZ_curve_intersections_batch(const int* num_pairs,
+    const int* offsets_first, const double* nodes_first,
+    const int* offsets_second, const double* nodes_second,
+    const int* intersections_size, double* intersections, int* pair_indices,
+    int* num_intersections, bool* coincident, Status* status);
 void BEZ_free_curve_intersections_workspace(void);
 
 #if defined(__cplusplus)
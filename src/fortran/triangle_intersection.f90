@@ -18,8 +18,8 @@ module triangle_intersection
        Status_BAD_INTERIOR, Status_EDGE_END, Status_UNKNOWN
   use curve, only: CurveData, LOCATE_MISS, evaluate_hodograph, get_curvature
   use curve_intersection, only: &
-       BoxIntersectionType_INTERSECTION, INTERSECTIONS_WORKSPACE, &
-       bbox_intersect, all_intersections
+       BoxIntersectionType_INTERSECTION, bbox_intersect, &
+       all_intersections_workspace
   use helpers, only: cross_product, contains_nd, vector_close
   use types, only: dp
   use triangle, only: &
@@ -28,7 +28,7 @@ module triangle_intersection
   private &
        LocateCandidate, &
        MAX_LOCATE_SUBDIVISIONS, LOCATE_EPS, MAX_EDGES, &
-       ALMOST_TANGENT, SEGMENT_ENDS_WORKSPACE, SEGMENTS_WORKSPACE, &
+       ALMOST_TANGENT, &
        newton_refine_solve, split_candidate, allocate_candidates, &
        update_candidates, ignored_edge_corner, ignored_double_corner, &
        ignored_corner, classify_tangent_intersection, &
@@ -103,10 +103,9 @@ module triangle_intersection
   ! to be "zero". This is a "hack", since it doesn't take ||u||
   ! or ||v|| into account.
   real(c_double), parameter :: ALMOST_TANGENT = 0.5_dp**50
-  ! Long-lived workspaces for ``triangles_intersect_abi()``. If multiple
-  ! threads are used, each of these **should** be thread-local.
-  integer(c_int), allocatable :: SEGMENT_ENDS_WORKSPACE(:)
-  type(CurvedPolygonSegment), allocatable :: SEGMENTS_WORKSPACE(:)
+  ! NOTE: There are no module-level workspaces. The scratch space used by
+  !       ``triangles_intersect()`` is local to each call, so the ABI
+  !       routines can be invoked from multiple threads at once.
 
 contains
 
@@ -1011,6 +1010,9 @@ contains
     integer(c_int), intent(out) :: status
     ! Variables outside of signature.
     type(CurveData) :: edges_first(3), edges_second(3)
+    type(CurveData), allocatable :: candidates_odd(:, :)
+    type(CurveData), allocatable :: candidates_even(:, :)
+    real(c_double), allocatable :: st_vals(:, :)
     integer(c_int) :: index1, index2
     integer(c_int) :: num_st_vals
     logical(c_bool) :: coincident
@@ -1036,10 +1038,12 @@ contains
     all_types = 0
     do index1 = 1, 3
        do index2 = 1, 3
-          call all_intersections( &
+          ! NOTE: The scratch space is shared by all nine pairs of edges.
+          call all_intersections_workspace( &
                degree1 + 1, edges_first(index1)%nodes, &
                degree2 + 1, edges_second(index2)%nodes, &
-               INTERSECTIONS_WORKSPACE, num_st_vals, coincident, status)
+               candidates_odd, candidates_even, &
+               st_vals, num_st_vals, coincident, status)
           if (coincident) then
              ! NOTE: This assumes, but doesn't check, that ``num_st_vals == 2``
              !       in the coincident case.
@@ -1047,10 +1051,8 @@ contains
              ! ``s1 >= s2`` or ``t1 >= t2`` then the curves are moving in
              ! opposite directions, hence don't define an interior of an
              ! intersection.
-             if (INTERSECTIONS_WORKSPACE(1, 1) >= &
-                  INTERSECTIONS_WORKSPACE(1, 2) .OR. &
-                  INTERSECTIONS_WORKSPACE(2, 1) >= &
-                  INTERSECTIONS_WORKSPACE(2, 2)) then
+             if (st_vals(1, 1) >= st_vals(1, 2) .OR. &
+                  st_vals(2, 1) >= st_vals(2, 2)) then
                 enum_ = IntersectionClassification_COINCIDENT_UNUSED
              else
                 enum_ = IntersectionClassification_COINCIDENT
@@ -1062,7 +1064,7 @@ contains
              if (num_st_vals > 0) then
                 call add_st_vals( &
                      edges_first, edges_second, &
-                     num_st_vals, INTERSECTIONS_WORKSPACE(:, :num_st_vals), &
+                     num_st_vals, st_vals(:, :num_st_vals), &
                      enum_, index1, index2, intersections, &
                      num_intersections, status)
                 if (status /= Status_SUCCESS) then
@@ -1815,12 +1817,14 @@ contains
     integer(c_int), intent(out) :: contained
     integer(c_int), intent(out) :: status
     ! Variables outside of signature.
+    integer(c_int), allocatable :: segment_ends_workspace(:)
+    type(CurvedPolygonSegment), allocatable :: segments_workspace(:)
     integer(c_int) :: num_segments
 
     call triangles_intersect( &
          num_nodes1, nodes1, degree1, &
          num_nodes2, nodes2, degree2, &
-         SEGMENT_ENDS_WORKSPACE, SEGMENTS_WORKSPACE, num_intersected, &
+         segment_ends_workspace, segments_workspace, num_intersected, &
          contained, status)
 
     if (status /= Status_SUCCESS) then
@@ -1837,30 +1841,24 @@ contains
     end if
 
     segment_ends(:num_intersected) = ( &
-         SEGMENT_ENDS_WORKSPACE(:num_intersected))
+         segment_ends_workspace(:num_intersected))
     num_segments = segment_ends(num_intersected)
     if (num_segments > segments_size) then
        status = Status_INSUFFICIENT_SPACE
        return
     end if
 
-    segments(:num_segments) = SEGMENTS_WORKSPACE(:num_segments)
+    segments(:num_segments) = segments_workspace(:num_segments)
 
   end subroutine triangles_intersect_abi
 
   subroutine free_triangle_intersections_workspace() &
        bind(c, name='BEZ_free_triangle_intersections_workspace')
 
-    ! NOTE: This **should** be run during clean-up for any code which
-    !       invokes ``triangles_intersect_abi()``.
-
-    if (allocated(SEGMENT_ENDS_WORKSPACE)) then
-       deallocate(SEGMENT_ENDS_WORKSPACE)
-    end if
-
-    if (allocated(SEGMENTS_WORKSPACE)) then
-       deallocate(SEGMENTS_WORKSPACE)
-    end if
+    ! NOTE: There is no module-level scratch space (the ABI routines own
+    !       their scratch space for the duration of a call), so there is
+    !       nothing to free. This is retained so that existing callers of the
+    !       ABI continue to work.
 
   end subroutine free_triangle_intersections_workspace
 
@@ -29,9 +29,16 @@ Plotting utilities are also provided.
 from bezier import __config__
 from bezier._legacy import Surface
 from bezier.curve import Curve
+from bezier.curve import intersect_curve_pairs
+from bezier.curve_batch import CurveBatch
+from bezier.curve_collection import CurveCollection
+from bezier.curve_collection import intersect_collections
 from bezier.curved_polygon import CurvedPolygon
+from bezier.evaluation_plan import EvaluationPlan
+from bezier.evaluation_plan import TriangleEvaluationPlan
 from bezier.hazmat.helpers import UnsupportedDegree
 from bezier.triangle import Triangle
+from bezier.workspace import IntersectionWorkspace
 
 try:
     import bezier._speedup  # noqa: F401
@@ -51,8 +58,15 @@ __all__ = [
     "__author__",
     "__version__",
     "Curve",
+    "CurveBatch",
+    "CurveCollection",
     "CurvedPolygon",
+    "EvaluationPlan",
+    "intersect_collections",
+    "intersect_curve_pairs",
+    "IntersectionWorkspace",
     "Surface",
     "Triangle",
+    "TriangleEvaluationPlan",
     "UnsupportedDegree",
 ]
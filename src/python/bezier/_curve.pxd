@@ -16,7 +16,7 @@
 from libcpp cimport bool as bool_t
 
 
-cdef extern from "bezier/curve.h":
+cdef extern from "bezier/curve.h" nogil:
     void evaluate_curve_barycentric "BEZ_evaluate_curve_barycentric" (
         const int* num_nodes, const int* dimension,
         const double* nodes, const int* num_vals, const double* lambda1,
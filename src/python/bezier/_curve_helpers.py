@@ -53,3 +53,7 @@ else:
     reduce_pseudo_inverse = _speedup.reduce_pseudo_inverse
     full_reduce = _speedup.full_reduce
 # pylint: enable=invalid-name
+# NOTE: The cached derivative nodes of a curve (see ``hodograph_nodes``) can
+#       only be passed to the pure Python implementations. The Fortran
+#       implementations compute them as needed.
+CACHED_DERIVATIVES = _speedup is None
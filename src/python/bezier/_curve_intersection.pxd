@@ -18,7 +18,7 @@ from libcpp cimport bool as bool_t
 from bezier._status cimport Status
 
 
-cdef extern from "bezier/curve_intersection.h":
+cdef extern from "bezier/curve_intersection.h" nogil:
     cpdef enum BoxIntersectionType:
         INTERSECTION = 0
         TANGENT = 1
@@ -37,4 +37,10 @@ cdef extern from "bezier/curve_intersection.h":
         const double* nodes_second, const int* intersections_size,
         double* intersections, const int* num_intersections, bool_t* coincident,
         Status* status)
+    void curve_intersections_batch "BEZ_curve_intersections_batch" (
+        const int* num_pairs, const int* offsets_first,
+        const double* nodes_first, const int* offsets_second,
+        const double* nodes_second, const int* intersections_size,
+        double* intersections, int* pair_indices, int* num_intersections,
+        bool_t* coincident, Status* status)
     void free_curve_intersections_workspace "BEZ_free_curve_intersections_workspace" ()
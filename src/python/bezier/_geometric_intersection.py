@@ -17,8 +17,6 @@ exact same interface which calls out to a Fortran implementation. The speedup
 will be used if the extension can be built.
 """
 
-import atexit
-
 from bezier.hazmat import geometric_intersection
 
 try:
@@ -31,8 +29,13 @@ except ImportError:  # pragma: NO COVER
 if _speedup is None:  # pragma: NO COVER
     bbox_intersect = geometric_intersection.bbox_intersect
     all_intersections = geometric_intersection.all_intersections
+    all_intersections_batch = geometric_intersection.all_intersections_batch
 else:
     bbox_intersect = _speedup.bbox_intersect
     all_intersections = _speedup.curve_intersections
-    atexit.register(_speedup.free_curve_intersections_workspace)
+    all_intersections_batch = _speedup.curve_intersections_batch
 # pylint: enable=invalid-name
+# NOTE: An :class:`.IntersectionWorkspace` only holds scratch space for the
+#       Fortran implementation, so it can't be passed to the pure Python
+#       implementation.
+ACCEPTS_WORKSPACE = _speedup is not None
@@ -16,7 +16,7 @@
 from libcpp cimport bool as bool_t
 
 
-cdef extern from "bezier/helpers.h":
+cdef extern from "bezier/helpers.h" nogil:
     void cross_product "BEZ_cross_product" (
         const double* vec0, const double* vec1, double* result)
     void bbox "BEZ_bbox" (
@@ -37,6 +37,8 @@ import numpy as np
 from numpy cimport dtype as dtype_t
 from numpy cimport ndarray as ndarray_t
 
+from bezier import workspace as _workspace
+
 cimport bezier._curve
 cimport bezier._curve_intersection
 from bezier._curve_intersection cimport BoxIntersectionType
@@ -51,18 +53,7 @@ from bezier._triangle_intersection cimport TriangleContained
 cdef double EPS = 0.5**40
 cdef double LOCATE_MISS = -1.0
 cdef double LOCATE_INVALID = -2.0
-cdef double[::1, :] CURVES_WORKSPACE = np.empty((2, 2), order="F")
-cdef int[::1] SEGMENT_ENDS_WORKSPACE = np.empty(3, dtype=np.intc)
-cdef dtype_t SEGMENT_DTYPE = np.dtype(
-    [
-        ("start", np.double),
-        ("end", np.double),
-        ("edge_index", np.intc),
-    ],
-    align=True,
-)
-cdef CurvedPolygonSegment[::1] SEGMENTS_WORKSPACE = np.empty(
-    6, dtype=SEGMENT_DTYPE)
+cdef dtype_t SEGMENT_DTYPE = _workspace.SEGMENT_DTYPE
 
 DQAGSE_ERR_MSGS = (
     "Maximum number of subdivisions allowed has been achieved.",
@@ -128,15 +119,16 @@ def evaluate_multi_barycentric(
     dimension, num_nodes = np.shape(nodes)
     num_vals, = np.shape(lambda1)
     evaluated = np.empty((dimension, num_vals), order="F")
-    bezier._curve.evaluate_curve_barycentric(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_vals,
-        &lambda1[0],
-        &lambda2[0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_curve_barycentric(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_vals,
+            &lambda1[0],
+            &lambda2[0],
+            &evaluated[0, 0],
+        )
     return evaluated
 
 
@@ -148,14 +140,15 @@ def evaluate_multi(
     dimension, num_nodes = np.shape(nodes)
     num_vals, = np.shape(s_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
-    bezier._curve.evaluate_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_vals,
-        &s_vals[0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_vals,
+            &s_vals[0],
+            &evaluated[0, 0],
+        )
     return evaluated
 
 
@@ -166,14 +159,15 @@ def specialize_curve(double[::1, :] nodes, double start, double end):
     dimension, num_nodes = np.shape(nodes)
     new_nodes = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.specialize_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &start,
-        &end,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._curve.specialize_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &start,
+            &end,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
@@ -185,13 +179,14 @@ def evaluate_hodograph(double s, double[::1, :] nodes):
     dimension, num_nodes = np.shape(nodes)
     hodograph = np.empty((dimension, 1), order="F")
 
-    bezier._curve.evaluate_hodograph(
-        &s,
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &hodograph[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_hodograph(
+            &s,
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &hodograph[0, 0],
+        )
 
     return hodograph
 
@@ -205,13 +200,14 @@ def subdivide_nodes_curve(double[::1, :] nodes):
     left_nodes = np.empty((dimension, num_nodes), order="F")
     right_nodes = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.subdivide_nodes_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &left_nodes[0, 0],
-        &right_nodes[0, 0],
-    )
+    with nogil:
+        bezier._curve.subdivide_nodes_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &left_nodes[0, 0],
+            &right_nodes[0, 0],
+        )
 
     return left_nodes, right_nodes
 
@@ -224,14 +220,15 @@ def newton_refine_curve(
     dimension, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(point) == (dimension, 1)``.
 
-    bezier._curve.newton_refine_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0, 0],
-        &s,
-        &updated_s,
-    )
+    with nogil:
+        bezier._curve.newton_refine_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0, 0],
+            &s,
+            &updated_s,
+        )
 
     return updated_s
 
@@ -243,13 +240,14 @@ def locate_point_curve(double[::1, :] nodes, double[::1, :] point):
     dimension, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(point) == (dimension, 1)``.
 
-    bezier._curve.locate_point_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0, 0],
-        &s_approx,
-    )
+    with nogil:
+        bezier._curve.locate_point_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0, 0],
+            &s_approx,
+        )
 
     if s_approx == LOCATE_MISS:
         return None
@@ -267,12 +265,13 @@ def elevate_nodes(double[::1, :] nodes):
     dimension, num_nodes = np.shape(nodes)
     elevated = np.empty((dimension, num_nodes + 1), order="F")
 
-    bezier._curve.elevate_nodes_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &elevated[0, 0],
-    )
+    with nogil:
+        bezier._curve.elevate_nodes_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &elevated[0, 0],
+        )
 
     return elevated
 
@@ -285,13 +284,14 @@ def get_curvature(double[::1, :] nodes, double[::1, :] tangent_vec, double s):
     _, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(tangent_vec) == (2, 1)``.
 
-    bezier._curve.get_curvature(
-        &num_nodes,
-        &nodes[0, 0],
-        &tangent_vec[0, 0],
-        &s,
-        &curvature,
-    )
+    with nogil:
+        bezier._curve.get_curvature(
+            &num_nodes,
+            &nodes[0, 0],
+            &tangent_vec[0, 0],
+            &s,
+            &curvature,
+        )
 
     return curvature
 
@@ -305,13 +305,14 @@ def reduce_pseudo_inverse(double[::1, :] nodes):
 
     reduced = np.empty((dimension, num_nodes - 1), order="F")
 
-    bezier._curve.reduce_pseudo_inverse(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &reduced[0, 0],
-        &not_implemented,
-    )
+    with nogil:
+        bezier._curve.reduce_pseudo_inverse(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &reduced[0, 0],
+            &not_implemented,
+        )
 
     if not_implemented:
         # NOTE: This import at runtime is expensive, but we don't mind it
@@ -331,14 +332,15 @@ def full_reduce(double[::1, :] nodes):
     dimension, num_nodes = np.shape(nodes)
     reduced = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.full_reduce(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_reduced_nodes,
-        &reduced[0, 0],
-        &not_implemented,
-    )
+    with nogil:
+        bezier._curve.full_reduce(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_reduced_nodes,
+            &reduced[0, 0],
+            &not_implemented,
+        )
 
     if not_implemented:
         # NOTE: This import at runtime is expensive, but we don't mind it
@@ -362,13 +364,14 @@ def compute_length(double[::1, :] nodes):
 
     dimension, num_nodes = np.shape(nodes)
 
-    bezier._curve.compute_length(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &length,
-        &error_val,
-    )
+    with nogil:
+        bezier._curve.compute_length(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &length,
+            &error_val,
+        )
 
     if error_val == 6:
         err_msg = DQAGSE_ERR_MSGS[5]
@@ -399,17 +402,18 @@ def newton_refine_curve_intersect(
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes2 = np.shape(nodes2)
 
-    bezier._curve_intersection.newton_refine_curve_intersect(
-        &s,
-        &num_nodes1,
-        &nodes1[0, 0],
-        &t,
-        &num_nodes2,
-        &nodes2[0, 0],
-        &new_s,
-        &new_t,
-        &status,
-    )
+    with nogil:
+        bezier._curve_intersection.newton_refine_curve_intersect(
+            &s,
+            &num_nodes1,
+            &nodes1[0, 0],
+            &t,
+            &num_nodes2,
+            &nodes2[0, 0],
+            &new_s,
+            &new_t,
+            &status,
+        )
 
     if status == bezier._status.Status.SINGULAR:
         raise ValueError("Jacobian is singular.")
@@ -426,70 +430,72 @@ def bbox_intersect(double[::1, :] nodes1, double[::1, :] nodes2):
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes2 = np.shape(nodes2)
 
-    bezier._curve_intersection.bbox_intersect(
-        &num_nodes1,
-        &nodes1[0, 0],
-        &num_nodes2,
-        &nodes2[0, 0],
-        &enum_val,
-    )
+    with nogil:
+        bezier._curve_intersection.bbox_intersect(
+            &num_nodes1,
+            &nodes1[0, 0],
+            &num_nodes2,
+            &nodes2[0, 0],
+            &enum_val,
+        )
 
     return enum_val
 
 
 def reset_curves_workspace(int workspace_size):
-    global CURVES_WORKSPACE
-    CURVES_WORKSPACE = np.empty((2, workspace_size), order="F")
+    _workspace.thread_workspace().reset(intersections_size=workspace_size)
 
 
 def curves_workspace_size():
-    global CURVES_WORKSPACE
-    cdef int intersections_size
-
-    # NOTE: We don't check that there are 2 rows.
-    _, intersections_size = np.shape(CURVES_WORKSPACE)
-    return intersections_size
+    return _workspace.thread_workspace().intersections_size
 
 
 def curve_intersections(
         double[::1, :] nodes_first, double[::1, :] nodes_second,
-        bint allow_resize=True):
-    global CURVES_WORKSPACE
+        bint allow_resize=True, workspace=None):
     cdef int num_nodes_first, num_nodes_second
     cdef int intersections_size, num_intersections
     cdef bezier._status.Status status
+    cdef double[::1, :] intersections_workspace
     cdef ndarray_t[double, ndim=2, mode="fortran"] intersections
     cdef bool_t coincident
 
+    if workspace is None:
+        workspace = _workspace.thread_workspace()
+    intersections_workspace = workspace._intersections
+
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes_first = np.shape(nodes_first)
     _, num_nodes_second = np.shape(nodes_second)
     # NOTE: We don't check that there are 2 rows.
-    _, intersections_size = np.shape(CURVES_WORKSPACE)
-
-    bezier._curve_intersection.curve_intersections(
-        &num_nodes_first,
-        &nodes_first[0, 0],
-        &num_nodes_second,
-        &nodes_second[0, 0],
-        &intersections_size,
-        &CURVES_WORKSPACE[0, 0],
-        &num_intersections,
-        &coincident,
-        &status,
-    )
+    _, intersections_size = np.shape(intersections_workspace)
+
+    with nogil:
+        bezier._curve_intersection.curve_intersections(
+            &num_nodes_first,
+            &nodes_first[0, 0],
+            &num_nodes_second,
+            &nodes_second[0, 0],
+            &intersections_size,
+            &intersections_workspace[0, 0],
+            &num_intersections,
+            &coincident,
+            &status,
+        )
 
     if status == bezier._status.Status.SUCCESS:
         intersections = np.empty((2, num_intersections), order="F")
-        intersections[:, :] = CURVES_WORKSPACE[:, :num_intersections]
+        intersections[:, :] = (
+            intersections_workspace[:, :num_intersections])
         return intersections, coincident
     elif status == bezier._status.Status.NO_CONVERGE:
         raise ValueError(SUBDIVISION_NO_CONVERGE)
     elif status == bezier._status.Status.INSUFFICIENT_SPACE:
         if allow_resize:
-            reset_curves_workspace(num_intersections)
+            workspace.reset(intersections_size=num_intersections)
             return curve_intersections(
-                nodes_first, nodes_second, allow_resize=False)
+                nodes_first, nodes_second, allow_resize=False,
+                workspace=workspace)
         else:
             msg = TOO_SMALL_TEMPLATE.format(
                 num_intersections, intersections_size)
@@ -502,8 +508,97 @@ def curve_intersections(
         raise NotImplementedError(TOO_MANY_TEMPLATE.format(status))
 
 
-def free_curve_intersections_workspace():
-    bezier._curve_intersection.free_curve_intersections_workspace()
+def _curve_intersections_batch_size(int[::1] offsets_first,
+                                    int[::1] offsets_second):
+    cdef int num_pairs
+    cdef int i, degree1, degree2
+    cdef int intersections_size
+
+    num_pairs = np.shape(offsets_first)[0] - 1
+    intersections_size = 0
+    for i in range(num_pairs):
+        # NOTE: By Bezout's theorem, two curves that are not coincident
+        #       intersect at most ``degree1 * degree2`` times. Coincident
+        #       curves produce two parameter pairs.
+        degree1 = offsets_first[i + 1] - offsets_first[i] - 1
+        degree2 = offsets_second[i + 1] - offsets_second[i] - 1
+        intersections_size += max(degree1 * degree2, 2)
+
+    return intersections_size
+
+
+def curve_intersections_batch(
+        double[::1, :] nodes_first, int[::1] offsets_first,
+        double[::1, :] nodes_second, int[::1] offsets_second,
+        int intersections_size=-1, bint allow_resize=True):
+    cdef int num_pairs
+    cdef int num_intersections
+    cdef bezier._status.Status status
+    cdef ndarray_t[double, ndim=2, mode="fortran"] intersections
+    cdef int[::1] pair_indices
+    cdef unsigned char[::1] coincident
+
+    # NOTE: We don't check that there are 2 rows or that ``offsets_first``
+    #       and ``offsets_second`` have the same length.
+    num_pairs = np.shape(offsets_first)[0] - 1
+    if num_pairs == 0:
+        return (
+            np.empty(0, dtype=np.intc),
+            np.empty((2, 0), order="F"),
+            np.empty(0, dtype=np.bool_),
+        )
+
+    if intersections_size == -1:
+        intersections_size = _curve_intersections_batch_size(
+            offsets_first, offsets_second)
+    intersections = np.empty((2, intersections_size), order="F")
+    pair_indices_arr = np.empty(intersections_size, dtype=np.intc)
+    pair_indices = pair_indices_arr
+    coincident_arr = np.empty(num_pairs, dtype=np.uint8)
+    coincident = coincident_arr
+
+    with nogil:
+        bezier._curve_intersection.curve_intersections_batch(
+            &num_pairs,
+            &offsets_first[0],
+            &nodes_first[0, 0],
+            &offsets_second[0],
+            &nodes_second[0, 0],
+            &intersections_size,
+            &intersections[0, 0],
+            &pair_indices[0],
+            &num_intersections,
+            <bool_t*>&coincident[0],
+            &status,
+        )
+
+    if status == bezier._status.Status.SUCCESS:
+        # NOTE: We switch from 1-based to 0-based indexing since
+        #       the data moves from Fortran to Python.
+        pair_indices_arr = pair_indices_arr[:num_intersections] - 1
+        return (
+            pair_indices_arr,
+            intersections[:, :num_intersections],
+            coincident_arr.view(np.bool_),
+        )
+    elif status == bezier._status.Status.NO_CONVERGE:
+        raise ValueError(SUBDIVISION_NO_CONVERGE)
+    elif status == bezier._status.Status.INSUFFICIENT_SPACE:
+        if allow_resize:
+            return curve_intersections_batch(
+                nodes_first, offsets_first, nodes_second, offsets_second,
+                intersections_size=num_intersections, allow_resize=False)
+        else:
+            msg = TOO_SMALL_TEMPLATE.format(
+                num_intersections, intersections_size)
+            raise ValueError(msg)
+    elif status == bezier._status.Status.BAD_MULTIPLICITY:
+        raise NotImplementedError(NEWTON_NO_CONVERGE)
+    else:
+        # NOTE: If ``status`` isn't one of the enum values, then it is the
+        #       number of candidate intersections.
+        raise NotImplementedError(TOO_MANY_TEMPLATE.format(status))
+
 
 ############################
 # Section: ``helpers.f90`` #
@@ -512,11 +607,12 @@ def free_curve_intersections_workspace():
 def cross_product(double[::1] vec0, double[::1] vec1):
     cdef double result
 
-    bezier._helpers.cross_product(
-        &vec0[0],
-        &vec1[0],
-        &result,
-    )
+    with nogil:
+        bezier._helpers.cross_product(
+            &vec0[0],
+            &vec1[0],
+            &result,
+        )
 
     return result
 
@@ -528,14 +624,15 @@ def bbox(double[::1, :] nodes):
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._helpers.bbox(
-        &num_nodes,
-        &nodes[0, 0],
-        &left,
-        &right,
-        &bottom,
-        &top,
-    )
+    with nogil:
+        bezier._helpers.bbox(
+            &num_nodes,
+            &nodes[0, 0],
+            &left,
+            &right,
+            &bottom,
+            &top,
+        )
 
     return left, right, bottom, top
 
@@ -544,11 +641,12 @@ def wiggle_interval(double value):
     cdef double result
     cdef bool_t success
 
-    bezier._helpers.wiggle_interval(
-        &value,
-        &result,
-        &success,
-    )
+    with nogil:
+        bezier._helpers.wiggle_interval(
+            &value,
+            &result,
+            &success,
+        )
 
     return result, success
 
@@ -563,13 +661,14 @@ def contains_nd(double[::1, :] nodes, double[::1] point):
             np.asarray(point), dimension)
         raise ValueError(msg)
 
-    bezier._helpers.contains_nd(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0],
-        &predicate,
-    )
+    with nogil:
+        bezier._helpers.contains_nd(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0],
+            &predicate,
+        )
 
     return predicate
 
@@ -605,12 +704,13 @@ def simple_convex_hull(double[::1, :] points):
     _, num_points = np.shape(points)
     polygon = np.empty((2, num_points), order="F")
 
-    bezier._helpers.simple_convex_hull(
-        &num_points,
-        &points[0, 0],
-        &polygon_size,
-        &polygon[0, 0],
-    )
+    with nogil:
+        bezier._helpers.simple_convex_hull(
+            &num_points,
+            &points[0, 0],
+            &polygon_size,
+            &polygon[0, 0],
+        )
 
     return polygon[:, :polygon_size]
 
@@ -623,13 +723,14 @@ def polygon_collide(double[::1, :] polygon1, double[::1, :] polygon2):
     _, polygon_size1 = np.shape(polygon1)
     _, polygon_size2 = np.shape(polygon2)
 
-    bezier._helpers.polygon_collide(
-        &polygon_size1,
-        &polygon1[0, 0],
-        &polygon_size2,
-        &polygon2[0, 0],
-        &collision,
-    )
+    with nogil:
+        bezier._helpers.polygon_collide(
+            &polygon_size1,
+            &polygon1[0, 0],
+            &polygon_size2,
+            &polygon2[0, 0],
+            &collision,
+        )
 
     return collision
 
@@ -646,16 +747,17 @@ def de_casteljau_one_round(
     dimension, num_nodes = np.shape(nodes)
     new_nodes = np.empty((dimension, num_nodes - degree - 1), order="F")
 
-    bezier._triangle.de_casteljau_one_round(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &lambda1,
-        &lambda2,
-        &lambda3,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._triangle.de_casteljau_one_round(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &lambda1,
+            &lambda2,
+            &lambda3,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
@@ -669,16 +771,17 @@ def evaluate_barycentric(
     dimension, num_nodes = np.shape(nodes)
     point = np.empty((dimension, 1), order="F")
 
-    bezier._triangle.evaluate_barycentric(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &lambda1,
-        &lambda2,
-        &lambda3,
-        &point[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_barycentric(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &lambda1,
+            &lambda2,
+            &lambda3,
+            &point[0, 0],
+        )
 
     return point
 
@@ -695,15 +798,16 @@ def evaluate_barycentric_multi(
     num_vals, _ = np.shape(param_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
 
-    bezier._triangle.evaluate_barycentric_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &param_vals[0, 0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_barycentric_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &param_vals[0, 0],
+            &evaluated[0, 0],
+        )
 
     return evaluated
 
@@ -720,15 +824,16 @@ def evaluate_cartesian_multi(
     num_vals, _ = np.shape(param_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
 
-    bezier._triangle.evaluate_cartesian_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &param_vals[0, 0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_cartesian_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &param_vals[0, 0],
+            &evaluated[0, 0],
+        )
 
     return evaluated
 
@@ -741,13 +846,14 @@ def jacobian_both(double[::1, :] nodes, int degree, int dimension):
     _, num_nodes = np.shape(nodes)
     new_nodes = np.empty((2 * dimension, num_nodes - degree - 1), order="F")
 
-    bezier._triangle.jacobian_both(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._triangle.jacobian_both(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
@@ -763,14 +869,15 @@ def jacobian_det(double[::1, :] nodes, int degree, double[::1, :] st_vals):
 
     evaluated = np.empty((num_vals,), order="F")
 
-    bezier._triangle.jacobian_det(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &st_vals[0, 0],
-        &evaluated[0],
-    )
+    with nogil:
+        bezier._triangle.jacobian_det(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &st_vals[0, 0],
+            &evaluated[0],
+        )
 
     return evaluated
 
@@ -784,16 +891,17 @@ def specialize_triangle(
     dimension, num_nodes = np.shape(nodes)
     specialized = np.empty((dimension, num_nodes), order="F")
 
-    bezier._triangle.specialize_triangle(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &weights_a[0],
-        &weights_b[0],
-        &weights_c[0],
-        &specialized[0, 0],
-    )
+    with nogil:
+        bezier._triangle.specialize_triangle(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &weights_a[0],
+            &weights_b[0],
+            &weights_c[0],
+            &specialized[0, 0],
+        )
 
     return specialized
 
@@ -811,16 +919,17 @@ def subdivide_nodes_triangle(double[::1, :] nodes, int degree):
     nodes_c = np.empty((dimension, num_nodes), order="F")
     nodes_d = np.empty((dimension, num_nodes), order="F")
 
-    bezier._triangle.subdivide_nodes_triangle(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &nodes_a[0, 0],
-        &nodes_b[0, 0],
-        &nodes_c[0, 0],
-        &nodes_d[0, 0],
-    )
+    with nogil:
+        bezier._triangle.subdivide_nodes_triangle(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &nodes_a[0, 0],
+            &nodes_b[0, 0],
+            &nodes_c[0, 0],
+            &nodes_d[0, 0],
+        )
 
     return nodes_a, nodes_b, nodes_c, nodes_d
 
@@ -836,15 +945,16 @@ def compute_edge_nodes(double[::1, :] nodes, int degree):
     nodes2 = np.empty((dimension, degree + 1), order="F")
     nodes3 = np.empty((dimension, degree + 1), order="F")
 
-    bezier._triangle.compute_edge_nodes(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &nodes1[0, 0],
-        &nodes2[0, 0],
-        &nodes3[0, 0],
-    )
+    with nogil:
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &nodes1[0, 0],
+            &nodes2[0, 0],
+            &nodes3[0, 0],
+        )
 
     return nodes1, nodes2, nodes3
 
@@ -883,13 +993,14 @@ def compute_area(tuple edges):
     # Pass along the pointers to the ABI (i.e. the Fortran layer).
     # This assumes that ``unused_not_implemented`` will be ``False``
     # since we already check the supported degrees above.
-    bezier._triangle.compute_area(
-        &num_edges,
-        &sizes[0],
-        nodes_pointers,
-        &area,
-        &unused_not_implemented,
-    )
+    with nogil:
+        bezier._triangle.compute_area(
+            &num_edges,
+            &sizes[0],
+            nodes_pointers,
+            &area,
+            &unused_not_implemented,
+        )
 
     free(nodes_pointers)
 
@@ -908,17 +1019,18 @@ def newton_refine_triangle(
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._triangle_intersection.newton_refine_triangle(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &x_val,
-        &y_val,
-        &s,
-        &t,
-        &updated_s,
-        &updated_t,
-    )
+    with nogil:
+        bezier._triangle_intersection.newton_refine_triangle(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &x_val,
+            &y_val,
+            &s,
+            &t,
+            &updated_s,
+            &updated_t,
+        )
 
     return updated_s, updated_t
 
@@ -931,15 +1043,16 @@ def locate_point_triangle(
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._triangle_intersection.locate_point_triangle(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &x_val,
-        &y_val,
-        &s_val,
-        &t_val,
-    )
+    with nogil:
+        bezier._triangle_intersection.locate_point_triangle(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &x_val,
+            &y_val,
+            &s_val,
+            &t_val,
+        )
 
     if s_val == LOCATE_MISS:
         return None
@@ -948,31 +1061,23 @@ def locate_point_triangle(
 
 
 def reset_triangle_workspaces(int segment_ends_size=-1, int segments_size=-1):
-    global SEGMENT_ENDS_WORKSPACE
-    global SEGMENTS_WORKSPACE
+    workspace = _workspace.thread_workspace()
     if segment_ends_size != -1:
-        SEGMENT_ENDS_WORKSPACE = np.empty(segment_ends_size, dtype=np.intc)
+        workspace.reset(segment_ends_size=segment_ends_size)
     if segments_size != -1:
-        SEGMENTS_WORKSPACE = np.empty(segments_size, dtype=SEGMENT_DTYPE)
+        workspace.reset(segments_size=segments_size)
 
 
 def triangle_workspace_sizes():
-    global SEGMENT_ENDS_WORKSPACE
-    global SEGMENTS_WORKSPACE
-    cdef int segment_ends_size
-    cdef int segments_size
-
-    segment_ends_size, = np.shape(SEGMENT_ENDS_WORKSPACE)
-    segments_size, = np.shape(SEGMENTS_WORKSPACE)
-    return segment_ends_size, segments_size
+    workspace = _workspace.thread_workspace()
+    return workspace.segment_ends_size, workspace.segments_size
 
 
 def _triangle_intersections_success(
         double[::1, :] nodes1, int degree1,
         double[::1, :] nodes2, int degree2,
-        int num_intersected):
-    global SEGMENT_ENDS_WORKSPACE
-    global SEGMENTS_WORKSPACE
+        int num_intersected, int[::1] segment_ends,
+        CurvedPolygonSegment[::1] segments):
     cdef int begin_index, end_index
     cdef size_t i, j
     cdef int num_nodes, dimension
@@ -988,15 +1093,15 @@ def _triangle_intersections_success(
         if i == 0:
             begin_index = 0
         else:
-            begin_index = SEGMENT_ENDS_WORKSPACE[i - 1]
-        end_index = SEGMENT_ENDS_WORKSPACE[i]
+            begin_index = segment_ends[i - 1]
+        end_index = segment_ends[i]
         # NOTE: We switch from 1-based to 0-based indexing since
         #       the data moves from Fortran to Python.
         triples = tuple(
             (
-                SEGMENTS_WORKSPACE[j].edge_index - 1,
-                SEGMENTS_WORKSPACE[j].start,
-                SEGMENTS_WORKSPACE[j].end,
+                segments[j].edge_index - 1,
+                segments[j].start,
+                segments[j].end,
             )
             for j in range(begin_index, end_index)
         )
@@ -1011,29 +1116,31 @@ def _triangle_intersections_success(
     edge_nodes1 = np.empty((dimension, degree1 + 1), order="F")
     edge_nodes2 = np.empty((dimension, degree1 + 1), order="F")
     edge_nodes3 = np.empty((dimension, degree1 + 1), order="F")
-    bezier._triangle.compute_edge_nodes(
-        &num_nodes,
-        &dimension,
-        &nodes1[0, 0],
-        &degree1,
-        &edge_nodes1[0, 0],
-        &edge_nodes2[0, 0],
-        &edge_nodes3[0, 0],
-    )
+    with nogil:
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes,
+            &dimension,
+            &nodes1[0, 0],
+            &degree1,
+            &edge_nodes1[0, 0],
+            &edge_nodes2[0, 0],
+            &edge_nodes3[0, 0],
+        )
 
     dimension, num_nodes = np.shape(nodes2)
     edge_nodes4 = np.empty((dimension, degree2 + 1), order="F")
     edge_nodes5 = np.empty((dimension, degree2 + 1), order="F")
     edge_nodes6 = np.empty((dimension, degree2 + 1), order="F")
-    bezier._triangle.compute_edge_nodes(
-        &num_nodes,
-        &dimension,
-        &nodes2[0, 0],
-        &degree2,
-        &edge_nodes4[0, 0],
-        &edge_nodes5[0, 0],
-        &edge_nodes6[0, 0],
-    )
+    with nogil:
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes,
+            &dimension,
+            &nodes2[0, 0],
+            &degree2,
+            &edge_nodes4[0, 0],
+            &edge_nodes5[0, 0],
+            &edge_nodes6[0, 0],
+        )
 
     all_edge_nodes = (
         edge_nodes1,
@@ -1050,27 +1157,27 @@ def _triangle_intersections_resize(
         double[::1, :] nodes1, int degree1,
         double[::1, :] nodes2, int degree2,
         int segment_ends_size, int segments_size,
-        int num_intersected, int resizes_allowed):
-    global SEGMENT_ENDS_WORKSPACE
+        int num_intersected, int resizes_allowed, workspace):
+    cdef int[::1] segment_ends = workspace._segment_ends
     cdef int num_segments
 
     if resizes_allowed > 0:
         if num_intersected > segment_ends_size:
-            reset_triangle_workspaces(segment_ends_size=num_intersected)
+            workspace.reset(segment_ends_size=num_intersected)
         else:
-            num_segments = SEGMENT_ENDS_WORKSPACE[num_intersected - 1]
-            reset_triangle_workspaces(segments_size=num_segments)
+            num_segments = segment_ends[num_intersected - 1]
+            workspace.reset(segments_size=num_segments)
 
         return triangle_intersections(
             nodes1, degree1, nodes2, degree2,
-            resizes_allowed=resizes_allowed - 1)
+            resizes_allowed=resizes_allowed - 1, workspace=workspace)
     else:
         if num_intersected > segment_ends_size:
             msg = SEGMENT_ENDS_TOO_SMALL.format(
                 num_intersected, segment_ends_size)
             raise ValueError(msg)
         else:
-            num_segments = SEGMENT_ENDS_WORKSPACE[num_intersected - 1]
+            num_segments = segment_ends[num_intersected - 1]
             msg = SEGMENTS_TOO_SMALL.format(
                 num_segments, segments_size)
             raise ValueError(msg)
@@ -1079,39 +1186,46 @@ def _triangle_intersections_resize(
 def triangle_intersections(
         double[::1, :] nodes1, int degree1,
         double[::1, :] nodes2, int degree2,
-        bint verify=True, int resizes_allowed=2):
+        bint verify=True, int resizes_allowed=2, workspace=None):
     # NOTE: ``verify`` is unused. It is only provided as compatibility
     #       with the Python version.
-    global SEGMENT_ENDS_WORKSPACE
-    global SEGMENTS_WORKSPACE
     cdef int num_nodes1, num_nodes2
+    cdef int[::1] segment_ends
+    cdef CurvedPolygonSegment[::1] segments
     cdef int segment_ends_size
     cdef int segments_size
     cdef int num_intersected
     cdef TriangleContained contained
     cdef bezier._status.Status status
 
+    if workspace is None:
+        workspace = _workspace.thread_workspace()
+    segment_ends = workspace._segment_ends
+    segments = workspace._segments
+
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes1 = np.shape(nodes1)
     _, num_nodes2 = np.shape(nodes2)
 
-    segment_ends_size, segments_size = triangle_workspace_sizes()
-
-    bezier._triangle_intersection.triangle_intersections(
-        &num_nodes1,
-        &nodes1[0, 0],
-        &degree1,
-        &num_nodes2,
-        &nodes2[0, 0],
-        &degree2,
-        &segment_ends_size,
-        &SEGMENT_ENDS_WORKSPACE[0],
-        &segments_size,
-        &SEGMENTS_WORKSPACE[0],
-        &num_intersected,
-        &contained,
-        &status,
-    )
+    segment_ends_size, = np.shape(segment_ends)
+    segments_size, = np.shape(segments)
+
+    with nogil:
+        bezier._triangle_intersection.triangle_intersections(
+            &num_nodes1,
+            &nodes1[0, 0],
+            &degree1,
+            &num_nodes2,
+            &nodes2[0, 0],
+            &degree2,
+            &segment_ends_size,
+            &segment_ends[0],
+            &segments_size,
+            &segments[0],
+            &num_intersected,
+            &contained,
+            &status,
+        )
 
     if status == bezier._status.Status.SUCCESS:
         if contained == bezier._triangle_intersection.TriangleContained.FIRST:
@@ -1122,12 +1236,13 @@ def triangle_intersections(
             # Assumes, but does not check, that ``contained`` is equal to
             # ``bezier._triangle_intersection.NEITHER``.
             return _triangle_intersections_success(
-                nodes1, degree1, nodes2, degree2, num_intersected)
+                nodes1, degree1, nodes2, degree2, num_intersected,
+                segment_ends, segments)
     elif status == bezier._status.Status.INSUFFICIENT_SPACE:
         return _triangle_intersections_resize(
             nodes1, degree1, nodes2, degree2,
             segment_ends_size, segments_size,
-            num_intersected, resizes_allowed)
+            num_intersected, resizes_allowed, workspace)
     elif status == bezier._status.Status.NO_CONVERGE:
         raise ValueError(SUBDIVISION_NO_CONVERGE)
     elif status == bezier._status.Status.BAD_MULTIPLICITY:
@@ -1153,9 +1268,6 @@ def triangle_intersections(
         raise NotImplementedError(TOO_MANY_TEMPLATE.format(status))
 
 
-def free_triangle_intersections_workspace():
-    bezier._triangle_intersection.free_triangle_intersections_workspace()
-
 
 def _type_info():
     return (
@@ -16,7 +16,7 @@
 from bezier._status cimport Status
 
 
-cdef extern from "bezier/triangle_intersection.h":
+cdef extern from "bezier/triangle_intersection.h" nogil:
     cpdef enum TriangleContained:
         NEITHER = 0
         FIRST = 1
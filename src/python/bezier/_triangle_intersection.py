@@ -17,8 +17,6 @@ exact same interface which calls out to a Fortran implementation. The speedup
 will be used if the extension can be built.
 """
 
-import atexit
-
 from bezier.hazmat import triangle_intersection
 
 try:
@@ -36,5 +34,12 @@ else:
     newton_refine = _speedup.newton_refine_triangle
     locate_point = _speedup.locate_point_triangle
     geometric_intersect = _speedup.triangle_intersections
-    atexit.register(_speedup.free_triangle_intersections_workspace)
 # pylint: enable=invalid-name
+# NOTE: The cached Jacobian nodes of a triangle (see ``jacobian_both``) can
+#       only be passed to the pure Python implementations. The Fortran
+#       implementations compute them as needed.
+CACHED_DERIVATIVES = _speedup is None
+# NOTE: An :class:`.IntersectionWorkspace` only holds scratch space for the
+#       Fortran implementation, so it can't be passed to the pure Python
+#       implementation.
+ACCEPTS_WORKSPACE = _speedup is not None
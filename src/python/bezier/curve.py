@@ -29,9 +29,13 @@ import numpy as np
 from bezier import _base
 from bezier import _curve_helpers
 from bezier import _geometric_intersection
+from bezier import _helpers
 from bezier import _plot_helpers
 from bezier import _symbolic
 from bezier.hazmat import algebraic_intersection
+from bezier.hazmat import clipping
+from bezier.hazmat import curve_helpers
+from bezier.hazmat import geometric_intersection as _py_geometric_intersection
 from bezier.hazmat import intersection_helpers
 
 
@@ -39,10 +43,22 @@ _LOCATE_ERROR_TEMPLATE = (
     "Dimension mismatch: This curve is {:d}-dimensional, so the point should "
     "be a {:d} x 1 NumPy array. Instead the point {} has dimensions {}."
 )
+_LOCATE_MULTI_ERROR_TEMPLATE = (
+    "Dimension mismatch: This curve is {:d}-dimensional, so the points "
+    "should be a {:d} x N NumPy array. Instead the points have dimensions "
+    "{}."
+)
+_BAD_OFFSETS_TEMPLATE = (
+    "Offsets must start at 0, strictly increase and end at the number of "
+    "nodes ({:d}). Instead the offsets are {}."
+)
+_MAX_FLATTEN_SUBDIVISIONS = 20
 IntersectionStrategy = intersection_helpers.IntersectionStrategy
 
 
-class Curve(_base.Base):
+# NOTE: Each public method of ``Curve`` is part of the documented API, so
+#       they can't be moved elsewhere to satisfy Pylint.
+class Curve(_base.Base):  # pylint: disable=too-many-public-methods
     r"""Represents a B |eacute| zier `curve`_.
 
     .. _curve: https://en.wikipedia.org/wiki/B%C3%A9zier_curve
@@ -93,11 +109,17 @@ class Curve(_base.Base):
         "_dimension",  # From base class
         "_nodes",  # From base class
         "_degree",  # From constructor
+        "_arc_length_table",  # Empty default
+        "_hodographs",  # Empty default
+        "_implicit_curve",  # Empty default
     )
 
     def __init__(self, nodes, degree, *, copy=True, verify=True):
         super(Curve, self).__init__(nodes, copy=copy)
         self._degree = degree
+        self._arc_length_table = None
+        self._hodographs = None
+        self._implicit_curve = None
         self._verify_degree(verify)
 
     @classmethod
@@ -174,6 +196,12 @@ class Curve(_base.Base):
         Returns:
             float: The length of the current curve.
         """
+        if _curve_helpers.CACHED_DERIVATIVES:
+            first_deriv, _ = self._get_hodographs()
+            return curve_helpers.compute_length(
+                self._nodes, first_deriv=first_deriv
+            )
+
         return _curve_helpers.compute_length(self._nodes)
 
     @property
@@ -191,6 +219,9 @@ class Curve(_base.Base):
             "_dimension": self._dimension,
             "_nodes": self._nodes,
             "_degree": self._degree,
+            "_arc_length_table": self._arc_length_table,
+            "_hodographs": self._hodographs,
+            "_implicit_curve": self._implicit_curve,
         }
 
     def copy(self):
@@ -303,7 +334,210 @@ class Curve(_base.Base):
             numpy.ndarray: The tangent vector along the curve (as a two
             dimensional NumPy array with a single column).
         """
-        return _curve_helpers.evaluate_hodograph(s, self._nodes)
+        first_deriv, _ = self._get_hodographs()
+        return _curve_helpers.evaluate_multi(
+            first_deriv, np.asfortranarray([s])
+        )
+
+    def _get_hodographs(self):
+        """Get the (cached) nodes of the derivatives of the current curve.
+
+        These are computed the first time they are needed and shared
+        by every later caller, so they must not be modified.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The nodes of the first and
+            second derivatives :math:`B'(s)` and :math:`B''(s)`.
+        """
+        if self._hodographs is None:
+            first_deriv = np.asfortranarray(
+                curve_helpers.hodograph_nodes(self._nodes)
+            )
+            second_deriv = np.asfortranarray(
+                curve_helpers.hodograph_nodes(first_deriv)
+            )
+            self._hodographs = first_deriv, second_deriv
+        return self._hodographs
+
+    def _get_implicit_curve(self):
+        """Get the (cached) implicit form of the current curve.
+
+        This is computed the first time it is needed and shared by every
+        later caller (e.g. each call to :meth:`intersect_many` with the
+        algebraic strategy).
+
+        Returns:
+            ~bezier.hazmat.algebraic_intersection.ImplicitCurve: The
+            implicit form.
+        """
+        if self._implicit_curve is None:
+            self._implicit_curve = algebraic_intersection.ImplicitCurve(
+                self._nodes
+            )
+        return self._implicit_curve
+
+    def _get_arc_length_table(self):
+        """Get the (cached) arc-length table for the current curve.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The nodes of
+            the hodograph, the breakpoints of the table and the length of
+            the curve up to each breakpoint. See
+            :func:`~bezier.hazmat.curve_helpers.arc_length_table`.
+        """
+        if self._arc_length_table is None:
+            first_deriv, _ = self._get_hodographs()
+            breakpoints, cumulative = curve_helpers.arc_length_table(
+                first_deriv
+            )
+            self._arc_length_table = first_deriv, breakpoints, cumulative
+        return self._arc_length_table
+
+    def arc_length(self, s):
+        r"""Compute the length of the curve between :math:`0` and :math:`s`.
+
+        I.e. computes
+
+        .. math::
+
+           \int_0^s \left\lVert B'(\sigma) \right\rVert_2 \, d\sigma.
+
+        The first call builds an arc-length table for the curve (the
+        cumulative length at breakpoints chosen by adaptive Gauss-Kronrod
+        quadrature, see
+        :func:`~bezier.hazmat.curve_helpers.arc_length_table`), which is
+        cached on the curve. After that, each ``s`` only requires
+        quadrature over part of a single interval of the table. The
+        estimated relative error in each length is below :math:`2^{-40}`
+        (see :func:`~bezier.hazmat.curve_helpers.compute_lengths`).
+
+        .. doctest:: curve-arc-length
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 3.0],
+           ...     [0.0, 0.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> curve.arc_length(0.375)
+           0.890625
+           >>> curve.arc_length(np.asfortranarray([0.0, 0.5, 1.0]))
+           array([0.  , 1.25, 3.  ])
+
+        .. note::
+
+           The cached table assumes the nodes of the curve are not modified
+           after the first call.
+
+        Args:
+            s (Union[float, numpy.ndarray]): The parameter(s) along the
+                curve.
+
+        Returns:
+            Union[float, numpy.ndarray]: The length(s) along the curve (with
+            the same shape as ``s``).
+        """
+        first_deriv, breakpoints, cumulative = self._get_arc_length_table()
+        s_vals = np.asarray(s, dtype=np.float64)
+        lengths = curve_helpers.arc_lengths_from_table(
+            first_deriv, breakpoints, cumulative, s_vals.ravel()
+        )
+        if s_vals.ndim == 0:
+            return float(lengths[0])
+        return lengths.reshape(s_vals.shape)
+
+    def param_at_length(self, length):
+        r"""Find the parameter where the curve reaches a given length.
+
+        This is the inverse of :meth:`arc_length`. Uses the cached
+        arc-length table (see :meth:`arc_length`) to find the interval
+        containing each ``length`` (via binary search) and interpolates
+        within it. Then refines with Newton's method, falling back to
+        bisection of the interval whenever a Newton step would leave it
+        (e.g. where the speed is zero at a cusp), until the parameter
+        changes by at most :math:`2^{-50}`.
+
+        .. doctest:: curve-param-at-length
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 3.0],
+           ...     [0.0, 0.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> curve.param_at_length(0.890625)
+           0.375
+           >>> s_vals = curve.param_at_length(np.asfortranarray([1.0, 2.0]))
+           >>> s_vals
+           array([0.41421356, 0.73205081])
+           >>> curve.arc_length(s_vals)
+           array([1., 2.])
+
+        Args:
+            length (Union[float, numpy.ndarray]): The length(s) along the
+                curve. Lengths outside of ``[0, L]`` (where ``L`` is the
+                length of the curve) are clamped to that interval.
+
+        Returns:
+            Union[float, numpy.ndarray]: The parameter(s) :math:`s` where the
+            curve has the given length(s) (with the same shape as
+            ``length``).
+        """
+        first_deriv, breakpoints, cumulative = self._get_arc_length_table()
+        lengths = np.asarray(length, dtype=np.float64)
+        # NOTE: This allows for round-off in lengths computed some other
+        #       way (e.g. via ``Curve.length``).
+        clamped = np.clip(lengths.ravel(), 0.0, cumulative[-1])
+        s_vals = curve_helpers.params_from_table(
+            first_deriv, breakpoints, cumulative, clamped
+        )
+        if lengths.ndim == 0:
+            return float(s_vals[0])
+        return s_vals.reshape(lengths.shape)
+
+    def sample_by_length(self, num_pts):
+        """Sample points that are evenly spaced along the curve.
+
+        Consecutive points are (approximately) the same distance apart
+        when measured along the curve. See :meth:`param_at_length`.
+
+        .. doctest:: curve-sample-by-length
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 3.0],
+           ...     [0.0, 0.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> points, s_vals = curve.sample_by_length(4)
+           >>> points
+           array([[0., 1., 2., 3.],
+                  [0., 0., 0., 0.]])
+           >>> s_vals
+           array([0.        , 0.41421356, 0.73205081, 1.        ])
+
+        Args:
+            num_pts (int): The number of points to sample (including both
+                endpoints of the curve).
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * ``D x num_pts`` array of the points on the curve
+            * The ``num_pts`` (increasing) parameters :math:`s` of the
+              points
+
+        Raises:
+            ValueError: If ``num_pts`` is less than two.
+        """
+        if num_pts < 2:
+            raise ValueError("At least two points are required", num_pts)
+
+        first_deriv, breakpoints, cumulative = self._get_arc_length_table()
+        lengths = np.linspace(0.0, cumulative[-1], num_pts)
+        s_vals = curve_helpers.params_from_table(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+        points = _curve_helpers.evaluate_multi(self._nodes, s_vals)
+        return points, s_vals
 
     def plot(self, num_pts, color=None, alpha=None, ax=None):
         """Plot the current curve.
@@ -377,8 +611,88 @@ class Curve(_base.Base):
         right = Curve(right_nodes, self._degree, copy=False, verify=False)
         return left, right
 
+    def flatten(self, tolerance):
+        r"""Approximate the curve by a polyline.
+
+        Adaptively subdivides the curve until each piece is within
+        ``tolerance`` of the line segment joining its endpoints. Uses
+        :func:`.linearization_error` as the (upper bound on the) error of
+        each piece, so flat parts of the curve use few points while tight
+        bends use many.
+
+        .. doctest:: curve-flatten
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 2.0],
+           ...     [0.0, 2.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> points, s_vals = curve.flatten(0.125)
+           >>> points
+           array([[0.  , 0.5 , 1.  , 1.5 , 2.  ],
+                  [0.  , 0.75, 1.  , 0.75, 0.  ]])
+           >>> s_vals
+           array([0.  , 0.25, 0.5 , 0.75, 1.  ])
+           >>> line = bezier.Curve(nodes[:, ::2], degree=1)
+           >>> line.flatten(0.125)[1]
+           array([0., 1.])
+
+        A piece is never subdivided more than 20 times, so the error bound
+        may not be met for a ``tolerance`` near the limits of floating point
+        precision. A degree zero curve (i.e. a point) is "flattened" to the
+        single point, with :math:`s = 0`.
+
+        Args:
+            tolerance (float): The maximum allowed distance between the
+                curve and the polyline.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * ``D x M`` array of the points in the polyline (starting at
+              :math:`B(0)` and ending at :math:`B(1)`)
+            * The ``M`` (increasing) parameters :math:`s` of the points
+
+        Raises:
+            ValueError: If ``tolerance`` is not positive.
+        """
+        if not tolerance > 0.0:
+            raise ValueError("Tolerance must be positive", tolerance)
+
+        if self._degree == 0:
+            return np.asfortranarray(self._nodes[:, :1]), np.zeros(1)
+
+        points = [self._nodes[:, 0]]
+        s_vals = [0.0]
+        # NOTE: Pieces are popped left-to-right so that the polyline is
+        #       built in order.
+        pieces = [(self._nodes, 0.0, 1.0, 0)]
+        while pieces:
+            nodes, start, end, depth = pieces.pop()
+            if (
+                depth == _MAX_FLATTEN_SUBDIVISIONS
+                or _py_geometric_intersection.linearization_error(nodes)
+                <= tolerance
+            ):
+                points.append(nodes[:, -1])
+                s_vals.append(end)
+                continue
+
+            left_nodes, right_nodes = _curve_helpers.subdivide_nodes(nodes)
+            midpoint = 0.5 * (start + end)
+            pieces.append((right_nodes, midpoint, end, depth + 1))
+            pieces.append((left_nodes, start, midpoint, depth + 1))
+
+        return np.asfortranarray(np.column_stack(points)), np.asarray(s_vals)
+
     def intersect(
-        self, other, strategy=IntersectionStrategy.GEOMETRIC, _verify=True
+        self,
+        other,
+        strategy=IntersectionStrategy.GEOMETRIC,
+        _verify=True,
+        *,
+        workspace=None,
     ):
         """Find the points of intersection with another curve.
 
@@ -423,6 +737,11 @@ class Curve(_base.Base):
                 used to verify assumptions about the input and current
                 curve. Can be disabled to speed up execution time.
                 Defaults to :data:`True`.
+            workspace (Optional[~bezier.workspace.IntersectionWorkspace]):
+                Scratch buffers to re-use with the geometric strategy. If
+                not provided, the default workspace for the current thread
+                is used. Ignored for the other strategies and if the binary
+                extension is not available.
 
         Returns:
             numpy.ndarray: ``2 x N`` array of ``s``- and ``t``-parameters where
@@ -447,15 +766,160 @@ class Curve(_base.Base):
                 )
 
         if strategy == IntersectionStrategy.GEOMETRIC:
-            all_intersections = _geometric_intersection.all_intersections
-        elif strategy == IntersectionStrategy.ALGEBRAIC:
+            extra_kwargs = {}
+            if _geometric_intersection.ACCEPTS_WORKSPACE:
+                extra_kwargs["workspace"] = workspace
+            st_vals, _ = _geometric_intersection.all_intersections(
+                self._nodes, other._nodes, **extra_kwargs
+            )
+            return st_vals
+
+        if strategy == IntersectionStrategy.ALGEBRAIC:
             all_intersections = algebraic_intersection.all_intersections
+        elif strategy == IntersectionStrategy.CLIPPING:
+            all_intersections = clipping.all_intersections
         else:
             raise ValueError("Unexpected strategy.", strategy)
 
         st_vals, _ = all_intersections(self._nodes, other._nodes)
         return st_vals
 
+    def intersect_many(
+        self, others, strategy=IntersectionStrategy.GEOMETRIC, _verify=True
+    ):
+        """Find the points of intersection with many other curves.
+
+        This is the same as calling :meth:`intersect` for each curve in
+        ``others``, but partners whose bounding box is disjoint from the
+        bounding box of the current curve are skipped. With the geometric
+        strategy, the remaining pairs are intersected in a single batch
+        (see :func:`intersect_curve_pairs`). With the algebraic
+        strategy, the current curve is implicitized once (and the result
+        is cached on the curve) and evaluated for every partner at once
+        (see
+        :func:`~bezier.hazmat.algebraic_intersection.intersect_curves_many`).
+
+        .. doctest:: curve-intersect-many
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.5, 1.0],
+           ...     [0.0, 1.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> others = [
+           ...     bezier.Curve.from_nodes([[0.0, 1.0], [0.375, 0.375]]),
+           ...     bezier.Curve.from_nodes([[2.0, 3.0], [0.0, 1.0]]),
+           ...     bezier.Curve.from_nodes([[0.5, 0.5], [0.0, 1.0]]),
+           ... ]
+           >>> partner_indices, st_vals = curve.intersect_many(others)
+           >>> partner_indices
+           array([0, 0, 2], dtype=int32)
+           >>> st_vals
+           array([[0.25, 0.75, 0.5 ],
+                  [0.25, 0.75, 0.5 ]])
+
+        Args:
+            others (Sequence[Curve]): The curves to intersect with.
+            strategy (Optional[ \
+                ~bezier.hazmat.intersection_helpers.IntersectionStrategy]): The
+                intersection algorithm to use. Defaults to geometric.
+            _verify (Optional[bool]): Indicates if extra caution should be
+                used to verify assumptions about the input and current
+                curve. Can be disabled to speed up execution time.
+                Defaults to :data:`True`.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: A pair of
+
+            * A 1D array of length ``K`` with the index (in ``others``) of
+              the curve that each intersection belongs to, in increasing
+              order.
+            * A ``2 x K`` array of ``s``- and ``t``-parameters where
+              intersections occur (possibly empty).
+
+        Raises:
+            TypeError: If any of the ``others`` is not a curve (and
+                ``_verify=True``).
+            NotImplementedError: If any of the curves isn't
+                two-dimensional (and ``_verify=True``).
+            NotImplementedError: With the algebraic strategy, if any
+                partner is coincident with or tangent to the current curve
+                (or the product of their degrees is unsupported). This
+                aborts the whole call, so no intersections are returned for
+                the other partners.
+            ValueError: If ``strategy`` is not a valid
+                :class:`.IntersectionStrategy`.
+        """
+        if strategy not in (
+            IntersectionStrategy.GEOMETRIC,
+            IntersectionStrategy.ALGEBRAIC,
+            IntersectionStrategy.CLIPPING,
+        ):
+            raise ValueError("Unexpected strategy.", strategy)
+
+        if _verify:
+            for other in others:
+                if not isinstance(other, Curve):
+                    raise TypeError(
+                        "Can only intersect with another curve",
+                        "Received",
+                        other,
+                    )
+
+                if other._dimension != 2:
+                    raise NotImplementedError(
+                        "Intersection only implemented in 2D"
+                    )
+
+            if self._dimension != 2:
+                raise NotImplementedError(
+                    "Intersection only implemented in 2D"
+                )
+
+        partners = _bbox_partners(self._nodes, others)
+        if partners.size == 0:
+            return np.empty(0, dtype=np.intc), np.empty((2, 0), order="F")
+
+        if strategy == IntersectionStrategy.ALGEBRAIC:
+            all_st_vals = algebraic_intersection.intersect_curves_many(
+                self._nodes,
+                [others[partner]._nodes for partner in partners],
+                implicit=self._get_implicit_curve(),
+            )
+            return _gather_intersections(partners, all_st_vals)
+
+        if strategy == IntersectionStrategy.CLIPPING:
+            all_st_vals = []
+            for partner in partners:
+                st_vals, _ = clipping.all_intersections(
+                    self._nodes, others[partner]._nodes
+                )
+                all_st_vals.append(st_vals)
+            return _gather_intersections(partners, all_st_vals)
+
+        num_pairs = partners.size
+        _, num_nodes = self._nodes.shape
+        nodes_first = np.asfortranarray(np.tile(self._nodes, (1, num_pairs)))
+        offsets_first = np.arange(
+            0, num_nodes * num_pairs + 1, num_nodes, dtype=np.intc
+        )
+        nodes_second = np.asfortranarray(
+            np.hstack([others[partner]._nodes for partner in partners])
+        )
+        offsets_second = np.zeros(num_pairs + 1, dtype=np.intc)
+        offsets_second[1:] = np.cumsum(
+            [others[partner]._nodes.shape[1] for partner in partners]
+        )
+        (
+            pair_indices,
+            st_vals,
+            _,
+        ) = _geometric_intersection.all_intersections_batch(
+            nodes_first, offsets_first, nodes_second, offsets_second
+        )
+        return partners[pair_indices].astype(np.intc), st_vals
+
     def elevate(self):
         r"""Return a degree-elevated version of the current curve.
 
@@ -660,6 +1124,88 @@ class Curve(_base.Base):
         new_nodes = _curve_helpers.specialize_curve(self._nodes, start, end)
         return Curve(new_nodes, self._degree, copy=False, verify=False)
 
+    def split_at(self, s_vals, as_curves=False):
+        r"""Split the curve into pieces at many parameters.
+
+        This is the same as calling :meth:`specialize` for each interval
+        between consecutive (sorted) parameters, but every piece is
+        computed in a single sweep of (vectorized) de Casteljau steps.
+
+        .. doctest:: curve-split-at
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.5, 1.0],
+           ...     [0.0, 1.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> pieces = curve.split_at([0.75, 0.25])
+           >>> pieces.shape
+           (2, 3, 3)
+           >>> pieces[:, :, 1]
+           array([[0.25 , 0.5  , 0.75 ],
+                  [0.375, 0.625, 0.375]])
+
+        The stacked pieces can be used directly as the nodes of a
+        :class:`.CurveBatch`, or the pieces can be returned as curves:
+
+        .. doctest:: curve-split-at
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> left, middle, right = curve.split_at(
+           ...     [0.25, 0.75], as_curves=True
+           ... )
+           >>> right
+           <Curve (degree=2, dimension=2)>
+           >>> right.nodes
+           array([[0.75 , 0.875, 1.   ],
+                  [0.375, 0.25 , 0.   ]])
+
+        Args:
+            s_vals (Sequence[float]): The parameters to split at. These
+                must be in :math:`\left[0, 1\right]` but need not be
+                sorted.
+            as_curves (Optional[bool]): Indicates if the pieces should be
+                returned as a tuple of curves (which share memory with a
+                single stacked array). Defaults to :data:`False`.
+
+        Returns:
+            Union[numpy.ndarray, Tuple[Curve, ...]]: The ``K + 1`` pieces
+            for ``K`` parameters, in order along the curve. Either as a
+            ``D x (N + 1) x (K + 1)`` array of nodes or as curves.
+
+        Raises:
+            ValueError: If ``s_vals`` is not one-dimensional.
+            ValueError: If any of the ``s_vals`` are outside of
+                :math:`\left[0, 1\right]`.
+        """
+        s_vals = np.asarray(s_vals, dtype=np.float64)
+        if s_vals.ndim != 1:
+            raise ValueError("Parameters must be 1D array", s_vals.shape)
+
+        if np.any((s_vals < 0.0) | (s_vals > 1.0)):
+            raise ValueError("Parameters must be in the unit interval", s_vals)
+
+        breaks = np.empty(s_vals.size + 2)
+        breaks[0] = 0.0
+        breaks[1:-1] = np.sort(s_vals)
+        breaks[-1] = 1.0
+        pieces = curve_helpers.specialize_curve_multi(
+            self._nodes, breaks[:-1], breaks[1:]
+        )
+        if as_curves:
+            return tuple(
+                Curve(
+                    pieces[:, :, index],
+                    self._degree,
+                    copy=False,
+                    verify=False,
+                )
+                for index in range(s_vals.size + 1)
+            )
+
+        return pieces
+
     def locate(self, point):
         r"""Find a point on the current curve.
 
@@ -731,8 +1277,129 @@ class Curve(_base.Base):
             )
             raise ValueError(msg)
 
+        if _curve_helpers.CACHED_DERIVATIVES:
+            first_deriv, _ = self._get_hodographs()
+            return curve_helpers.locate_point(
+                self._nodes, point, first_deriv=first_deriv
+            )
+
         return _curve_helpers.locate_point(self._nodes, point)
 
+    def locate_multi(self, points):
+        r"""Find many points on the current curve.
+
+        Solves for :math:`s` in :math:`B(s) = p` for every point
+        :math:`p`. This is the same as calling :meth:`locate` for each
+        point, but the subdivision of the curve is shared by all of the
+        points and the final Newton step is vectorized.
+
+        .. doctest:: curve-locate-multi
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, -1.0, 1.0, -0.75 ],
+           ...     [2.0,  0.0, 1.0,  1.625],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=3)
+           >>> points = np.asfortranarray([
+           ...     [-0.09375 , 0.0, -0.75 ],
+           ...     [ 0.828125, 1.5,  1.625],
+           ... ])
+           >>> curve.locate_multi(points)
+           array([0.5, nan, 1. ])
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points, where
+                :math:`D` is the dimension of the curve.
+
+        Returns:
+            numpy.ndarray: The parameter values (:math:`s`) corresponding to
+            each point. If a point is not on the curve, its value is NaN.
+
+        Raises:
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current curve.
+            ValueError: If any point is too close to a self-intersection of
+                the curve (see :meth:`locate`).
+        """
+        self._check_points(points)
+        first_deriv, _ = self._get_hodographs()
+        return curve_helpers.locate_points(
+            self._nodes, points, first_deriv=first_deriv
+        )
+
+    def project(self, points):
+        r"""Find the points on the current curve closest to many points.
+
+        For each point :math:`p`, finds :math:`s \in \left[0, 1\right]`
+        minimizing :math:`\left\lVert B(s) - p \right\rVert_2`. Unlike
+        :meth:`locate`, the points need not be on the curve.
+
+        The curve is subdivided (with the subdivision shared by all of the
+        points) and sub-curves that are too far from a point are discarded
+        based on the bounding box of their control points. Then a few steps
+        of Newton's method are taken for every point at once.
+
+        .. doctest:: curve-project
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 2.0],
+           ...     [0.0, 2.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> points = np.asfortranarray([
+           ...     [1.0, 1.0, 3.0],
+           ...     [2.0, 0.5, 0.0],
+           ... ])
+           >>> s_vals, projected, distances = curve.project(points)
+           >>> s_vals
+           array([0.5, 0.5, 1. ])
+           >>> projected
+           array([[1., 1., 2.],
+                  [1., 1., 0.]])
+           >>> distances
+           array([1. , 0.5, 1. ])
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points, where
+                :math:`D` is the dimension of the curve.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+            * The parameter values (:math:`s`) of the closest points on
+              the curve (as a 1D array).
+            * The closest points on the curve (as a ``D x N`` array).
+            * The distance from each point to the curve (as a 1D array).
+
+        Raises:
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current curve.
+        """
+        self._check_points(points)
+        return curve_helpers.project_points(
+            self._nodes, points, derivatives=self._get_hodographs()
+        )
+
+    def _check_points(self, points):
+        """Check that an array of points matches the current curve.
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points.
+
+        Raises:
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current curve.
+        """
+        if points.ndim != 2 or points.shape[0] != self._dimension:
+            point_dimensions = " x ".join(
+                str(dimension) for dimension in points.shape
+            )
+            msg = _LOCATE_MULTI_ERROR_TEMPLATE.format(
+                self._dimension, self._dimension, point_dimensions
+            )
+            raise ValueError(msg)
+
     # Return type doc appears missing to Pylint because of the use of the
     # :class:`sympy.Matrix ...` aliases.
     # pylint: disable=missing-return-type-doc
@@ -798,3 +1465,166 @@ class Curve(_base.Base):
         return _symbolic.implicitize_curve(self._nodes, self._degree)
 
     # pylint: enable=missing-return-type-doc
+
+
+def _bbox_partners(nodes, others):
+    """Find the curves whose bounding box overlaps a given curve's box.
+
+    Boxes that only touch (e.g. share an edge) are considered overlapping,
+    matching :func:`~bezier.hazmat.geometric_intersection.bbox_intersect`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of a curve.
+        others (Sequence[Curve]): The candidate partner curves.
+
+    Returns:
+        numpy.ndarray: The indices (in ``others``) of the curves whose
+        bounding boxes overlap the bounding box of ``nodes``.
+    """
+    if not others:
+        return np.empty(0, dtype=np.intp)
+
+    left, right, bottom, top = _helpers.bbox(nodes)
+    boxes = np.array([_helpers.bbox(other._nodes) for other in others]).T
+    lefts, rights, bottoms, tops = boxes
+    overlap = (lefts <= right) & (left <= rights)
+    overlap &= (bottoms <= top) & (bottom <= tops)
+    return np.flatnonzero(overlap)
+
+
+def _gather_intersections(partners, all_st_vals):
+    """Combine the intersections found with each partner of a curve.
+
+    Helper for :meth:`Curve.intersect_many`.
+
+    Args:
+        partners (numpy.ndarray): The indices of the partner curves.
+        all_st_vals (List[numpy.ndarray]): The ``2 x N`` array of
+            intersection parameters for each partner.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The partner index of each
+        intersection and the ``2 x K`` array of all intersections.
+    """
+    counts = [st_vals.shape[1] for st_vals in all_st_vals]
+    pair_indices = np.repeat(partners, counts).astype(np.intc)
+    return pair_indices, np.asfortranarray(np.hstack(all_st_vals))
+
+
+def _packed_curves(nodes, offsets):
+    """Convert packed curve nodes and offsets to the expected types.
+
+    Args:
+        nodes (Sequence[Sequence[numbers.Number]]): The control points of
+            many curves, packed column-wise into a single ``2 x M`` array.
+        offsets (Sequence[int]): The ``N + 1`` column offsets into ``nodes``
+            that separate the ``N`` curves.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The nodes as a Fortran-ordered
+        ``np.float64`` array and the offsets as a ``np.intc`` array.
+
+    Raises:
+        NotImplementedError: If the ``nodes`` are not two-dimensional.
+        ValueError: If the ``offsets`` do not partition the columns of
+            ``nodes`` into curves with at least one node each.
+    """
+    nodes_np = _base.sequence_to_array(nodes)
+    dimension, num_nodes = nodes_np.shape
+    if dimension != 2:
+        raise NotImplementedError("Intersection only implemented in 2D")
+
+    offsets_np = np.asarray(offsets)
+    if (
+        offsets_np.ndim != 1
+        or offsets_np.size == 0
+        or offsets_np[0] != 0
+        or offsets_np[-1] != num_nodes
+        or np.any(np.diff(offsets_np) < 1)
+    ):
+        msg = _BAD_OFFSETS_TEMPLATE.format(num_nodes, offsets_np)
+        raise ValueError(msg)
+
+    return nodes_np, np.ascontiguousarray(offsets_np, dtype=np.intc)
+
+
+def intersect_curve_pairs(
+    nodes_first, offsets_first, nodes_second, offsets_second
+):
+    """Find the points of intersection among many pairs of curves.
+
+    This is a batched version of :meth:`Curve.intersect` (using the
+    geometric strategy). The curves in each pair are given as columns
+    of a packed array of control points along with offsets that separate
+    each curve, so the ``j``-th pair intersects the curve with nodes
+    ``nodes_first[:, offsets_first[j]:offsets_first[j + 1]]``
+    with the curve with nodes
+    ``nodes_second[:, offsets_second[j]:offsets_second[j + 1]]``.
+
+    When the binary extension is available, every pair is intersected
+    without returning to Python.
+
+    .. doctest:: intersect-curve-pairs
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes_first = np.asfortranarray([
+       ...     [0.0, 0.375, 0.75 , 0.0, 2.0],
+       ...     [0.0, 0.75 , 0.375, 0.0, 2.0],
+       ... ])
+       >>> offsets_first = [0, 3, 5]
+       >>> nodes_second = np.asfortranarray([
+       ...     [0.5, 0.5 , -1.0, 1.0],
+       ...     [0.0, 0.75,  2.0, 0.0],
+       ... ])
+       >>> offsets_second = [0, 2, 4]
+       >>> pair_indices, st_vals, coincident = bezier.intersect_curve_pairs(
+       ...     nodes_first, offsets_first, nodes_second, offsets_second
+       ... )
+       >>> pair_indices
+       array([0, 1], dtype=int32)
+       >>> 12.0 * st_vals
+       array([[8., 3.],
+              [8., 9.]])
+       >>> coincident
+       array([False, False])
+
+    Args:
+        nodes_first (Sequence[Sequence[numbers.Number]]): The control points
+            of the first curve in each pair, packed column-wise into a single
+            ``2 x M1`` array.
+        offsets_first (Sequence[int]): The ``N + 1`` column offsets into
+            ``nodes_first`` (for ``N`` pairs of curves).
+        nodes_second (Sequence[Sequence[numbers.Number]]): The control points
+            of the second curve in each pair, packed column-wise into a
+            single ``2 x M2`` array.
+        offsets_second (Sequence[int]): The ``N + 1`` column offsets into
+            ``nodes_second``.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: A triple of
+
+        * A 1D array of length ``K`` with the index of the pair that each
+          intersection belongs to.
+        * A ``2 x K`` array of ``s``- and ``t``-parameters where
+          intersections occur.
+        * A 1D boolean array of length ``N`` indicating if the curves in
+          each pair are coincident.
+
+    Raises:
+        NotImplementedError: If the curves aren't two-dimensional.
+        ValueError: If the offsets do not partition the packed nodes into
+            curves or if ``offsets_first`` and ``offsets_second`` describe a
+            different number of curves.
+    """
+    nodes_first, offsets_first = _packed_curves(nodes_first, offsets_first)
+    nodes_second, offsets_second = _packed_curves(nodes_second, offsets_second)
+    if offsets_first.size != offsets_second.size:
+        raise ValueError(
+            "Mismatched number of curves",
+            offsets_first.size - 1,
+            offsets_second.size - 1,
+        )
+
+    return _geometric_intersection.all_intersections_batch(
+        nodes_first, offsets_first, nodes_second, offsets_second
+    )
@@ -0,0 +1,424 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batches of B |eacute| zier curves with a shared degree.
+
+A curve batch stores the nodes of many curves in a single array, rather
+than one small array per :class:`.Curve`. Operations on the batch are
+vectorized over every curve at once.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _base
+from bezier import _curve_helpers
+from bezier import curve
+from bezier.hazmat import curve_helpers
+from bezier.hazmat import matrix_cache
+
+
+class CurveBatch:
+    r"""Represents a batch of B |eacute| zier curves of the same degree.
+
+    The nodes are stored in a single ``D x (N + 1) x M`` array (for ``M``
+    curves of degree ``N`` in ``D`` dimensions). The array is in Fortran
+    order, so the nodes of each curve are contiguous.
+
+    .. doctest:: curve-batch-constructor
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+       ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+       ... ])
+       >>> batch = bezier.CurveBatch(nodes)
+       >>> batch
+       <CurveBatch (num_curves=2, degree=2, dimension=2)>
+       >>> batch[1]
+       <Curve (degree=2, dimension=2)>
+       >>> batch[1].nodes
+       array([[1., 1., 3.],
+              [1., 2., 1.]])
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The nodes of
+            each curve. Must be convertible to a 3D NumPy array of floating
+            point values, where the first axis is the dimension of the
+            ambient space, the second axis indexes the nodes within a curve
+            and the third axis indexes the curves.
+        copy (bool): Flag indicating if the nodes should be copied before
+            being stored. Defaults to :data:`True` since callers may
+            freely mutate ``nodes`` after passing in.
+
+    Raises:
+        ValueError: If ``nodes`` is not 3-dimensional.
+    """
+
+    __slots__ = ("_dimension", "_degree", "_nodes")
+
+    def __init__(self, nodes, copy=True):
+        nodes_np = np.asarray(nodes)
+        if nodes_np.ndim != 3:
+            raise ValueError("Nodes must be 3-dimensional, not", nodes_np.ndim)
+
+        nodes_np = _base._lossless_to_float(nodes_np)
+        dimension, num_nodes, _ = nodes_np.shape
+        self._dimension = dimension
+        self._degree = num_nodes - 1
+        if copy:
+            self._nodes = np.array(nodes_np, order="F")
+        else:
+            self._nodes = np.asfortranarray(nodes_np)
+
+    @classmethod
+    def from_curves(cls, curves):
+        """Create a :class:`.CurveBatch` from existing curves.
+
+        .. doctest:: curve-batch-from-curves
+
+           >>> curve1 = bezier.Curve.from_nodes([
+           ...     [0.0, 1.0],
+           ...     [0.0, 2.0],
+           ... ])
+           >>> curve2 = bezier.Curve.from_nodes([
+           ...     [1.0, 1.0],
+           ...     [1.0, 0.0],
+           ... ])
+           >>> batch = bezier.CurveBatch.from_curves([curve1, curve2])
+           >>> batch
+           <CurveBatch (num_curves=2, degree=1, dimension=2)>
+
+        Args:
+            curves (Iterable[~bezier.curve.Curve]): The curves to be
+                batched. The nodes of each curve are copied.
+
+        Returns:
+            CurveBatch: The constructed batch.
+
+        Raises:
+            TypeError: If any of the ``curves`` is not a :class:`.Curve`.
+            ValueError: If there are no ``curves``.
+            ValueError: If the ``curves`` don't all have the same degree
+                and dimension.
+        """
+        curves = tuple(curves)
+        if not curves:
+            raise ValueError("A batch must contain at least one curve")
+
+        for item in curves:
+            if not isinstance(item, curve.Curve):
+                raise TypeError(
+                    "Batches can only contain curves", "Received", item
+                )
+
+        first = curves[0]
+        for item in curves[1:]:
+            if item._nodes.shape != first._nodes.shape:
+                raise ValueError(
+                    "Curves in a batch must have the same degree and "
+                    "dimension",
+                    first._nodes.shape,
+                    item._nodes.shape,
+                )
+
+        nodes = np.stack([item._nodes for item in curves], axis=2)
+        return cls(nodes, copy=False)
+
+    @property
+    def degree(self):
+        """int: The degree of every curve in the batch."""
+        return self._degree
+
+    @property
+    def dimension(self):
+        """int: The dimension that the curves lie in."""
+        return self._dimension
+
+    @property
+    def num_curves(self):
+        """int: The number of curves in the batch."""
+        return self._nodes.shape[2]
+
+    @property
+    def nodes(self):
+        """numpy.ndarray: The nodes of every curve in the batch.
+
+        This is a copy, as a ``D x (N + 1) x M`` array.
+        """
+        return self._nodes.copy(order="F")
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current batch's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_dimension": self._dimension,
+            "_degree": self._degree,
+            "_nodes": self._nodes,
+        }
+
+    def __len__(self):
+        """Get the number of curves in the batch.
+
+        Returns:
+            int: The number of curves.
+        """
+        return self._nodes.shape[2]
+
+    def __getitem__(self, index):
+        """Get a single curve from the batch.
+
+        The curve shares its nodes with the batch (i.e. they are not
+        copied), so modifying one will modify the other.
+
+        Args:
+            index (int): The index of the curve.
+
+        Returns:
+            ~bezier.curve.Curve: The curve at ``index``.
+        """
+        return curve.Curve(
+            self._nodes[:, :, index], self._degree, copy=False, verify=False
+        )
+
+    def _apply_matrix(self, matrix):
+        """Apply a linear map to the nodes of every curve.
+
+        Args:
+            matrix (numpy.ndarray): The ``(N + 1) x K`` matrix to multiply
+                the nodes of each curve by (on the right).
+
+        Returns:
+            CurveBatch: The batch of transformed curves.
+        """
+        new_nodes = np.einsum("ijk,jl->ilk", self._nodes, matrix, order="F")
+        return CurveBatch(new_nodes, copy=False)
+
+    def evaluate_multi(self, s_vals):
+        """Evaluate every curve in the batch at multiple parameters.
+
+        .. doctest:: curve-batch-evaluate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+           ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> points = batch.evaluate_multi(np.asfortranarray([0.0, 0.5]))
+           >>> points.shape
+           (2, 2, 2)
+           >>> points[:, :, 1]
+           array([[1. , 1.5],
+                  [1. , 1.5]])
+
+        Args:
+            s_vals (numpy.ndarray): Parameters along the curves (as a
+                1D array).
+
+        Returns:
+            numpy.ndarray: The points on the curves. As a ``D x S x M``
+            array, where the columns of ``result[:, :, j]`` are the points
+            on curve ``j`` for each ``s`` value.
+        """
+        (num_vals,) = np.shape(s_vals)
+        flat_points = _curve_helpers.evaluate_multi(
+            curve_helpers.flatten_batch_nodes(self._nodes), s_vals
+        )
+        points = flat_points.reshape(
+            (self._dimension, self.num_curves, num_vals), order="F"
+        )
+        return np.asfortranarray(np.moveaxis(points, 2, 1))
+
+    def evaluate_hodograph(self, s):
+        """Evaluate the tangent vector of every curve in the batch.
+
+        .. doctest:: curve-batch-evaluate-hodograph
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+           ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> batch.evaluate_hodograph(0.5)
+           array([[1., 2.],
+                  [0., 0.]])
+
+        Args:
+            s (float): Parameter along the curves.
+
+        Returns:
+            numpy.ndarray: The tangent vectors, as a ``D x M`` array with
+            one column for each curve.
+        """
+        if self._degree == 0:
+            return np.zeros((self._dimension, self.num_curves), order="F")
+
+        first_deriv = self._degree * np.diff(self._nodes, axis=1)
+        flat_deriv = _curve_helpers.evaluate_multi(
+            curve_helpers.flatten_batch_nodes(first_deriv),
+            np.asfortranarray([s]),
+        )
+        return flat_deriv.reshape(
+            (self._dimension, self.num_curves), order="F"
+        )
+
+    def lengths(self):
+        """Compute the length of every curve in the batch.
+
+        Uses adaptive Gauss-Kronrod quadrature for all of the curves at
+        once (see :func:`.compute_lengths`).
+
+        .. doctest:: curve-batch-lengths
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 0.0], [1.5, 3.0]],
+           ...     [[0.0, 0.0], [2.0, 4.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> batch.lengths()
+           array([2.5, 5. ])
+
+        Returns:
+            numpy.ndarray: The length of each curve (as a 1D array).
+        """
+        return curve_helpers.compute_lengths(self._nodes)
+
+    def subdivide(self):
+        """Split every curve in the batch at the midpoint.
+
+        .. doctest:: curve-batch-subdivide
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+           ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> left, right = batch.subdivide()
+           >>> left[1].nodes
+           array([[1. , 1. , 1.5],
+                  [1. , 1.5, 1.5]])
+           >>> right[1].nodes
+           array([[1.5, 2. , 3. ],
+                  [1.5, 1.5, 1. ]])
+
+        Returns:
+            Tuple[CurveBatch, CurveBatch]: The left and right sub-curves
+            of every curve in the batch.
+        """
+        left_mat, right_mat = matrix_cache.get_matrices(
+            "curve-subdivide",
+            self._degree,
+            curve_helpers.make_subdivision_matrices,
+        )
+        return self._apply_matrix(left_mat), self._apply_matrix(right_mat)
+
+    def specialize(self, start, end):
+        """Specialize every curve in the batch to a given sub-interval.
+
+        See :meth:`.Curve.specialize` for details.
+
+        .. doctest:: curve-batch-specialize
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+           ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> new_batch = batch.specialize(-0.25, 0.75)
+           >>> new_batch[0].nodes
+           array([[-0.25 ,  0.25 ,  0.75 ],
+                  [-0.625,  0.875,  0.375]])
+
+        Args:
+            start (float): The start point of the interval we
+                are specializing to.
+            end (float): The end point of the interval we
+                are specializing to.
+
+        Returns:
+            CurveBatch: The batch of newly-specialized curves.
+        """
+        num_nodes = self._degree + 1
+        matrix = _curve_helpers.specialize_curve(
+            np.eye(num_nodes, order="F"), start, end
+        )
+        return self._apply_matrix(matrix)
+
+    def elevate(self):
+        """Degree-elevate every curve in the batch.
+
+        See :meth:`.Curve.elevate` for details.
+
+        .. doctest:: curve-batch-elevate
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [1.5, 1.0], [3.0, 3.0]],
+           ...     [[0.0, 1.0], [1.5, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> elevated = batch.elevate()
+           >>> elevated
+           <CurveBatch (num_curves=2, degree=3, dimension=2)>
+           >>> elevated[0].nodes
+           array([[0., 1., 2., 3.],
+                  [0., 1., 1., 0.]])
+
+        Returns:
+            CurveBatch: The degree-elevated batch.
+        """
+        dimension, num_nodes, num_curves = self._nodes.shape
+        new_nodes = np.empty((dimension, num_nodes + 1, num_curves), order="F")
+        multipliers = np.arange(1, num_nodes, dtype=np.float64)
+        multipliers = multipliers[np.newaxis, :, np.newaxis]
+        denominator = float(num_nodes)
+        new_nodes[:, 1:-1, :] = (
+            multipliers * self._nodes[:, :-1, :]
+            + (denominator - multipliers) * self._nodes[:, 1:, :]
+        )
+        # Hold off on division until the end, to (attempt to) avoid
+        # round-off (this matches ``Curve.elevate()``).
+        new_nodes /= denominator
+        new_nodes[:, 0, :] = self._nodes[:, 0, :]
+        new_nodes[:, -1, :] = self._nodes[:, -1, :]
+        return CurveBatch(new_nodes, copy=False)
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_curves={:d}, degree={:d}, dimension={:d})>".format(
+            self.__class__.__name__,
+            self.num_curves,
+            self._degree,
+            self._dimension,
+        )
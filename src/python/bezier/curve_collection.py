@@ -0,0 +1,359 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collections of B |eacute| zier curves.
+
+A curve collection is used to find all intersections among many planar
+curves (e.g. the edges of a road network or the outlines of glyphs in a
+font) without intersecting every pair of curves.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _geometric_intersection
+from bezier import curve
+from bezier.hazmat import geometric_intersection
+
+
+class CurveCollection:
+    """Represents a collection of planar B |eacute| zier curves.
+
+    The bounding box of each curve is computed once, when the collection
+    is created. These are used as a broad phase (via sweep and prune) so
+    that only curves with overlapping bounding boxes are intersected.
+
+    .. doctest:: curve-collection-constructor
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 1.0],
+       ...     [0.0, 1.0],
+       ... ])
+       >>> nodes2 = np.asfortranarray([
+       ...     [0.0, 1.0],
+       ...     [1.0, 0.0],
+       ... ])
+       >>> nodes3 = np.asfortranarray([
+       ...     [3.0, 4.0, 5.0],
+       ...     [0.0, 1.0, 0.0],
+       ... ])
+       >>> collection = bezier.CurveCollection([
+       ...     bezier.Curve(nodes1, degree=1),
+       ...     bezier.Curve(nodes2, degree=1),
+       ...     bezier.Curve(nodes3, degree=2),
+       ... ])
+       >>> collection
+       <CurveCollection (num_curves=3)>
+
+    Args:
+        curves (Iterable[~bezier.curve.Curve]): The curves in the collection.
+
+    Raises:
+        TypeError: If any of the ``curves`` is not a :class:`.Curve`.
+        NotImplementedError: If any of the ``curves`` is not
+            two-dimensional.
+    """
+
+    __slots__ = ("_curves", "_nodes", "_offsets", "_boxes")
+
+    def __init__(self, curves):
+        self._curves = tuple(curves)
+        for item in self._curves:
+            if not isinstance(item, curve.Curve):
+                raise TypeError(
+                    "Collections can only contain curves", "Received", item
+                )
+
+            if item._dimension != 2:
+                raise NotImplementedError(
+                    "Intersection only implemented in 2D"
+                )
+
+        num_nodes = [item._nodes.shape[1] for item in self._curves]
+        self._offsets = np.zeros(len(num_nodes) + 1, dtype=np.intc)
+        np.cumsum(num_nodes, out=self._offsets[1:])
+        if self._curves:
+            self._nodes = np.asfortranarray(
+                np.hstack([item._nodes for item in self._curves])
+            )
+            starts = self._offsets[:-1]
+            # NOTE: These are the same bounds as ``helpers.bbox()``, computed
+            #       for every curve at once.
+            lefts, bottoms = np.minimum.reduceat(self._nodes, starts, axis=1)
+            rights, tops = np.maximum.reduceat(self._nodes, starts, axis=1)
+            self._boxes = np.asfortranarray([lefts, rights, bottoms, tops])
+        else:
+            self._nodes = np.empty((2, 0), order="F")
+            self._boxes = np.empty((4, 0), order="F")
+
+    @property
+    def curves(self):
+        """Tuple[~bezier.curve.Curve, ...]: The curves in the collection."""
+        return self._curves
+
+    @property
+    def num_curves(self):
+        """int: The number of curves in the collection."""
+        return len(self._curves)
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current collection's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_curves": self._curves,
+            "_nodes": self._nodes,
+            "_offsets": self._offsets,
+            "_boxes": self._boxes,
+        }
+
+    def self_intersections(self):
+        """Find the points of intersection among curves in the collection.
+
+        Only pairs of distinct curves with overlapping bounding boxes are
+        intersected (using the geometric strategy). A curve intersecting
+        itself is not considered.
+
+        .. doctest:: curve-collection-self-intersections
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes1 = np.asfortranarray([
+           ...     [0.0, 1.0],
+           ...     [0.0, 1.0],
+           ... ])
+           >>> nodes2 = np.asfortranarray([
+           ...     [0.0, 1.0],
+           ...     [1.0, 0.0],
+           ... ])
+           >>> nodes3 = np.asfortranarray([
+           ...     [3.0, 4.0, 5.0],
+           ...     [0.0, 1.0, 0.0],
+           ... ])
+           >>> collection = bezier.CurveCollection([
+           ...     bezier.Curve(nodes1, degree=1),
+           ...     bezier.Curve(nodes2, degree=1),
+           ...     bezier.Curve(nodes3, degree=2),
+           ... ])
+           >>> curve_indices, st_vals, coincident = (
+           ...     collection.self_intersections()
+           ... )
+           >>> curve_indices
+           array([[0],
+                  [1]], dtype=int32)
+           >>> st_vals
+           array([[0.5],
+                  [0.5]])
+           >>> coincident
+           array([False])
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: A triple of
+
+            * A ``2 x K`` array with the indices of the (first and second)
+              intersecting curves. The first index is always less than the
+              second.
+            * A ``2 x K`` array of ``s``- and ``t``-parameters where
+              intersections occur (possibly empty).
+            * A 1D boolean array of length ``K`` indicating if the curves
+              that each intersection belongs to are coincident. (In that
+              case, the intersections are the endpoints of the shared
+              segment, as in :func:`.intersect_curve_pairs`.)
+        """
+        first, second = geometric_intersection.bbox_candidates(self._boxes)
+        return _intersect_candidates(
+            self._nodes,
+            self._offsets,
+            first,
+            self._nodes,
+            self._offsets,
+            second,
+        )
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_curves={:d})>".format(
+            self.__class__.__name__, len(self._curves)
+        )
+
+
+def _packed_nodes(nodes, offsets, indices):
+    """Pack the nodes of some of the curves in a collection into one array.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of every curve in the collection,
+            stacked horizontally.
+        offsets (numpy.ndarray): The offsets that separate each curve within
+            ``nodes``.
+        indices (numpy.ndarray): The indices of the curves to pack
+            (which may contain repeats).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The packed nodes and the
+        offsets that separate each curve within them.
+    """
+    starts = offsets[:-1][indices]
+    counts = offsets[1:][indices] - starts
+    packed_offsets = np.zeros(indices.size + 1, dtype=np.intc)
+    np.cumsum(counts, out=packed_offsets[1:])
+    # Offset each column within a curve by the start of the curve.
+    columns = np.repeat(starts, counts) + (
+        np.arange(packed_offsets[-1]) - np.repeat(packed_offsets[:-1], counts)
+    )
+    return np.asfortranarray(nodes[:, columns]), packed_offsets
+
+
+def _intersect_candidates(nodes1, offsets1, first, nodes2, offsets2, second):
+    """Intersect candidate pairs of curves from two collections.
+
+    Args:
+        nodes1 (numpy.ndarray): The (stacked) nodes of the collection
+            containing the first curve in each pair.
+        offsets1 (numpy.ndarray): The offsets that separate each curve
+            within ``nodes1``.
+        first (numpy.ndarray): The indices (in the first collection) of the
+            first curve in each pair.
+        nodes2 (numpy.ndarray): The (stacked) nodes of the collection
+            containing the second curve in each pair.
+        offsets2 (numpy.ndarray): The offsets that separate each curve
+            within ``nodes2``.
+        second (numpy.ndarray): The indices (in the second collection) of
+            the second curve in each pair.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The indices of
+        the intersecting curves, the ``s``- and ``t``-parameters where they
+        intersect and a flag for each intersection indicating if the curves
+        are coincident.
+    """
+    if first.size == 0:
+        return (
+            np.empty((2, 0), dtype=np.intc, order="F"),
+            np.empty((2, 0), order="F"),
+            np.empty(0, dtype=bool),
+        )
+
+    nodes_first, offsets_first = _packed_nodes(nodes1, offsets1, first)
+    nodes_second, offsets_second = _packed_nodes(nodes2, offsets2, second)
+    (
+        pair_indices,
+        st_vals,
+        coincident,
+    ) = _geometric_intersection.all_intersections_batch(
+        nodes_first, offsets_first, nodes_second, offsets_second
+    )
+    curve_indices = np.asfortranarray(
+        [first[pair_indices], second[pair_indices]], dtype=np.intc
+    )
+    return curve_indices, st_vals, coincident[pair_indices]
+
+
+def intersect_collections(collection1, collection2):
+    """Find the points of intersection between curves in two collections.
+
+    Only pairs of curves with overlapping bounding boxes are
+    intersected (using the geometric strategy).
+
+    .. doctest:: intersect-collections
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 0.375, 0.75 ],
+       ...     [0.0, 0.75 , 0.375],
+       ... ])
+       >>> nodes2 = np.asfortranarray([
+       ...     [4.0, 5.0],
+       ...     [0.0, 1.0],
+       ... ])
+       >>> collection1 = bezier.CurveCollection([
+       ...     bezier.Curve(nodes1, degree=2),
+       ...     bezier.Curve(nodes2, degree=1),
+       ... ])
+       >>> nodes3 = np.asfortranarray([
+       ...     [0.5, 0.5 ],
+       ...     [0.0, 0.75],
+       ... ])
+       >>> collection2 = bezier.CurveCollection([
+       ...     bezier.Curve(nodes3, degree=1),
+       ... ])
+       >>> curve_indices, st_vals, coincident = bezier.intersect_collections(
+       ...     collection1, collection2
+       ... )
+       >>> curve_indices
+       array([[0],
+              [0]], dtype=int32)
+       >>> 3.0 * st_vals
+       array([[2.],
+              [2.]])
+       >>> coincident
+       array([False])
+
+    Args:
+        collection1 (CurveCollection): The first collection of curves.
+        collection2 (CurveCollection): The second collection of curves.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: A triple of
+
+        * A ``2 x K`` array with the index of the intersecting curve in
+          ``collection1`` (first row) and in ``collection2`` (second row).
+        * A ``2 x K`` array of ``s``- and ``t``-parameters where
+          intersections occur (possibly empty).
+        * A 1D boolean array of length ``K`` indicating if the curves that
+          each intersection belongs to are coincident.
+
+    Raises:
+        TypeError: If either argument is not a :class:`CurveCollection`.
+    """
+    if not isinstance(collection1, CurveCollection) or not isinstance(
+        collection2, CurveCollection
+    ):
+        raise TypeError(
+            "Can only intersect curve collections",
+            "Received",
+            collection1,
+            collection2,
+        )
+
+    # NOTE: This function is a "friend" of ``CurveCollection`` (i.e. part
+    #       of its implementation that is not bound to a single instance),
+    #       so it reads the packed arrays of both collections directly.
+    # pylint: disable=protected-access
+    first, second = geometric_intersection.bbox_candidates(
+        collection1._boxes, collection2._boxes
+    )
+    return _intersect_candidates(
+        collection1._nodes,
+        collection1._offsets,
+        first,
+        collection2._nodes,
+        collection2._offsets,
+        second,
+    )
+    # pylint: enable=protected-access
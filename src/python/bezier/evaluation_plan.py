@@ -0,0 +1,410 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Plans for evaluating many B |eacute| zier shapes at the same parameters.
+
+Evaluating a curve (or triangle) is linear in its nodes, so for a fixed
+set of parameters it is a product with a matrix of Bernstein basis
+values. An evaluation plan computes this matrix once and then evaluates
+any number of shapes (of the same degree) with one matrix product each.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _curve_helpers
+from bezier import _triangle_helpers
+from bezier.hazmat import curve_helpers
+
+
+class EvaluationPlan:
+    r"""Plan for evaluating curves of one degree at shared parameters.
+
+    The plan stores the ``(N + 1) x S`` matrix :math:`M` of Bernstein
+    basis values
+
+    .. math::
+
+       M_{j, k} = \binom{N}{j} (1 - s_k)^{N - j} s_k^j
+
+    so that evaluating a curve with nodes :math:`V` (as a ``D x (N + 1)``
+    array) is just the product :math:`V M`.
+
+    .. doctest:: evaluation-plan-constructor
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> plan = bezier.EvaluationPlan(2, np.linspace(0.0, 1.0, 5))
+       >>> plan
+       <EvaluationPlan (degree=2, num_vals=5)>
+       >>> curve = bezier.Curve.from_nodes([
+       ...     [0.0, 0.5, 1.0],
+       ...     [0.0, 1.0, 0.0],
+       ... ])
+       >>> plan.evaluate(curve)
+       array([[0.   , 0.25 , 0.5  , 0.75 , 1.   ],
+              [0.   , 0.375, 0.5  , 0.375, 0.   ]])
+
+    Args:
+        degree (int): The degree of the curves being evaluated.
+        s_vals (numpy.ndarray): Parameters along the curves (as a
+            1D array).
+
+    Raises:
+        ValueError: If ``s_vals`` is not a 1D array.
+    """
+
+    __slots__ = ("_degree", "_s_vals", "_basis")
+
+    def __init__(self, degree, s_vals):
+        s_vals = np.array(s_vals, dtype=np.float64, order="F")
+        if s_vals.ndim != 1:
+            raise ValueError("Parameter values must be 1D array")
+
+        self._degree = degree
+        self._s_vals = s_vals
+        # NOTE: Evaluating the "curve" with the identity as nodes gives
+        #       the value of each basis function in each row.
+        identity = np.eye(degree + 1, order="F")
+        self._basis = _curve_helpers.evaluate_multi(identity, s_vals)
+        self._s_vals.flags.writeable = False
+        self._basis.flags.writeable = False
+
+    @property
+    def degree(self):
+        """int: The degree of the curves being evaluated."""
+        return self._degree
+
+    @property
+    def s_vals(self):
+        """numpy.ndarray: The parameters that curves are evaluated at."""
+        return self._s_vals
+
+    @property
+    def num_vals(self):
+        """int: The number of parameters that curves are evaluated at."""
+        return self._s_vals.size
+
+    @property
+    def basis(self):
+        """numpy.ndarray: The (read-only) matrix of Bernstein basis values.
+
+        The rows correspond to each basis function and the columns to each
+        ``s`` value.
+        """
+        return self._basis
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current plan's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_degree": self._degree,
+            "_s_vals": self._s_vals,
+            "_basis": self._basis,
+        }
+
+    def _check_degree(self, degree):
+        """Make sure a curve (or batch) can be evaluated by this plan.
+
+        Args:
+            degree (int): The degree of the curve(s).
+
+        Raises:
+            ValueError: If ``degree`` does not match the plan.
+        """
+        if degree != self._degree:
+            raise ValueError(
+                "Degree does not match plan", degree, self._degree
+            )
+
+    def evaluate(self, curve):
+        """Evaluate a curve at every parameter in the plan.
+
+        This is equivalent to :meth:`.Curve.evaluate_multi`.
+
+        Args:
+            curve (~bezier.curve.Curve): The curve to evaluate.
+
+        Returns:
+            numpy.ndarray: The points on the curve. As a two dimensional
+            NumPy array, with the columns corresponding to each ``s``
+            value and the rows to the dimension.
+
+        Raises:
+            ValueError: If the degree of ``curve`` does not match the plan.
+        """
+        self._check_degree(curve._degree)
+        return _apply_basis(curve._nodes, self._basis)
+
+    def evaluate_batch(self, batch):
+        """Evaluate every curve in a batch at every parameter in the plan.
+
+        This is equivalent to :meth:`.CurveBatch.evaluate_multi`, but
+        all of the curves are evaluated with a single matrix product.
+
+        .. doctest:: evaluation-plan-evaluate-batch
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+           ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+           ... ])
+           >>> batch = bezier.CurveBatch(nodes)
+           >>> plan = bezier.EvaluationPlan(2, [0.0, 0.5])
+           >>> points = plan.evaluate_batch(batch)
+           >>> points.shape
+           (2, 2, 2)
+           >>> points[:, :, 1]
+           array([[1. , 1.5],
+                  [1. , 1.5]])
+
+        Args:
+            batch (~bezier.curve_batch.CurveBatch): The curves to evaluate.
+
+        Returns:
+            numpy.ndarray: The points on the curves. As a ``D x S x M``
+            array, where the columns of ``result[:, :, j]`` are the points
+            on curve ``j`` for each ``s`` value.
+
+        Raises:
+            ValueError: If the degree of ``batch`` does not match the plan.
+        """
+        self._check_degree(batch._degree)
+        flat_points = _apply_basis(
+            curve_helpers.flatten_batch_nodes(batch._nodes), self._basis
+        )
+        points = flat_points.reshape(
+            (batch._dimension, batch.num_curves, self.num_vals), order="F"
+        )
+        return np.asfortranarray(np.moveaxis(points, 2, 1))
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (degree={:d}, num_vals={:d})>".format(
+            self.__class__.__name__, self._degree, self.num_vals
+        )
+
+
+class TriangleEvaluationPlan:
+    r"""Plan for evaluating triangles of one degree at shared parameters.
+
+    The plan stores the matrix of Bernstein basis values at each point
+    :math:`(s, t)` in a parameter grid, so that evaluating a triangle is
+    a single product with its nodes. See :class:`EvaluationPlan`.
+
+    .. doctest:: triangle-evaluation-plan-constructor
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> param_vals = np.asfortranarray([
+       ...     [0.0  , 0.0  ],
+       ...     [0.125, 0.625],
+       ...     [0.5  , 0.5  ],
+       ... ])
+       >>> plan = bezier.TriangleEvaluationPlan(1, param_vals)
+       >>> plan
+       <TriangleEvaluationPlan (degree=1, num_vals=3)>
+       >>> triangle = bezier.Triangle.from_nodes([
+       ...     [0.0, 2.0, -3.0],
+       ...     [0.0, 1.0,  2.0],
+       ... ])
+       >>> plan.evaluate(triangle)
+       array([[ 0.   , -1.625, -0.5  ],
+              [ 0.   ,  1.375,  1.5  ]])
+
+    Args:
+        degree (int): The degree of the triangles being evaluated.
+        param_vals (numpy.ndarray): Array of parameter values (as a
+            ``N x 2`` array).
+
+    Raises:
+        ValueError: If ``param_vals`` is not a ``N x 2`` array.
+    """
+
+    __slots__ = ("_degree", "_param_vals", "_basis")
+
+    def __init__(self, degree, param_vals):
+        param_vals = np.array(param_vals, dtype=np.float64, order="F")
+        if param_vals.ndim != 2 or param_vals.shape[1] != 2:
+            raise ValueError("Parameter values must be N x 2 array")
+
+        self._degree = degree
+        self._param_vals = param_vals
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        identity = np.eye(num_nodes, order="F")
+        self._basis = _triangle_helpers.evaluate_cartesian_multi(
+            identity, degree, param_vals, num_nodes
+        )
+        self._param_vals.flags.writeable = False
+        self._basis.flags.writeable = False
+
+    @property
+    def degree(self):
+        """int: The degree of the triangles being evaluated."""
+        return self._degree
+
+    @property
+    def param_vals(self):
+        """numpy.ndarray: The parameters that triangles are evaluated at."""
+        return self._param_vals
+
+    @property
+    def num_vals(self):
+        """int: The number of parameters that triangles are evaluated at."""
+        num_vals, _ = self._param_vals.shape
+        return num_vals
+
+    @property
+    def basis(self):
+        """numpy.ndarray: The (read-only) matrix of Bernstein basis values.
+
+        The rows correspond to each basis function and the columns to each
+        ``(s, t)`` value.
+        """
+        return self._basis
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current plan's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_degree": self._degree,
+            "_param_vals": self._param_vals,
+            "_basis": self._basis,
+        }
+
+    def _check_degree(self, degree):
+        """Make sure a triangle can be evaluated by this plan.
+
+        Args:
+            degree (int): The degree of the triangle.
+
+        Raises:
+            ValueError: If ``degree`` does not match the plan.
+        """
+        if degree != self._degree:
+            raise ValueError(
+                "Degree does not match plan", degree, self._degree
+            )
+
+    def evaluate(self, triangle):
+        """Evaluate a triangle at every parameter in the plan.
+
+        This is equivalent to :meth:`.Triangle.evaluate_cartesian_multi`.
+
+        Args:
+            triangle (~bezier.triangle.Triangle): The triangle to evaluate.
+
+        Returns:
+            numpy.ndarray: The points on the triangle.
+
+        Raises:
+            ValueError: If the degree of ``triangle`` does not match the
+                plan.
+        """
+        self._check_degree(triangle._degree)
+        return _apply_basis(triangle._nodes, self._basis)
+
+    def evaluate_many(self, triangles):
+        """Evaluate many triangles at every parameter in the plan.
+
+        The nodes of all of the triangles are stacked so that they are
+        evaluated with a single matrix product.
+
+        .. doctest:: triangle-evaluation-plan-evaluate-many
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> triangle1 = bezier.Triangle.from_nodes([
+           ...     [0.0, 1.0, 0.0],
+           ...     [0.0, 0.0, 1.0],
+           ... ])
+           >>> triangle2 = bezier.Triangle.from_nodes([
+           ...     [1.0, 3.0, 1.0],
+           ... ])
+           >>> plan = bezier.TriangleEvaluationPlan(1, [[0.25, 0.5]])
+           >>> points1, points2 = plan.evaluate_many([triangle1, triangle2])
+           >>> points1
+           array([[0.25],
+                  [0.5 ]])
+           >>> points2
+           array([[1.5]])
+
+        Args:
+            triangles (Sequence[~bezier.triangle.Triangle]): The triangles
+                to evaluate. They may have different dimensions.
+
+        Returns:
+            List[numpy.ndarray]: The points on each triangle.
+
+        Raises:
+            ValueError: If the degree of any of the ``triangles`` does not
+                match the plan.
+        """
+        for triangle in triangles:
+            self._check_degree(triangle._degree)
+        if not triangles:
+            return []
+
+        stacked = np.vstack([triangle._nodes for triangle in triangles])
+        points = _apply_basis(stacked, self._basis)
+        dimensions = [triangle._dimension for triangle in triangles]
+        splits = np.cumsum(dimensions[:-1])
+        return [np.asfortranarray(block) for block in np.split(points, splits)]
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (degree={:d}, num_vals={:d})>".format(
+            self.__class__.__name__, self._degree, self.num_vals
+        )
+
+
+def _apply_basis(nodes, basis):
+    """Multiply nodes by a matrix of basis values.
+
+    Args:
+        nodes (numpy.ndarray): The nodes (as a ``D x N`` array).
+        basis (numpy.ndarray): The ``N x S`` basis values.
+
+    Returns:
+        numpy.ndarray: The ``D x S`` product, in Fortran order.
+    """
+    # NOTE: Computing the transpose of the product (which is in C order)
+    #       gives the product in Fortran order without a copy.
+    return np.dot(basis.T, nodes.T).T
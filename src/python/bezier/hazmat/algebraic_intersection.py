@@ -41,14 +41,17 @@ is the "intersection polynomial" for :math:`t`.
 """
 
 import numpy as np
+from numpy.polynomial import chebyshev
 from numpy.polynomial import polynomial
 
 from bezier import _curve_helpers
 from bezier import _geometric_intersection
 from bezier import _helpers
 from bezier import _intersection_helpers
+from bezier.hazmat import curve_helpers as _py_curve_helpers
 from bezier.hazmat import geometric_intersection
 from bezier.hazmat import helpers as _py_helpers
+from bezier.hazmat import matrix_cache
 
 
 # NOTE: These are hardcoded from:
@@ -101,6 +104,11 @@ _UNIT_INTERVAL_WIGGLE_START = -(0.5 ** 13)
 _UNIT_INTERVAL_WIGGLE_END = 1.0 + 0.5 ** 13
 _SIGMA_THRESHOLD = 0.5 ** 20
 _SINGULAR_EPS = 0.5 ** 52
+# Subdivide (at most) down to intervals of width 2^{-30} when isolating
+# roots and then polish each isolated root with (safeguarded) Newton.
+_ISOLATION_DEPTH = 30
+_POLISH_MAX_STEPS = 64
+_POLISH_EPS = 0.5 ** 52
 # Detect almost zero polynomials.
 _L2_THRESHOLD = 0.5 ** 40  # 4096 (machine precision)
 _ZERO_THRESHOLD = 0.5 ** 38  # 16384 (machine precision)
@@ -112,6 +120,19 @@ _POWER_BASIS_ERR = (
     "Currently only supporting degree pairs "
     "1-1, 1-2, 1-3, 1-4, 2-2, 2-3, 2-4 and 3-3."
 )
+_POWER_BASIS_MANY_ERR = (
+    "Currently only supporting degree pairs whose product is "
+    "1, 2, 3, 4, 6, 8 or 9."
+)
+_POWER_BASIS_SAMPLES = {
+    1: np.asfortranarray([0.0, 1.0]),
+    2: np.asfortranarray([0.0, 0.5, 1.0]),
+    3: np.asfortranarray([0.0, 0.25, 0.75, 1.0]),
+    4: np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0]),
+    6: _CHEB7,
+    8: _CHEB9,
+    9: _CHEB10,
+}
 _LINEARIZATION = geometric_intersection.Linearization
 _DISJOINT = geometric_intersection.BoxIntersectionType.DISJOINT
 
@@ -237,6 +258,140 @@ def eval_intersection_polynomial(nodes1, nodes2, t):
     return evaluate(nodes1, x_val, y_val)
 
 
+def _sample_values(nodes1, nodes2, degree):
+    """Sample an **intersection polynomial** for :func:`to_power_basis`.
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes in the first curve.
+        nodes2 (numpy.ndarray): The nodes in the second curve.
+        degree (int): The degree of the **intersection polynomial**.
+
+    Returns:
+        List[float]: The values of the **intersection polynomial** at each
+        parameter in ``_POWER_BASIS_SAMPLES[degree]``.
+    """
+    return [
+        eval_intersection_polynomial(nodes1, nodes2, t_val)
+        for t_val in _POWER_BASIS_SAMPLES[degree]
+    ]
+
+
+def _interpolate_power_basis(values):
+    r"""Compute the coefficients of a polynomial from sampled values.
+
+    The ``d + 1`` values of a degree ``d`` polynomial are expected at the
+    parameters in ``_POWER_BASIS_SAMPLES[d]``. For degree four or less,
+    these are equally spaced and the Vandermonde matrix is inverted by
+    hand. Otherwise, they are the Chebyshev nodes (scaled and shifted onto
+    ``[0, 1]``) and a least-squares fit is used.
+
+    Each value may also be a 1D array, in which case the coefficients of
+    many polynomials (one per column) are computed at once.
+
+    Args:
+        values (Union[List[float], numpy.ndarray]): The sampled values.
+
+    Returns:
+        numpy.ndarray: Array of coefficients (with one column per
+        polynomial when each value is an array).
+    """
+    num_values = len(values)
+    if num_values == 2:
+        # We manually invert the Vandermonde matrix:
+        # [1 0][c0] = [n0]
+        # [1 1][c1]   [n1]
+        val0, val1 = values
+        # [c0] = [ 1 0][n0]
+        # [c1] = [-1 1][n1]
+        return np.asfortranarray([val0, -val0 + val1])
+
+    if num_values == 3:
+        # We manually invert the Vandermonde matrix:
+        # [1 0   0  ][c0] = [n0]
+        # [1 1/2 1/4][c1]   [n1]
+        # [1 1   1  ][c2]   [n2]
+        val0, val1, val2 = values
+        # [c0] = [ 1  0  0][n0]
+        # [c1] = [-3  4 -1][n1]
+        # [c2] = [ 2 -4  2][n2]
+        return np.asfortranarray(
+            [
+                val0,
+                -3.0 * val0 + 4.0 * val1 - val2,
+                2.0 * val0 - 4.0 * val1 + 2.0 * val2,
+            ]
+        )
+
+    if num_values == 4:
+        # We manually invert the Vandermonde matrix:
+        # Use exact f.p. numbers to avoid round-off wherever possible.
+        # [1 0   0    0    ][c0] = [n0]
+        # [1 1/4 1/16 1/64 ][c1]   [n1]
+        # [1 3/4 9/16 27/64][c2]   [n2]
+        # [1 1   1    1    ][c3]   [n3]
+        val0, val1, val2, val3 = values
+        # [c0] =       [  3   0   0   0][n0]
+        # [c1] = 1 / 3 [-19  24  -8   3][n1]
+        # [c2] =       [ 32 -56  40 -16][n2]
+        # [c3] =       [-16  32 -32  16][n3]
+        # Since polynomial coefficients, we don't need to divide by 3
+        # to get the same polynomial. Avoid the division to avoid round-off.
+        return np.asfortranarray(
+            [
+                3.0 * val0,
+                -19.0 * val0 + 24.0 * val1 - 8.0 * val2 + 3.0 * val3,
+                32.0 * val0 - 56.0 * val1 + 40.0 * val2 - 16.0 * val3,
+                -16.0 * val0 + 32.0 * val1 - 32.0 * val2 + 16.0 * val3,
+            ]
+        )
+
+    if num_values == 5:
+        # We manually invert the Vandermonde matrix:
+        # [1 0   0    0     0     ][c0] = [n0]
+        # [1 1/4 1/16 1/64  1/256 ][c1]   [n1]
+        # [1 1/2 1/4  1/8   1/16  ][c2]   [n2]
+        # [1 3/4 9/16 27/64 81/256][c3]   [n3]
+        # [1 1   1    1     1     ][c4]   [n4]
+        val0, val1, val2, val3, val4 = values
+        # [c0] =       [ 3   0    0    0    0 ][n0]
+        # [c1] = 1 / 3 [-25  48  -36   16  -3 ][n1]
+        # [c2] =       [ 70 -208  228 -112  22][n2]
+        # [c3] =       [-80  288 -384  224 -48][n3]
+        # [c4] =       [ 32 -128  192 -128  32][n4]
+        # Since polynomial coefficients, we don't need to divide by 3
+        # to get the same polynomial. Avoid the division to avoid round-off.
+        return np.asfortranarray(
+            [
+                3.0 * val0,
+                -25.0 * val0
+                + 48.0 * val1
+                - 36.0 * val2
+                + 16.0 * val3
+                - 3.0 * val4,
+                70.0 * val0
+                - 208.0 * val1
+                + 228.0 * val2
+                - 112.0 * val3
+                + 22.0 * val4,
+                (
+                    -80.0 * val0
+                    + 288.0 * val1
+                    - 384.0 * val2
+                    + 224.0 * val3
+                    - 48.0 * val4
+                ),
+                32.0 * val0
+                - 128.0 * val1
+                + 192.0 * val2
+                - 128.0 * val3
+                + 32.0 * val4,
+            ]
+        )
+
+    degree = num_values - 1
+    return polynomial.polyfit(_POWER_BASIS_SAMPLES[degree], values, degree)
+
+
 def _to_power_basis11(nodes1, nodes2):
     r"""Compute the coefficients of an **intersection polynomial**.
 
@@ -252,14 +407,7 @@ def _to_power_basis11(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``2``-array of coefficients.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0][c0] = [n0]
-    # [1 1][c1]   [n1]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] = [ 1 0][n0]
-    # [c1] = [-1 1][n1]
-    return np.asfortranarray([val0, -val0 + val1])
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 1))
 
 
 def _to_power_basis12(nodes1, nodes2):
@@ -277,23 +425,7 @@ def _to_power_basis12(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``3``-array of coefficients.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0   0  ][c0] = [n0]
-    # [1 1/2 1/4][c1]   [n1]
-    # [1 1   1  ][c2]   [n2]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.5)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] = [ 1  0  0][n0]
-    # [c1] = [-3  4 -1][n1]
-    # [c2] = [ 2 -4  2][n2]
-    return np.asfortranarray(
-        [
-            val0,
-            -3.0 * val0 + 4.0 * val1 - val2,
-            2.0 * val0 - 4.0 * val1 + 2.0 * val2,
-        ]
-    )
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 2))
 
 
 def _to_power_basis13(nodes1, nodes2):
@@ -311,30 +443,7 @@ def _to_power_basis13(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``4``-array of coefficients.
     """
-    # We manually invert the Vandermonde matrix:
-    # Use exact f.p. numbers to avoid round-off wherever possible.
-    # [1 0   0    0    ][c0] = [n0]
-    # [1 1/4 1/16 1/64 ][c1]   [n1]
-    # [1 3/4 9/16 27/64][c2]   [n2]
-    # [1 1   1    1    ][c3]   [n3]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.25)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 0.75)
-    val3 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] =       [  3   0   0   0][n0]
-    # [c1] = 1 / 3 [-19  24  -8   3][n1]
-    # [c2] =       [ 32 -56  40 -16][n2]
-    # [c3] =       [-16  32 -32  16][n3]
-    # Since polynomial coefficients, we don't need to divide by 3
-    # to get the same polynomial. Avoid the division to avoid round-off.
-    return np.asfortranarray(
-        [
-            3.0 * val0,
-            -19.0 * val0 + 24.0 * val1 - 8.0 * val2 + 3.0 * val3,
-            32.0 * val0 - 56.0 * val1 + 40.0 * val2 - 16.0 * val3,
-            -16.0 * val0 + 32.0 * val1 - 32.0 * val2 + 16.0 * val3,
-        ]
-    )
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 3))
 
 
 def _to_power_basis_degree4(nodes1, nodes2):
@@ -352,51 +461,7 @@ def _to_power_basis_degree4(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``5``-array of coefficients.
     """
-    # We manually invert the Vandermonde matrix:
-    # [1 0   0    0     0     ][c0] = [n0]
-    # [1 1/4 1/16 1/64  1/256 ][c1]   [n1]
-    # [1 1/2 1/4  1/8   1/16  ][c2]   [n2]
-    # [1 3/4 9/16 27/64 81/256][c3]   [n3]
-    # [1 1   1    1     1     ][c4]   [n4]
-    val0 = eval_intersection_polynomial(nodes1, nodes2, 0.0)
-    val1 = eval_intersection_polynomial(nodes1, nodes2, 0.25)
-    val2 = eval_intersection_polynomial(nodes1, nodes2, 0.5)
-    val3 = eval_intersection_polynomial(nodes1, nodes2, 0.75)
-    val4 = eval_intersection_polynomial(nodes1, nodes2, 1.0)
-    # [c0] =       [ 3   0    0    0    0 ][n0]
-    # [c1] = 1 / 3 [-25  48  -36   16  -3 ][n1]
-    # [c2] =       [ 70 -208  228 -112  22][n2]
-    # [c3] =       [-80  288 -384  224 -48][n3]
-    # [c4] =       [ 32 -128  192 -128  32][n4]
-    # Since polynomial coefficients, we don't need to divide by 3
-    # to get the same polynomial. Avoid the division to avoid round-off.
-    return np.asfortranarray(
-        [
-            3.0 * val0,
-            -25.0 * val0
-            + 48.0 * val1
-            - 36.0 * val2
-            + 16.0 * val3
-            - 3.0 * val4,
-            70.0 * val0
-            - 208.0 * val1
-            + 228.0 * val2
-            - 112.0 * val3
-            + 22.0 * val4,
-            (
-                -80.0 * val0
-                + 288.0 * val1
-                - 384.0 * val2
-                + 224.0 * val3
-                - 48.0 * val4
-            ),
-            32.0 * val0
-            - 128.0 * val1
-            + 192.0 * val2
-            - 128.0 * val3
-            + 32.0 * val4,
-        ]
-    )
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 4))
 
 
 def _to_power_basis23(nodes1, nodes2):
@@ -421,10 +486,7 @@ def _to_power_basis23(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``7``-array of coefficients.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val) for t_val in _CHEB7
-    ]
-    return polynomial.polyfit(_CHEB7, evaluated, 6)
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 6))
 
 
 def _to_power_basis_degree8(nodes1, nodes2):
@@ -449,10 +511,7 @@ def _to_power_basis_degree8(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``9``-array of coefficients.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val) for t_val in _CHEB9
-    ]
-    return polynomial.polyfit(_CHEB9, evaluated, 8)
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 8))
 
 
 def _to_power_basis33(nodes1, nodes2):
@@ -477,11 +536,7 @@ def _to_power_basis33(nodes1, nodes2):
     Returns:
         numpy.ndarray: ``10``-array of coefficients.
     """
-    evaluated = [
-        eval_intersection_polynomial(nodes1, nodes2, t_val)
-        for t_val in _CHEB10
-    ]
-    return polynomial.polyfit(_CHEB10, evaluated, 9)
+    return _interpolate_power_basis(_sample_values(nodes1, nodes2, 9))
 
 
 def to_power_basis(nodes1, nodes2):
@@ -724,7 +779,7 @@ def bernstein_companion(coeffs):
     return companion, degree, effective_degree
 
 
-def bezier_roots(coeffs):
+def bezier_roots(coeffs, unit_interval=False):
     r"""Compute polynomial roots from a polynomial in the Bernstein basis.
 
     .. note::
@@ -875,13 +930,39 @@ def bezier_roots(coeffs):
        >>> np.allclose(expected2, roots2, rtol=8 * machine_eps, atol=0.0)
        True
 
+    When only the roots in :math:`\left[0, 1\right]` are needed, the
+    eigenvalue solve can be skipped entirely. With ``unit_interval=True``
+    the roots are instead isolated by subdividing the unit interval and
+    then polished with Newton's method. This is typically faster than
+    the eigenvalue solve and immediately rejects a polynomial with no
+    sign variations in its coefficients:
+
+    .. doctest:: bezier-roots1
+
+       >>> bezier_roots(coeffs1, unit_interval=True)
+       array([1.])
+       >>> coeffs3 = np.asfortranarray([1.0, -1.0, 1.0])
+       >>> bezier_roots(coeffs3, unit_interval=True)
+       array([0.5])
+       >>> coeffs4 = np.asfortranarray([3.0, 3.0, 4.0, 6.0])
+       >>> bezier_roots(coeffs4, unit_interval=True)
+       array([], dtype=float64)
+
     Args:
         coeffs (numpy.ndarray): A 1D array of coefficients in
             the Bernstein basis.
+        unit_interval (Optional[bool]): Flag indicating if only the (real)
+            roots in :math:`\left[0, 1\right]` should be computed. In
+            this case each root is returned once (in increasing order),
+            regardless of multiplicity. Defaults to :data:`False`.
 
     Returns:
         numpy.ndarray: A 1D array containing the roots.
     """
+    if unit_interval:
+        _, s_vals = _subdivision_roots(coeffs[:, np.newaxis])
+        return s_vals
+
     companion, degree, effective_degree = bernstein_companion(coeffs)
     if effective_degree:
         sigma_roots = np.linalg.eigvals(companion)
@@ -898,6 +979,433 @@ def bezier_roots(coeffs):
     return s_vals
 
 
+def _companion_eigvals(monic_coeffs):
+    r"""Compute the eigenvalues of many companion matrices at once.
+
+    Each column of ``monic_coeffs`` holds the non-lead coefficients
+    :math:`c_0, \ldots, c_{d - 1}` of a monic polynomial
+    :math:`x^d + c_{d - 1} x^{d - 1} + \cdots + c_0`. The companion matrices
+    have the same layout as those from :func:`bernstein_companion` and are
+    solved in a single (stacked) call to :func:`numpy.linalg.eigvals`.
+
+    Args:
+        monic_coeffs (numpy.ndarray): A ``d x K`` array of coefficients.
+
+    Returns:
+        numpy.ndarray: A ``K x d`` array of eigenvalues (i.e. roots), one
+        row per polynomial.
+    """
+    degree, num_polys = monic_coeffs.shape
+    companions = np.zeros((num_polys, degree, degree))
+    companions[:, 0, :] = -monic_coeffs[::-1, :].T
+    rows = np.arange(1, degree)
+    companions[:, rows, rows - 1] = 1.0
+    return np.linalg.eigvals(companions)
+
+
+def bezier_roots_multi(coeffs, unit_interval=False):
+    r"""Compute the roots of many polynomials in the Bernstein basis.
+
+    This is a batched version of :func:`bezier_roots`. The polynomials are
+    grouped by their "effective degree" and the companion matrices in each
+    group are solved together, rather than one polynomial at a time.
+
+    .. testsetup:: bezier-roots-multi
+
+       import numpy as np
+       from bezier.hazmat import algebraic_intersection
+
+    .. doctest:: bezier-roots-multi
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> coeffs = np.asfortranarray([
+       ...     [12.0, 8.0, 6.0],
+       ...     [11.0, 5.0, 2.0],
+       ...     [ 8.0, 3.0, 0.0],
+       ... ])
+       >>> poly_ids, roots = algebraic_intersection.bezier_roots_multi(coeffs)
+       >>> poly_ids
+       array([0, 0, 1, 1, 2, 2])
+       >>> roots
+       array([ 2., -3.,  2.,  4.,  3.,  1.])
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients in
+            the Bernstein basis, one column per polynomial.
+        unit_interval (Optional[bool]): Flag indicating if only the (real)
+            roots in :math:`\left[0, 1\right]` should be computed, as in
+            :func:`bezier_roots`. Defaults to :data:`False`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: A pair of
+
+        * A 1D array with the index (i.e. column) of the polynomial that
+          each root belongs to, in increasing order.
+        * A 1D array containing the roots. For each polynomial, these are
+          the same (up to round-off and in the same order) as the roots
+          computed by :func:`bezier_roots`.
+    """
+    if unit_interval:
+        return _subdivision_roots(coeffs)
+
+    degree = coeffs.shape[0] - 1
+    effective_degrees, is_zero = _effective_degrees(coeffs)
+    all_ids = []
+    all_roots = []
+    for effective_degree in np.unique(effective_degrees):
+        if effective_degree == 0:
+            continue
+
+        poly_ids = np.flatnonzero(
+            (effective_degrees == effective_degree) & ~is_zero
+        )
+        sigma_coeffs = _sigma_coeffs_multi(
+            coeffs[:, poly_ids], effective_degree
+        )
+        ids, roots = _finite_roots(poly_ids, _companion_eigvals(sigma_coeffs))
+        all_ids.append(ids)
+        all_roots.append(roots)
+
+    # Add a root at ``s = 1`` for each factor of ``(1 - s)``.
+    num_ones = degree - effective_degrees
+    all_ids.append(np.repeat(np.arange(coeffs.shape[1]), num_ones))
+    all_roots.append(np.ones(np.sum(num_ones)))
+
+    poly_ids = np.concatenate(all_ids)
+    roots = np.concatenate(all_roots)
+    order = np.argsort(poly_ids, kind="stable")
+    return poly_ids[order], roots[order]
+
+
+def _effective_degrees(coeffs):
+    """Find the "effective degree" of many polynomials.
+
+    The effective degree is the degree once all factors of :math:`(1 - s)`
+    are removed, i.e. the index of the last non-zero coefficient.
+
+    .. note::
+
+       This is a helper for :func:`bezier_roots_multi`.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients in
+            the Bernstein basis, one column per polynomial.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The effective degree of each
+        polynomial and a flag for each polynomial that is identically
+        zero. (The effective degree of the zero polynomial is ``n``, since
+        :func:`bezier_roots` finds no roots for it.)
+    """
+    degree = coeffs.shape[0] - 1
+    nonzero = coeffs != 0.0
+    is_zero = ~np.any(nonzero, axis=0)
+    effective_degrees = degree - np.argmax(nonzero[::-1, :], axis=0)
+    effective_degrees[is_zero] = degree
+    return effective_degrees, is_zero
+
+
+def _sigma_coeffs_multi(coeffs, effective_degree):
+    r"""Compute the monic :math:`\sigma`-polynomials for many polynomials.
+
+    This is a batched version of :func:`_get_sigma_coeffs` for
+    polynomials that share the same effective degree.
+
+    .. note::
+
+       This is a helper for :func:`bezier_roots_multi`.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients in
+            the Bernstein basis, one column per polynomial.
+        effective_degree (int): The index of the last non-zero coefficient
+            (the same for every polynomial).
+
+    Returns:
+        numpy.ndarray: The ``d x K`` non-lead coefficients of the monic
+        polynomials, where ``d`` is ``effective_degree`` (as expected by
+        :func:`_companion_eigvals`).
+    """
+    degree = coeffs.shape[0] - 1
+    sigma_coeffs = coeffs[:effective_degree, :] / coeffs[effective_degree, :]
+    # See ``_get_sigma_coeffs()`` for the binomial coefficient ratios.
+    binom_numerator = effective_degree
+    binom_denominator = degree - effective_degree + 1
+    for exponent in range(effective_degree - 1, -1, -1):
+        sigma_coeffs[exponent, :] *= binom_numerator
+        sigma_coeffs[exponent, :] /= binom_denominator
+        binom_numerator *= exponent
+        binom_denominator *= degree - exponent + 1
+    return sigma_coeffs
+
+
+def _finite_roots(poly_ids, sigma_roots):
+    r"""Convert roots in :math:`\sigma` into roots in :math:`s`.
+
+    Roots at :math:`\sigma = -1` (i.e. "points at infinity") are dropped.
+
+    .. note::
+
+       This is a helper for :func:`bezier_roots_multi`.
+
+    Args:
+        poly_ids (numpy.ndarray): The index of each polynomial.
+        sigma_roots (numpy.ndarray): A ``K x d`` array of the roots of the
+            :math:`\sigma`-polynomial for each polynomial.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The index of the polynomial
+        for each remaining root and the roots :math:`s = \sigma / (1 +
+        \sigma)`.
+    """
+    # We want the error ||(sigma - (-1))|| ~= 2^{-52}
+    to_keep = np.abs(sigma_roots + 1.0) > _SIGMA_THRESHOLD
+    sigma_roots = sigma_roots[to_keep]
+    ids = np.repeat(poly_ids, np.sum(to_keep, axis=1))
+    return ids, sigma_roots / (1.0 + sigma_roots)
+
+
+def _sign_variations(coeffs):
+    """Count the sign variations in many coefficient sequences.
+
+    Zero coefficients are skipped, e.g. ``[1, 0, -1]`` has one variation.
+
+    Args:
+        coeffs (numpy.ndarray): A ``K x N`` array, one sequence per row.
+
+    Returns:
+        numpy.ndarray: The number of sign variations in each row.
+    """
+    signs = np.sign(coeffs)
+    _, num_coeffs = coeffs.shape
+    # Replace each zero with the last non-zero sign before it.
+    last_nonzero = np.where(signs != 0.0, np.arange(num_coeffs), 0)
+    np.maximum.accumulate(last_nonzero, axis=1, out=last_nonzero)
+    signs = np.take_along_axis(signs, last_nonzero, axis=1)
+    return np.sum(signs[:, 1:] * signs[:, :-1] < 0.0, axis=1)
+
+
+def _bernstein_value(coeffs, s_vals):
+    """Evaluate many polynomials (and derivatives) in the Bernstein basis.
+
+    Uses the de Casteljau algorithm.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients
+            (with ``n > 0``), one column per polynomial.
+        s_vals (numpy.ndarray): The parameter to evaluate each polynomial at.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The values and derivatives.
+    """
+    num_nodes, _ = coeffs.shape
+    complements = 1.0 - s_vals
+    values = coeffs
+    for _ in range(num_nodes - 2):
+        values = complements * values[:-1, :] + s_vals * values[1:, :]
+    derivs = (num_nodes - 1) * (values[1, :] - values[0, :])
+    return complements * values[0, :] + s_vals * values[1, :], derivs
+
+
+def _polish_roots(coeffs, starts, ends):
+    """Polish isolated roots of many polynomials in the Bernstein basis.
+
+    Uses Newton's method, falling back to bisection when a Newton step
+    would leave the current bracket around the root.
+
+    .. note::
+
+       This assumes, but doesn't check, that each polynomial changes sign
+       between the ends of its bracket.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients,
+            one column per root.
+        starts (numpy.ndarray): The start of the bracket for each root.
+        ends (numpy.ndarray): The end of the bracket for each root.
+
+    Returns:
+        numpy.ndarray: The polished roots.
+    """
+    starts = np.array(starts, dtype=np.float64)
+    ends = np.array(ends, dtype=np.float64)
+    start_signs = np.sign(_bernstein_value(coeffs, starts)[0])
+    s_vals = 0.5 * (starts + ends)
+    # Only the roots which have not yet converged are updated.
+    active = np.arange(s_vals.size)
+    for _ in range(_POLISH_MAX_STEPS):
+        values, derivs = _bernstein_value(coeffs[:, active], s_vals[active])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = values / derivs
+        converged = (values == 0.0) | (np.abs(steps) <= _POLISH_EPS)
+        s_vals[active[converged]] -= np.where(
+            values[converged] == 0.0, 0.0, steps[converged]
+        )
+        # Shrink the bracket, then take a Newton step if it stays inside
+        # the bracket or bisect if it doesn't.
+        current = s_vals[active]
+        same_sign = np.sign(values) == start_signs[active]
+        starts[active] = np.where(same_sign, current, starts[active])
+        ends[active] = np.where(same_sign, ends[active], current)
+        newton_vals = current - steps
+        inside = (starts[active] < newton_vals) & (newton_vals < ends[active])
+        updated = np.where(
+            inside, newton_vals, 0.5 * (starts[active] + ends[active])
+        )
+        active = active[~converged]
+        s_vals[active] = updated[~converged]
+        if active.size == 0:
+            break
+
+    return s_vals
+
+
+def _subdivision_roots(coeffs):
+    r"""Find the roots in the unit interval of many Bernstein polynomials.
+
+    Isolates the roots by repeatedly subdividing :math:`\left[0, 1\right]`
+    (all polynomials and sub-intervals at once). The Bernstein coefficients
+    on a sub-interval bound the polynomial there, so a sub-interval is
+    discarded as soon as its coefficients have no sign variations and a
+    root is isolated when there is exactly one sign variation (with
+    non-zero coefficients at both ends), see :func:`_isolate_roots`. Each
+    isolated root is then polished with :func:`_polish_roots`.
+
+    A sub-interval which still has more than one sign variation after
+    ``_ISOLATION_DEPTH`` subdivisions contains a cluster of roots (e.g. a
+    root of higher multiplicity) and its midpoint is used as a root.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients in
+            the Bernstein basis, one column per polynomial.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The index (i.e. column) of the
+        polynomial that each root belongs to, in increasing order, and the
+        real roots in :math:`\left[0, 1\right]` (in increasing order for
+        each polynomial).
+    """
+    num_nodes, _ = coeffs.shape
+    if num_nodes == 1:
+        # A constant polynomial is either zero or has no roots.
+        return np.empty((0,), dtype=np.intp), np.empty((0,))
+
+    poly_ids = np.flatnonzero(np.any(coeffs != 0.0, axis=0))
+    (bracket_ids, starts, ends), found = _isolate_roots(coeffs, poly_ids)
+    # Roots at the ends of the unit interval.
+    at_start = poly_ids[coeffs[0, poly_ids] == 0.0]
+    found.append((at_start, np.zeros(at_start.size)))
+    at_end = poly_ids[coeffs[-1, poly_ids] == 0.0]
+    found.append((at_end, np.ones(at_end.size)))
+    found.append(
+        (bracket_ids, _polish_roots(coeffs[:, bracket_ids], starts, ends))
+    )
+
+    found_ids = np.concatenate([ids for ids, _ in found])
+    found_roots = np.concatenate([roots for _, roots in found])
+    order = np.lexsort((found_roots, found_ids))
+    return found_ids[order], found_roots[order]
+
+
+def _isolate_roots(coeffs, poly_ids):
+    r"""Isolate the roots in the unit interval of many Bernstein polynomials.
+
+    .. note::
+
+       This is a helper for :func:`_subdivision_roots`. It does not find
+       roots at the ends of :math:`\left[0, 1\right]`.
+
+    Args:
+        coeffs (numpy.ndarray): A ``(n + 1) x K`` array of coefficients in
+            the Bernstein basis, one column per polynomial.
+        poly_ids (numpy.ndarray): The (indices of the) polynomials that
+            are not identically zero.
+
+    Returns:
+        Tuple[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray], list]:
+        Pair of
+
+        * The polynomial, start and end of each bracket that isolates a
+          (simple) root.
+        * The roots found without a bracket (at the midpoint of a
+          sub-interval or for a cluster of roots), as a list of pairs of
+          polynomial indices and roots.
+    """
+    matrices = matrix_cache.get_matrices(
+        "curve-subdivide",
+        coeffs.shape[0] - 1,
+        _py_curve_helpers.make_subdivision_matrices,
+    )
+    brackets = []
+    found = []
+    sub_coeffs = coeffs[:, poly_ids].T
+    starts = np.zeros(poly_ids.size)
+    width = 1.0
+    for depth in range(_ISOLATION_DEPTH + 1):
+        final = depth == _ISOLATION_DEPTH
+        isolated, remaining = _classify_intervals(sub_coeffs, final)
+        brackets.append(
+            (poly_ids[isolated], starts[isolated], starts[isolated] + width)
+        )
+        sub_coeffs = sub_coeffs[remaining, :]
+        poly_ids = poly_ids[remaining]
+        starts = starts[remaining]
+        if poly_ids.size == 0:
+            break
+
+        if not final:
+            width *= 0.5
+            left_coeffs = _py_helpers.matrix_product(sub_coeffs, matrices[0])
+            # Roots at the midpoint of a sub-interval.
+            at_middle = left_coeffs[:, -1] == 0.0
+            found.append((poly_ids[at_middle], starts[at_middle] + width))
+
+            poly_ids = np.tile(poly_ids, 2)
+            starts = np.concatenate([starts, starts + width])
+            right_coeffs = _py_helpers.matrix_product(sub_coeffs, matrices[1])
+            sub_coeffs = np.vstack([left_coeffs, right_coeffs])
+
+    # Any remaining sub-intervals are as small as we allow, so the cluster
+    # of roots in each is replaced by its midpoint.
+    found.append((poly_ids, starts + 0.5 * width))
+    return tuple(np.concatenate(values) for values in zip(*brackets)), found
+
+
+def _classify_intervals(sub_coeffs, final):
+    """Classify sub-intervals by the sign variations of their coefficients.
+
+    The Bernstein coefficients on a sub-interval bound the polynomial
+    there, so a sub-interval with no sign variations contains no roots and
+    a sub-interval with exactly one sign variation (and non-zero
+    coefficients of opposite sign at both ends) contains exactly one
+    root.
+
+    .. note::
+
+       This is a helper for :func:`_isolate_roots`.
+
+    Args:
+        sub_coeffs (numpy.ndarray): A ``M x (n + 1)`` array of coefficients
+            on each sub-interval, one row per sub-interval.
+        final (bool): Indicates if the sub-intervals can no longer be
+            subdivided. In that case, every sub-interval with a sign change
+            between its ends is treated as isolating a root.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Flags for the sub-intervals
+        which isolate a root and for the sub-intervals that still contain
+        roots (i.e. which should be subdivided or, if ``final``, contain a
+        cluster of roots).
+    """
+    variations = _sign_variations(sub_coeffs)
+    opposite = sub_coeffs[:, 0] * sub_coeffs[:, -1] < 0.0
+    if final:
+        isolated = (variations > 0) & opposite
+    else:
+        isolated = (variations == 1) & opposite
+    return isolated, (variations > 0) & ~isolated
+
+
 def lu_companion(top_row, value):
     r"""Compute an LU-factored :math:`C - t I` and its 1-norm.
 
@@ -1154,6 +1662,89 @@ def roots_in_unit_interval(coeffs):
     return all_roots[real_inds].real
 
 
+def _make_wiggle_bernstein_matrix(degree):
+    r"""Make the matrix that converts power basis to Bernstein coefficients.
+
+    The Bernstein coefficients are with respect to the (slightly widened)
+    interval :math:`\left[a, b\right]` used by
+    :func:`roots_in_unit_interval`. First the polynomial is re-parameterized
+    via :math:`s = a + (b - a) u` so that
+
+    .. math::
+
+       \sum_{i = 0}^d p_i s^i = \sum_{k = 0}^d q_k u^k, \qquad
+       q_k = (b - a)^k \sum_{i = k}^d \binom{i}{k} a^{i - k} p_i
+
+    and then the power basis in :math:`u` is converted to the Bernstein
+    basis via :math:`b_j = \sum_{k = 0}^j \binom{j}{k} q_k / \binom{d}{k}`.
+
+    The result is stored in the shared :mod:`.matrix_cache` by
+    :func:`intersect_curves_many`, so the matrix is only built once for
+    each degree.
+
+    Args:
+        degree (int): The degree of the polynomial.
+
+    Returns:
+        numpy.ndarray: The matrix which maps a column of power basis
+        coefficients (in increasing order) to Bernstein coefficients.
+    """
+    # Pascal's triangle: ``binomial[row, k]`` is ``row`` choose ``k``.
+    binomial = np.zeros((degree + 1, degree + 1), order="F")
+    binomial[:, 0] = 1.0
+    for row in range(1, degree + 1):
+        binomial[row, 1:] = binomial[row - 1, 1:] + binomial[row - 1, :-1]
+
+    start = _UNIT_INTERVAL_WIGGLE_START
+    width = _UNIT_INTERVAL_WIGGLE_END - _UNIT_INTERVAL_WIGGLE_START
+    shift = np.zeros((degree + 1, degree + 1), order="F")
+    for k in range(degree + 1):
+        for i in range(k, degree + 1):
+            shift[k, i] = width ** k * binomial[i, k] * start ** (i - k)
+    to_bernstein = binomial / binomial[degree, :]
+    return _py_helpers.matrix_product(to_bernstein, shift)
+
+
+def roots_in_unit_interval_multi(coeffs):
+    r"""Compute roots of many polynomials in the unit interval.
+
+    This is a batched version of :func:`roots_in_unit_interval`. All of
+    the companion matrices are solved together and the roots are filtered
+    without a loop over polynomials.
+
+    .. note::
+
+       This assumes, but doesn't check, that the lead coefficient of each
+       polynomial is not zero (e.g. the polynomials have been passed
+       through :func:`_strip_leading_zeros`).
+
+    Args:
+        coeffs (numpy.ndarray): A ``(d + 1) x K`` array of coefficients in
+            monomial / power basis, one column per polynomial.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: A pair of
+
+        * A 1D array with the index (i.e. column) of the polynomial that
+          each root belongs to, in increasing order.
+        * A 1D array of real values in :math:`\left[0, 1\right]`.
+    """
+    num_coeffs, _ = coeffs.shape
+    if num_coeffs == 1:
+        return np.empty(0, dtype=np.intp), np.empty(0)
+
+    all_roots = _companion_eigvals(coeffs[:-1, :] / coeffs[-1, :])
+    # Only keep roots inside or very near to the unit interval and with
+    # very small imaginary part. (Really only keep the real parts.)
+    to_keep = (
+        (_UNIT_INTERVAL_WIGGLE_START < all_roots.real)
+        & (all_roots.real < _UNIT_INTERVAL_WIGGLE_END)
+        & (np.abs(all_roots.imag) < _IMAGINARY_WIGGLE)
+    )
+    poly_ids, _ = np.nonzero(to_keep)
+    return poly_ids, all_roots[to_keep].real
+
+
 def _strip_leading_zeros(coeffs, threshold=_COEFFICIENT_THRESHOLD):
     r"""Strip leading zero coefficients from a polynomial.
 
@@ -1258,6 +1849,67 @@ def _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t):
     final_t.append(t_val)
 
 
+def _prepare_polynomial(coeffs, strip=False):
+    r"""Prepare an **intersection polynomial** for root finding.
+
+    Helper for :func:`intersect_curves` and :func:`intersect_curves_many`.
+
+    Args:
+        coeffs (numpy.ndarray): The coefficients (in power basis) of the
+            **intersection polynomial** :math:`g(t) = f_1(x_2(t), y_2(t))`.
+            These will be modified.
+        strip (Optional[bool]): Indicates if (numerically) zero leading
+            coefficients should be removed. This is needed when ``coeffs``
+            come from an interpolant, since round-off can leave tiny
+            leading coefficients that would produce spurious roots.
+            Defaults to :data:`False`.
+
+    Returns:
+        numpy.ndarray: The normalized coefficients.
+
+    Raises:
+        NotImplementedError: If the "intersection polynomial" is
+            all zeros -- which indicates coincident curves.
+    """
+    coeffs = normalize_polynomial(coeffs)
+    if np.all(coeffs == 0.0):
+        raise NotImplementedError(_COINCIDENT_ERR)
+
+    if strip:
+        coeffs = _strip_leading_zeros(coeffs)
+    return coeffs
+
+
+def _intersect_at_roots(nodes1, nodes2, t_vals):
+    """Find the intersections at the roots of an **intersection polynomial**.
+
+    Helper for :func:`intersect_curves` and :func:`intersect_curves_many`.
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes in the first (implicitized) curve.
+        nodes2 (numpy.ndarray): The nodes in the second curve.
+        t_vals (numpy.ndarray): The roots of the **intersection polynomial**
+            in the unit interval.
+
+    Returns:
+        numpy.ndarray: ``2 x N`` array of intersection parameters
+        ``s`` (along ``nodes1``) and ``t`` (along ``nodes2``).
+    """
+    final_s = []
+    final_t = []
+    for t_val in t_vals:
+        (x_val,), (y_val,) = _curve_helpers.evaluate_multi(
+            nodes2, np.asfortranarray([t_val])
+        )
+        s_val = locate_point(nodes1, x_val, y_val)
+        if s_val is not None:
+            _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t)
+    result = np.zeros((2, len(final_s)), order="F")
+    result[0, :] = final_s
+    result[1, :] = final_t
+    return result
+
+
 def intersect_curves(nodes1, nodes2):
     r"""Intersect two parametric B |eacute| zier curves.
 
@@ -1283,26 +1935,12 @@ def intersect_curves(nodes1, nodes2):
     if num_nodes1 > num_nodes2:
         nodes1, nodes2 = nodes2, nodes1
         swapped = True
-    coeffs = normalize_polynomial(to_power_basis(nodes1, nodes2))
-    if np.all(coeffs == 0.0):
-        raise NotImplementedError(_COINCIDENT_ERR)
-
+    coeffs = _prepare_polynomial(to_power_basis(nodes1, nodes2))
     _check_non_simple(coeffs)
     t_vals = roots_in_unit_interval(coeffs)
-    final_s = []
-    final_t = []
-    for t_val in t_vals:
-        (x_val,), (y_val,) = _curve_helpers.evaluate_multi(
-            nodes2, np.asfortranarray([t_val])
-        )
-        s_val = locate_point(nodes1, x_val, y_val)
-        if s_val is not None:
-            _resolve_and_add(nodes1, s_val, final_s, nodes2, t_val, final_t)
-    result = np.zeros((2, len(final_s)), order="F")
+    result = _intersect_at_roots(nodes1, nodes2, t_vals)
     if swapped:
-        final_s, final_t = final_t, final_s
-    result[0, :] = final_s
-    result[1, :] = final_t
+        result = np.asfortranarray(result[::-1, :])
     return result
 
 
@@ -1441,3 +2079,345 @@ def all_intersections(nodes_first, nodes_second):
         return np.empty((2, 0), order="F"), False
 
     return intersect_curves(nodes_first, nodes_second), False
+
+
+def intersect_curves_many(nodes1, nodes_others, implicit=None):
+    r"""Intersect one parametric B |eacute| zier curve with many others.
+
+    This is the same as calling :func:`intersect_curves` for each pair, but
+    the first curve is only implicitized once (see :class:`ImplicitCurve`)
+    and its implicit function :math:`f_1(x, y)` is evaluated at the sample
+    points of **every** partner in a single vectorized pass. The
+    **intersection polynomials** of the same degree are then converted to
+    power basis together. Any polynomial whose Bernstein coefficients (on
+    a slightly widened unit interval) all have the same sign can't have
+    a root there, so it is rejected without solving for its roots.
+
+    .. note::
+
+       Unlike :func:`intersect_curves`, the first curve is always the one
+       that is implicitized (even if it has a higher degree than a
+       partner), so only its degree is limited to ``1``, ``2`` or ``3``.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    .. testsetup:: intersect-curves-many
+
+       import numpy as np
+       from bezier.hazmat import algebraic_intersection
+
+    .. doctest:: intersect-curves-many
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 0.5, 1.0],
+       ...     [0.0, 1.0, 0.0],
+       ... ])
+       >>> nodes_others = [
+       ...     np.asfortranarray([[0.0, 1.0], [0.375, 0.375]]),
+       ...     np.asfortranarray([[0.5, 0.5], [0.0, 1.0]]),
+       ... ]
+       >>> first, second = algebraic_intersection.intersect_curves_many(
+       ...     nodes1, nodes_others
+       ... )
+       >>> first
+       array([[0.25, 0.75],
+              [0.25, 0.75]])
+       >>> second
+       array([[0.5],
+              [0.5]])
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes in the first curve.
+        nodes_others (Sequence[numpy.ndarray]): The nodes in each of the
+            curves to intersect with the first.
+        implicit (Optional[ImplicitCurve]): The (cached) implicit form of
+            the first curve. If not provided, it will be computed.
+
+    Returns:
+        List[numpy.ndarray]: A ``2 x N`` array of intersection parameters
+        for each curve in ``nodes_others`` (see :func:`intersect_curves`).
+
+    Raises:
+        NotImplementedError: If an "intersection polynomial" is
+            all zeros -- which indicates coincident curves.
+        NotImplementedError: If the product of the degrees of the first
+            curve and a partner is not one of the supported degrees of an
+            "intersection polynomial".
+        NotImplementedError: If an "intersection polynomial" that is not
+            rejected has non-simple roots.
+
+        Any of these errors (for a single partner) aborts the whole call,
+        so no intersections are returned for the other partners either.
+        Call :func:`intersect_curves` for each pair to isolate a failure.
+    """
+    if implicit is None:
+        implicit = ImplicitCurve(nodes1)
+    all_nodes2 = [
+        _curve_helpers.full_reduce(nodes2) for nodes2 in nodes_others
+    ]
+    if not all_nodes2:
+        return []
+
+    all_values = _sample_implicit_many(implicit, all_nodes2)
+    all_coeffs = _power_basis_many(all_values)
+    all_t_vals = _roots_many(all_coeffs)
+    return [
+        _intersect_at_roots(implicit.nodes, nodes2, t_vals)
+        for nodes2, t_vals in zip(all_nodes2, all_t_vals)
+    ]
+
+
+def _sample_implicit_many(implicit, all_nodes2):
+    """Sample the **intersection polynomials** of one curve and many others.
+
+    .. note::
+
+       This is a helper for :func:`intersect_curves_many`.
+
+    Args:
+        implicit (ImplicitCurve): The implicit form of the first curve.
+        all_nodes2 (List[numpy.ndarray]): The (reduced) nodes in each of
+            the curves to intersect with the first.
+
+    Returns:
+        List[numpy.ndarray]: The values of each **intersection polynomial**
+        at the Chebyshev nodes (on the unit interval) used to recover its
+        power basis coefficients.
+
+    Raises:
+        NotImplementedError: If the product of the degrees of the first
+            curve and a partner is not one of the supported degrees of an
+            "intersection polynomial".
+    """
+    _, num_nodes1 = implicit.nodes.shape
+    sizes = []
+    sample_points = []
+    for nodes2 in all_nodes2:
+        _, num_nodes2 = nodes2.shape
+        degree = (num_nodes1 - 1) * (num_nodes2 - 1)
+        if degree not in _POWER_BASIS_SAMPLES:
+            raise NotImplementedError(
+                "Degree 1",
+                num_nodes1 - 1,
+                "Degree 2",
+                num_nodes2 - 1,
+                _POWER_BASIS_MANY_ERR,
+            )
+        sizes.append(degree + 1)
+        sample_points.append(
+            _curve_helpers.evaluate_multi(nodes2, _POWER_BASIS_SAMPLES[degree])
+        )
+
+    values = implicit.evaluate_multi(np.hstack(sample_points))
+    return np.split(values, np.cumsum(sizes))[:-1]
+
+
+def _power_basis_many(all_values):
+    """Convert sampled **intersection polynomials** to power basis.
+
+    The polynomials of the same degree are interpolated together.
+
+    .. note::
+
+       This is a helper for :func:`intersect_curves_many`.
+
+    Args:
+        all_values (List[numpy.ndarray]): The values of each polynomial
+            (see :func:`_sample_implicit_many`).
+
+    Returns:
+        List[numpy.ndarray]: The (normalized and stripped) power basis
+        coefficients of each polynomial.
+
+    Raises:
+        NotImplementedError: If a polynomial is all zeros -- which
+            indicates coincident curves.
+    """
+    sizes = [values.size for values in all_values]
+    all_coeffs = [None] * len(all_values)
+    for size in sorted(set(sizes)):
+        indices = [index for index, other in enumerate(sizes) if other == size]
+        group_coeffs = _interpolate_power_basis(
+            np.column_stack([all_values[index] for index in indices])
+        )
+        for column, index in enumerate(indices):
+            all_coeffs[index] = _prepare_polynomial(
+                np.array(group_coeffs[:, column], order="F"), strip=True
+            )
+    return all_coeffs
+
+
+def _roots_many(all_coeffs):
+    """Find the unit interval roots of many **intersection polynomials**.
+
+    The (stripped) polynomials of the same degree are solved together. Any
+    polynomial with Bernstein coefficients (on the interval where roots are
+    kept) of a single sign has no roots there, so it is skipped.
+
+    .. note::
+
+       This is a helper for :func:`intersect_curves_many`.
+
+    Args:
+        all_coeffs (List[numpy.ndarray]): The power basis coefficients of
+            each polynomial.
+
+    Returns:
+        List[numpy.ndarray]: The sorted roots of each polynomial.
+
+    Raises:
+        NotImplementedError: If a polynomial that is not skipped has
+            non-simple roots.
+    """
+    all_t_vals = [np.empty((0,))] * len(all_coeffs)
+    sizes = [coeffs.size for coeffs in all_coeffs]
+    for size in sorted(set(sizes)):
+        indices = np.asarray(
+            [index for index, other in enumerate(sizes) if other == size]
+        )
+        group_coeffs = np.column_stack(
+            [all_coeffs[index] for index in indices]
+        )
+        to_bernstein = matrix_cache.get_matrices(
+            "wiggle-bernstein", size - 1, _make_wiggle_bernstein_matrix
+        )
+        bernstein = _py_helpers.matrix_product(to_bernstein, group_coeffs)
+        has_roots = ~(
+            np.all(bernstein > 0.0, axis=0) | np.all(bernstein < 0.0, axis=0)
+        )
+        indices = indices[has_roots]
+        for index in indices:
+            _check_non_simple(all_coeffs[index])
+        poly_ids, roots = roots_in_unit_interval_multi(
+            group_coeffs[:, has_roots]
+        )
+        splits = np.searchsorted(poly_ids, np.arange(1, len(indices)))
+        for index, t_vals in zip(indices, np.split(roots, splits)):
+            all_t_vals[index] = np.sort(t_vals)
+    return all_t_vals
+
+
+class ImplicitCurve:
+    r"""The implicitized `algebraic curve`_ containing a planar curve.
+
+    Each call to :func:`evaluate` computes a (modified) Sylvester
+    determinant. When a curve is intersected with many others, the same
+    implicit function :math:`f(x, y)` is evaluated again and again, so
+    this computes it once in a form that is cheap to evaluate at many
+    points at once.
+
+    For a curve of degree :math:`d`, :math:`f(x, y)` has degree at most
+    :math:`d` in each of :math:`x` and :math:`y`. Hence it is reproduced
+    (up to round-off) by a tensor product Chebyshev interpolant on a
+    :math:`(d + 1) \times (d + 1)` grid of points, which is placed over
+    the bounding box of the curve.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    .. testsetup:: implicit-curve
+
+       import numpy as np
+       from bezier.hazmat import algebraic_intersection
+
+    .. doctest:: implicit-curve
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 1.0, 1.0],
+       ...     [2.0, 0.0, 1.0],
+       ... ])
+       >>> implicit = algebraic_intersection.ImplicitCurve(nodes)
+       >>> points = np.asfortranarray([
+       ...     [0.0, 1.0, 0.5 ,  2.0],
+       ...     [0.0, 1.0, 2.0 , -1.0],
+       ... ])
+       >>> values = implicit.evaluate_multi(points)
+       >>> np.round(values, 12) + 0.0
+       array([12. ,  0. , -1.75,  5. ])
+
+    Args:
+        nodes (numpy.ndarray): The nodes in the curve. These are reduced
+            (see :func:`.full_reduce`) before implicitizing.
+
+    Raises:
+        ValueError: If the curve is a point.
+        .UnsupportedDegree: If the (reduced) degree is not 1, 2 or 3.
+    """
+
+    __slots__ = ("nodes", "center", "radius", "coeffs")
+
+    def __init__(self, nodes):
+        nodes = _curve_helpers.full_reduce(nodes)
+        _, num_nodes = nodes.shape
+        left, right, bottom, top = _helpers.bbox(nodes)
+        self.nodes = nodes
+        self.center = np.asfortranarray(
+            [[0.5 * (left + right)], [0.5 * (bottom + top)]]
+        )
+        self.radius = 0.5 * max(right - left, top - bottom)
+        grid = chebyshev.chebpts1(num_nodes)
+        x_vals = self.center[0, 0] + self.radius * grid
+        y_vals = self.center[1, 0] + self.radius * grid
+        values = _evaluate_grid(nodes, x_vals, y_vals)
+        # Solve V C V^T = F for the coefficients C.
+        vandermonde = chebyshev.chebvander(grid, num_nodes - 1)
+        partial = np.linalg.solve(vandermonde, values)
+        self.coeffs = np.linalg.solve(vandermonde, partial.T).T
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current implicit curve's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "nodes": self.nodes,
+            "center": self.center,
+            "radius": self.radius,
+            "coeffs": self.coeffs,
+        }
+
+    def evaluate_multi(self, points):
+        r"""Evaluate the implicit function :math:`f(x, y)` at many points.
+
+        Args:
+            points (numpy.ndarray): A ``2 x N`` array of points.
+
+        Returns:
+            numpy.ndarray: The ``N`` values of :math:`f(x, y)`.
+        """
+        scaled = (points - self.center) / self.radius
+        return chebyshev.chebval2d(scaled[0, :], scaled[1, :], self.coeffs)
+
+
+def _evaluate_grid(nodes, x_vals, y_vals):
+    """Evaluate the implicit function :math:`f(x, y)` on a tensor grid.
+
+    .. note::
+
+       This is a helper for :class:`ImplicitCurve`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes in the curve.
+        x_vals (numpy.ndarray): The :math:`x`-coordinates of the grid.
+        y_vals (numpy.ndarray): The :math:`y`-coordinates of the grid.
+
+    Returns:
+        numpy.ndarray: The values :math:`f(x_i, y_j)` (with ``i`` indexing
+        rows and ``j`` indexing columns).
+    """
+    values = np.empty((x_vals.size, y_vals.size), order="F")
+    for i, x_val in enumerate(x_vals):
+        for j, y_val in enumerate(y_vals):
+            values[i, j] = evaluate(nodes, x_val, y_val)
+    return values
@@ -23,7 +23,9 @@ bounded distance from the line connecting the start and end points of a
 B |eacute| zier curve.)
 
 It has `quadratic convergence`_. It can be used to find tangent intersections,
-which is the primary usage within ``bezier``.
+which is the primary usage within ``bezier``. A complete curve-curve
+intersection algorithm built on clipping (:func:`all_intersections`) is
+available via the :attr:`~.IntersectionStrategy.CLIPPING` strategy.
 
 .. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
    :trim:
@@ -31,13 +33,42 @@ which is the primary usage within ``bezier``.
 
 import numpy as np
 
+from bezier import _curve_helpers
+from bezier import _geometric_intersection
 from bezier import _helpers
+from bezier.hazmat import curve_helpers
 from bezier.hazmat import geometric_intersection
+from bezier.hazmat import helpers as _py_helpers
+from bezier.hazmat import intersection_helpers
 
 
 NO_PARALLEL = "Parallel lines not supported during clipping."
 DEFAULT_S_MIN = 1.0
 DEFAULT_S_MAX = 0.0
+# Parameter intervals narrower than this are considered converged; as with
+# the geometric strategy, this is half of the bits available so that
+# Newton's method can finish the job.
+_CONVERGED_WIDTH = 0.5 ** 26
+# Fat lines are widened (relative to the size of the coordinates of the
+# curves being intersected) to account for round-off in the computed
+# distances.
+_FAT_LINE_FUZZ = 0.5 ** 44
+# If clipping keeps more than this fraction of an interval, the interval
+# is halved instead.
+_SLOW_CLIP_RATIO = 0.8
+# Clusters of candidates narrower than this are considered converged when
+# there are too many candidates.
+_CLUSTER_WIDTH = 0.5 ** 16
+_MAX_CLIP_ITERATIONS = 128
+_MAX_CANDIDATES = 64
+_TOO_MANY_TEMPLATE = (
+    "The number of candidate intersections is too high.\n"
+    "{:d} candidate pairs."
+)
+_NO_CONVERGE_TEMPLATE = (
+    "Curve intersection failed to converge via clipping "
+    "after {:d} iterations."
+)
 
 
 def compute_implicit_line(nodes):
@@ -432,3 +463,685 @@ def clip_range(nodes1, nodes2):
                 polynomial[:, end_index],
             )
     return _check_parameter_range(s_min, s_max)
+
+
+def _clipping_fat_line(nodes_fat, nodes_clipped):
+    """Compute the fat line used to clip one curve against another.
+
+    .. note::
+
+       This is a helper for :func:`_clip_interval`.
+
+    This is the same as :func:`compute_fat_line`, unless the first and last
+    node in ``nodes_fat`` are identical. In that case, the implicit line is
+    undefined, so the fat line is centered at the first node and is
+    perpendicular to the line connecting the endpoints of
+    ``nodes_clipped``. If the endpoints of ``nodes_clipped`` are also
+    identical, the line is :math:`0 = 0`, i.e. every point is on it.
+
+    Args:
+        nodes_fat (numpy.ndarray): ``2 x N1`` array of nodes in a curve
+            which will define the clipping region.
+        nodes_clipped (numpy.ndarray): ``2 x N2`` array of nodes in a curve
+            which will be clipped.
+
+    Returns:
+        Tuple[float, float, float, float, float]: The coefficients
+        :math:`a, b, c` of the implicit line and the minimum and maximum
+        (signed) distance of the control points in ``nodes_fat`` from it.
+    """
+    if np.all(nodes_fat[:, 0] == nodes_fat[:, -1]):
+        delta = nodes_clipped[:, -1] - nodes_clipped[:, 0]
+        length = np.linalg.norm(delta, ord=2)
+        if length == 0.0:
+            return 0.0, 0.0, 0.0, 0.0, 0.0
+
+        coeff_a = delta[0] / length
+        coeff_b = delta[1] / length
+        coeff_c = -coeff_a * nodes_fat[0, 0] - coeff_b * nodes_fat[1, 0]
+        distances = (
+            coeff_a * nodes_fat[0, :] + coeff_b * nodes_fat[1, :] + coeff_c
+        )
+        return (
+            coeff_a,
+            coeff_b,
+            coeff_c,
+            min(0.0, np.min(distances)),
+            max(0.0, np.max(distances)),
+        )
+
+    return compute_fat_line(nodes_fat)
+
+
+def _hull_extent(polynomial, d_min, d_max):
+    """Find the extent of a convex hull within a horizontal strip.
+
+    .. note::
+
+       This is a helper for :func:`_clip_interval`.
+
+    The extent includes every control point **inside** the strip and every
+    crossing of a strip boundary by a segment connecting two control
+    points. (Segments parallel to the boundary never cross it.)
+
+    Args:
+        polynomial (numpy.ndarray): ``2 x N`` array of the control points
+            of the distance polynomial (see :func:`_clip_range_polynomial`).
+        d_min (float): The bottom of the strip.
+        d_max (float): The top of the strip.
+
+    Returns:
+        Tuple[float, float]: The minimum and maximum parameter of the
+        convex hull within the strip. If the convex hull does not intersect
+        the strip, the minimum will be greater than the maximum.
+    """
+    params = polynomial[0, :]
+    distances = polynomial[1, :]
+    inside = params[(d_min <= distances) & (distances <= d_max)]
+    t_min = np.min(inside, initial=np.inf)
+    t_max = np.max(inside, initial=-np.inf)
+    for bound in (d_min, d_max):
+        offsets = distances - bound
+        # Consider **all** segments between two control points; those that
+        # are not edges of the convex hull can't change the extent.
+        start_index, end_index = np.nonzero(
+            np.triu(np.outer(offsets, offsets) < 0.0)
+        )
+        if start_index.size == 0:
+            continue
+
+        start_offsets = offsets[start_index]
+        crossings = params[start_index] + start_offsets * (
+            params[end_index] - params[start_index]
+        ) / (start_offsets - offsets[end_index])
+        t_min = min(t_min, np.min(crossings))
+        t_max = max(t_max, np.max(crossings))
+    return t_min, t_max
+
+
+def _clip_interval(nodes_fat, nodes_clipped, fuzz):
+    r"""Clip the parameter range of a curve against the fat line of another.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    This is similar to :func:`clip_range`, but is safe to use when
+    the curves have several intersections or when the distance polynomial
+    has control points inside the fat line. The clipped range is the
+    extent of the intersection of the convex hull of the distance
+    polynomial (see :func:`_clip_range_polynomial`) with the fat line (see
+    :func:`_hull_extent`), so there is no need to fail when a segment is
+    parallel to the fat line. The fat line is computed by
+    :func:`_clipping_fat_line`, which also handles a curve with identical
+    endpoints.
+
+    Args:
+        nodes_fat (numpy.ndarray): ``2 x N1`` array of nodes in a curve
+            which will define the clipping region.
+        nodes_clipped (numpy.ndarray): ``2 x N2`` array of nodes in a curve
+            which will be clipped.
+        fuzz (float): The amount the fat line is widened (on both sides)
+            to account for round-off.
+
+    Returns:
+        Optional[Tuple[float, float]]: The start and end parameter of the
+        clipped range of ``nodes_clipped`` or :data:`None` if the convex
+        hull of ``nodes_clipped`` does not intersect the fat line, i.e. the
+        curves can't intersect.
+    """
+    coeff_a, coeff_b, coeff_c, d_min, d_max = _clipping_fat_line(
+        nodes_fat, nodes_clipped
+    )
+    polynomial = _clip_range_polynomial(
+        nodes_clipped, coeff_a, coeff_b, coeff_c
+    )
+    t_min, t_max = _hull_extent(polynomial, d_min - fuzz, d_max + fuzz)
+    if t_min > t_max:
+        return None
+
+    return max(0.0, t_min), min(1.0, t_max)
+
+
+def _merge_candidates(candidates):
+    """Merge nearby candidates.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    Near a tangent intersection, clipping converges slowly and the
+    parameter intervals are split many times, so several (adjacent)
+    candidates converge to the same intersection. Candidates within
+    :math:`2^{-26}` of each other (in both :math:`s` and :math:`t`) are
+    merged so that Newton's method is only used once for each intersection.
+
+    Args:
+        candidates (List[Tuple[float, float, float, float]]): The start and
+            end of the :math:`s`- and :math:`t`-intervals of each candidate.
+
+    Returns:
+        List[Tuple[float, float, float, float]]: The merged candidates.
+    """
+    merged = []
+    for s_start, s_end, t_start, t_end in sorted(candidates):
+        for index, (s_min, s_max, t_min, t_max) in enumerate(merged):
+            if (
+                s_start <= s_max + _CONVERGED_WIDTH
+                and s_min <= s_end + _CONVERGED_WIDTH
+                and t_start <= t_max + _CONVERGED_WIDTH
+                and t_min <= t_end + _CONVERGED_WIDTH
+            ):
+                merged[index] = (
+                    min(s_min, s_start),
+                    max(s_max, s_end),
+                    min(t_min, t_start),
+                    max(t_max, t_end),
+                )
+                break
+
+        else:
+            merged.append((s_start, s_end, t_start, t_end))
+    return merged
+
+
+def _converge_clusters(candidates, converged):
+    """Treat small clusters of candidates as converged.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    Clipping makes little progress near a tangent intersection (or where
+    the curves nearly touch), so repeatedly halving the parameter intervals
+    produces many adjacent candidates. When there are too many candidates,
+    they are merged (see :func:`_merge_candidates`) and each merged
+    cluster with parameter intervals narrower than :math:`2^{-16}` is
+    treated as converged, i.e. Newton's method is used to find the
+    intersection in the cluster.
+
+    Args:
+        candidates (List[Tuple[float, float, float, float]]): The start and
+            end of the :math:`s`- and :math:`t`-intervals of each candidate.
+        converged (List[Tuple[float, float, float, float]]): The converged
+            candidates. Small clusters will be added to this list.
+
+    Returns:
+        List[Tuple[float, float, float, float]]: The candidates that are
+        not part of a small cluster.
+    """
+    clusters = [
+        cluster
+        for cluster in _merge_candidates(candidates)
+        if (
+            cluster[1] - cluster[0] <= _CLUSTER_WIDTH
+            and cluster[3] - cluster[2] <= _CLUSTER_WIDTH
+        )
+    ]
+    converged.extend(clusters)
+    return [
+        candidate
+        for candidate in candidates
+        if not any(
+            s_min <= candidate[0]
+            and candidate[1] <= s_max
+            and t_min <= candidate[2]
+            and candidate[3] <= t_max
+            for s_min, s_max, t_min, t_max in clusters
+        )
+    ]
+
+
+def _hodographs(nodes):
+    """Compute the control points of the first and second derivatives.
+
+    .. note::
+
+       This is a helper for :func:`_polish_tangent`.
+
+    Args:
+        nodes (numpy.ndarray): Control points of a curve.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The control points of the
+        hodograph :math:`B'(s)` and of :math:`B''(s)` (see
+        :func:`.curve_helpers.hodograph_nodes`).
+    """
+    first_deriv = curve_helpers.hodograph_nodes(nodes)
+    return first_deriv, curve_helpers.hodograph_nodes(first_deriv)
+
+
+def _polish_tangent(s, nodes1, t, nodes2):
+    """Polish an intersection where the curves are (almost) tangent.
+
+    .. note::
+
+       This is a helper for :func:`_add_converged`.
+
+    At a tangent intersection, :math:`F(s, t) = B_1(s) - B_2(t)` is only
+    determined to about half of the bits available, so Newton's method for
+    a simple root may stop short of the intersection. In this case, the
+    intersection is refined via :class:`.NewtonDoubleRoot`.
+
+    Args:
+        s (float): The parameter along the first curve.
+        nodes1 (numpy.ndarray): Control points of the first curve.
+        t (float): The parameter along the second curve.
+        nodes2 (numpy.ndarray): Control points of the second curve.
+
+    Returns:
+        Tuple[float, float]: The (possibly) polished :math:`s` and :math:`t`
+        values.
+    """
+    derivs1 = _hodographs(nodes1)
+    derivs2 = _hodographs(nodes2)
+    tangent1 = _curve_helpers.evaluate_multi(
+        derivs1[0], np.asfortranarray([s])
+    )[:, 0]
+    tangent2 = _curve_helpers.evaluate_multi(
+        derivs2[0], np.asfortranarray([t])
+    )[:, 0]
+    cross_prod = _helpers.cross_product(tangent1, tangent2)
+    scale = np.linalg.norm(tangent1, ord=2) * np.linalg.norm(tangent2, ord=2)
+    if abs(cross_prod) > _CLUSTER_WIDTH * scale:
+        return s, t
+
+    evaluate_fn = intersection_helpers.NewtonDoubleRoot(
+        nodes1, derivs1[0], derivs1[1], nodes2, derivs2[0], derivs2[1]
+    )
+    converged, polished_s, polished_t = intersection_helpers.newton_iterate(
+        evaluate_fn, s, t
+    )
+    if converged:
+        return polished_s, polished_t
+
+    return s, t
+
+
+def _refine_converged(candidate, nodes_first, nodes_second):
+    """Use Newton's method to find the intersection in a converged candidate.
+
+    .. note::
+
+       This is a helper for :func:`_add_converged`.
+
+    Newton's method (on the original curves) starts from the intersection
+    of the chords of the converged segments and falls back to the midpoints
+    of the converged parameter intervals.
+
+    Args:
+        candidate (Tuple[float, float, float, float]): The start and end
+            of the :math:`s`- and :math:`t`-intervals of a converged
+            candidate.
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+
+    Returns:
+        Optional[Tuple[float, float]]: The refined :math:`s` and :math:`t`
+        values or :data:`None` if the bounding boxes of the converged
+        segments are disjoint.
+    """
+    s_start, s_end, t_start, t_end = candidate
+    s_width = s_end - s_start
+    t_width = t_end - t_start
+    nodes1 = _curve_helpers.specialize_curve(nodes_first, s_start, s_end)
+    nodes2 = _curve_helpers.specialize_curve(nodes_second, t_start, t_end)
+    if (
+        _geometric_intersection.bbox_intersect(nodes1, nodes2)
+        == geometric_intersection.BoxIntersectionType.DISJOINT
+    ):
+        return None
+
+    # Start from the intersection of the chords of the (almost linear)
+    # segments if they are not parallel and the chords actually meet.
+    s, t, success = geometric_intersection.segment_intersection(
+        nodes1[:, 0], nodes1[:, -1], nodes2[:, 0], nodes2[:, -1]
+    )
+    if not (
+        success
+        and _helpers.in_interval(s, 0.0, 1.0)
+        and _helpers.in_interval(t, 0.0, 1.0)
+    ):
+        s = 0.5
+        t = 0.5
+    try:
+        return intersection_helpers.full_newton(
+            s_start + s * s_width,
+            nodes_first,
+            t_start + t * t_width,
+            nodes_second,
+        )
+    except NotImplementedError:
+        # Newton's method may fail from the intersection of the chords
+        # (e.g. if the curves are almost parallel), so we fall back to
+        # the midpoints.
+        return intersection_helpers.full_newton(
+            s_start + 0.5 * s_width,
+            nodes_first,
+            t_start + 0.5 * t_width,
+            nodes_second,
+        )
+
+
+def _add_converged(candidate, nodes_first, nodes_second, fuzz, intersections):
+    """Refine a converged candidate and add it to the intersections.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    Uses Newton's method (see :func:`_refine_converged`) and then polishes
+    tangent intersections (see :func:`_polish_tangent`). The refined
+    intersection is only added if the curves actually meet there and it
+    is in the unit square (up to the width of a converged interval).
+
+    Args:
+        candidate (Tuple[float, float, float, float]): The start and end
+            of the :math:`s`- and :math:`t`-intervals of a converged
+            candidate.
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        fuzz (float): The largest allowed distance between the points on
+            each curve at the refined intersection.
+        intersections (list): List of existing intersections.
+    """
+    refined = _refine_converged(candidate, nodes_first, nodes_second)
+    if refined is None:
+        return
+
+    refined_s, refined_t = refined
+    refined_s, refined_t = _polish_tangent(
+        refined_s, nodes_first, refined_t, nodes_second
+    )
+    point1 = _curve_helpers.evaluate_multi(
+        nodes_first, np.asfortranarray([refined_s])
+    )
+    point2 = _curve_helpers.evaluate_multi(
+        nodes_second, np.asfortranarray([refined_t])
+    )
+    if np.linalg.norm(point1[:, 0] - point2[:, 0], ord=2) > fuzz:
+        return
+
+    # NOTE: Newton's method only has linear convergence at a tangent
+    #       intersection, so we allow as much wiggle room as the width
+    #       of a converged interval.
+    refined_s, success = _py_helpers.wiggle_interval(
+        refined_s, wiggle=_CONVERGED_WIDTH
+    )
+    if not success:
+        return
+
+    refined_t, success = _py_helpers.wiggle_interval(
+        refined_t, wiggle=_CONVERGED_WIDTH
+    )
+    if not success:
+        return
+
+    geometric_intersection.add_intersection(
+        refined_s, refined_t, intersections
+    )
+
+
+def _clip_candidate(nodes_first, nodes_second, candidate, fuzz):
+    """Perform one clipping step for a pair of curve segments.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    The curve segments are always specialized from the original curves
+    (rather than from previously clipped segments) so that round-off does
+    not accumulate. The second segment is clipped against the fat line of
+    the first, then the (already clipped) first segment is clipped against
+    the fat line of the second. If either clip keeps more than 80% of the
+    parameter interval, clipping is converging slowly (e.g. because there
+    are several intersections or a tangent intersection) so the wider
+    interval is split in half.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        candidate (Tuple[float, float, float, float]): The start and end
+            of the :math:`s`- and :math:`t`-intervals of a candidate.
+        fuzz (float): The amount the fat lines are widened (on both sides)
+            to account for round-off.
+
+    Returns:
+        List[Tuple[float, float, float, float]]: The new candidates (zero,
+        one or two) that remain after clipping.
+    """
+    s_start, s_end, t_start, t_end = candidate
+    nodes1 = _curve_helpers.specialize_curve(nodes_first, s_start, s_end)
+    nodes2 = _curve_helpers.specialize_curve(nodes_second, t_start, t_end)
+    if (
+        _geometric_intersection.bbox_intersect(nodes1, nodes2)
+        == geometric_intersection.BoxIntersectionType.DISJOINT
+    ):
+        return []
+
+    t_clip = _clip_interval(nodes1, nodes2, fuzz)
+    if t_clip is None:
+        return []
+
+    nodes2 = _curve_helpers.specialize_curve(nodes2, t_clip[0], t_clip[1])
+    s_clip = _clip_interval(nodes2, nodes1, fuzz)
+    if s_clip is None:
+        return []
+
+    clipped = _rescale(s_start, s_end, s_clip) + _rescale(
+        t_start, t_end, t_clip
+    )
+    slow_clip = (
+        max(t_clip[1] - t_clip[0], s_clip[1] - s_clip[0]) > _SLOW_CLIP_RATIO
+    )
+    if not slow_clip:
+        return [clipped]
+
+    return _split_candidate(clipped)
+
+
+def _rescale(start, end, clip):
+    """Map a clipped range back to the parameters of the original curve.
+
+    .. note::
+
+       This is a helper for :func:`_clip_candidate`.
+
+    Args:
+        start (float): The start of the interval.
+        end (float): The end of the interval.
+        clip (Tuple[float, float]): The clipped range, relative to the
+            interval.
+
+    Returns:
+        Tuple[float, float]: The start and end of the clipped range.
+    """
+    width = end - start
+    return start + clip[0] * width, start + clip[1] * width
+
+
+def _split_candidate(candidate):
+    """Split the wider parameter interval of a candidate in half.
+
+    .. note::
+
+       This is a helper for :func:`_clip_candidate`.
+
+    Args:
+        candidate (Tuple[float, float, float, float]): The start and end
+            of the :math:`s`- and :math:`t`-intervals of a candidate.
+
+    Returns:
+        List[Tuple[float, float, float, float]]: The two halves.
+    """
+    s_start, s_end, t_start, t_end = candidate
+    if s_end - s_start >= t_end - t_start:
+        s_mid = 0.5 * (s_start + s_end)
+        return [
+            (s_start, s_mid, t_start, t_end),
+            (s_mid, s_end, t_start, t_end),
+        ]
+
+    t_mid = 0.5 * (t_start + t_end)
+    return [(s_start, s_end, t_start, t_mid), (s_start, s_end, t_mid, t_end)]
+
+
+def _finalize(nodes_first, nodes_second, converged, fuzz):
+    """Turn converged candidates into intersections.
+
+    .. note::
+
+       This is a helper for :func:`all_intersections`.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        converged (List[Tuple[float, float, float, float]]): The start and
+            end of the :math:`s`- and :math:`t`-intervals of each converged
+            candidate.
+        fuzz (float): The largest allowed distance between the points on
+            each curve at an intersection.
+
+    Returns:
+        Tuple[numpy.ndarray, bool]: The intersections and the
+        coincident flag (see :func:`all_intersections`).
+
+    Raises:
+        NotImplementedError: If Newton's method fails to converge for
+            curves that are not coincident.
+    """
+    intersections = []
+    for candidate in _merge_candidates(converged):
+        try:
+            _add_converged(
+                candidate, nodes_first, nodes_second, fuzz, intersections
+            )
+        except NotImplementedError:
+            # Newton's method fails along coincident segments.
+            params = geometric_intersection.coincident_parameters(
+                nodes_first, nodes_second
+            )
+            if params is None:
+                raise
+
+            return np.array(params, order="C").T, True
+
+    if intersections:
+        # NOTE: The transpose of a C-ordered array is Fortran-ordered,
+        #       i.e. this is on purpose.
+        return np.array(intersections, order="C").T, False
+
+    return np.empty((2, 0), order="F"), False
+
+
+def all_intersections(nodes_first, nodes_second):
+    r"""Find the points of intersection among a pair of curves.
+
+    Uses B |eacute| zier clipping: each curve is repeatedly clipped to the
+    parameter range where it lies inside the "fat line" of the other curve
+    (see :func:`compute_fat_line`). When clipping converges slowly, the
+    wider parameter range is split in half and each half is clipped
+    separately, so all intersections are found. Once both parameter ranges
+    are narrower than :math:`2^{-26}`, the intersection is refined with
+    Newton's method.
+
+    .. note::
+
+       This assumes both curves are in :math:`\mathbf{R}^2`, but does not
+       **explicitly** check this. However, functions used here will fail if
+       that assumption fails.
+
+    .. testsetup:: clipping-all-intersections
+
+       import numpy as np
+       from bezier.hazmat.clipping import all_intersections
+
+    .. doctest:: clipping-all-intersections
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 0.5, 1.0],
+       ...     [0.0, 1.0, 0.0],
+       ... ])
+       >>> nodes2 = np.asfortranarray([
+       ...     [0.0, 1.0],
+       ...     [0.375, 0.375],
+       ... ])
+       >>> st_vals, coincident = all_intersections(nodes1, nodes2)
+       >>> st_vals
+       array([[0.25, 0.75],
+              [0.25, 0.75]])
+       >>> coincident
+       False
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of a curve to be
+            intersected with ``nodes_second``.
+        nodes_second (numpy.ndarray): Control points of a curve to be
+            intersected with ``nodes_first``.
+
+    Returns:
+        Tuple[numpy.ndarray, bool]: An array and a flag:
+
+        * A ``2 x N`` array of intersection parameters.
+          Each row contains a pair of values :math:`s` and :math:`t`
+          (each in :math:`\left[0, 1\right]`) such that the curves
+          intersect: :math:`B_1(s) = B_2(t)`.
+        * Flag indicating if the curves are coincident.
+
+    Raises:
+        ValueError: If the clipping iteration does not terminate
+            before exhausting the maximum number of iterations.
+        NotImplementedError: If the clipping process picks up too
+            many candidate pairs.
+    """
+    # Handle the line-line intersection case as a one-off.
+    both_linear, result = geometric_intersection.check_lines(
+        geometric_intersection.Linearization.from_shape(
+            geometric_intersection.SubdividedCurve(nodes_first, nodes_first)
+        ),
+        geometric_intersection.Linearization.from_shape(
+            geometric_intersection.SubdividedCurve(nodes_second, nodes_second)
+        ),
+    )
+    if both_linear:
+        return result
+
+    # NOTE: Round-off in the clipped segments is relative to the size of
+    #       the original curves, not the (possibly tiny) segments.
+    fuzz = _FAT_LINE_FUZZ * max(
+        np.max(np.abs(nodes_first)), np.max(np.abs(nodes_second))
+    )
+    candidates = [(0.0, 1.0, 0.0, 1.0)]
+    converged = []
+    for _ in range(_MAX_CLIP_ITERATIONS):
+        next_candidates = []
+        for candidate in candidates:
+            s_start, s_end, t_start, t_end = candidate
+            if (
+                s_end - s_start <= _CONVERGED_WIDTH
+                and t_end - t_start <= _CONVERGED_WIDTH
+            ):
+                converged.append(candidate)
+            else:
+                next_candidates.extend(
+                    _clip_candidate(nodes_first, nodes_second, candidate, fuzz)
+                )
+        candidates = next_candidates
+        if len(candidates) > _MAX_CANDIDATES:
+            candidates = _converge_clusters(candidates, converged)
+        if len(candidates) > _MAX_CANDIDATES:
+            params = geometric_intersection.coincident_parameters(
+                nodes_first, nodes_second
+            )
+            if params is None:
+                raise NotImplementedError(
+                    _TOO_MANY_TEMPLATE.format(len(candidates))
+                )
+
+            return np.array(params, order="C").T, True
+
+        if not candidates:
+            return _finalize(nodes_first, nodes_second, converged, fuzz)
+
+    raise ValueError(_NO_CONVERGE_TEMPLATE.format(_MAX_CLIP_ITERATIONS))
@@ -16,15 +16,16 @@
    :trim:
 """
 
-import functools
-
 import numpy as np
 
 from bezier.hazmat import helpers as _py_helpers
+from bezier.hazmat import matrix_cache
 
 
 _MAX_LOCATE_SUBDIVISIONS = 20
 _LOCATE_STD_CAP = 0.5 ** 20
+_PROJECT_SUBDIVISIONS = 5
+_PROJECT_NEWTON_STEPS = 6
 _FLOAT64 = np.float64  # pylint: disable=no-member
 _REDUCE_THRESHOLD = 0.5 ** 26  # sqrt(machine precision)
 # Projections onto the space of degree-elevated nodes.
@@ -105,6 +106,70 @@ _CUBIC_SUBDIVIDE_RIGHT = np.asfortranarray(
         [0.125, 0.25, 0.5, 1.0],
     ]
 )
+# Nodes and weights of the 15-point Gauss-Kronrod rule on [-1, 1] (as in
+# QUADPACK's ``dqk15``). The 7-point Gauss rule used for the error estimate
+# uses every other node; its weights are zero at the remaining nodes.
+_KRONROD_NODES = np.asfortranarray(
+    [
+        -0.991455371120812639206854697526329,
+        -0.949107912342758524526189684047851,
+        -0.864864423359769072789712788640926,
+        -0.741531185599394439863864773280788,
+        -0.586087235467691130294144845693013,
+        -0.405845151377397166906606412076961,
+        -0.207784955007898467600689403773245,
+        0.0,
+        0.207784955007898467600689403773245,
+        0.405845151377397166906606412076961,
+        0.586087235467691130294144845693013,
+        0.741531185599394439863864773280788,
+        0.864864423359769072789712788640926,
+        0.949107912342758524526189684047851,
+        0.991455371120812639206854697526329,
+    ]
+)
+_KRONROD_WEIGHTS = np.asfortranarray(
+    [
+        0.022935322010529224963732008058970,
+        0.063092092629978553290700663189204,
+        0.104790010322250183839876322541518,
+        0.140653259715525918745189590510238,
+        0.169004726639267902826583426598550,
+        0.190350578064785409913256402421014,
+        0.204432940075298892414161999234649,
+        0.209482141084727828012999174891714,
+        0.204432940075298892414161999234649,
+        0.190350578064785409913256402421014,
+        0.169004726639267902826583426598550,
+        0.140653259715525918745189590510238,
+        0.104790010322250183839876322541518,
+        0.063092092629978553290700663189204,
+        0.022935322010529224963732008058970,
+    ]
+)
+_GAUSS_WEIGHTS = np.asfortranarray(
+    [
+        0.0,
+        0.129484966168869693270611432679082,
+        0.0,
+        0.279705391489276667901467771423780,
+        0.0,
+        0.381830050505118944950369775488975,
+        0.0,
+        0.417959183673469387755102040816327,
+        0.0,
+        0.381830050505118944950369775488975,
+        0.0,
+        0.279705391489276667901467771423780,
+        0.0,
+        0.129484966168869693270611432679082,
+        0.0,
+    ]
+)
+_LENGTH_TOLERANCE = 0.5 ** 40
+_MAX_LENGTH_SUBDIVISIONS = 30
+_ARC_LENGTH_TOLERANCE = 0.5 ** 50
+_MAX_ARC_LENGTH_ITERATIONS = 64
 
 
 def make_subdivision_matrices(degree):
@@ -116,6 +181,10 @@ def make_subdivision_matrices(degree):
         Fortran speedup because it is **only** used by a function which has
         a Fortran speedup.
 
+    The result is stored in the shared :mod:`.matrix_cache` by
+    :func:`subdivide_nodes`, so these matrices are only built once for
+    each degree.
+
     Args:
         degree (int): The degree of the curve.
 
@@ -174,7 +243,9 @@ def subdivide_nodes(nodes):
         left_nodes = _py_helpers.matrix_product(nodes, _CUBIC_SUBDIVIDE_LEFT)
         right_nodes = _py_helpers.matrix_product(nodes, _CUBIC_SUBDIVIDE_RIGHT)
     else:
-        left_mat, right_mat = make_subdivision_matrices(num_nodes - 1)
+        left_mat, right_mat = matrix_cache.get_matrices(
+            "curve-subdivide", num_nodes - 1, make_subdivision_matrices
+        )
         left_nodes = _py_helpers.matrix_product(nodes, left_mat)
         right_nodes = _py_helpers.matrix_product(nodes, right_mat)
     return left_nodes, right_nodes
@@ -259,6 +330,47 @@ def evaluate_multi_barycentric(nodes, lambda1, lambda2):
     return result
 
 
+def flatten_batch_nodes(nodes):
+    """Stack the nodes of a batch of curves as the nodes of a single curve.
+
+    Since the nodes of a batch of curves are combined linearly in
+    the same way for every curve, they can be treated as the nodes of
+    one curve in a ``D * M`` dimensional space.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    .. doctest:: flatten-batch-nodes
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 1.0], [0.5, 1.0], [1.0, 3.0]],
+       ...     [[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+       ... ])
+       >>> flatten_batch_nodes(nodes)
+       array([[0. , 0.5, 1. ],
+              [0. , 1. , 0. ],
+              [1. , 1. , 3. ],
+              [1. , 2. , 1. ]])
+
+    Args:
+        nodes (numpy.ndarray): A ``D x (N + 1) x M`` array of nodes, one
+            ``D x (N + 1)`` slice for each curve.
+
+    Returns:
+        numpy.ndarray: The ``(D * M) x (N + 1)`` nodes, with the ``D`` rows
+        for each curve stacked in order.
+    """
+    dimension, num_nodes, num_curves = nodes.shape
+    # NOTE: Moving the curve axis next to the dimension axis makes the
+    #       reshape a view (for Fortran-ordered nodes).
+    flat_nodes = np.moveaxis(nodes, 2, 1).reshape(
+        (dimension * num_curves, num_nodes), order="F"
+    )
+    return np.asfortranarray(flat_nodes)
+
+
 def vec_size(nodes, s_val):
     r"""Compute :math:`\|B(s)\|_2`.
 
@@ -282,11 +394,9 @@ def vec_size(nodes, s_val):
     return np.linalg.norm(result_vec[:, 0], ord=2)
 
 
-def compute_length(nodes):
+def compute_length(nodes, first_deriv=None):
     r"""Approximately compute the length of a curve.
 
-    .. _QUADPACK: https://en.wikipedia.org/wiki/QUADPACK
-
     If ``degree`` is :math:`n`, then the Hodograph curve
     :math:`B'(s)` is degree :math:`d = n - 1`. Using this curve, we
     approximate the integral:
@@ -296,7 +406,7 @@ def compute_length(nodes):
        \int_{B\left(\left[0, 1\right]\right)} 1 \, d\mathbf{x} =
        \int_0^1 \left\lVert B'(s) \right\rVert_2 \, ds
 
-    using `QUADPACK`_ (via SciPy).
+    using adaptive Gauss-Kronrod quadrature (see :func:`compute_lengths`).
 
     .. note::
 
@@ -305,6 +415,9 @@ def compute_length(nodes):
 
     Args:
         nodes (numpy.ndarray): The nodes defining a curve.
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodograph
+            of the curve (see :func:`hodograph_nodes`), if already
+            computed.
 
     Returns:
         float: The length of the curve.
@@ -312,29 +425,444 @@ def compute_length(nodes):
     Raises:
         ValueError: If ``nodes`` has zero columns.
     """
-    _, num_nodes = np.shape(nodes)
-    # NOTE: We somewhat replicate code in ``evaluate_hodograph()``
-    #       here. This is so we don't re-compute the nodes for the first
-    #       derivative every time it is evaluated.
-    first_deriv = (num_nodes - 1) * (nodes[:, 1:] - nodes[:, :-1])
+    if first_deriv is not None:
+        first_deriv = first_deriv[:, :, np.newaxis]
+    (length,) = compute_lengths(
+        nodes[:, :, np.newaxis], first_deriv=first_deriv
+    )
+    return length
+
+
+def _bernstein_basis(degree, s_vals):
+    r"""Evaluate every Bernstein basis polynomial of a given degree.
+
+    I.e. computes :math:`\binom{n}{j} (1 - s)^{n - j} s^j` for each
+    :math:`j`. This uses the same recurrence as the de Casteljau
+    algorithm, rather than computing binomial coefficients.
+
+    Args:
+        degree (int): The degree :math:`n` of the basis.
+        s_vals (numpy.ndarray): The parameters to evaluate at.
+
+    Returns:
+        numpy.ndarray: The basis values, with one more axis than
+        ``s_vals`` (the first) to index the ``degree + 1`` polynomials.
+    """
+    one_less = 1.0 - s_vals
+    basis = np.empty((degree + 1,) + s_vals.shape)
+    basis[0] = 1.0
+    for current in range(1, degree + 1):
+        basis[current] = s_vals * basis[current - 1]
+        for index in range(current - 1, 0, -1):
+            basis[index] = one_less * basis[index] + s_vals * basis[index - 1]
+        basis[0] *= one_less
+    return basis
+
+
+def _kronrod_error(values, kronrod, gauss, widths):
+    """Estimate the error in Gauss-Kronrod quadrature on many intervals.
+
+    Uses the same estimate as QUADPACK: the difference between the
+    Kronrod and Gauss results is scaled relative to the (Kronrod
+    estimate of the) variation of the integrand, since the difference
+    greatly overestimates the error for smooth integrands.
+
+    Args:
+        values (numpy.ndarray): The integrand at the quadrature points of
+            each interval (as an ``M x 15`` array).
+        kronrod (numpy.ndarray): The Kronrod estimate on each interval.
+        gauss (numpy.ndarray): The Gauss estimate on each interval.
+        widths (numpy.ndarray): The width of each interval.
+
+    Returns:
+        numpy.ndarray: The estimated error on each interval.
+    """
+    means = kronrod / widths
+    variation = widths * np.abs(values - means[:, np.newaxis]).dot(
+        0.5 * _KRONROD_WEIGHTS
+    )
+    errors = np.abs(kronrod - gauss)
+    ratios = np.divide(
+        200.0 * errors,
+        variation,
+        out=np.zeros_like(errors),
+        where=variation > 0.0,
+    )
+    return np.where(
+        variation > 0.0, variation * np.minimum(1.0, ratios ** 1.5), errors,
+    )
+
+
+def compute_lengths(nodes, first_deriv=None):
+    r"""Approximately compute the lengths of many curves of the same degree.
+
+    Integrates the speed :math:`\left\lVert B'(s) \right\rVert_2` of
+    every curve at once with the 15-point Gauss-Kronrod rule, using the
+    embedded 7-point Gauss rule to estimate the error. Intervals where the
+    error estimate is too large (relative to the first estimate of the
+    length of the curve) are bisected, so only parts of curves where the
+    speed varies quickly need more than one pass.
+
+    .. note::
+
+       This is a helper for :func:`compute_length` and does not have
+       a Fortran speedup.
+
+    .. testsetup:: compute-lengths
+
+       import numpy as np
+       from bezier.hazmat.curve_helpers import compute_lengths
+
+    .. doctest:: compute-lengths
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 0.0], [1.5, 3.0], [3.0, 6.0]],
+       ...     [[0.0, 0.0], [2.0, 0.0], [4.0, 0.0]],
+       ... ])
+       >>> compute_lengths(nodes)
+       array([5., 6.])
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining the curves, as a
+            ``D x (N + 1) x M`` array (the third axis indexes the curves).
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodographs
+            of the curves (as a ``D x N x M`` array), if already computed.
+
+    Returns:
+        numpy.ndarray: The length of each curve (as a 1D array).
+
+    Raises:
+        ValueError: If ``nodes`` has zero columns.
+    """
+    _, num_nodes, num_curves = np.shape(nodes)
     if num_nodes == 0:
         raise ValueError("Curve should have at least one node.")
 
     if num_nodes == 1:
-        return 0.0
+        return np.zeros(num_curves)
 
+    if first_deriv is None:
+        # NOTE: We somewhat replicate code in ``evaluate_hodograph()``
+        #       here. This is so we don't re-compute the nodes for the
+        #       first derivative every time it is evaluated.
+        first_deriv = (num_nodes - 1) * (nodes[:, 1:, :] - nodes[:, :-1, :])
     if num_nodes == 2:
-        # NOTE: We convert to 1D to make sure NumPy uses vector norm.
-        return np.linalg.norm(first_deriv[:, 0], ord=2)
+        return np.linalg.norm(first_deriv[:, 0, :], ord=2, axis=0)
 
-    # NOTE: We import SciPy at runtime to avoid the import-time cost for users
-    #       that don't pure Python curve helpers (e.g. if the ``_speedup``
-    #       module is available). The ``scipy`` import is a tad expensive.
-    import scipy.integrate  # pylint: disable=import-outside-toplevel
+    curves, _, _, lengths = _length_intervals(first_deriv)
+    return np.bincount(curves, weights=lengths, minlength=num_curves)
 
-    size_func = functools.partial(vec_size, first_deriv)
-    length, _ = scipy.integrate.quad(size_func, 0.0, 1.0)
-    return length
+
+def _kronrod_speeds(first_deriv, starts, widths):
+    r"""Compute the speed of many curves at the Gauss-Kronrod points.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodographs, either
+            as a ``D x N x M`` array (one hodograph for each interval) or
+            as a ``D x N`` array (the same hodograph for every interval).
+        starts (numpy.ndarray): The start of each of the ``M`` intervals.
+        widths (numpy.ndarray): The width of each of the ``M`` intervals.
+
+    Returns:
+        numpy.ndarray: The speed :math:`\left\lVert B'(s) \right\rVert_2`
+        at the 15 quadrature points of each interval (as an ``M x 15``
+        array).
+    """
+    # Map the rule from [-1, 1] onto [0, 1].
+    quadrature_points = 0.5 * (_KRONROD_NODES + 1.0)
+    s_vals = starts[:, np.newaxis] + widths[:, np.newaxis] * quadrature_points
+    num_deriv = first_deriv.shape[1]
+    basis = _bernstein_basis(num_deriv - 1, s_vals)
+    if first_deriv.ndim == 2:
+        tangents = np.tensordot(first_deriv, basis, axes=1)
+    else:
+        # NOTE: Each curve is evaluated at the quadrature points of its own
+        #       intervals, so the product is with the Bernstein basis
+        #       (rather than evaluating every curve at every point).
+        tangents = np.einsum("ijk,jkl->ikl", first_deriv, basis, optimize=True)
+    return np.sqrt(np.einsum("ikl,ikl->kl", tangents, tangents))
+
+
+def _length_intervals(first_deriv):
+    r"""Adaptively integrate the speed of many curves of the same degree.
+
+    This is the shared implementation of :func:`compute_lengths` and
+    :func:`arc_length_table`.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodographs, as a
+            ``D x N x M`` array (the third axis indexes the curves).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        The curve, start, width and length of every interval accepted by
+        the quadrature. Together the intervals for each curve cover
+        :math:`\left[0, 1\right]`.
+    """
+    num_curves = first_deriv.shape[2]
+    kronrod_weights = 0.5 * _KRONROD_WEIGHTS
+    gauss_weights = 0.5 * _GAUSS_WEIGHTS
+    accepted = []
+    # The intervals (for each curve) that still need to be integrated.
+    curves = np.arange(num_curves)
+    starts = np.zeros(num_curves)
+    widths = np.ones(num_curves)
+    tolerances = None
+    depth = 0
+    while curves.size > 0:
+        speeds = _kronrod_speeds(first_deriv[:, :, curves], starts, widths)
+        kronrod = widths * speeds.dot(kronrod_weights)
+        gauss = widths * speeds.dot(gauss_weights)
+        if tolerances is None:
+            tolerances = _LENGTH_TOLERANCE * kronrod
+
+        if depth == _MAX_LENGTH_SUBDIVISIONS:
+            done = np.ones(curves.shape, dtype=bool)
+        else:
+            done = (
+                _kronrod_error(speeds, kronrod, gauss, widths)
+                <= tolerances[curves] * widths
+            )
+        accepted.append(
+            (curves[done], starts[done], widths[done], kronrod[done])
+        )
+        curves, starts, widths = _bisect_intervals(
+            curves[~done], starts[~done], widths[~done]
+        )
+        depth += 1
+
+    return tuple(np.concatenate(values) for values in zip(*accepted))
+
+
+def _bisect_intervals(curves, starts, widths):
+    """Split many intervals in half.
+
+    .. note::
+
+       This is a helper for :func:`_length_intervals`.
+
+    Args:
+        curves (numpy.ndarray): The curve of each interval.
+        starts (numpy.ndarray): The start of each interval.
+        widths (numpy.ndarray): The width of each interval.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The curve,
+        start and width of each half, with the two halves of each interval
+        next to each other.
+    """
+    half_widths = 0.5 * widths
+    new_starts = np.column_stack([starts, starts + half_widths]).ravel()
+    return np.repeat(curves, 2), new_starts, np.repeat(half_widths, 2)
+
+
+def arc_length_table(first_deriv):
+    r"""Compute a table of the arc length of a curve.
+
+    Splits :math:`\left[0, 1\right]` into the intervals chosen by the
+    same adaptive Gauss-Kronrod quadrature as :func:`compute_lengths`, so
+    the length over each interval has an estimated error below
+    :math:`2^{-40}` times the width of the interval times the length of
+    the curve. Intervals are short where the speed varies quickly (e.g.
+    near a cusp) and long where it doesn't.
+
+    .. note::
+
+       This is a helper for :meth:`.Curve.arc_length` and does not have
+       a Fortran speedup.
+
+    .. testsetup:: arc-length-table
+
+       import numpy as np
+       from bezier.hazmat.curve_helpers import arc_length_table
+
+    .. doctest:: arc-length-table
+
+       >>> first_deriv = np.asfortranarray([
+       ...     [2.0, 4.0],
+       ...     [0.0, 0.0],
+       ... ])
+       >>> breakpoints, cumulative = arc_length_table(first_deriv)
+       >>> breakpoints
+       array([0., 1.])
+       >>> cumulative
+       array([0., 3.])
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph
+            :math:`B'(s)` of the curve.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The (increasing) breakpoints of the table, starting with ``0.0``
+          and ending with ``1.0``
+        * The length of the curve up to each breakpoint
+    """
+    _, starts, _, lengths = _length_intervals(first_deriv[:, :, np.newaxis])
+    order = np.argsort(starts)
+    breakpoints = np.append(starts[order], 1.0)
+    cumulative = np.zeros(breakpoints.shape)
+    np.cumsum(lengths[order], out=cumulative[1:])
+    return breakpoints, cumulative
+
+
+def partial_lengths(first_deriv, starts, ends):
+    r"""Compute the length of a curve over many parameter intervals.
+
+    Uses a single 15-point Gauss-Kronrod rule on each interval, so it is
+    intended for intervals contained in an interval of an arc-length table
+    (see :func:`arc_length_table`). If an ``end`` is before the
+    corresponding ``start``, the length is negative.
+
+    .. note::
+
+       This is a helper for :meth:`.Curve.arc_length` and does not have
+       a Fortran speedup.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph
+            :math:`B'(s)` of the curve.
+        starts (numpy.ndarray): The start of each interval.
+        ends (numpy.ndarray): The end of each interval.
+
+    Returns:
+        numpy.ndarray: The (signed) length over each interval.
+    """
+    widths = ends - starts
+    speeds = _kronrod_speeds(first_deriv, starts, widths)
+    return widths * speeds.dot(0.5 * _KRONROD_WEIGHTS)
+
+
+def arc_lengths_from_table(first_deriv, breakpoints, cumulative, s_vals):
+    """Compute the arc length at many parameters from an arc-length table.
+
+    Finds the interval of the table containing each ``s`` (via binary
+    search) and adds the length over the part of that interval before
+    ``s`` (see :func:`partial_lengths`).
+
+    .. note::
+
+       This is a helper for :meth:`.Curve.arc_length` and does not have
+       a Fortran speedup.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph
+            :math:`B'(s)` of the curve.
+        breakpoints (numpy.ndarray): The breakpoints of the table.
+        cumulative (numpy.ndarray): The length of the curve up to each
+            breakpoint.
+        s_vals (numpy.ndarray): The parameters (as a 1D array).
+
+    Returns:
+        numpy.ndarray: The length of the curve from ``0`` to each ``s``.
+    """
+    index = np.searchsorted(breakpoints, s_vals, side="right") - 1
+    index = np.clip(index, 0, breakpoints.size - 2)
+    return cumulative[index] + partial_lengths(
+        first_deriv, breakpoints[index], s_vals
+    )
+
+
+def params_from_table(first_deriv, breakpoints, cumulative, lengths):
+    """Invert an arc-length table at many lengths.
+
+    Finds the interval of the table containing each length (via binary
+    search) and linearly interpolates within it. Then uses Newton's method
+    on the length within the interval (see :func:`_arc_length_step`)
+    until the parameters change by at most :math:`2^{-50}`.
+
+    .. note::
+
+       This is a helper for :meth:`.Curve.param_at_length` and does not
+       have a Fortran speedup.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph
+            :math:`B'(s)` of the curve.
+        breakpoints (numpy.ndarray): The breakpoints of the table.
+        cumulative (numpy.ndarray): The length of the curve up to each
+            breakpoint.
+        lengths (numpy.ndarray): The lengths (as a 1D array), each
+            between ``0`` and the length of the curve.
+
+    Returns:
+        numpy.ndarray: The parameter where the curve reaches each length.
+    """
+    index = np.searchsorted(cumulative, lengths, side="right") - 1
+    index = np.clip(index, 0, breakpoints.size - 2)
+    anchors = breakpoints[index]
+    targets = lengths - cumulative[index]
+    # The lower (first row) and upper (second row) bracket of each solution.
+    brackets = np.vstack([anchors, breakpoints[index + 1]])
+    interval_lengths = cumulative[index + 1] - cumulative[index]
+    # NOTE: Intervals where the curve has zero length (e.g. a curve with
+    #       all nodes equal) are "inverted" at their start.
+    fractions = np.divide(
+        targets,
+        interval_lengths,
+        out=np.zeros_like(lengths),
+        where=interval_lengths > 0.0,
+    )
+    s_vals = anchors + np.clip(fractions, 0.0, 1.0) * (brackets[1] - anchors)
+    # The (indices of the) lengths that have not converged.
+    active = np.arange(lengths.size)
+    iteration = 0
+    while active.size > 0 and iteration < _MAX_ARC_LENGTH_ITERATIONS:
+        current = s_vals[active]
+        updated, brackets[:, active] = _arc_length_step(
+            first_deriv,
+            anchors[active],
+            targets[active],
+            brackets[:, active],
+            current,
+        )
+        s_vals[active] = updated
+        active = active[np.abs(updated - current) > _ARC_LENGTH_TOLERANCE]
+        iteration += 1
+
+    return s_vals
+
+
+def _arc_length_step(first_deriv, anchors, targets, brackets, current):
+    """Perform one (safeguarded) Newton step when inverting arc length.
+
+    Newton's method is applied to :math:`L(s) - L(a) - t` where :math:`a`
+    is the ``anchor`` and :math:`t` the ``target``. The bracket is shrunk
+    to the current parameter (depending on the sign of the residual) and
+    any Newton step that would leave it is replaced by bisection, so this
+    converges even where the speed is zero.
+
+    .. note::
+
+       This is a helper for :func:`params_from_table`.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph
+            :math:`B'(s)` of the curve.
+        anchors (numpy.ndarray): The start of the table interval of each
+            solution.
+        targets (numpy.ndarray): The length (from the anchor) to reach.
+        brackets (numpy.ndarray): The ``2 x N`` lower and upper bracket of
+            each solution.
+        current (numpy.ndarray): The current parameters.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The updated parameters and
+        the updated ``2 x N`` brackets.
+    """
+    residuals = partial_lengths(first_deriv, anchors, current) - targets
+    above = residuals > 0.0
+    low = np.where(above, brackets[0], current)
+    high = np.where(above, current, brackets[1])
+    speeds = np.linalg.norm(evaluate_multi(first_deriv, current), axis=0)
+    newton = current - np.divide(
+        residuals, speeds, out=np.zeros_like(residuals), where=speeds > 0.0,
+    )
+    use_newton = (speeds > 0.0) & (low <= newton) & (newton <= high)
+    updated = np.where(use_newton, newton, 0.5 * (low + high))
+    updated = np.where(residuals == 0.0, current, updated)
+    return updated, np.vstack([low, high])
 
 
 def elevate_nodes(nodes):
@@ -449,6 +977,70 @@ def specialize_curve(nodes, start, end):
     return result
 
 
+def specialize_curve_multi(nodes, starts, ends):
+    r"""Specialize a curve to many sub-intervals at once.
+
+    Does the same thing as :func:`specialize_curve` for every interval
+    :math:`\left[a_k, b_k\right]`. The :math:`j`-th control point of each
+    specialized curve is the blossom of the curve at :math:`a_k` (repeated
+    :math:`n - j` times) and :math:`b_k` (repeated :math:`j` times), so
+    every control point of every interval is computed in a single sweep of
+    :math:`n` vectorized de Casteljau steps.
+
+    .. testsetup:: specialize-curve-multi
+
+       import numpy as np
+       from bezier.hazmat.curve_helpers import specialize_curve_multi
+
+    .. doctest:: specialize-curve-multi
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 0.5, 1.0],
+       ...     [0.0, 1.0, 0.0],
+       ... ])
+       >>> starts = np.asfortranarray([0.0, 0.5])
+       >>> ends = np.asfortranarray([0.5, 1.0])
+       >>> pieces = specialize_curve_multi(nodes, starts, ends)
+       >>> pieces.shape
+       (2, 3, 2)
+       >>> pieces[:, :, 1]
+       array([[0.5 , 0.75, 1.  ],
+              [0.5 , 0.5 , 0.  ]])
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    Args:
+        nodes (numpy.ndarray): Control points for a curve.
+        starts (numpy.ndarray): The start point of each interval (as a
+            1D array).
+        ends (numpy.ndarray): The end point of each interval (as a 1D
+            array).
+
+    Returns:
+        numpy.ndarray: The control points for the specialized curves, as a
+        ``D x (N + 1) x K`` array (for ``K`` intervals).
+    """
+    _, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    # ``partial[:, :, j, k]`` holds the partially evaluated blossom for
+    # control point ``j`` of interval ``k``.
+    partial = nodes[:, :, np.newaxis, np.newaxis]
+    node_ids = np.arange(num_nodes)[:, np.newaxis]
+    for step in range(degree):
+        # Control point ``j`` uses the start ``n - j`` times, then the end.
+        lambda2 = np.where(step < degree - node_ids, starts, ends)
+        lambda1 = 1.0 - lambda2
+        partial = lambda1 * partial[:, :-1] + lambda2 * partial[:, 1:]
+    num_intervals = np.size(starts)
+    partial = np.broadcast_to(
+        partial[:, 0], (nodes.shape[0], num_nodes, num_intervals)
+    )
+    return np.asfortranarray(partial)
+
+
 def evaluate_hodograph(s, nodes):
     r"""Evaluate the Hodograph curve at a point :math:`s`.
 
@@ -484,7 +1076,31 @@ def evaluate_hodograph(s, nodes):
     )
 
 
-def get_curvature(nodes, tangent_vec, s):
+def hodograph_nodes(nodes):
+    r"""Compute the nodes of the hodograph of a curve.
+
+    These are the nodes :math:`n \Delta v_j` of the degree :math:`n - 1`
+    curve :math:`B'(s)` (see :func:`evaluate_hodograph`). For a degree
+    zero curve (i.e. a point), the hodograph is the constant zero.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of a curve.
+
+    Returns:
+        numpy.ndarray: The nodes of the hodograph.
+    """
+    dimension, num_nodes = nodes.shape
+    if num_nodes == 1:
+        return np.zeros((dimension, 1), order="F")
+
+    return (num_nodes - 1) * (nodes[:, 1:] - nodes[:, :-1])
+
+
+def get_curvature(nodes, tangent_vec, s, second_deriv=None):
     r"""Compute the signed curvature of a curve at :math:`s`.
 
     Computed via
@@ -534,6 +1150,10 @@ def get_curvature(nodes, tangent_vec, s):
         tangent_vec (numpy.ndarray): The already computed value of
             :math:`B'(s)`
         s (float): The parameter value along the curve.
+        second_deriv (Optional[numpy.ndarray]): The nodes of the second
+            derivative :math:`B''(s)` of the curve (i.e. the hodograph of
+            the hodograph, see :func:`hodograph_nodes`), if already
+            computed.
 
     Returns:
         float: The signed curvature.
@@ -542,14 +1162,17 @@ def get_curvature(nodes, tangent_vec, s):
     if num_nodes == 2:  # Lines have no curvature.
         return 0.0
 
-    # NOTE: We somewhat replicate code in ``evaluate_hodograph()`` here.
-    first_deriv = nodes[:, 1:] - nodes[:, :-1]
-    second_deriv = first_deriv[:, 1:] - first_deriv[:, :-1]
-    concavity = (
-        (num_nodes - 1)
-        * (num_nodes - 2)
-        * evaluate_multi(second_deriv, np.asfortranarray([s]))
-    )
+    if second_deriv is None:
+        # NOTE: We somewhat replicate code in ``evaluate_hodograph()`` here.
+        first_deriv = nodes[:, 1:] - nodes[:, :-1]
+        second_deriv = first_deriv[:, 1:] - first_deriv[:, :-1]
+        concavity = (
+            (num_nodes - 1)
+            * (num_nodes - 2)
+            * evaluate_multi(second_deriv, np.asfortranarray([s]))
+        )
+    else:
+        concavity = evaluate_multi(second_deriv, np.asfortranarray([s]))
     curvature = _py_helpers.cross_product(
         tangent_vec.ravel(order="F"), concavity.ravel(order="F")
     )
@@ -558,7 +1181,7 @@ def get_curvature(nodes, tangent_vec, s):
     return curvature
 
 
-def newton_refine(nodes, point, s):
+def newton_refine(nodes, point, s, first_deriv=None):
     r"""Refine a solution to :math:`B(s) = p` using Newton's method.
 
     Computes updates via
@@ -717,12 +1340,18 @@ def newton_refine(nodes, point, s):
         nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
         point (numpy.ndarray): A point on the curve.
         s (float): An "almost" solution to :math:`B(s) = p`.
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodograph
+            of the curve (see :func:`hodograph_nodes`), if already
+            computed.
 
     Returns:
         float: The updated value :math:`s + \Delta s`.
     """
     pt_delta = point - evaluate_multi(nodes, np.asfortranarray([s]))
-    derivative = evaluate_hodograph(s, nodes)
+    if first_deriv is None:
+        derivative = evaluate_hodograph(s, nodes)
+    else:
+        derivative = evaluate_multi(first_deriv, np.asfortranarray([s]))
     # Each array is 2 x 1 (i.e. a column vector), we want the vector
     # dot product.
     delta_s = np.vdot(pt_delta[:, 0], derivative[:, 0]) / np.vdot(
@@ -731,7 +1360,7 @@ def newton_refine(nodes, point, s):
     return s + delta_s
 
 
-def locate_point(nodes, point):
+def locate_point(nodes, point, first_deriv=None):
     r"""Locate a point on a curve.
 
     Does so by recursively subdividing the curve and rejecting
@@ -752,6 +1381,9 @@ def locate_point(nodes, point):
     Args:
         nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
         point (numpy.ndarray): The point to locate.
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodograph
+            of the curve (see :func:`hodograph_nodes`), if already
+            computed.
 
     Returns:
         Optional[float]: The parameter value (:math:`s`) corresponding
@@ -781,7 +1413,7 @@ def locate_point(nodes, point):
         raise ValueError("Parameters not close enough to one another", params)
 
     s_approx = np.mean(params)
-    s_approx = newton_refine(nodes, point, s_approx)
+    s_approx = newton_refine(nodes, point, s_approx, first_deriv=first_deriv)
     # NOTE: Since ``np.mean(params)`` must be in ``[0, 1]`` it's
     #       "safe" to push the Newton-refined value back into the unit
     #       interval.
@@ -795,6 +1427,467 @@ def locate_point(nodes, point):
         return s_approx
 
 
+def locate_points(nodes, points, first_deriv=None):
+    r"""Locate many points on a curve.
+
+    Does the same thing as :func:`locate_point`, but for every point at
+    once. The curve is subdivided level by level, and at each level the
+    bounding boxes of the sub-curves are checked against every point that
+    is still a candidate for that sub-curve. A sub-curve is only subdivided
+    if its bounding box contains at least one point, so the subdivision is
+    shared by all of the points. Finally, one Newton step is taken for
+    every point at once (see :func:`newton_refine`).
+
+    .. note::
+
+       This assumes, but does not check, that ``points`` is ``D x N``,
+       where ``D`` is the dimension that ``curve`` is in.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        points (numpy.ndarray): The points to locate (as a ``D x N`` array).
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodograph
+            of the curve (see :func:`hodograph_nodes`), if already
+            computed.
+
+    Returns:
+        numpy.ndarray: The parameter values (:math:`s`) corresponding to
+        each point (as a 1D array). If a point is not on the curve, its
+        value is NaN.
+
+    Raises:
+        ValueError: If the standard deviation of the remaining start / end
+            parameters among the subdivided intervals for any point exceeds
+            a given threshold (e.g. :math:`2^{-20}`).
+    """
+    num_points = points.shape[1]
+    if num_points == 0:
+        return np.empty(0)
+
+    matrices = matrix_cache.get_matrices(
+        "curve-subdivide", nodes.shape[1] - 1, make_subdivision_matrices
+    )
+    segments = nodes[:, :, np.newaxis]
+    starts = np.zeros(1)
+    width = 1.0
+    # Each (point, segment) pair that is still a candidate.
+    point_ids = np.arange(num_points)
+    segment_ids = np.zeros(num_points, dtype=np.intp)
+    for _ in range(_MAX_LOCATE_SUBDIVISIONS + 1):
+        point_ids, segment_ids, kept = _prune_located(
+            points, segments, point_ids, segment_ids
+        )
+        width *= 0.5
+        segments, starts, point_ids, segment_ids = _split_frontier(
+            segments[:, :, kept],
+            starts[kept],
+            width,
+            (point_ids, segment_ids),
+            matrices,
+        )
+
+    s_approx = _mean_params(starts[segment_ids], width, point_ids, num_points)
+    found = ~np.isnan(s_approx)
+    s_approx[found] = _locate_newton(
+        nodes, first_deriv, points[:, found], s_approx[found]
+    )
+    return s_approx
+
+
+def _split_frontier(segments, starts, width, pairs, matrices):
+    """Subdivide every sub-curve in a shared subdivision frontier.
+
+    .. note::
+
+       This is a helper for :func:`locate_points` and
+       :func:`project_points`.
+
+    Args:
+        segments (numpy.ndarray): The nodes of each sub-curve (as a
+            ``D x (N + 1) x M`` array).
+        starts (numpy.ndarray): The start parameter of each sub-curve.
+        width (float): The width of each half of a sub-curve.
+        pairs (Tuple[numpy.ndarray, numpy.ndarray]): The point and the
+            sub-curve in each (point, sub-curve) pair.
+        matrices (Tuple[numpy.ndarray, numpy.ndarray]): The subdivision
+            matrices (see :func:`make_subdivision_matrices`).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, \
+        numpy.ndarray]: The nodes and start parameters of the ``2 M``
+        halves (all of the left halves followed by all of the right
+        halves), followed by the point and the half in each pair. Each
+        pair is replaced by one pair for each half.
+    """
+    left_mat, right_mat = matrices
+    point_ids, segment_ids = pairs
+    num_segments = segments.shape[2]
+    segments = np.concatenate(
+        [
+            np.einsum("ijk,jl->ilk", segments, left_mat),
+            np.einsum("ijk,jl->ilk", segments, right_mat),
+        ],
+        axis=2,
+    )
+    return (
+        segments,
+        np.concatenate([starts, starts + width]),
+        np.concatenate([point_ids, point_ids]),
+        np.concatenate([segment_ids, segment_ids + num_segments]),
+    )
+
+
+def _prune_located(points, segments, point_ids, segment_ids):
+    """Discard sub-curves with a bounding box that doesn't contain a point.
+
+    .. note::
+
+       This is a helper for :func:`locate_points`.
+
+    Args:
+        points (numpy.ndarray): The points being located.
+        segments (numpy.ndarray): The nodes of each sub-curve (as a
+            ``D x (N + 1) x M`` array).
+        point_ids (numpy.ndarray): The point in each (point, sub-curve)
+            pair.
+        segment_ids (numpy.ndarray): The sub-curve in each (point,
+            sub-curve) pair.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The point in each remaining pair.
+        * The (renumbered) sub-curve in each remaining pair.
+        * The indices of the sub-curves that remain.
+    """
+    candidates = points[:, point_ids]
+    inside = np.all(
+        (np.min(segments, axis=1)[:, segment_ids] <= candidates)
+        & (candidates <= np.max(segments, axis=1)[:, segment_ids]),
+        axis=0,
+    )
+    kept, segment_ids = np.unique(segment_ids[inside], return_inverse=True)
+    return point_ids[inside], segment_ids, kept
+
+
+def _mean_params(seg_starts, width, point_ids, num_points):
+    """Average the parameters of the sub-curves that contain each point.
+
+    .. note::
+
+       This is a helper for :func:`locate_points`.
+
+    Args:
+        seg_starts (numpy.ndarray): The start parameter of the sub-curve in
+            each (point, sub-curve) pair.
+        width (float): The width of every sub-curve.
+        point_ids (numpy.ndarray): The point in each (point, sub-curve)
+            pair.
+        num_points (int): The number of points.
+
+    Returns:
+        numpy.ndarray: The mean of the start and end parameters for each
+        point (NaN if no sub-curve contains the point).
+
+    Raises:
+        ValueError: If the standard deviation of the start / end
+            parameters for any point exceeds :math:`2^{-20}`.
+    """
+    # NOTE: Each pair contributes the start and end of its segment to the
+    #       parameters for the point.
+    counts = 2 * np.bincount(point_ids, minlength=num_points)
+    found = counts > 0
+    totals = np.bincount(
+        point_ids, weights=2.0 * seg_starts + width, minlength=num_points
+    )
+    s_approx = np.full(num_points, np.nan)
+    s_approx[found] = totals[found] / counts[found]
+    start_devs = seg_starts - s_approx[point_ids]
+    end_devs = start_devs + width
+    variances = np.bincount(
+        point_ids,
+        weights=start_devs * start_devs + end_devs * end_devs,
+        minlength=num_points,
+    )
+    variances[found] /= counts[found]
+    too_spread = variances > _LOCATE_STD_CAP * _LOCATE_STD_CAP
+    if np.any(too_spread):
+        raise ValueError(
+            "Parameters not close enough to one another",
+            np.flatnonzero(too_spread),
+        )
+
+    return s_approx
+
+
+def _locate_newton(nodes, first_deriv, points, s_vals):
+    """Perform one Newton step for many points on a curve.
+
+    This is a vectorized version of :func:`newton_refine`.
+
+    .. note::
+
+       This is a helper for :func:`locate_points`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        first_deriv (Optional[numpy.ndarray]): The nodes of the hodograph
+            of the curve, if already computed.
+        points (numpy.ndarray): The points on the curve (as a ``D x N``
+            array).
+        s_vals (numpy.ndarray): The "almost" solutions to :math:`B(s) = p`
+            for each point.
+
+    Returns:
+        numpy.ndarray: The updated parameters, clipped to the unit
+        interval.
+    """
+    pt_delta = points - evaluate_multi(nodes, s_vals)
+    if first_deriv is None:
+        first_deriv = hodograph_nodes(nodes)
+    derivative = evaluate_multi(first_deriv, s_vals)
+    numerators = np.sum(pt_delta * derivative, axis=0)
+    denominators = np.sum(derivative * derivative, axis=0)
+    s_vals = s_vals + np.divide(
+        numerators,
+        denominators,
+        out=np.zeros_like(numerators),
+        where=denominators > 0.0,
+    )
+    # NOTE: Since each mean of parameters must be in ``[0, 1]`` it's
+    #       "safe" to push the Newton-refined values back into the unit
+    #       interval.
+    return np.clip(s_vals, 0.0, 1.0)
+
+
+def _prune_projections(points, segments, point_ids, segment_ids, best):
+    """Discard sub-curves that can't contain the closest point to a point.
+
+    .. note::
+
+       This is a helper for :func:`project_points`.
+
+    The upper bound for the (squared) distance from a point to a sub-curve
+    is the distance to the nearest endpoint of the sub-curve and the lower
+    bound is the distance to the bounding box of the control points.
+
+    .. note::
+
+       This updates ``best`` in place.
+
+    Args:
+        points (numpy.ndarray): The points being projected.
+        segments (numpy.ndarray): The nodes of each sub-curve (as a
+            ``D x (N + 1) x M`` array).
+        point_ids (numpy.ndarray): The point in each (point, sub-curve)
+            pair.
+        segment_ids (numpy.ndarray): The sub-curve in each (point,
+            sub-curve) pair.
+        best (numpy.ndarray): The smallest upper bound found so far for
+            the squared distance to each point.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The point in each remaining pair.
+        * The (renumbered) sub-curve in each remaining pair.
+        * The indices of the sub-curves that remain.
+    """
+    candidates = points[:, point_ids]
+    start_deltas = segments[:, 0, segment_ids] - candidates
+    end_deltas = segments[:, -1, segment_ids] - candidates
+    upper = np.minimum(
+        np.sum(start_deltas * start_deltas, axis=0),
+        np.sum(end_deltas * end_deltas, axis=0),
+    )
+    np.minimum.at(best, point_ids, upper)
+    box_deltas = np.maximum(
+        np.min(segments, axis=1)[:, segment_ids] - candidates,
+        candidates - np.max(segments, axis=1)[:, segment_ids],
+    )
+    box_deltas = np.maximum(box_deltas, 0.0)
+    lower = np.sum(box_deltas * box_deltas, axis=0)
+    keep = lower <= best[point_ids]
+    kept, segment_ids = np.unique(segment_ids[keep], return_inverse=True)
+    return point_ids[keep], segment_ids, kept
+
+
+def project_points(nodes, points, derivatives=None):
+    r"""Find the points on a curve that are closest to many points.
+
+    For each point :math:`p`, this minimizes
+    :math:`\left\lVert B(s) - p \right\rVert_2` over :math:`s \in [0, 1]`.
+    This is done by subdividing the curve level by level, as in
+    :func:`locate_points`. Each sub-curve gives an upper bound for the
+    distance to :math:`p` (the distance to either of its endpoints) and a
+    lower bound (the distance to the bounding box of its control points,
+    which contains the sub-curve). A (point, sub-curve) pair is discarded
+    once its lower bound exceeds the best upper bound for that point.
+
+    Then a few (vectorized) steps of Newton's method are taken on
+
+    .. math::
+
+       f(s) = \left(B(s) - p\right) \cdot B'(s) = 0, \qquad
+       f'(s) = B'(s) \cdot B'(s) + \left(B(s) - p\right) \cdot B''(s)
+
+    starting from the midpoint of each remaining sub-curve (and staying
+    within it). The closest of these candidates and the endpoints of the
+    sub-curves is the projection.
+
+    .. note::
+
+       This assumes, but does not check, that ``points`` is ``D x N``,
+       where ``D`` is the dimension that ``curve`` is in.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        points (numpy.ndarray): The points to project (as a ``D x N``
+            array).
+        derivatives (Optional[Tuple[numpy.ndarray, numpy.ndarray]]): The
+            nodes of the first and second derivatives of the curve (see
+            :func:`hodograph_nodes`), if already computed.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The parameter values (:math:`s`) of the closest points (as a
+          1D array).
+        * The closest points on the curve (as a ``D x N`` array).
+        * The distances from each point to the curve (as a 1D array).
+    """
+    num_points = points.shape[1]
+    if num_points == 0:
+        empty_points = np.empty((nodes.shape[0], 0), order="F")
+        return np.empty(0), empty_points, np.empty(0)
+
+    matrices = matrix_cache.get_matrices(
+        "curve-subdivide", nodes.shape[1] - 1, make_subdivision_matrices
+    )
+    segments = nodes[:, :, np.newaxis]
+    starts = np.zeros(1)
+    width = 1.0
+    best = np.full(num_points, np.inf)
+    # Each (point, segment) pair that may still contain the projection.
+    point_ids = np.arange(num_points)
+    segment_ids = np.zeros(num_points, dtype=np.intp)
+    for _ in range(_PROJECT_SUBDIVISIONS):
+        point_ids, segment_ids, kept = _prune_projections(
+            points, segments, point_ids, segment_ids, best
+        )
+        width *= 0.5
+        segments, starts, point_ids, segment_ids = _split_frontier(
+            segments[:, :, kept],
+            starts[kept],
+            width,
+            (point_ids, segment_ids),
+            matrices,
+        )
+
+    point_ids, segment_ids, kept = _prune_projections(
+        points, segments, point_ids, segment_ids, best
+    )
+    lower_s = starts[kept][segment_ids]
+    s_vals = _project_newton(
+        nodes, derivatives, points[:, point_ids], lower_s, width
+    )
+    return _closest_candidates(nodes, points, np.tile(point_ids, 3), s_vals)
+
+
+def _project_newton(nodes, derivatives, points, lower_s, width):
+    r"""Find candidates for the closest point on many sub-curves.
+
+    Takes a few (vectorized) steps of Newton's method on
+    :math:`f(s) = \left(B(s) - p\right) \cdot B'(s)`, starting from the
+    midpoint of each sub-curve and staying within it.
+
+    .. note::
+
+       This is a helper for :func:`project_points`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        derivatives (Optional[Tuple[numpy.ndarray, numpy.ndarray]]): The
+            nodes of the first and second derivatives of the curve, if
+            already computed.
+        points (numpy.ndarray): The point in each (point, sub-curve) pair
+            (as a ``D x K`` array).
+        lower_s (numpy.ndarray): The start parameter of the sub-curve in
+            each pair.
+        width (float): The width of every sub-curve.
+
+    Returns:
+        numpy.ndarray: The ``3 K`` candidate parameters: the result of
+        Newton's method for each pair, followed by the start and then the
+        end of each sub-curve.
+    """
+    if derivatives is None:
+        first_deriv = hodograph_nodes(nodes)
+        derivatives = first_deriv, hodograph_nodes(first_deriv)
+    first_deriv, second_deriv = derivatives
+    upper_s = lower_s + width
+    s_vals = lower_s + 0.5 * width
+    for _ in range(_PROJECT_NEWTON_STEPS):
+        deltas = evaluate_multi(nodes, s_vals) - points
+        tangents = evaluate_multi(first_deriv, s_vals)
+        func_vals = np.sum(deltas * tangents, axis=0)
+        deriv_vals = np.sum(tangents * tangents, axis=0) + np.sum(
+            deltas * evaluate_multi(second_deriv, s_vals), axis=0
+        )
+        # NOTE: Where ``f'(s) <= 0``, the squared distance is not convex,
+        #       so Newton's method would head towards a maximum.
+        steps = np.divide(
+            func_vals,
+            deriv_vals,
+            out=np.zeros_like(func_vals),
+            where=deriv_vals > 0.0,
+        )
+        s_vals = np.clip(s_vals - steps, lower_s, upper_s)
+
+    return np.concatenate([s_vals, lower_s, upper_s])
+
+
+def _closest_candidates(nodes, points, point_ids, s_vals):
+    """Choose the closest candidate on a curve to each point.
+
+    .. note::
+
+       This is a helper for :func:`project_points`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        points (numpy.ndarray): The points being projected.
+        point_ids (numpy.ndarray): The point for each candidate.
+        s_vals (numpy.ndarray): The parameter of each candidate.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The parameter
+        values, the points on the curve and the distances for the closest
+        candidate to each point (see :func:`project_points`).
+    """
+    evaluated = evaluate_multi(nodes, s_vals)
+    deltas = evaluated - points[:, point_ids]
+    distances = np.sum(deltas * deltas, axis=0)
+    # Sort by point and then by distance, so the first entry for each
+    # point is the closest candidate.
+    order = np.lexsort((distances, point_ids))
+    _, first = np.unique(point_ids[order], return_index=True)
+    chosen = order[first]
+    return (
+        s_vals[chosen],
+        np.asfortranarray(evaluated[:, chosen]),
+        np.sqrt(distances[chosen]),
+    )
+
+
 def reduce_pseudo_inverse(nodes):
     """Performs degree-reduction for a B |eacute| zier curve.
 
@@ -1066,8 +1066,9 @@ def intersect_one_round(candidates, intersections):
 
     .. note::
 
-       This is a helper for :func:`all_intersections` and that function
-       has a Fortran equivalent.
+       :func:`all_intersections` uses the vectorized
+       :meth:`CandidateFrontier.intersect_one_round` rather than this
+       function. Both process the candidates in the same order.
 
     Checks if the bounding boxes of each pair in ``candidates``
     intersect. If the bounding boxes do not intersect, the pair
@@ -1142,7 +1143,8 @@ def prune_candidates(candidates):
 
     .. note::
 
-       This is a helper for :func:`all_intersections`.
+       :func:`all_intersections` uses the vectorized
+       :meth:`CandidateFrontier.prune` rather than this function.
 
     Uses more strict bounding box intersection predicate by forming the
     actual convex hull of each candidate curve segment and then checking
@@ -1441,13 +1443,13 @@ def all_intersections(nodes_first, nodes_second):
     if both_linear:
         return result
 
-    candidates = [(candidate1, candidate2)]
+    candidates = CandidateFrontier.from_pair(candidate1, candidate2)
     intersections = []
     coincident = False
     for _ in range(_MAX_INTERSECT_SUBDIVISIONS):
-        candidates = intersect_one_round(candidates, intersections)
+        candidates = candidates.intersect_one_round(intersections)
         if len(candidates) > _MAX_CANDIDATES:
-            candidates = prune_candidates(candidates)
+            candidates = candidates.prune()
             # If pruning didn't fix anything, we check if the curves are
             # coincident and "fail" if they aren't.
             if len(candidates) > _MAX_CANDIDATES:
@@ -1461,7 +1463,7 @@ def all_intersections(nodes_first, nodes_second):
                 coincident = True
                 # Artificially empty out candidates so that this
                 # function exits.
-                candidates = []
+                candidates = candidates.take(slice(0, 0))
         # If none of the candidate pairs have been accepted, then there are
         # no more intersections to find.
         if not candidates:
@@ -1476,6 +1478,242 @@ def all_intersections(nodes_first, nodes_second):
     raise ValueError(msg)
 
 
+def all_intersections_batch(
+    nodes_first, offsets_first, nodes_second, offsets_second
+):
+    r"""Find the points of intersection among many pairs of curves.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    The curves are packed (column-wise) into ``nodes_first`` and
+    ``nodes_second``. For the ``j``-th pair, the first curve has control
+    points ``nodes_first[:, offsets_first[j]:offsets_first[j + 1]]`` and
+    the second curve has control points
+    ``nodes_second[:, offsets_second[j]:offsets_second[j + 1]]``.
+
+    .. note::
+
+       This assumes (but does not check) that all curves are in
+       :math:`\mathbf{R}^2` and that each curve has at least one node.
+
+    Args:
+        nodes_first (numpy.ndarray): Packed control points of the first
+            curve in each pair.
+        offsets_first (numpy.ndarray): 1D array of ``N + 1`` column offsets
+            into ``nodes_first`` (for ``N`` pairs).
+        nodes_second (numpy.ndarray): Packed control points of the second
+            curve in each pair.
+        offsets_second (numpy.ndarray): 1D array of ``N + 1`` column offsets
+            into ``nodes_second``.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: A triple of
+
+        * A 1D array of length :math:`K` with the index of the pair that
+          each intersection belongs to.
+        * A ``2 x K`` array of intersection parameters. Each column contains
+          a pair of values :math:`s` and :math:`t` such that the curves in
+          the corresponding pair intersect: :math:`B_1(s) = B_2(t)`.
+        * A 1D boolean array of length :math:`N` indicating if the curves in
+          each pair are coincident.
+
+    Raises:
+        ValueError: If the subdivision iteration does not terminate
+            before exhausting the maximum number of subdivisions for
+            any pair.
+        NotImplementedError: If the subdivision process picks up too
+            many candidate pairs for any pair.
+    """
+    num_pairs = len(offsets_first) - 1
+    pair_indices = []
+    all_st_vals = []
+    coincident = np.zeros(num_pairs, dtype=bool)
+    for index in range(num_pairs):
+        start1, end1 = offsets_first[index], offsets_first[index + 1]
+        start2, end2 = offsets_second[index], offsets_second[index + 1]
+        st_vals, coincident[index] = all_intersections(
+            nodes_first[:, start1:end1], nodes_second[:, start2:end2]
+        )
+        _, num_intersections = st_vals.shape
+        pair_indices.extend([index] * num_intersections)
+        all_st_vals.append(st_vals)
+    if pair_indices:
+        return (
+            np.array(pair_indices, dtype=np.intc),
+            np.asfortranarray(np.hstack(all_st_vals)),
+            coincident,
+        )
+
+    return np.empty(0, dtype=np.intc), np.empty((2, 0), order="F"), coincident
+
+
+def _expand_ranges(starts, ends, order):
+    """Expand ranges of sorted positions into pairs of indices.
+
+    This is a helper for :func:`bbox_candidates`. For each ``i``, the
+    positions ``starts[i] <= p < ends[i]`` (in a sorted order) are converted
+    to pairs ``(i, order[p])``.
+
+    Args:
+        starts (numpy.ndarray): 1D array with the start of each range.
+        ends (numpy.ndarray): 1D array with the end (exclusive) of each
+            range.
+        order (numpy.ndarray): The indices which produce the sorted order.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The indices ``i`` and the
+        values ``order[p]`` for every position in every range.
+    """
+    counts = np.maximum(ends - starts, 0)
+    indices = np.repeat(np.arange(starts.size), counts)
+    # Offset each position within a range by the start of the range.
+    offsets = np.arange(indices.size) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return indices, order[np.repeat(starts, counts) + offsets]
+
+
+def _sweep_self(lefts, rights):
+    """Find all pairs of intervals in one set that overlap.
+
+    .. note::
+
+       This is a helper for :func:`bbox_candidates`.
+
+    Each interval is swept against all intervals that come **after** it
+    when sorted by their left endpoint, so each overlapping pair is found
+    exactly once.
+
+    Args:
+        lefts (numpy.ndarray): The left endpoint of each interval.
+        rights (numpy.ndarray): The right endpoint of each interval.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The indices of the
+        overlapping pairs, with the smaller index first in each pair.
+    """
+    order = np.argsort(lefts, kind="stable")
+    starts = np.empty(lefts.size, dtype=np.intp)
+    starts[order] = np.arange(1, lefts.size + 1)
+    ends = np.searchsorted(lefts[order], rights, side="right")
+    first, second = _expand_ranges(starts, ends, order)
+    return np.minimum(first, second), np.maximum(first, second)
+
+
+def _sweep_pair(lefts1, rights1, lefts2, rights2):
+    """Find all pairs of overlapping intervals from two sets.
+
+    .. note::
+
+       This is a helper for :func:`bbox_candidates`.
+
+    Args:
+        lefts1 (numpy.ndarray): The left endpoint of each interval in the
+            first set.
+        rights1 (numpy.ndarray): The right endpoint of each interval in the
+            first set.
+        lefts2 (numpy.ndarray): The left endpoint of each interval in the
+            second set.
+        rights2 (numpy.ndarray): The right endpoint of each interval in the
+            second set.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The indices (in the first
+        and second set, respectively) of the overlapping pairs.
+    """
+    order1 = np.argsort(lefts1, kind="stable")
+    sorted_lefts1 = lefts1[order1]
+    order2 = np.argsort(lefts2, kind="stable")
+    sorted_lefts2 = lefts2[order2]
+    # Intervals in the second set that start within an interval in the
+    # first set.
+    first_a, second_a = _expand_ranges(
+        np.searchsorted(sorted_lefts2, lefts1, side="left"),
+        np.searchsorted(sorted_lefts2, rights1, side="right"),
+        order2,
+    )
+    # Intervals in the first set that (strictly) start within an interval
+    # in the second set. Equal left endpoints were already found above.
+    second_b, first_b = _expand_ranges(
+        np.searchsorted(sorted_lefts1, lefts2, side="right"),
+        np.searchsorted(sorted_lefts1, rights2, side="right"),
+        order1,
+    )
+    return (
+        np.concatenate([first_a, first_b]),
+        np.concatenate([second_a, second_b]),
+    )
+
+
+def bbox_candidates(boxes_first, boxes_second=None):
+    r"""Find all pairs of overlapping bounding boxes.
+
+    Uses a sweep and prune broad phase: the boxes are sorted by their left
+    edge so that the boxes overlapping along the :math:`x`-axis can be
+    found with binary searches. Of these, only the pairs that also
+    overlap along the :math:`y`-axis are kept. Boxes that only touch
+    (e.g. share an edge) are considered overlapping, matching the
+    ``TANGENT`` case in :func:`bbox_intersect`.
+
+    .. testsetup:: bbox-candidates
+
+       import numpy as np
+       from bezier.hazmat.geometric_intersection import bbox_candidates
+
+    .. doctest:: bbox-candidates
+
+       >>> boxes = np.asfortranarray([
+       ...     [0.0, 0.5, 3.0, 1.0],
+       ...     [1.0, 1.5, 4.0, 2.0],
+       ...     [0.0, 0.5, 0.0, 1.0],
+       ...     [1.0, 1.5, 1.0, 2.0],
+       ... ])
+       >>> first, second = bbox_candidates(boxes)
+       >>> first
+       array([0, 0, 1], dtype=int32)
+       >>> second
+       array([1, 3, 3], dtype=int32)
+
+    Args:
+        boxes_first (numpy.ndarray): A ``4 x N1`` array of bounding boxes.
+            Each column contains the left, right, bottom and top bounds
+            for a box (i.e. the values returned by
+            :func:`~bezier.hazmat.helpers.bbox`).
+        boxes_second (Optional[numpy.ndarray]): A ``4 x N2`` array of
+            bounding boxes. If not provided, the pairs of boxes in
+            ``boxes_first`` that overlap each other are found.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The indices of the first
+        and second box in each overlapping pair, sorted lexicographically.
+        If ``boxes_second`` is not provided, each pair is only reported
+        once (with the smaller index first) and a box is never paired
+        with itself.
+    """
+    lefts1, rights1, bottoms1, tops1 = boxes_first
+    if boxes_second is None:
+        first, second = _sweep_self(lefts1, rights1)
+        lefts2, rights2, bottoms2, tops2 = boxes_first
+    else:
+        lefts2, rights2, bottoms2, tops2 = boxes_second
+        first, second = _sweep_pair(lefts1, rights1, lefts2, rights2)
+
+    # Prune pairs that don't overlap in the ``y``-direction.
+    keep = (bottoms1[first] <= tops2[second]) & (
+        bottoms2[second] <= tops1[first]
+    )
+    first = first[keep]
+    second = second[keep]
+    sort_order = np.lexsort((second, first))
+    return (
+        first[sort_order].astype(np.intc),
+        second[sort_order].astype(np.intc),
+    )
+
+
 class BoxIntersectionType:  # pylint: disable=too-few-public-methods
     """Enum representing all possible bounding box intersections.
 
@@ -1632,3 +1870,621 @@ class Linearization:
 
             else:
                 return shape
+
+
+def _bboxes(nodes):
+    """Compute the bounding boxes of a stack of curves.
+
+    Args:
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The left, right, bottom and top bounds
+        (each a 1D array of length ``K``) for the boxes.
+    """
+    lower = np.min(nodes, axis=2)
+    upper = np.max(nodes, axis=2)
+    return lower[:, 0], upper[:, 0], lower[:, 1], upper[:, 1]
+
+
+def _bbox_intersect_many(boxes1, boxes2):
+    """Vectorized version of :func:`bbox_intersect`.
+
+    Args:
+        boxes1 (Tuple[numpy.ndarray, ...]): The left, right, bottom and top
+            bounds of the first box in each pair.
+        boxes2 (Tuple[numpy.ndarray, ...]): The left, right, bottom and top
+            bounds of the second box in each pair.
+
+    Returns:
+        numpy.ndarray: Enum values from :class:`.BoxIntersectionType`, one
+        for each pair of boxes.
+    """
+    left1, right1, bottom1, top1 = boxes1
+    left2, right2, bottom2, top2 = boxes2
+    result = np.full(left1.shape, BoxIntersectionType.INTERSECTION)
+    tangent = (
+        (right2 == left1)
+        | (right1 == left2)
+        | (top2 == bottom1)
+        | (top1 == bottom2)
+    )
+    result[tangent] = BoxIntersectionType.TANGENT
+    disjoint = (
+        (right2 < left1)
+        | (right1 < left2)
+        | (top2 < bottom1)
+        | (top1 < bottom2)
+    )
+    result[disjoint] = BoxIntersectionType.DISJOINT
+    return result
+
+
+def _points_in_boxes(boxes, points):
+    """Determine which points lie in (or on) the corresponding box.
+
+    Args:
+        boxes (Tuple[numpy.ndarray, ...]): The left, right, bottom and top
+            bounds of each box.
+        points (numpy.ndarray): ``2 x K`` array of points.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating which points are contained
+        in their box.
+    """
+    left, right, bottom, top = boxes
+    x_vals, y_vals = points
+    return (
+        (left <= x_vals)
+        & (x_vals <= right)
+        & (bottom <= y_vals)
+        & (y_vals <= top)
+    )
+
+
+def _segments_cross_box_edges(boxes, line_start, line_end):
+    """Determine which line segments cross an edge of the corresponding box.
+
+    This intersects each segment with the bottom, right and top edges of its
+    box (in that order) all at once. As in :func:`bbox_line_intersect`, the
+    left edge is skipped. This uses the same computation as
+    :func:`segment_intersection`.
+
+    Args:
+        boxes (Tuple[numpy.ndarray, ...]): The left, right, bottom and top
+            bounds of each box.
+        line_start (numpy.ndarray): ``2 x K`` array of the start of each
+            line segment.
+        line_end (numpy.ndarray): ``2 x K`` array of the end of each
+            line segment.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating which segments cross an
+        edge of their box.
+    """
+    left, right, bottom, top = boxes
+    # NOTE: These are ``2 x 3 x K`` (coordinate, edge, box) arrays.
+    edge_start = np.stack([[left, right, right], [bottom, bottom, top]])
+    delta0 = np.stack([[right, right, left], [bottom, top, top]]) - edge_start
+    delta1 = (line_end - line_start)[:, np.newaxis, :]
+    start_delta = line_start[:, np.newaxis, :] - edge_start
+    cross_d0_d1 = delta0[0] * delta1[1] - delta0[1] * delta1[0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = (start_delta[0] * delta1[1] - start_delta[1] * delta1[0]) / (
+            cross_d0_d1
+        )
+        t = (start_delta[0] * delta0[1] - start_delta[1] * delta0[0]) / (
+            cross_d0_d1
+        )
+    # NOTE: Comparisons with NaN (when ``cross_d0_d1 == 0.0``) are false.
+    return np.any((0.0 <= s) & (s <= 1.0) & (0.0 <= t) & (t <= 1.0), axis=0)
+
+
+def _bbox_line_intersect_many(boxes, line_start, line_end):
+    """Vectorized version of :func:`bbox_line_intersect`.
+
+    Args:
+        boxes (Tuple[numpy.ndarray, ...]): The left, right, bottom and top
+            bounds of each box.
+        line_start (numpy.ndarray): ``2 x K`` array of the start of each
+            line segment.
+        line_end (numpy.ndarray): ``2 x K`` array of the end of each
+            line segment.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating which boxes and segments
+        intersect.
+    """
+    hit = _points_in_boxes(boxes, line_start)
+    hit |= _points_in_boxes(boxes, line_end)
+    hit |= _segments_cross_box_edges(boxes, line_start, line_end)
+    return hit
+
+
+def _linearization_errors(nodes):
+    """Vectorized version of :func:`linearization_error`.
+
+    Args:
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+
+    Returns:
+        numpy.ndarray: The linearization error for each curve.
+    """
+    num_curves, _, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    if degree == 1:
+        return np.zeros(num_curves)
+
+    second_deriv = nodes[:, :, :-2] - 2.0 * nodes[:, :, 1:-1] + nodes[:, :, 2:]
+    worst_case = np.max(np.abs(second_deriv), axis=2)
+    # max_{0 <= s <= 1} s(1 - s)/2 = 1/8 = 0.125
+    multiplier = 0.125 * degree * (degree - 1)
+    return multiplier * np.linalg.norm(worst_case, ord=2, axis=1)
+
+
+def _children(nodes, start, end, error):
+    """Subdivide (and linearize) each curve in a stack.
+
+    This is a vectorized version of applying :meth:`.SubdividedCurve.subdivide`
+    and :meth:`.Linearization.from_shape` to each curve. Curves that have
+    already been linearized are not subdivided.
+
+    Since :func:`.curve_helpers.subdivide_nodes` is a matrix product on the
+    right, the stack of curves can be subdivided as a single ``2K x N``
+    matrix.
+
+    Args:
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+        start (numpy.ndarray): The start parameter of each curve.
+        end (numpy.ndarray): The end parameter of each curve.
+        error (numpy.ndarray): The linearization error of each curve
+            (``inf`` if not linearized).
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The ``K x 2 x 2 x N`` stack of control
+        points for the (up to) two children of each curve, the ``K x 2``
+        start and end parameters and linearization errors of the children
+        and a ``K x 2`` boolean array indicating which children exist.
+    """
+    num_curves, dimension, num_nodes = nodes.shape
+    linearized = error < _ERROR_VAL
+    child_nodes = np.empty((num_curves, 2, dimension, num_nodes))
+    left, right = curve_helpers.subdivide_nodes(
+        nodes.reshape((num_curves * dimension, num_nodes))
+    )
+    child_nodes[:, 0] = left.reshape(nodes.shape)
+    child_nodes[:, 1] = right.reshape(nodes.shape)
+    child_nodes[linearized, 0] = nodes[linearized]
+    child_error = _linearization_errors(
+        child_nodes.reshape((2 * num_curves, dimension, num_nodes))
+    ).reshape((num_curves, 2))
+    child_error[linearized, 0] = error[linearized]
+    child_error[child_error >= _ERROR_VAL] = np.inf
+    child_start = np.empty((num_curves, 2))
+    child_start[:, 0] = start
+    child_start[:, 1] = 0.5 * (start + end)
+    child_end = np.empty((num_curves, 2))
+    child_end[:, 0] = np.where(linearized, end, child_start[:, 1])
+    child_end[:, 1] = end
+    exists = np.ones((num_curves, 2), dtype=bool)
+    exists[:, 1] = ~linearized
+    return child_nodes, child_start, child_end, child_error, exists
+
+
+def _flat(nodes):
+    """Determine which curves in a stack have collinear control points.
+
+    Args:
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating which curves have all of
+        their control points on a single line.
+    """
+    delta = nodes[:, :, 1:] - nodes[:, :, :1]
+    cross = (
+        delta[:, 0, :, np.newaxis] * delta[:, 1, np.newaxis, :]
+        - delta[:, 1, :, np.newaxis] * delta[:, 0, np.newaxis, :]
+    )
+    return np.all(cross == 0.0, axis=(1, 2))
+
+
+def _pairwise_differences(nodes):
+    """Compute the difference of every pair of control points in a stack.
+
+    Args:
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+
+    Returns:
+        numpy.ndarray: The ``K x 2 x (N choose 2)`` stack of differences.
+    """
+    _, _, num_nodes = nodes.shape
+    index1, index2 = np.triu_indices(num_nodes, k=1)
+    return nodes[:, :, index2] - nodes[:, :, index1]
+
+
+def _projection_bounds(direction_x, direction_y, norm_squared, nodes):
+    """Project control points onto the normal of each direction.
+
+    .. note::
+
+       This is a helper for :func:`_convex_hulls_collide_many`.
+
+    Args:
+        direction_x (numpy.ndarray): ``K x D x 1`` array of the
+            :math:`x`-components of the directions.
+        direction_y (numpy.ndarray): ``K x D x 1`` array of the
+            :math:`y`-components of the directions.
+        norm_squared (numpy.ndarray): ``K x D x 1`` array of the squared
+            norm of each direction.
+        nodes (numpy.ndarray): A ``K x 2 x N`` stack of control points.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The ``K x D`` minimum and
+        maximum (scaled) projection along each direction.
+    """
+    # NOTE: Zero directions produce NaN, which is never separating.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        param = (
+            direction_x * nodes[:, np.newaxis, 1, :]
+            - direction_y * nodes[:, np.newaxis, 0, :]
+        ) / norm_squared
+    return np.min(param, axis=2), np.max(param, axis=2)
+
+
+def _convex_hulls_collide_many(nodes1, nodes2):
+    """Vectorized version of :func:`convex_hull_collide`.
+
+    Rather than computing each convex hull, this uses the separating axis
+    theorem with **every** difference of control points in each pair as a
+    potential separating line. This includes every edge of both convex
+    hulls, which is sufficient when both convex hulls are polygons with
+    positive area. Pairs where either curve has collinear control points
+    (i.e. the convex hull is a line segment or a point) are handled by
+    :func:`convex_hull_collide`.
+
+    Args:
+        nodes1 (numpy.ndarray): A ``K x 2 x N1`` stack of control points.
+        nodes2 (numpy.ndarray): A ``K x 2 x N2`` stack of control points.
+
+    Returns:
+        numpy.ndarray: Boolean array indicating if the convex hulls of
+        each pair collide.
+    """
+    directions = np.concatenate(
+        [_pairwise_differences(nodes1), _pairwise_differences(nodes2)], axis=2
+    )
+    direction_x = directions[:, 0, :, np.newaxis]
+    direction_y = directions[:, 1, :, np.newaxis]
+    norm_squared = direction_x * direction_x + direction_y * direction_y
+    min_param1, max_param1 = _projection_bounds(
+        direction_x, direction_y, norm_squared, nodes1
+    )
+    min_param2, max_param2 = _projection_bounds(
+        direction_x, direction_y, norm_squared, nodes2
+    )
+    separated = (min_param1 > max_param2) | (max_param1 < min_param2)
+    collide = ~np.any(separated, axis=1)
+    for index in np.flatnonzero(_flat(nodes1) | _flat(nodes2)):
+        collide[index] = convex_hull_collide(
+            np.asfortranarray(nodes1[index]), np.asfortranarray(nodes2[index])
+        )
+    return collide
+
+
+def _curve_and_error(shape):
+    """Get the curve and linearization error of a candidate.
+
+    Args:
+        shape (Union[SubdividedCurve, Linearization]): The candidate.
+
+    Returns:
+        Tuple[SubdividedCurve, float]: The (subdivided) curve and its
+        linearization error (``inf`` if not linearized).
+    """
+    # NOTE: In the below we replace ``isinstance(a, B)`` with
+    #       ``a.__class__ is B``, which is a 3-3.5x speedup.
+    if shape.__class__ is Linearization:
+        return shape.curve, shape.error
+
+    return shape, np.inf
+
+
+class CandidateFrontier:
+    """All pairs of candidate sub-curves in one round of intersection.
+
+    This is an array-based replacement for the list of pairs of
+    :class:`SubdividedCurve` / :class:`Linearization` objects used by
+    :func:`intersect_one_round`. The control points for the ``K``
+    candidates are stored in ``K x 2 x N`` stacks, so that bounding boxes,
+    linearization errors and subdivisions can be computed for every pair at
+    once. A sub-curve is linearized if it has a (finite) linearization
+    error.
+
+    Args:
+        original_first (numpy.ndarray): The control points of the first
+            curve being intersected.
+        original_second (numpy.ndarray): The control points of the second
+            curve being intersected.
+        nodes_first (numpy.ndarray): ``K x 2 x N1`` stack of control points
+            for the first sub-curve in each candidate pair.
+        nodes_second (numpy.ndarray): ``K x 2 x N2`` stack of control points
+            for the second sub-curve in each candidate pair.
+        params (numpy.ndarray): ``K x 4`` array with the start and end
+            parameters of the first sub-curve, then the start and end
+            parameters of the second sub-curve.
+        errors (numpy.ndarray): ``K x 2`` array with the linearization errors
+            of each sub-curve (``inf`` for sub-curves that are not
+            linearized).
+    """
+
+    __slots__ = (
+        "original_first",
+        "original_second",
+        "nodes_first",
+        "nodes_second",
+        "params",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        original_first,
+        original_second,
+        nodes_first,
+        nodes_second,
+        params,
+        errors,
+    ):
+        self.original_first = original_first
+        self.original_second = original_second
+        self.nodes_first = nodes_first
+        self.nodes_second = nodes_second
+        self.params = params
+        self.errors = errors
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current frontier's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "original_first": self.original_first,
+            "original_second": self.original_second,
+            "nodes_first": self.nodes_first,
+            "nodes_second": self.nodes_second,
+            "params": self.params,
+            "errors": self.errors,
+        }
+
+    def __len__(self):
+        """Get the number of candidate pairs.
+
+        Returns:
+            int: The number of candidate pairs.
+        """
+        return self.params.shape[0]
+
+    @classmethod
+    def from_pair(cls, first, second):
+        """Create a frontier from a single pair of candidates.
+
+        Args:
+            first (Union[SubdividedCurve, Linearization]): The first curve.
+            second (Union[SubdividedCurve, Linearization]): The second curve.
+
+        Returns:
+            CandidateFrontier: The frontier containing only the given pair.
+        """
+        curve_first, error_first = _curve_and_error(first)
+        curve_second, error_second = _curve_and_error(second)
+        return cls(
+            curve_first.original_nodes,
+            curve_second.original_nodes,
+            np.array([curve_first.nodes]),
+            np.array([curve_second.nodes]),
+            np.array(
+                [
+                    [
+                        curve_first.start,
+                        curve_first.end,
+                        curve_second.start,
+                        curve_second.end,
+                    ]
+                ]
+            ),
+            np.array([[error_first, error_second]]),
+        )
+
+    def candidate(self, index):
+        """Get a single candidate pair as objects.
+
+        Args:
+            index (int): The index of the candidate pair.
+
+        Returns:
+            Tuple[Union[SubdividedCurve, Linearization], \
+            Union[SubdividedCurve, Linearization]]: The first and second
+            (potentially linearized) curves in the pair.
+        """
+        start1, end1, start2, end2 = self.params[index]
+        error1, error2 = self.errors[index]
+        first = SubdividedCurve(
+            np.asfortranarray(self.nodes_first[index]),
+            self.original_first,
+            start=start1,
+            end=end1,
+        )
+        if error1 < _ERROR_VAL:
+            first = Linearization(first, error1)
+        second = SubdividedCurve(
+            np.asfortranarray(self.nodes_second[index]),
+            self.original_second,
+            start=start2,
+            end=end2,
+        )
+        if error2 < _ERROR_VAL:
+            second = Linearization(second, error2)
+        return first, second
+
+    def take(self, indices):
+        """Restrict the frontier to a subset of the candidate pairs.
+
+        Args:
+            indices (numpy.ndarray): Indices (or a boolean mask) of the
+                candidate pairs to keep.
+
+        Returns:
+            CandidateFrontier: The restricted frontier.
+        """
+        return CandidateFrontier(
+            self.original_first,
+            self.original_second,
+            self.nodes_first[indices],
+            self.nodes_second[indices],
+            self.params[indices],
+            self.errors[indices],
+        )
+
+    def intersect_one_round(self, intersections):
+        """Perform one step of the intersection process.
+
+        This is a vectorized version of :func:`intersect_one_round`, which
+        processes candidate pairs (and adds intersections) in the same
+        order. The bounding box checks, subdivisions and linearization
+        errors are computed for every candidate pair at once. Only the
+        pairs that require :func:`from_linearized` or
+        :func:`tangent_bbox_intersection` are handled one at a time.
+
+        Args:
+            intersections (list): A list of already encountered
+                intersections. If any intersections can be readily
+                determined during this round of subdivision, then they will
+                be added to this list.
+
+        Returns:
+            CandidateFrontier: The next round of candidates.
+        """
+        linearized = self.errors < _ERROR_VAL
+        both_linearized = linearized[:, 0] & linearized[:, 1]
+        bbox_int = self._bbox_intersections(linearized)
+        accepted = bbox_int != BoxIntersectionType.DISJOINT
+        # NOTE: Tangent bounding boxes can only occur when neither curve is
+        #       linearized (``bbox_line_intersect()`` never reports a
+        #       tangency) or when both are.
+        immediate = accepted & (
+            both_linearized | (bbox_int == BoxIntersectionType.TANGENT)
+        )
+        for index in np.flatnonzero(immediate):
+            first, second = self.candidate(index)
+            if both_linearized[index]:
+                from_linearized(first, second, intersections)
+            else:
+                tangent_bbox_intersection(first, second, intersections)
+
+        return self.take(accepted & ~immediate).subdivide()
+
+    def _bbox_intersections(self, linearized):
+        """Classify the bounding box intersection of every candidate pair.
+
+        When exactly one curve in a pair is linearized, the line segment is
+        intersected with the bounding box of the other curve (as in
+        :func:`intersect_one_round`), so the result is either
+        ``INTERSECTION`` or ``DISJOINT``.
+
+        Args:
+            linearized (numpy.ndarray): ``K x 2`` boolean array indicating
+                which sub-curves are linearized.
+
+        Returns:
+            numpy.ndarray: The :class:`BoxIntersectionType` of each pair.
+        """
+        boxes_first = _bboxes(self.nodes_first)
+        boxes_second = _bboxes(self.nodes_second)
+        bbox_int = _bbox_intersect_many(boxes_first, boxes_second)
+        mixed = np.flatnonzero(linearized[:, 0] != linearized[:, 1])
+        if mixed.size:
+            line_first = linearized[mixed, 0]
+            boxes = [
+                np.where(line_first, box2[mixed], box1[mixed])
+                for box1, box2 in zip(boxes_first, boxes_second)
+            ]
+            line_start = np.where(
+                line_first,
+                self.nodes_first[mixed, :, 0].T,
+                self.nodes_second[mixed, :, 0].T,
+            )
+            line_end = np.where(
+                line_first,
+                self.nodes_first[mixed, :, -1].T,
+                self.nodes_second[mixed, :, -1].T,
+            )
+            hit = _bbox_line_intersect_many(boxes, line_start, line_end)
+            bbox_int[mixed] = np.where(
+                hit,
+                BoxIntersectionType.INTERSECTION,
+                BoxIntersectionType.DISJOINT,
+            )
+        return bbox_int
+
+    def subdivide(self):
+        """Subdivide every candidate pair.
+
+        Each (non-linearized) sub-curve is split in half and every child of
+        the first sub-curve is paired with every child of the second, in
+        the same order as :func:`itertools.product`.
+
+        Returns:
+            CandidateFrontier: The frontier of the children of each pair.
+        """
+        nodes1, start1, end1, error1, exists1 = _children(
+            self.nodes_first,
+            self.params[:, 0],
+            self.params[:, 1],
+            self.errors[:, 0],
+        )
+        nodes2, start2, end2, error2, exists2 = _children(
+            self.nodes_second,
+            self.params[:, 2],
+            self.params[:, 3],
+            self.errors[:, 1],
+        )
+        # NOTE: ``np.nonzero()`` returns indices in row-major order, which
+        #       matches the order of ``itertools.product()``.
+        pair, child1, child2 = np.nonzero(
+            exists1[:, :, np.newaxis] & exists2[:, np.newaxis, :]
+        )
+        return CandidateFrontier(
+            self.original_first,
+            self.original_second,
+            nodes1[pair, child1],
+            nodes2[pair, child2],
+            np.stack(
+                [
+                    start1[pair, child1],
+                    end1[pair, child1],
+                    start2[pair, child2],
+                    end2[pair, child2],
+                ],
+                axis=1,
+            ),
+            np.stack([error1[pair, child1], error2[pair, child2]], axis=1),
+        )
+
+    def prune(self):
+        """Reduce number of candidate intersection pairs.
+
+        This is equivalent to :func:`prune_candidates`, using the convex
+        hull of each sub-curve.
+
+        Returns:
+            CandidateFrontier: The pruned frontier.
+        """
+        keep = _convex_hulls_collide_many(self.nodes_first, self.nodes_second)
+        return self.take(keep)
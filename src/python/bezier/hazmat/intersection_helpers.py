@@ -927,3 +927,5 @@ class IntersectionStrategy(enum.Enum):
     """Geometric approach to intersection (via subdivision)."""
     ALGEBRAIC = 1
     """Algebraic approach to intersection (via implicitization)."""
+    CLIPPING = 2
+    """B |eacute| zier clipping approach to intersection (via fat lines)."""
@@ -0,0 +1,293 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache for matrices that only depend on the degree of a shape.
+
+Many operations on B |eacute| zier curves and triangles (subdivision,
+degree-elevation, computing a hodograph) are linear maps on the nodes,
+so they can be applied as a matrix product on the right. The pure Python
+helpers hard-code these matrices for low degrees; for any other degree
+the matrices are built once and then stored in a shared least recently
+used (LRU) cache.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   from bezier.hazmat import curve_helpers
+   from bezier.hazmat import matrix_cache
+"""
+
+import collections
+import threading
+
+
+_DEFAULT_MAXSIZE = 128
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+CacheInfo.__doc__ = """Statistics for a :class:`MatrixCache`.
+
+This mirrors the value returned by the ``cache_info()`` method of a
+function wrapped with :func:`functools.lru_cache`.
+"""
+
+
+class MatrixCache:
+    """Least recently used cache of degree-dependent matrices.
+
+    Entries are keyed by a ``kind`` (e.g. ``"curve-subdivide"``) and a
+    degree. The cached matrices are marked read-only, since they are
+    shared by every caller.
+
+    .. doctest:: matrix-cache-constructor
+
+       >>> cache = matrix_cache.MatrixCache(maxsize=2)
+       >>> left, right = cache.get(
+       ...     "curve-subdivide", 5, curve_helpers.make_subdivision_matrices
+       ... )
+       >>> left.shape
+       (6, 6)
+       >>> left.flags.writeable
+       False
+       >>> _ = cache.get(
+       ...     "curve-subdivide", 5, curve_helpers.make_subdivision_matrices
+       ... )
+       >>> cache.info()
+       CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    Args:
+        maxsize (Optional[int]): The maximum number of entries held by the
+            cache. Defaults to 128.
+
+    Raises:
+        ValueError: If ``maxsize`` is negative.
+    """
+
+    __slots__ = ("_lock", "_maxsize", "_entries", "_hits", "_misses")
+
+    def __init__(self, maxsize=_DEFAULT_MAXSIZE):
+        _check_maxsize(maxsize)
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        """int: The maximum number of entries held by the cache."""
+        return self._maxsize
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current cache's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_maxsize": self._maxsize,
+            "_entries": self._entries,
+            "_hits": self._hits,
+            "_misses": self._misses,
+        }
+
+    def get(self, kind, degree, factory):
+        """Get the matrices of a given kind for a given degree.
+
+        If the matrices are not in the cache, they are computed with
+        ``factory(degree)`` and then added (evicting the least recently
+        used entry if the cache is full).
+
+        Args:
+            kind (str): The kind of matrices being requested.
+            degree (int): The degree of the curve or triangle.
+            factory (Callable[[int], Union[numpy.ndarray, \
+                Tuple[numpy.ndarray, ...]]]): Function that computes the
+                matrices for a given degree.
+
+        Returns:
+            Union[numpy.ndarray, Tuple[numpy.ndarray, ...]]: The (read-only)
+            matrices returned by ``factory``.
+        """
+        key = (kind, degree)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+            self._misses += 1
+
+        # NOTE: The factory is called without holding the lock, so (rarely)
+        #       two threads may both compute the same matrices.
+        value = factory(degree)
+        _freeze(value)
+        with self._lock:
+            self._entries[key] = value
+            self._evict()
+        return value
+
+    def resize(self, maxsize):
+        """Change the maximum number of entries held by the cache.
+
+        If the cache holds more than ``maxsize`` entries, the least
+        recently used entries are discarded.
+
+        Args:
+            maxsize (int): The new maximum number of entries.
+
+        Raises:
+            ValueError: If ``maxsize`` is negative.
+        """
+        _check_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """Remove every entry from the cache and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Get statistics about the cache.
+
+        Returns:
+            CacheInfo: The number of hits and misses, the maximum size and
+            the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def _evict(self):
+        """Discard least recently used entries until the cache fits.
+
+        .. note::
+
+           This assumes the caller holds the lock.
+        """
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (maxsize={:d}, currsize={:d})>".format(
+            self.__class__.__name__, self._maxsize, len(self._entries)
+        )
+
+
+def _check_maxsize(maxsize):
+    """Make sure the size of a cache is not negative.
+
+    Args:
+        maxsize (int): The maximum number of entries held by a cache.
+
+    Raises:
+        ValueError: If ``maxsize`` is negative.
+    """
+    if maxsize < 0:
+        raise ValueError("Cache size must be non-negative", maxsize)
+
+
+def _freeze(value):
+    """Mark a matrix (or a tuple of matrices) as read-only.
+
+    Args:
+        value (Union[numpy.ndarray, Tuple[numpy.ndarray, ...]]): The
+            matrices to freeze.
+    """
+    if isinstance(value, tuple):
+        for matrix in value:
+            matrix.flags.writeable = False
+    else:
+        value.flags.writeable = False
+
+
+_CACHE = MatrixCache()
+
+
+def get_matrices(kind, degree, factory):
+    """Get matrices from the shared cache.
+
+    This is used by the helpers in :mod:`.curve_helpers` and
+    :mod:`.triangle_helpers`. See :meth:`MatrixCache.get` for details.
+
+    Args:
+        kind (str): The kind of matrices being requested.
+        degree (int): The degree of the curve or triangle.
+        factory (Callable[[int], Union[numpy.ndarray, \
+            Tuple[numpy.ndarray, ...]]]): Function that computes the
+            matrices for a given degree.
+
+    Returns:
+        Union[numpy.ndarray, Tuple[numpy.ndarray, ...]]: The (read-only)
+        matrices returned by ``factory``.
+    """
+    return _CACHE.get(kind, degree, factory)
+
+
+def cache_info():
+    """Get statistics about the shared matrix cache.
+
+    .. doctest:: cache-info
+
+       >>> matrix_cache.cache_clear()
+       >>> nodes = np.zeros((2, 8), order="F")
+       >>> _ = curve_helpers.subdivide_nodes(nodes)
+       >>> _ = curve_helpers.subdivide_nodes(nodes)
+       >>> matrix_cache.cache_info()
+       CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+    .. testcleanup:: cache-info
+
+       matrix_cache.cache_clear()
+
+    Returns:
+        CacheInfo: The number of hits and misses, the maximum size and
+        the current size of the shared cache.
+    """
+    return _CACHE.info()
+
+
+def cache_clear():
+    """Remove every entry from the shared matrix cache."""
+    _CACHE.clear()
+
+
+def cache_resize(maxsize):
+    """Change the maximum number of entries in the shared matrix cache.
+
+    Args:
+        maxsize (int): The new maximum number of entries. Use ``0`` to
+            disable caching.
+
+    Raises:
+        ValueError: If ``maxsize`` is negative.
+    """
+    _CACHE.resize(maxsize)
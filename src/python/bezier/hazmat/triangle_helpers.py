@@ -24,6 +24,8 @@ import numpy as np
 from bezier.hazmat import curve_helpers
 from bezier.hazmat import helpers as _py_helpers
 from bezier.hazmat import intersection_helpers
+from bezier.hazmat import matrix_cache
+from bezier.hazmat import triangle_matrices
 
 
 _MAX_POLY_SUBDIVISIONS = 5
@@ -266,12 +268,6 @@ QUARTIC_SUBDIVIDE_D = (
     )
     / 16.0
 )
-_WEIGHTS_SUBDIVIDE0 = np.asfortranarray([1.0, 0.0, 0.0])
-_WEIGHTS_SUBDIVIDE1 = np.asfortranarray([0.5, 0.5, 0.0])
-_WEIGHTS_SUBDIVIDE2 = np.asfortranarray([0.5, 0.0, 0.5])
-_WEIGHTS_SUBDIVIDE3 = np.asfortranarray([0.0, 0.5, 0.5])
-_WEIGHTS_SUBDIVIDE4 = np.asfortranarray([0.0, 1.0, 0.0])
-_WEIGHTS_SUBDIVIDE5 = np.asfortranarray([0.0, 0.0, 1.0])
 # The Jacobian of a quadratric (in any dimension) as given by
 # dB/ds = [-2L1, 2(L1 - L2), 2L2, -2L3, 2L3, 0] * nodes
 # dB/dt = [-2L1, -2L2, 0, 2(L1 - L3), 2L2, 2L3] * nodes
@@ -1143,34 +1139,15 @@ def subdivide_nodes(nodes, degree):
         nodes_c = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_C)
         nodes_d = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_D)
     else:
-        nodes_a = specialize_triangle(
-            nodes,
+        mat_a, mat_b, mat_c, mat_d = matrix_cache.get_matrices(
+            "triangle-subdivide",
             degree,
-            _WEIGHTS_SUBDIVIDE0,
-            _WEIGHTS_SUBDIVIDE1,
-            _WEIGHTS_SUBDIVIDE2,
-        )
-        nodes_b = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE3,
-            _WEIGHTS_SUBDIVIDE2,
-            _WEIGHTS_SUBDIVIDE1,
-        )
-        nodes_c = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE1,
-            _WEIGHTS_SUBDIVIDE4,
-            _WEIGHTS_SUBDIVIDE3,
-        )
-        nodes_d = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE2,
-            _WEIGHTS_SUBDIVIDE3,
-            _WEIGHTS_SUBDIVIDE5,
+            triangle_matrices.make_subdivision_matrices,
         )
+        nodes_a = _py_helpers.matrix_product(nodes, mat_a)
+        nodes_b = _py_helpers.matrix_product(nodes, mat_b)
+        nodes_c = _py_helpers.matrix_product(nodes, mat_c)
+        nodes_d = _py_helpers.matrix_product(nodes, mat_d)
     return nodes_a, nodes_b, nodes_c, nodes_d
 
 
@@ -1257,10 +1234,21 @@ def jacobian_both(nodes, degree, dimension):
         numpy.ndarray: Nodes of the Jacobian triangles in
         B |eacute| zier form.
     """
+    if degree == 1:
+        # NOTE: For a linear triangle, two differences are cheaper than the
+        #       cache lookup and the matrix products.
+        result = np.empty((2 * dimension, 1), order="F")
+        result[:dimension, 0] = nodes[:, 1] - nodes[:, 0]
+        result[dimension:, 0] = nodes[:, 2] - nodes[:, 0]
+        return result
+
     _, num_nodes = nodes.shape
+    jac_s, jac_t = matrix_cache.get_matrices(
+        "triangle-jacobian", degree, triangle_matrices.make_jacobian_matrices
+    )
     result = np.empty((2 * dimension, num_nodes - degree - 1), order="F")
-    result[:dimension, :] = jacobian_s(nodes, degree, dimension)
-    result[dimension:, :] = jacobian_t(nodes, degree, dimension)
+    result[:dimension, :] = _py_helpers.matrix_product(nodes, jac_s)
+    result[dimension:, :] = _py_helpers.matrix_product(nodes, jac_t)
     return result
 
 
@@ -2801,14 +2789,48 @@ def evaluate_barycentric(nodes, degree, lambda1, lambda2, lambda3):
         numpy.ndarray: The evaluated point as a ``D x 1`` array (where ``D``
         is the ambient dimension where ``nodes`` reside).
     """
-    dimension, num_nodes = nodes.shape
+    dimension, _ = nodes.shape
+    # curve evaluate_multi_barycentric() takes arrays.
+    return _evaluate_barycentric_vals(
+        nodes,
+        degree,
+        np.asfortranarray([lambda1]),
+        np.asfortranarray([lambda2]),
+        np.asfortranarray([lambda3]),
+        dimension,
+    )
+
+
+def _evaluate_barycentric_vals(
+    nodes, degree, lambda1, lambda2, lambda3, dimension
+):
+    r"""Compute many points on a triangle.
+
+    Helper for :func:`evaluate_barycentric` and the ``*_multi`` evaluation
+    functions. Does the same computation as :func:`evaluate_barycentric`
+    for every triple of barycentric parameters at once.
+
+    Args:
+        nodes (numpy.ndarray): Control point nodes that define the triangle.
+        degree (int): The degree of the triangle define by ``nodes``.
+        lambda1 (numpy.ndarray): Parameters along the reference triangle
+            (as a 1D array).
+        lambda2 (numpy.ndarray): Parameters along the reference triangle
+            (as a 1D array).
+        lambda3 (numpy.ndarray): Parameters along the reference triangle
+            (as a 1D array).
+        dimension (int): The dimension the triangle lives in.
+
+    Returns:
+        numpy.ndarray: The evaluated points, where columns correspond to
+        each triple of parameters.
+    """
+    _, num_nodes = nodes.shape
+    (num_vals,) = lambda1.shape
     binom_val = 1.0
-    result = np.zeros((dimension, 1), order="F")
+    result = np.zeros((dimension, num_vals), order="F")
     index = num_nodes - 1
-    result[:, 0] += nodes[:, index]
-    # curve evaluate_multi_barycentric() takes arrays.
-    lambda1 = np.asfortranarray([lambda1])
-    lambda2 = np.asfortranarray([lambda2])
+    result += nodes[:, [index]]
     for k in range(degree - 1, -1, -1):
         # We want to go from (d C (k + 1)) to (d C k).
         binom_val = (binom_val * (k + 1)) / (degree - k)
@@ -2849,13 +2871,14 @@ def evaluate_barycentric_multi(nodes, degree, param_vals, dimension):
         rows of ``param_vals`` and the rows to the dimension of the
         underlying triangle.
     """
-    num_vals, _ = param_vals.shape
-    result = np.empty((dimension, num_vals), order="F")
-    for index, (lambda1, lambda2, lambda3) in enumerate(param_vals):
-        result[:, index] = evaluate_barycentric(
-            nodes, degree, lambda1, lambda2, lambda3
-        )[:, 0]
-    return result
+    return _evaluate_barycentric_vals(
+        nodes,
+        degree,
+        np.asfortranarray(param_vals[:, 0]),
+        np.asfortranarray(param_vals[:, 1]),
+        np.asfortranarray(param_vals[:, 2]),
+        dimension,
+    )
 
 
 def evaluate_cartesian_multi(nodes, degree, param_vals, dimension):
@@ -2878,13 +2901,11 @@ def evaluate_cartesian_multi(nodes, degree, param_vals, dimension):
         rows of ``param_vals`` and the rows to the dimension of the
         underlying triangle.
     """
-    num_vals, _ = param_vals.shape
-    result = np.empty((dimension, num_vals), order="F")
-    for index, (s, t) in enumerate(param_vals):
-        result[:, index] = evaluate_barycentric(
-            nodes, degree, 1.0 - s - t, s, t
-        )[:, 0]
-    return result
+    s_vals = np.asfortranarray(param_vals[:, 0])
+    t_vals = np.asfortranarray(param_vals[:, 1])
+    return _evaluate_barycentric_vals(
+        nodes, degree, 1.0 - s_vals - t_vals, s_vals, t_vals, dimension
+    )
 
 
 def compute_edge_nodes(nodes, degree):
@@ -22,14 +22,21 @@ import itertools
 import numpy as np
 
 from bezier.hazmat import algebraic_intersection
+from bezier.hazmat import clipping
 from bezier.hazmat import geometric_intersection
 from bezier.hazmat import helpers as _py_helpers
 from bezier.hazmat import intersection_helpers
+from bezier.hazmat import matrix_cache
 from bezier.hazmat import triangle_helpers
+from bezier.hazmat import triangle_matrices
 
 
 MAX_LOCATE_SUBDIVISIONS = 20
 LOCATE_EPS = 0.5 ** 47
+# When a ``LocateIndex`` is used, Newton's method starts from the leaves
+# of the index, so a few more steps are allowed.
+LOCATE_INDEX_NEWTON_STEPS = 8
+LOCATE_INDEX_WIGGLE = 0.5 ** 40
 INTERSECTION_T = geometric_intersection.BoxIntersectionType.INTERSECTION
 CLASSIFICATION_T = intersection_helpers.IntersectionClassification
 UNUSED_T = CLASSIFICATION_T.COINCIDENT_UNUSED
@@ -90,7 +97,7 @@ def newton_refine_solve(jac_both, x_val, triangle_x, y_val, triangle_y):
     return delta_s, delta_t
 
 
-def newton_refine(nodes, degree, x_val, y_val, s, t):
+def newton_refine(nodes, degree, x_val, y_val, s, t, jac_nodes=None):
     r"""Refine a solution to :math:`B(s, t) = p` using Newton's method.
 
     .. note::
@@ -192,6 +199,8 @@ def newton_refine(nodes, degree, x_val, y_val, s, t):
             on the triangle.
         s (float): Approximate :math:`s`-value to be refined.
         t (float): Approximate :math:`t`-value to be refined.
+        jac_nodes (Optional[numpy.ndarray]): The nodes of the Jacobian of
+            the triangle (see :func:`.jacobian_both`), if already computed.
 
     Returns:
         Tuple[float, float]: The refined :math:`s` and :math:`t` values.
@@ -204,8 +213,9 @@ def newton_refine(nodes, degree, x_val, y_val, s, t):
         # No refinement is needed.
         return s, t
 
-    # NOTE: This function assumes ``dimension==2`` (i.e. since ``x, y``).
-    jac_nodes = triangle_helpers.jacobian_both(nodes, degree, 2)
+    if jac_nodes is None:
+        # NOTE: This function assumes ``dimension==2`` (i.e. since ``x, y``).
+        jac_nodes = triangle_helpers.jacobian_both(nodes, degree, 2)
     # The degree of the jacobian is one less.
     jac_both = triangle_helpers.evaluate_barycentric(
         jac_nodes, degree - 1, lambda1, s, t
@@ -302,7 +312,7 @@ def mean_centroid(candidates):
     return sum_x / denom, sum_y / denom
 
 
-def locate_point(nodes, degree, x_val, y_val):
+def locate_point(nodes, degree, x_val, y_val, jac_nodes=None):
     r"""Locate a point on a triangle.
 
     .. note::
@@ -323,6 +333,8 @@ def locate_point(nodes, degree, x_val, y_val):
             on the triangle.
         y_val (float): The :math:`y`-coordinate of a point
             on the triangle.
+        jac_nodes (Optional[numpy.ndarray]): The nodes of the Jacobian of
+            the triangle (see :func:`.jacobian_both`), if already computed.
 
     Returns:
         Optional[Tuple[float, float]]: The :math:`s` and :math:`t`
@@ -346,7 +358,9 @@ def locate_point(nodes, degree, x_val, y_val):
     # We take the average of all centroids from the candidates
     # that may contain the point.
     s_approx, t_approx = mean_centroid(candidates)
-    s, t = newton_refine(nodes, degree, x_val, y_val, s_approx, t_approx)
+    s, t = newton_refine(
+        nodes, degree, x_val, y_val, s_approx, t_approx, jac_nodes=jac_nodes
+    )
     actual = triangle_helpers.evaluate_barycentric(
         nodes, degree, 1.0 - s - t, s, t
     )
@@ -354,10 +368,620 @@ def locate_point(nodes, degree, x_val, y_val):
     if not _py_helpers.vector_close(
         actual.ravel(order="F"), expected, eps=LOCATE_EPS
     ):
-        s, t = newton_refine(nodes, degree, x_val, y_val, s, t)
+        s, t = newton_refine(
+            nodes, degree, x_val, y_val, s, t, jac_nodes=jac_nodes
+        )
     return s, t
 
 
+def _subdivide_candidates(
+    triangles, centroids_x, centroids_y, widths, sub_mats
+):
+    """Subdivide many candidate sub-triangles at once.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points` and
+       :class:`LocateIndex`.
+
+    As in :func:`update_locate_candidates`, each sub-triangle is described
+    by triple its centroid and the (signed) width of its parameter space.
+
+    Args:
+        triangles (numpy.ndarray): The nodes of each sub-triangle (as a
+            ``D x N x M`` array).
+        centroids_x (numpy.ndarray): Three times the centroid ``x``-value
+            of each sub-triangle.
+        centroids_y (numpy.ndarray): Three times the centroid ``y``-value
+            of each sub-triangle.
+        widths (numpy.ndarray): The width of each sub-triangle.
+        sub_mats (Tuple[numpy.ndarray, ...]): The subdivision matrices
+            (see :func:`.triangle_matrices.make_subdivision_matrices`).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        The same four values for the ``4 M`` sub-triangles, in four blocks
+        of ``M`` (i.e. the :math:`j`-th child of sub-triangle :math:`k` is
+        at index :math:`k + jM`).
+    """
+    triangles = np.concatenate(
+        [np.einsum("ijk,jl->ilk", triangles, sub_mat) for sub_mat in sub_mats],
+        axis=2,
+    )
+    half_widths = 0.5 * widths
+    # NOTE: The sub-triangles are in the same order as in
+    #       ``update_locate_candidates``.
+    centroids_x = np.concatenate(
+        [
+            centroids_x - half_widths,
+            centroids_x,
+            centroids_x + widths,
+            centroids_x - half_widths,
+        ]
+    )
+    centroids_y = np.concatenate(
+        [
+            centroids_y - half_widths,
+            centroids_y,
+            centroids_y - half_widths,
+            centroids_y + widths,
+        ]
+    )
+    widths = np.concatenate(
+        [half_widths, -half_widths, half_widths, half_widths]
+    )
+    return triangles, centroids_x, centroids_y, widths
+
+
+def _located_close(actual, expected):
+    """Check if located points are close to the points being located.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    This is :func:`.vector_close` (with ``eps=LOCATE_EPS``) applied to
+    every column at once.
+
+    Args:
+        actual (numpy.ndarray): The points on the triangle (as a ``2 x N``
+            array).
+        expected (numpy.ndarray): The points being located.
+
+    Returns:
+        numpy.ndarray: Flags indicating if each pair of points is close.
+    """
+    sizes_actual = np.linalg.norm(actual, ord=2, axis=0)
+    sizes_expected = np.linalg.norm(expected, ord=2, axis=0)
+    min_sizes = np.minimum(sizes_actual, sizes_expected)
+    return np.where(
+        min_sizes == 0.0,
+        np.maximum(sizes_actual, sizes_expected) <= LOCATE_EPS,
+        np.linalg.norm(actual - expected, ord=2, axis=0)
+        <= LOCATE_EPS * min_sizes,
+    )
+
+
+def _newton_refine_multi(nodes, degree, jac_nodes, points, s_vals, t_vals):
+    """Refine many solutions to :math:`B(s, t) = p` using Newton's method.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    Takes one step of :func:`newton_refine` for every point at once.
+
+    Args:
+        nodes (numpy.ndarray): Array of nodes in a triangle.
+        degree (int): The degree of the triangle.
+        jac_nodes (numpy.ndarray): The nodes of the Jacobian of the
+            triangle (see :func:`.jacobian_both`).
+        points (numpy.ndarray): The points being located (as a ``2 x N``
+            array).
+        s_vals (numpy.ndarray): Approximate :math:`s`-values to be refined.
+        t_vals (numpy.ndarray): Approximate :math:`t`-values to be refined.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The refined
+        :math:`s` and :math:`t` values and the points on the triangle at
+        the refined values.
+    """
+    param_vals = np.column_stack([1.0 - s_vals - t_vals, s_vals, t_vals])
+    pt_delta = points - triangle_helpers.evaluate_barycentric_multi(
+        nodes, degree, param_vals, 2
+    )
+    jac_vals = triangle_helpers.evaluate_barycentric_multi(
+        jac_nodes, degree - 1, param_vals, 4
+    )
+    delta_s, delta_t = _newton_solve_multi(jac_vals, pt_delta)
+    s_vals = s_vals + delta_s
+    t_vals = t_vals + delta_t
+    param_vals = np.column_stack([1.0 - s_vals - t_vals, s_vals, t_vals])
+    actual = triangle_helpers.evaluate_barycentric_multi(
+        nodes, degree, param_vals, 2
+    )
+    return s_vals, t_vals, actual
+
+
+def _newton_solve_multi(jac_vals, pt_delta):
+    r"""Solve many of the linear systems in :func:`newton_refine_solve`.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`_newton_refine_multi`.
+
+    Args:
+        jac_vals (numpy.ndarray): A ``4 x N`` array; each column contains
+            the :math:`A, B, C, D` values from :func:`newton_refine_solve`.
+        pt_delta (numpy.ndarray): A ``2 x N`` array; each column contains
+            the :math:`E, F` values from :func:`newton_refine_solve`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The updates
+        :math:`\Delta s` and :math:`\Delta t` for each column.
+    """
+    a_vals, b_vals, c_vals, d_vals = jac_vals
+    e_vals, f_vals = pt_delta
+    # NOTE: No refinement is needed for points that are hit exactly.
+    to_refine = (e_vals != 0.0) | (f_vals != 0.0)
+    denoms = a_vals * d_vals - b_vals * c_vals
+    delta_s = np.divide(
+        d_vals * e_vals - c_vals * f_vals,
+        denoms,
+        out=np.zeros_like(denoms),
+        where=to_refine,
+    )
+    delta_t = np.divide(
+        a_vals * f_vals - b_vals * e_vals,
+        denoms,
+        out=np.zeros_like(denoms),
+        where=to_refine,
+    )
+    return delta_s, delta_t
+
+
+def locate_points(nodes, degree, points, jac_nodes=None, index=None):
+    r"""Locate many points on a triangle.
+
+    Does the same thing as :func:`locate_point`, but for every point at
+    once. The triangle is subdivided level by level, and at each level the
+    bounding boxes of the sub-triangles are checked against every point
+    that is still a candidate for that sub-triangle. A sub-triangle is only
+    subdivided if its bounding box contains at least one point, so the
+    subdivision is shared by all of the points. Finally, Newton's method
+    is applied to every point at once.
+
+    If a (pre-computed) :class:`LocateIndex` is provided, the subdivision
+    is skipped: the leaves of the index that may contain each point are
+    found by descending the index and Newton's method is started from the
+    centroid of those leaves. Any point where this does not converge to
+    a parameter in the reference triangle falls back to the subdivision.
+
+    .. note::
+
+       This assumes, but does not check, that ``points`` is ``2 x N``.
+
+    .. note::
+
+       This does not have a Fortran speedup.
+
+    .. testsetup:: locate-points-triangle
+
+       import numpy as np
+       from bezier.hazmat import triangle_intersection
+
+    .. doctest:: locate-points-triangle
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0,  0.5 , 1.0, 0.25, 0.75, 0.0],
+       ...     [0.0, -0.25, 0.0, 0.5 , 0.75, 1.0],
+       ... ])
+       >>> points = np.asfortranarray([
+       ...     [0.59375, 2.0, 0.375  ],
+       ...     [0.25   , 2.0, 0.53125],
+       ... ])
+       >>> triangle_intersection.locate_points(nodes, 2, points)
+       array([[0.5 , nan, 0.25],
+              [0.25, nan, 0.5 ]])
+
+    Args:
+        nodes (numpy.ndarray): Control points for B |eacute| zier triangle
+            (assumed to be two-dimensional).
+        degree (int): The degree of the triangle.
+        points (numpy.ndarray): The points to locate (as a ``2 x N``
+            array).
+        jac_nodes (Optional[numpy.ndarray]): The nodes of the Jacobian of
+            the triangle (see :func:`.jacobian_both`), if already computed.
+        index (Optional[LocateIndex]): An index built for the same
+            triangle.
+
+    Returns:
+        numpy.ndarray: A ``2 x N`` array of the :math:`s` and :math:`t`
+        values corresponding to each point. If a point is not on the
+        triangle, both values are NaN.
+    """
+    _, num_points = points.shape
+    result = np.full((2, num_points), np.nan, order="F")
+    if num_points == 0:
+        return result
+
+    if jac_nodes is None:
+        jac_nodes = triangle_helpers.jacobian_both(nodes, degree, 2)
+    if index is not None:
+        _locate_with_index(nodes, degree, points, jac_nodes, index, result)
+        return result
+
+    found, s_vals, t_vals = _mean_centroids(
+        *_locate_frontier(nodes, degree, points), num_points
+    )
+    if found.size == 0:
+        return result
+
+    result[0, found], result[1, found] = _refine_located(
+        nodes, degree, jac_nodes, points[:, found], s_vals, t_vals
+    )
+    return result
+
+
+def _locate_frontier(nodes, degree, points):
+    """Find the sub-triangles that may contain each of many points.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    The triangle is subdivided :data:`MAX_LOCATE_SUBDIVISIONS` times, but
+    only the sub-triangles with a bounding box that contains a point are
+    subdivided.
+
+    Args:
+        nodes (numpy.ndarray): Control points for B |eacute| zier triangle
+            (assumed to be two-dimensional).
+        degree (int): The degree of the triangle.
+        points (numpy.ndarray): The points to locate (as a ``2 x N``
+            array).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        The point and the sub-triangle in each (point, sub-triangle) pair
+        that is still a candidate and (triple) the centroids of every
+        sub-triangle.
+    """
+    sub_mats = matrix_cache.get_matrices(
+        "triangle-subdivide",
+        degree,
+        triangle_matrices.make_subdivision_matrices,
+    )
+    # As in ``locate_point``, we track triple the centroid and the (signed)
+    # width of each sub-triangle.
+    triangles = nodes[:, :, np.newaxis]
+    centroids_x = np.ones(1)
+    centroids_y = np.ones(1)
+    widths = np.ones(1)
+    # Each (point, sub-triangle) pair that is still a candidate.
+    point_ids = np.arange(points.shape[1])
+    triangle_ids = np.zeros_like(point_ids)
+    for _ in range(MAX_LOCATE_SUBDIVISIONS + 1):
+        inside = _inside_boxes(
+            np.min(triangles, axis=1)[:, triangle_ids],
+            np.max(triangles, axis=1)[:, triangle_ids],
+            points[:, point_ids],
+        )
+        point_ids = point_ids[inside]
+        # Only keep (and subdivide) the sub-triangles that contain a point.
+        kept, triangle_ids = np.unique(
+            triangle_ids[inside], return_inverse=True
+        )
+        triangles, centroids_x, centroids_y, widths = _subdivide_candidates(
+            triangles[:, :, kept],
+            centroids_x[kept],
+            centroids_y[kept],
+            widths[kept],
+            sub_mats,
+        )
+        point_ids = np.tile(point_ids, 4)
+        triangle_ids = np.concatenate(
+            [triangle_ids + index * kept.size for index in range(4)]
+        )
+    return point_ids, triangle_ids, centroids_x, centroids_y
+
+
+def _inside_boxes(min_vals, max_vals, points):
+    """Check if points are inside of bounding boxes.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points` and
+       :class:`LocateIndex`.
+
+    Args:
+        min_vals (numpy.ndarray): The lower-left corner of each box (as a
+            ``2 x N`` array).
+        max_vals (numpy.ndarray): The upper-right corner of each box.
+        points (numpy.ndarray): The points (as a ``2 x N`` array).
+
+    Returns:
+        numpy.ndarray: Flags indicating if each point is in its box.
+    """
+    return np.all((min_vals <= points) & (points <= max_vals), axis=0)
+
+
+def _mean_centroids(point_ids, cell_ids, centroids_x, centroids_y, num_points):
+    """Average the centroids of the candidates for each of many points.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    Args:
+        point_ids (numpy.ndarray): The point in each (point, sub-triangle)
+            pair.
+        cell_ids (numpy.ndarray): The sub-triangle in each pair.
+        centroids_x (numpy.ndarray): Three times the centroid ``x``-value
+            of each sub-triangle.
+        centroids_y (numpy.ndarray): Three times the centroid ``y``-value
+            of each sub-triangle.
+        num_points (int): The number of points.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The points with
+        at least one candidate and the mean of the centroids (i.e. the
+        starting :math:`s` and :math:`t` values) for each of them.
+    """
+    counts = 3 * np.bincount(point_ids, minlength=num_points)
+    (found,) = np.nonzero(counts)
+    s_vals = (
+        np.bincount(
+            point_ids, weights=centroids_x[cell_ids], minlength=num_points
+        )[found]
+        / counts[found]
+    )
+    t_vals = (
+        np.bincount(
+            point_ids, weights=centroids_y[cell_ids], minlength=num_points
+        )[found]
+        / counts[found]
+    )
+    return found, s_vals, t_vals
+
+
+def _refine_located(nodes, degree, jac_nodes, points, s_vals, t_vals):
+    """Refine located points with (at most) two steps of Newton's method.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    Args:
+        nodes (numpy.ndarray): Array of nodes in a triangle.
+        degree (int): The degree of the triangle.
+        jac_nodes (numpy.ndarray): The nodes of the Jacobian of the
+            triangle (see :func:`.jacobian_both`).
+        points (numpy.ndarray): The points being located (as a ``2 x N``
+            array).
+        s_vals (numpy.ndarray): Approximate :math:`s`-values to be refined.
+        t_vals (numpy.ndarray): Approximate :math:`t`-values to be refined.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The refined :math:`s` and
+        :math:`t` values.
+    """
+    s_vals, t_vals, actual = _newton_refine_multi(
+        nodes, degree, jac_nodes, points, s_vals, t_vals
+    )
+    # Take a second Newton step for any point that isn't close enough.
+    close = _located_close(actual, points)
+    if not np.all(close):
+        (indices,) = np.nonzero(~close)
+        s_vals[indices], t_vals[indices], _ = _newton_refine_multi(
+            nodes,
+            degree,
+            jac_nodes,
+            points[:, indices],
+            s_vals[indices],
+            t_vals[indices],
+        )
+    return s_vals, t_vals
+
+
+def _locate_with_index(nodes, degree, points, jac_nodes, index, result):
+    """Locate many points on a triangle with the help of an index.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_points`.
+
+    .. note::
+
+       This updates ``result`` in place.
+
+    Args:
+        nodes (numpy.ndarray): Control points for B |eacute| zier triangle
+            (assumed to be two-dimensional).
+        degree (int): The degree of the triangle.
+        points (numpy.ndarray): The points to locate (as a ``2 x N``
+            array).
+        jac_nodes (numpy.ndarray): The nodes of the Jacobian of the
+            triangle.
+        index (LocateIndex): An index built for the same triangle.
+        result (numpy.ndarray): The ``2 x N`` array of :math:`s` and
+            :math:`t` values (NaN for each point not on the triangle).
+    """
+    active, s_vals, t_vals = _mean_centroids(
+        *index.candidates(points),
+        index.centroids_x,
+        index.centroids_y,
+        points.shape[1],
+    )
+    fallback = []
+    for _ in range(LOCATE_INDEX_NEWTON_STEPS):
+        expected = points[:, active]
+        s_vals, t_vals, actual = _newton_refine_multi(
+            nodes, degree, jac_nodes, expected, s_vals, t_vals
+        )
+        close = _located_close(actual, expected)
+        accepted = (
+            close
+            & (-LOCATE_INDEX_WIGGLE <= s_vals)
+            & (-LOCATE_INDEX_WIGGLE <= t_vals)
+            & (s_vals + t_vals <= 1.0 + LOCATE_INDEX_WIGGLE)
+        )
+        result[0, active[accepted]] = s_vals[accepted]
+        result[1, active[accepted]] = t_vals[accepted]
+        fallback.append(active[close & ~accepted])
+        active = active[~close]
+        s_vals = s_vals[~close]
+        t_vals = t_vals[~close]
+        if active.size == 0:
+            break
+
+    # NOTE: Points that converged outside of the reference triangle (e.g.
+    #       points just outside of an edge) or that didn't converge are
+    #       located without the index.
+    fallback.append(active)
+    fallback = np.concatenate(fallback)
+    if fallback.size > 0:
+        result[:, fallback] = locate_points(
+            nodes, degree, points[:, fallback], jac_nodes=jac_nodes
+        )
+
+
+class LocateIndex:
+    r"""Index used to speed up locating points on a triangle.
+
+    This is a quadtree of the sub-triangles produced by subdividing the
+    triangle ``depth`` times (see :func:`.subdivide_nodes`). Each level of
+    the tree stores the bounding boxes of the control points of its
+    sub-triangles and the leaves store (triple) their centroids in the
+    reference triangle. Building the index is relatively expensive, but
+    it can be re-used to locate any number of points on the same triangle
+    (see :func:`locate_points`).
+
+    .. testsetup:: locate-index
+
+       import numpy as np
+       from bezier.hazmat import triangle_intersection
+
+    .. doctest:: locate-index
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0,  0.5 , 1.0, 0.25, 0.75, 0.0],
+       ...     [0.0, -0.25, 0.0, 0.5 , 0.75, 1.0],
+       ... ])
+       >>> index = triangle_intersection.LocateIndex(nodes, 2, 3)
+       >>> index.centroids_x.shape
+       (64,)
+       >>> points = np.asfortranarray([
+       ...     [0.59375, 2.0, 0.375  ],
+       ...     [0.25   , 2.0, 0.53125],
+       ... ])
+       >>> triangle_intersection.locate_points(
+       ...     nodes, 2, points, index=index
+       ... )
+       array([[0.5 , nan, 0.25],
+              [0.25, nan, 0.5 ]])
+
+    Args:
+        nodes (numpy.ndarray): Control points for B |eacute| zier triangle
+            (assumed to be two-dimensional).
+        degree (int): The degree of the triangle.
+        depth (int): The number of times to subdivide the triangle.
+    """
+
+    __slots__ = (
+        "depth",  # From constructor
+        "centroids_x",  # Built in constructor
+        "centroids_y",  # Built in constructor
+        "_min_vals",  # Built in constructor
+        "_max_vals",  # Built in constructor
+    )
+
+    def __init__(self, nodes, degree, depth):
+        sub_mats = matrix_cache.get_matrices(
+            "triangle-subdivide",
+            degree,
+            triangle_matrices.make_subdivision_matrices,
+        )
+        triangles = nodes[:, :, np.newaxis]
+        centroids_x = np.ones(1)
+        centroids_y = np.ones(1)
+        widths = np.ones(1)
+        self._min_vals = [np.min(triangles, axis=1)]
+        self._max_vals = [np.max(triangles, axis=1)]
+        for _ in range(depth):
+            (
+                triangles,
+                centroids_x,
+                centroids_y,
+                widths,
+            ) = _subdivide_candidates(
+                triangles, centroids_x, centroids_y, widths, sub_mats
+            )
+            self._min_vals.append(np.min(triangles, axis=1))
+            self._max_vals.append(np.max(triangles, axis=1))
+        self.depth = depth
+        self.centroids_x = centroids_x
+        self.centroids_y = centroids_y
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current index's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "depth": self.depth,
+            "centroids_x": self.centroids_x,
+            "centroids_y": self.centroids_y,
+            "_min_vals": self._min_vals,
+            "_max_vals": self._max_vals,
+        }
+
+    def candidates(self, points):
+        """Find the leaves that may contain each of many points.
+
+        Descends the quadtree, only visiting the children of sub-triangles
+        with bounding boxes that contain a point.
+
+        Args:
+            points (numpy.ndarray): The points to locate (as a ``2 x N``
+                array).
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The point and the leaf in
+            each (point, leaf) pair where the bounding box of the leaf
+            contains the point.
+        """
+        _, num_points = points.shape
+        point_ids = np.arange(num_points)
+        node_ids = np.zeros(num_points, dtype=np.intp)
+        for level, (min_vals, max_vals) in enumerate(
+            zip(self._min_vals, self._max_vals)
+        ):
+            if level > 0:
+                # See ``_subdivide_candidates`` for the order of children.
+                num_parents = 4 ** (level - 1)
+                point_ids = np.tile(point_ids, 4)
+                node_ids = np.concatenate(
+                    [node_ids + index * num_parents for index in range(4)]
+                )
+            inside = _inside_boxes(
+                min_vals[:, node_ids],
+                max_vals[:, node_ids],
+                points[:, point_ids],
+            )
+            point_ids = point_ids[inside]
+            node_ids = node_ids[inside]
+        return point_ids, node_ids
+
+
 def same_intersection(intersection1, intersection2, wiggle=0.5 ** 40):
     """Check if two intersections are close to machine precision.
 
@@ -879,3 +1503,36 @@ def algebraic_intersect(nodes1, degree1, nodes2, degree2, verify):
     return generic_intersect(
         nodes1, degree1, nodes2, degree2, verify, all_intersections
     )
+
+
+def clipping_intersect(nodes1, degree1, nodes2, degree2, verify):
+    r"""Find all intersections among edges of two triangles.
+
+    Uses :func:`generic_intersect` with the
+    :attr:`~.IntersectionStrategy.CLIPPING` intersection strategy.
+
+    Args:
+        nodes1 (numpy.ndarray): The nodes defining the first triangle in
+            the intersection (assumed in :math:`\mathbf{R}^2`).
+        degree1 (int): The degree of the triangle given by ``nodes1``.
+        nodes2 (numpy.ndarray): The nodes defining the second triangle in
+            the intersection (assumed in :math:`\mathbf{R}^2`).
+        degree2 (int): The degree of the triangle given by ``nodes2``.
+        verify (Optional[bool]): Indicates if duplicate intersections
+            should be checked.
+
+    Returns:
+        Tuple[Optional[list], Optional[bool], tuple]: 3-tuple of
+
+        * List of "edge info" lists. Each list represents a curved polygon
+          and contains 3-tuples of edge index, start and end (see the
+          output of :func:`.ends_to_curve`).
+        * "Contained" boolean. If not :data:`None`, indicates
+          that one of the triangles is contained in the other.
+        * The nodes of three edges of the first triangle being intersected
+          followed by the nodes of the three edges of the second.
+    """
+    all_intersections = clipping.all_intersections
+    return generic_intersect(
+        nodes1, degree1, nodes2, degree2, verify, all_intersections
+    )
@@ -0,0 +1,266 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Degree-dependent matrices for B |eacute| zier triangles.
+
+Subdivision, computing the Jacobian, comparing to a flat triangle and
+degree-elevation are all linear maps on the nodes of a triangle, so each
+can be applied as a matrix product on the right. The matrices only depend
+on the degree of the triangle; they are built by the functions in this
+module and stored in the shared :mod:`.matrix_cache`.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+"""
+
+import numpy as np
+
+from bezier.hazmat import helpers as _py_helpers
+from bezier.hazmat import matrix_cache
+
+
+_WEIGHTS_SUBDIVIDE0 = np.asfortranarray([1.0, 0.0, 0.0])
+_WEIGHTS_SUBDIVIDE1 = np.asfortranarray([0.5, 0.5, 0.0])
+_WEIGHTS_SUBDIVIDE2 = np.asfortranarray([0.5, 0.0, 0.5])
+_WEIGHTS_SUBDIVIDE3 = np.asfortranarray([0.0, 0.5, 0.5])
+_WEIGHTS_SUBDIVIDE4 = np.asfortranarray([0.0, 1.0, 0.0])
+_WEIGHTS_SUBDIVIDE5 = np.asfortranarray([0.0, 0.0, 1.0])
+
+
+def make_subdivision_matrices(degree):
+    """Make the matrices used to subdivide a triangle.
+
+    .. note::
+
+        This is a helper for :func:`.triangle_helpers.subdivide_nodes` and
+        for the batched subdivision in :mod:`.triangle_intersection`.
+
+    Since :func:`.specialize_triangle` is linear in the nodes, specializing
+    the identity matrix gives the matrix that specializes any set of nodes.
+    The result is stored in the shared :mod:`.matrix_cache` by the callers,
+    so these matrices are only built once for each degree.
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The
+        matrices used to convert the nodes into the nodes of each of the four
+        sub-triangles.
+    """
+    # NOTE: ``triangle_helpers`` depends on this module, so it can't be
+    #       imported at the top level.
+    # pylint: disable=import-outside-toplevel
+    from bezier.hazmat import triangle_helpers
+
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    id_mat = np.eye(num_nodes, order="F")
+    mat_a = triangle_helpers.specialize_triangle(
+        id_mat,
+        degree,
+        _WEIGHTS_SUBDIVIDE0,
+        _WEIGHTS_SUBDIVIDE1,
+        _WEIGHTS_SUBDIVIDE2,
+    )
+    mat_b = triangle_helpers.specialize_triangle(
+        id_mat,
+        degree,
+        _WEIGHTS_SUBDIVIDE3,
+        _WEIGHTS_SUBDIVIDE2,
+        _WEIGHTS_SUBDIVIDE1,
+    )
+    mat_c = triangle_helpers.specialize_triangle(
+        id_mat,
+        degree,
+        _WEIGHTS_SUBDIVIDE1,
+        _WEIGHTS_SUBDIVIDE4,
+        _WEIGHTS_SUBDIVIDE3,
+    )
+    mat_d = triangle_helpers.specialize_triangle(
+        id_mat,
+        degree,
+        _WEIGHTS_SUBDIVIDE2,
+        _WEIGHTS_SUBDIVIDE3,
+        _WEIGHTS_SUBDIVIDE5,
+    )
+    return mat_a, mat_b, mat_c, mat_d
+
+
+def make_jacobian_matrices(degree):
+    r"""Make the matrices used to compute the Jacobian of a triangle.
+
+    .. note::
+
+        This is a helper for :func:`.jacobian_both`.
+
+    Since :func:`.jacobian_s` and :func:`.jacobian_t` are linear in the
+    nodes, applying them to the identity matrix gives the matrices that
+    compute :math:`B_s` and :math:`B_t` (the hodographs of the triangle)
+    for any set of nodes. The result is stored in the shared
+    :mod:`.matrix_cache` by :func:`.jacobian_both`, so these matrices are
+    only built once for each degree. (A linear triangle skips the cache,
+    since its Jacobian is just two differences.)
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The matrices used to convert
+        the nodes into the nodes of :math:`B_s` and :math:`B_t`,
+        respectively.
+    """
+    # NOTE: ``triangle_helpers`` depends on this module, so it can't be
+    #       imported at the top level.
+    # pylint: disable=import-outside-toplevel
+    from bezier.hazmat import triangle_helpers
+
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    id_mat = np.eye(num_nodes, order="F")
+    return (
+        triangle_helpers.jacobian_s(id_mat, degree, num_nodes),
+        triangle_helpers.jacobian_t(id_mat, degree, num_nodes),
+    )
+
+
+def make_linearization_matrix(degree):
+    r"""Make the matrix used to compare a triangle to a flat triangle.
+
+    .. note::
+
+        This is a helper for :func:`linearization_error`.
+
+    The flat triangle :math:`L` with the same corners as a triangle
+    :math:`B` has control points :math:`L\left(\frac{j}{d},
+    \frac{k}{d}\right)` when written in degree :math:`d`. The product of
+    the nodes with this matrix is the difference of the control points of
+    :math:`B` and :math:`L`. The result is stored in the shared
+    :mod:`.matrix_cache` by :func:`linearization_error`, so this matrix is
+    only built once for each degree.
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        numpy.ndarray: The matrix used to convert the nodes into the control
+        points of :math:`B - L`.
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    result = np.eye(num_nodes, order="F")
+    index = 0
+    for k in range(degree + 1):
+        for j in range(degree + 1 - k):
+            i = degree - j - k
+            result[0, index] -= i / degree
+            result[degree, index] -= j / degree
+            result[num_nodes - 1, index] -= k / degree
+            index += 1
+    return result
+
+
+def linearization_error(nodes, degree):
+    r"""Compute the maximum error of a flat approximation of a triangle.
+
+    This is the triangle analogue of
+    :func:`.geometric_intersection.linearization_error`. We use the flat
+    triangle :math:`L` with the same corners as :math:`B` and compute an
+    upper bound on
+
+    .. math::
+
+       \max_{(s, t) \in \mathcal{U}} \left\|B(s, t) - L(s, t)\right\|_2.
+
+    Since :math:`B - L` is also a B |eacute| zier triangle (see
+    :func:`make_linearization_matrix`), the convex hull property means it
+    is bounded by the largest norm among its control points.
+
+    .. testsetup:: triangle-linearization-error
+
+       import numpy as np
+       from bezier.hazmat.triangle_matrices import linearization_error
+
+    .. doctest:: triangle-linearization-error
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 0.5, 1.0, 0.0, 0.5, 0.0],
+       ...     [0.0, 0.0, 0.0, 0.5, 0.5, 1.0],
+       ...     [0.0, 0.5, 0.0, 0.5, 0.5, 0.0],
+       ... ])
+       >>> linearization_error(nodes, 2)
+       0.5
+
+    Args:
+        nodes (numpy.ndarray): Control points for a triangle.
+        degree (int): The degree of the triangle.
+
+    Returns:
+        float: The maximum error between the triangle and the flat triangle
+        with the same corners.
+    """
+    if degree == 1:
+        return 0.0
+
+    lin_mat = matrix_cache.get_matrices(
+        "triangle-linearize", degree, make_linearization_matrix
+    )
+    differences = _py_helpers.matrix_product(nodes, lin_mat)
+    return float(np.max(np.linalg.norm(differences, ord=2, axis=0)))
+
+
+def make_elevation_matrix(degree):
+    """Make the matrix used to degree-elevate a triangle.
+
+    .. note::
+
+        This is a helper for :meth:`.Triangle.elevate`.
+
+    The entries of the matrix are the (integer) multipliers of each node;
+    the product must still be divided by :math:`d + 1` to get the
+    degree-elevated nodes. The result is stored in the shared
+    :mod:`.matrix_cache` by :meth:`.Triangle.elevate`, so this matrix is
+    only built once for each degree.
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        numpy.ndarray: The matrix used to convert the nodes into (scaled)
+        nodes of the degree-elevated triangle.
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    # (d + 1)(d + 2)/2 --> (d + 2)(d + 3)/2
+    num_new = num_nodes + degree + 2
+    result = np.zeros((num_nodes, num_new), order="F")
+    # NOTE: We start from the index triples (i, j, k) for the current
+    #       nodes and map them onto (i + 1, j, k), etc. This index
+    #       tracking is also done in :func:`.de_casteljau_one_round`.
+    index = 0
+    # parent_i1 = index + k
+    # parent_i2 = index + k + 1
+    # parent_i3 = index + degree + 2
+    parent_i1 = 0
+    parent_i2 = 1
+    parent_i3 = degree + 2
+    for k in range(degree + 1):
+        for j in range(degree + 1 - k):
+            i = degree - j - k
+            result[index, parent_i1] = i + 1
+            result[index, parent_i2] = j + 1
+            result[index, parent_i3] = k + 1
+            # Update all the indices.
+            parent_i1 += 1
+            parent_i2 += 1
+            parent_i3 += 1
+            index += 1
+        # Update the indices that depend on k.
+        parent_i1 += 1
+        parent_i2 += 1
+    return result
@@ -0,0 +1,922 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for intersecting many B |eacute| zier shapes concurrently.
+
+The binary extension releases the GIL while it is running Fortran code,
+so a pool of threads can intersect many pairs of shapes at the same
+time without paying to pickle the shapes (as a pool of processes would).
+If the binary extension is not available, the thread backend still works
+but runs no faster than a single thread.
+
+For workloads that are too large for one process, a pool of processes
+can be used instead. In that case, the control points of every shape
+are copied (once) into a block of shared memory and each worker process
+writes its results into shared memory, so only a few integers are sent
+to (and from) each worker.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+   import bezier.parallel
+"""
+
+import concurrent.futures
+import enum
+import os
+import traceback
+
+import numpy as np
+
+from bezier import _geometric_intersection
+from bezier import _triangle_intersection
+from bezier import curve
+from bezier import curved_polygon
+from bezier import triangle
+from bezier import workspace
+
+
+_BATCHES_PER_WORKER = 4
+"""int: The number of batches to create for each worker.
+
+Using more than one batch per worker evens out the load when some pairs
+of shapes take much longer to intersect than others.
+"""
+_STATUS_POLYGONS = 0
+_STATUS_FIRST_CONTAINED = 1
+_STATUS_SECOND_CONTAINED = 2
+
+
+class Backend(enum.Enum):
+    """Enum determining how work is spread across workers."""
+
+    THREAD = 0
+    """A pool of threads that share the current process."""
+    PROCESS = 1
+    """A pool of processes that read inputs from shared memory."""
+
+
+def _pack_batch(pairs):
+    """Pack the nodes of a batch of curve pairs into contiguous arrays.
+
+    Args:
+        pairs (Sequence[Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]]):
+            The pairs of curves in the batch.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, \
+        numpy.ndarray]: The packed nodes and offsets for the first curve
+        in each pair, followed by those for the second curve (in the form
+        expected by
+        :func:`~bezier.hazmat.geometric_intersection.all_intersections_batch`).
+    """
+    curves_first, curves_second = zip(*pairs)
+    nodes_first, offsets_first = _pack_shapes(curves_first)
+    nodes_second, offsets_second = _pack_shapes(curves_second)
+    return nodes_first, offsets_first, nodes_second, offsets_second
+
+
+def _pack_shapes(shapes):
+    """Pack the nodes of many shapes into a single array.
+
+    Args:
+        shapes (Sequence[Union[~bezier.curve.Curve, \
+            ~bezier.triangle.Triangle]]): The shapes to pack.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The nodes of every shape
+        (packed column-wise into a single Fortran-ordered array) and the
+        ``N + 1`` column offsets that separate each shape.
+    """
+    sizes = [shape._nodes.shape[1] for shape in shapes]
+    offsets = np.zeros(len(sizes) + 1, dtype=np.intc)
+    np.cumsum(sizes, out=offsets[1:])
+    nodes = np.asfortranarray(np.hstack([shape._nodes for shape in shapes]))
+    return nodes, offsets
+
+
+def _intersect_batch(pairs):
+    """Intersect a batch of curve pairs.
+
+    Args:
+        pairs (Sequence[Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]]):
+            The pairs of curves in the batch.
+
+    Returns:
+        List[numpy.ndarray]: The ``2 x N`` array of ``s``- and
+        ``t``-parameters for each pair in the batch.
+    """
+    pair_indices, st_vals, _ = _geometric_intersection.all_intersections_batch(
+        *_pack_batch(pairs)
+    )
+    bounds = np.searchsorted(pair_indices, np.arange(len(pairs) + 1))
+    return [
+        st_vals[:, start:end] for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def _intersect_triangle_batch(pairs):
+    """Intersect a batch of triangle pairs.
+
+    Args:
+        pairs (Sequence[Tuple[~bezier.triangle.Triangle, \
+            ~bezier.triangle.Triangle]]): The pairs of triangles in the
+            batch.
+
+    Returns:
+        List[List[Union[~bezier.curved_polygon.CurvedPolygon, \
+        ~bezier.triangle.Triangle]]]: The intersections for each pair in
+        the batch.
+    """
+    return [first.intersect(second) for first, second in pairs]
+
+
+def _verify_pairs(pairs, klass):
+    """Check that pairs of shapes can be intersected in a batch.
+
+    Args:
+        pairs (Iterable[Tuple[object, object]]): The pairs of shapes.
+        klass (type): The expected type of every shape.
+
+    Returns:
+        List[Tuple[object, object]]: The pairs, as a list of tuples.
+
+    Raises:
+        TypeError: If any value in ``pairs`` is not a pair or a shape in
+            ``pairs`` is not a ``klass``.
+        NotImplementedError: If any shape isn't two-dimensional.
+    """
+    pairs = [tuple(pair) for pair in pairs]
+    for pair in pairs:
+        if len(pair) != 2:
+            raise TypeError("Expected a pair of shapes", "Received", pair)
+
+        for value in pair:
+            if not isinstance(value, klass):
+                raise TypeError(
+                    "Can only intersect pairs of {}".format(klass.__name__),
+                    "Received",
+                    value,
+                )
+
+            if value._dimension != 2:
+                raise NotImplementedError(
+                    "Intersection only implemented in 2D"
+                )
+
+    return pairs
+
+
+def _batch_bounds(num_pairs, max_workers):
+    """Split pairs of shapes into contiguous batches.
+
+    Args:
+        num_pairs (int): The (positive) number of pairs.
+        max_workers (int): The number of workers.
+
+    Returns:
+        numpy.ndarray: The ``B + 1`` indices that separate the ``B``
+        batches.
+    """
+    num_batches = min(num_pairs, _BATCHES_PER_WORKER * max_workers)
+    return np.linspace(0, num_pairs, num_batches + 1).astype(int)
+
+
+def _map_in_threads(batch_func, pairs, max_workers, bounds):
+    """Intersect batches of pairs in a pool of threads.
+
+    Args:
+        batch_func (Callable): Intersects a batch of pairs.
+        pairs (List[Tuple[object, object]]): The pairs of shapes.
+        max_workers (int): The number of threads.
+        bounds (numpy.ndarray): The indices that separate the batches.
+
+    Returns:
+        list: The intersections for each pair, in the same order as
+        ``pairs``.
+    """
+    batches = [pairs[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        results = executor.map(batch_func, batches)
+        return [value for batch in results for value in batch]
+
+
+def _unique_shapes(pairs):
+    """Find the distinct shapes among pairs of shapes.
+
+    Args:
+        pairs (List[Tuple[object, object]]): The pairs of shapes.
+
+    Returns:
+        Tuple[list, numpy.ndarray]: The distinct shapes and a ``2 x N``
+        array with the index (among the distinct shapes) of each shape in
+        each pair.
+    """
+    shapes = []
+    index_of = {}
+    pair_table = np.empty((2, len(pairs)), dtype=np.intc, order="F")
+    for index, pair in enumerate(pairs):
+        for row, shape in enumerate(pair):
+            key = id(shape)
+            if key not in index_of:
+                index_of[key] = len(shapes)
+                shapes.append(shape)
+            pair_table[row, index] = index_of[key]
+    return shapes, pair_table
+
+
+def _view(block, spec):
+    """Create an array that uses a shared memory block as its buffer.
+
+    Args:
+        block (multiprocessing.shared_memory.SharedMemory): The block.
+        spec (Tuple[str, tuple, numpy.dtype]): The name of the block along
+            with the shape and type of the array.
+
+    Returns:
+        numpy.ndarray: The Fortran-ordered array.
+
+    .. note::
+
+       Closing ``block`` does **not** check for arrays that still use its
+       buffer, so the array must not outlive the (open) block.
+    """
+    _, shape, dtype = spec
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf, order="F")
+
+
+def _run_shard(shard_func, specs, start, end):
+    """Run a worker on a shard of pairs stored in shared memory.
+
+    .. note::
+
+       This is the entry point for worker processes. Since the arrays are
+       views into shared memory, they must be released before the blocks
+       are closed (this is why the frames in the traceback of any error
+       are cleared).
+
+    Args:
+        shard_func (Callable): Intersects the pairs ``start:end``, given
+            the arrays described by ``specs`` and ``start`` and ``end``.
+        specs (Tuple[Tuple[str, tuple, numpy.dtype], ...]): Descriptions
+            of the arrays in shared memory.
+        start (int): The index of the first pair in the shard.
+        end (int): One past the index of the last pair in the shard.
+    """
+    # NOTE: We import ``shared_memory`` at runtime since it is not
+    #       available in all supported versions of Python.
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    # pylint: enable=import-outside-toplevel
+
+    blocks = [shared_memory.SharedMemory(name=spec[0]) for spec in specs]
+    try:
+        shard_func(
+            [_view(block, spec) for block, spec in zip(blocks, specs)],
+            start,
+            end,
+        )
+    except Exception as exc:
+        traceback.clear_frames(exc.__traceback__)
+        raise
+
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _shape_nodes(nodes, offsets, index):
+    """Get the nodes of one of many packed shapes.
+
+    Args:
+        nodes (numpy.ndarray): The nodes of every shape, packed
+            column-wise.
+        offsets (numpy.ndarray): The column offsets that separate each
+            shape.
+        index (int): The index of the shape.
+
+    Returns:
+        numpy.ndarray: A copy of the nodes of the shape. (A copy is used so
+        that no view into shared memory can escape a worker, e.g. as an
+        argument of an exception.)
+    """
+    start = offsets[index]
+    end = offsets[index + 1]
+    return np.array(nodes[:, start:end], order="F")
+
+
+def _curve_shard(arrays, start, end):
+    """Intersect a shard of curve pairs stored in shared memory.
+
+    Args:
+        arrays (List[numpy.ndarray]): The packed nodes of every curve, the
+            offsets that separate them, the ``2 x N`` table of curve
+            indices in each pair, the offsets into the results for each
+            pair, the number of intersections for each pair (output) and
+            the ``s``- and ``t``-parameters (output).
+        start (int): The index of the first pair in the shard.
+        end (int): One past the index of the last pair in the shard.
+    """
+    nodes, offsets, pair_table, result_offsets, counts, st_vals = arrays
+    for index in range(start, end):
+        first, second = pair_table[:, index]
+        intersections, _ = _geometric_intersection.all_intersections(
+            _shape_nodes(nodes, offsets, first),
+            _shape_nodes(nodes, offsets, second),
+        )
+        counts[index] = intersections.shape[1]
+        begin = result_offsets[index]
+        end_ = begin + counts[index]
+        if end_ <= result_offsets[index + 1]:
+            st_vals[:, begin:end_] = intersections
+
+
+def _triangle_shard(arrays, start, end):
+    """Intersect a shard of triangle pairs stored in shared memory.
+
+    Args:
+        arrays (List[numpy.ndarray]): The packed nodes of every triangle,
+            the offsets that separate them, the degree of each triangle,
+            the ``2 x N`` table of triangle indices in each pair, the
+            offsets into the results for each pair, the status of each
+            pair (output), the number of curved polygons for each pair
+            (output), the number of curved polygon edges for each pair
+            (output), the (relative) end of each curved polygon (output)
+            and the edges of every curved polygon (output).
+        start (int): The index of the first pair in the shard.
+        end (int): One past the index of the last pair in the shard.
+    """
+    nodes, offsets, degrees, pair_table = arrays[:4]
+    for index in range(start, end):
+        first, second = pair_table[:, index]
+        edge_infos, contained, _ = _triangle_intersection.geometric_intersect(
+            _shape_nodes(nodes, offsets, first),
+            degrees[first],
+            _shape_nodes(nodes, offsets, second),
+            degrees[second],
+            True,
+        )
+        _store_triangle_result(arrays[4:], index, edge_infos, contained)
+
+
+def _store_triangle_result(outputs, index, edge_infos, contained):
+    """Store the intersection of a pair of triangles in shared memory.
+
+    .. note::
+
+       This is a helper for :func:`_triangle_shard`.
+
+    Args:
+        outputs (List[numpy.ndarray]): The offsets into the results for
+            each pair followed by the output arrays (in the order expected
+            by :func:`_triangle_shard`).
+        index (int): The index of the pair.
+        edge_infos (Optional[list]): The edges of each curved polygon in
+            the intersection (as returned by
+            :func:`~bezier.hazmat.triangle_intersection.geometric_intersect`).
+        contained (Optional[bool]): Indicates which triangle is contained
+            in the other when ``edge_infos`` is :data:`None`.
+    """
+    (
+        result_offsets,
+        statuses,
+        num_polygons,
+        num_segments,
+        segment_ends,
+        segments,
+    ) = outputs
+    if edge_infos is None:
+        if contained:
+            statuses[index] = _STATUS_FIRST_CONTAINED
+        else:
+            statuses[index] = _STATUS_SECOND_CONTAINED
+        return
+
+    statuses[index] = _STATUS_POLYGONS
+    num_polygons[index] = len(edge_infos)
+    num_segments[index] = sum(len(edge_info) for edge_info in edge_infos)
+    begin = result_offsets[index]
+    if begin + num_segments[index] <= result_offsets[index + 1]:
+        _store_segments(edge_infos, segments, segment_ends[begin:], begin)
+
+
+def _store_segments(edge_infos, segments, segment_ends, begin):
+    """Store the edges of each curved polygon in shared memory.
+
+    .. note::
+
+       This is a helper for :func:`_store_triangle_result`.
+
+    Args:
+        edge_infos (list): The edges of each curved polygon.
+        segments (numpy.ndarray): The edges of every curved polygon (for
+            all pairs).
+        segment_ends (numpy.ndarray): The (relative) end of each curved
+            polygon, starting with the first polygon for the current pair.
+        begin (int): The offset of the first edge for the current pair.
+    """
+    position = begin
+    for polygon_index, edge_info in enumerate(edge_infos):
+        for edge_index, s, t in edge_info:
+            segments[position] = (s, t, edge_index)
+            position += 1
+        segment_ends[polygon_index] = position - begin
+
+
+def _share(blocks, specs, shape, dtype, values=None):
+    """Allocate an array in a new shared memory block.
+
+    Args:
+        blocks (list): The shared memory blocks allocated so far. The new
+            block is added to these.
+        specs (list): The descriptions of the arrays allocated so far. The
+            new description is added to these.
+        shape (Tuple[int, ...]): The shape of the array.
+        dtype (numpy.dtype): The type of the array.
+        values (Optional[numpy.ndarray]): Values to copy into the array.
+
+    Returns:
+        numpy.ndarray: The array (a view into the shared memory block).
+    """
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory
+
+    # pylint: enable=import-outside-toplevel
+
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    blocks.append(block)
+    spec = (block.name, shape, dtype)
+    specs.append(spec)
+    array = _view(block, spec)
+    if values is not None:
+        array[...] = values
+    return array
+
+
+def _map_in_processes(process_funcs, pairs, max_workers, bounds):
+    """Intersect shards of pairs in a pool of processes.
+
+    The inputs and outputs of every worker are stored in shared memory.
+
+    Args:
+        process_funcs (Tuple[Callable, Callable, Callable]): The function
+            that allocates (and fills) the input and output arrays for
+            ``pairs`` in shared memory, the function that converts the
+            arrays (after all shards have been intersected) into the
+            intersections for each pair and the function that intersects
+            a shard of pairs.
+        pairs (List[Tuple[object, object]]): The pairs of shapes.
+        max_workers (int): The number of processes.
+        bounds (numpy.ndarray): The indices that separate the shards.
+
+    Returns:
+        list: The intersections for each pair, in the same order as
+        ``pairs``.
+    """
+    blocks = []
+    try:
+        return _map_shared(process_funcs, pairs, max_workers, bounds, blocks)
+    except Exception as exc:
+        traceback.clear_frames(exc.__traceback__)
+        raise
+
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _map_shared(process_funcs, pairs, max_workers, bounds, blocks):
+    """Intersect shards of pairs, using arrays in shared memory.
+
+    .. note::
+
+       This is a helper for :func:`_map_in_processes`, which owns (and
+       releases) the shared memory blocks. The views into the blocks
+       created here must not outlive this function.
+
+    Args:
+        process_funcs (Tuple[Callable, Callable, Callable]): The functions
+            to pack, unpack and intersect a shard of pairs.
+        pairs (List[Tuple[object, object]]): The pairs of shapes.
+        max_workers (int): The number of processes.
+        bounds (numpy.ndarray): The indices that separate the shards.
+        blocks (list): The shared memory blocks allocated so far.
+
+    Returns:
+        list: The intersections for each pair, in the same order as
+        ``pairs``.
+    """
+    pack_func, unpack_func, shard_func = process_funcs
+    specs = []
+    arrays = pack_func(pairs, blocks, specs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(
+                _run_shard, shard_func, tuple(specs), int(start), int(end)
+            )
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+    return unpack_func(pairs, arrays)
+
+
+def _pack_curves(pairs, blocks, specs):
+    """Allocate the shared arrays used to intersect pairs of curves.
+
+    Args:
+        pairs (List[Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]]): The
+            pairs of curves.
+        blocks (list): The shared memory blocks allocated so far.
+        specs (list): The descriptions of the arrays allocated so far.
+
+    Returns:
+        List[numpy.ndarray]: The arrays (in the order expected by
+        :func:`_curve_shard`).
+    """
+    curves, pair_table = _unique_shapes(pairs)
+    nodes, offsets = _pack_shapes(curves)
+    degrees = np.diff(offsets) - 1
+    # NOTE: Two curves of degree ``m`` and ``n`` intersect at most ``m n``
+    #       times (unless they are coincident, in which case the ends of
+    #       the overlap are returned).
+    capacities = np.maximum(
+        degrees[pair_table[0, :]] * degrees[pair_table[1, :]], 2
+    )
+    result_offsets = np.zeros(len(pairs) + 1, dtype=np.intc)
+    np.cumsum(capacities, out=result_offsets[1:])
+    arrays = [
+        _share(blocks, specs, nodes.shape, nodes.dtype, nodes),
+        _share(blocks, specs, offsets.shape, np.intc, offsets),
+        _share(blocks, specs, pair_table.shape, np.intc, pair_table),
+        _share(blocks, specs, result_offsets.shape, np.intc, result_offsets),
+        _share(blocks, specs, (len(pairs),), np.intc),
+        _share(blocks, specs, (2, result_offsets[-1]), np.double),
+    ]
+    return arrays
+
+
+def _unpack_curves(pairs, arrays):
+    """Convert the shared arrays into the intersections of each pair.
+
+    Args:
+        pairs (List[Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]]): The
+            pairs of curves.
+        arrays (List[numpy.ndarray]): The arrays (in the order expected by
+            :func:`_curve_shard`).
+
+    Returns:
+        List[numpy.ndarray]: The ``2 x N`` array of ``s``- and
+        ``t``-parameters for each pair.
+    """
+    _, _, _, result_offsets, counts, st_vals = arrays
+    result = []
+    for index, (first, second) in enumerate(pairs):
+        begin = result_offsets[index]
+        end = begin + counts[index]
+        if end > result_offsets[index + 1]:
+            # NOTE: This should not happen, but if the results did not fit
+            #       the pair is intersected again in the current process.
+            result.append(first.intersect(second))
+        else:
+            result.append(np.asfortranarray(st_vals[:, begin:end].copy()))
+    return result
+
+
+def _pack_triangles(pairs, blocks, specs):
+    """Allocate the shared arrays used to intersect pairs of triangles.
+
+    Args:
+        pairs (List[Tuple[~bezier.triangle.Triangle, \
+            ~bezier.triangle.Triangle]]): The pairs of triangles.
+        blocks (list): The shared memory blocks allocated so far.
+        specs (list): The descriptions of the arrays allocated so far.
+
+    Returns:
+        List[numpy.ndarray]: The arrays (in the order expected by
+        :func:`_triangle_shard`).
+    """
+    triangles, pair_table = _unique_shapes(pairs)
+    nodes, offsets = _pack_shapes(triangles)
+    degrees = np.asarray([value._degree for value in triangles], dtype=np.intc)
+    # NOTE: The edges of two triangles of degree ``m`` and ``n`` intersect
+    #       at most ``9 m n`` times. Each curved polygon edge starts at an
+    #       intersection or at one of the six corners.
+    capacities = 18 * degrees[pair_table[0, :]] * degrees[pair_table[1, :]] + 6
+    result_offsets = np.zeros(len(pairs) + 1, dtype=np.intc)
+    np.cumsum(capacities, out=result_offsets[1:])
+    num_pairs = len(pairs)
+    total = result_offsets[-1]
+    arrays = [
+        _share(blocks, specs, nodes.shape, nodes.dtype, nodes),
+        _share(blocks, specs, offsets.shape, np.intc, offsets),
+        _share(blocks, specs, degrees.shape, np.intc, degrees),
+        _share(blocks, specs, pair_table.shape, np.intc, pair_table),
+        _share(blocks, specs, result_offsets.shape, np.intc, result_offsets),
+        _share(blocks, specs, (num_pairs,), np.intc),
+        _share(blocks, specs, (num_pairs,), np.intc),
+        _share(blocks, specs, (num_pairs,), np.intc),
+        _share(blocks, specs, (total,), np.intc),
+        _share(blocks, specs, (total,), workspace.SEGMENT_DTYPE),
+    ]
+    return arrays
+
+
+def _unpack_triangles(pairs, arrays):
+    """Convert the shared arrays into the intersections of each pair.
+
+    Args:
+        pairs (List[Tuple[~bezier.triangle.Triangle, \
+            ~bezier.triangle.Triangle]]): The pairs of triangles.
+        arrays (List[numpy.ndarray]): The arrays (in the order expected by
+            :func:`_triangle_shard`).
+
+    Returns:
+        List[List[Union[~bezier.curved_polygon.CurvedPolygon, \
+        ~bezier.triangle.Triangle]]]: The intersections for each pair.
+    """
+    result_offsets, statuses, _, num_segments = arrays[4:8]
+    result = []
+    for index, (first, second) in enumerate(pairs):
+        if statuses[index] == _STATUS_FIRST_CONTAINED:
+            result.append([first])
+        elif statuses[index] == _STATUS_SECOND_CONTAINED:
+            result.append([second])
+        elif (
+            result_offsets[index] + num_segments[index]
+            > result_offsets[index + 1]
+        ):
+            # NOTE: This should not happen, but if the results did not fit
+            #       the pair is intersected again in the current process.
+            result.append(first.intersect(second))
+        else:
+            result.append(_unpack_polygons(first, second, index, arrays))
+    return result
+
+
+def _unpack_polygons(first, second, index, arrays):
+    """Convert the shared arrays into the curved polygons for a pair.
+
+    .. note::
+
+       This is a helper for :func:`_unpack_triangles`.
+
+    Args:
+        first (~bezier.triangle.Triangle): The first triangle in the pair.
+        second (~bezier.triangle.Triangle): The second triangle in the
+            pair.
+        index (int): The index of the pair.
+        arrays (List[numpy.ndarray]): The arrays (in the order expected by
+            :func:`_triangle_shard`).
+
+    Returns:
+        List[~bezier.curved_polygon.CurvedPolygon]: The curved polygons in
+        the intersection.
+    """
+    result_offsets = arrays[4]
+    num_polygons, _, segment_ends, segments = arrays[6:]
+    all_edges = first.edges + second.edges
+    begin = result_offsets[index]
+    intersections = []
+    polygon_start = begin
+    for polygon_index in range(num_polygons[index]):
+        polygon_end = begin + segment_ends[begin + polygon_index]
+        intersections.append(
+            _make_polygon(segments[polygon_start:polygon_end], all_edges)
+        )
+        polygon_start = polygon_end
+    return intersections
+
+
+def _make_polygon(polygon_segments, all_edges):
+    """Convert the edges stored in shared memory into a curved polygon.
+
+    .. note::
+
+       This is a helper for :func:`_unpack_polygons`. It mirrors what
+       :meth:`~bezier.triangle.Triangle.intersect` does with each edge
+       description.
+
+    Args:
+        polygon_segments (numpy.ndarray): The start and end parameters
+            along each edge of the curved polygon, along with the index
+            of the triangle edge.
+        all_edges (Tuple[~bezier.curve.Curve, ...]): The three edges of the
+            first triangle followed by the three edges of the second.
+
+    Returns:
+        ~bezier.curved_polygon.CurvedPolygon: The curved polygon.
+    """
+    edge_info = tuple(
+        (int(edge_index), float(start), float(end))
+        for start, end, edge_index in polygon_segments
+    )
+    edges = [
+        all_edges[edge_index].specialize(start, end)
+        for edge_index, start, end in edge_info
+    ]
+    return curved_polygon.CurvedPolygon(
+        *edges, metadata=edge_info, _verify=False
+    )
+
+
+def map_intersections(pairs, max_workers=None, backend=Backend.THREAD):
+    """Find the points of intersection for many pairs of curves.
+
+    The pairs are split into contiguous batches and the batches are spread
+    across a pool of workers.
+
+    With the :attr:`~Backend.THREAD` backend, each batch is handed to the
+    binary extension in a single call (see
+    :func:`~bezier.curve.intersect_curve_pairs`), which releases the GIL
+    for the duration of the batch.
+
+    With the :attr:`~Backend.PROCESS` backend, the control points of every
+    curve are copied into shared memory and each worker process only
+    receives the range of pairs to intersect. The intersections are
+    written into a shared result buffer.
+
+    .. doctest:: map-intersections
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 0.375, 0.75 ],
+       ...     [0.0, 0.75 , 0.375],
+       ... ])
+       >>> curve1 = bezier.Curve(nodes1, degree=2)
+       >>> nodes2 = np.asfortranarray([
+       ...     [0.5, 0.5 ],
+       ...     [0.0, 0.75],
+       ... ])
+       >>> curve2 = bezier.Curve(nodes2, degree=1)
+       >>> nodes3 = np.asfortranarray([
+       ...     [2.0, 3.0],
+       ...     [0.0, 0.0],
+       ... ])
+       >>> curve3 = bezier.Curve(nodes3, degree=1)
+       >>> intersections = bezier.parallel.map_intersections(
+       ...     [(curve1, curve2), (curve1, curve3)], max_workers=2
+       ... )
+       >>> len(intersections)
+       2
+       >>> 3.0 * intersections[0]
+       array([[2.],
+              [2.]])
+       >>> intersections[1].shape
+       (2, 0)
+
+    Args:
+        pairs (Iterable[Tuple[~bezier.curve.Curve, ~bezier.curve.Curve]]):
+            The pairs of curves to intersect.
+        max_workers (Optional[int]): The maximum number of workers used.
+            Defaults to the number of CPUs on the current machine.
+        backend (Optional[Backend]): The type of worker pool to use.
+            Defaults to a pool of threads.
+
+    Returns:
+        List[numpy.ndarray]: One ``2 x N`` array of ``s``- and
+        ``t``-parameters for each pair (possibly empty), in the same
+        order as ``pairs``. This is the same as what
+        :meth:`~bezier.curve.Curve.intersect` would return.
+
+    Raises:
+        TypeError: If any value in ``pairs`` is not a pair of curves.
+        NotImplementedError: If any of the curves isn't two-dimensional.
+        ValueError: If ``max_workers`` is not positive.
+        ValueError: If ``backend`` is not a valid :class:`Backend`.
+    """
+    pairs = _verify_pairs(pairs, curve.Curve)
+    return _map_pairs(
+        pairs,
+        max_workers,
+        backend,
+        _intersect_batch,
+        (_pack_curves, _unpack_curves, _curve_shard),
+    )
+
+
+def map_triangle_intersections(
+    pairs, max_workers=None, backend=Backend.THREAD
+):
+    """Find the intersections of many pairs of triangles.
+
+    The pairs are split into contiguous batches and the batches are spread
+    across a pool of workers (see :func:`map_intersections`). With the
+    :attr:`~Backend.PROCESS` backend, each worker writes the edges of
+    each curved polygon into a shared result buffer and the curved
+    polygons are created in the current process.
+
+    .. doctest:: map-triangle-intersections
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 1.0, 0.0],
+       ...     [0.0, 0.0, 1.0],
+       ... ])
+       >>> triangle1 = bezier.Triangle(nodes1, degree=1)
+       >>> nodes2 = np.asfortranarray([
+       ...     [0.5, 0.5, -0.5],
+       ...     [0.0, 1.0,  1.0],
+       ... ])
+       >>> triangle2 = bezier.Triangle(nodes2, degree=1)
+       >>> nodes3 = np.asfortranarray([
+       ...     [-1.0, 3.0, -1.0],
+       ...     [-1.0, -1.0, 3.0],
+       ... ])
+       >>> triangle3 = bezier.Triangle(nodes3, degree=1)
+       >>> intersections = bezier.parallel.map_triangle_intersections(
+       ...     [(triangle1, triangle2), (triangle3, triangle1)],
+       ...     max_workers=2,
+       ... )
+       >>> intersections[0]
+       [<CurvedPolygon (num_sides=4)>]
+       >>> intersections[1] == [triangle1]
+       True
+
+    Args:
+        pairs (Iterable[Tuple[~bezier.triangle.Triangle, \
+            ~bezier.triangle.Triangle]]): The pairs of triangles to
+            intersect.
+        max_workers (Optional[int]): The maximum number of workers used.
+            Defaults to the number of CPUs on the current machine.
+        backend (Optional[Backend]): The type of worker pool to use.
+            Defaults to a pool of threads.
+
+    Returns:
+        List[List[Union[~bezier.curved_polygon.CurvedPolygon, \
+        ~bezier.triangle.Triangle]]]: The intersections for each pair, in
+        the same order as ``pairs``. This is the same as what
+        :meth:`~bezier.triangle.Triangle.intersect` would return.
+
+    Raises:
+        TypeError: If any value in ``pairs`` is not a pair of triangles.
+        NotImplementedError: If any of the triangles isn't
+            two-dimensional.
+        ValueError: If ``max_workers`` is not positive.
+        ValueError: If ``backend`` is not a valid :class:`Backend`.
+    """
+    pairs = _verify_pairs(pairs, triangle.Triangle)
+    return _map_pairs(
+        pairs,
+        max_workers,
+        backend,
+        _intersect_triangle_batch,
+        (_pack_triangles, _unpack_triangles, _triangle_shard),
+    )
+
+
+def _map_pairs(pairs, max_workers, backend, batch_func, process_funcs):
+    """Intersect pairs of shapes with a given backend.
+
+    Args:
+        pairs (List[Tuple[object, object]]): The pairs of shapes.
+        max_workers (Optional[int]): The maximum number of workers used.
+        backend (Backend): The type of worker pool to use.
+        batch_func (Callable): Intersects a batch of pairs in a thread.
+        process_funcs (Tuple[Callable, Callable, Callable]): The functions
+            to pack, unpack and intersect a shard of pairs with a pool of
+            processes.
+
+    Returns:
+        list: The intersections for each pair, in the same order as
+        ``pairs``.
+
+    Raises:
+        ValueError: If ``max_workers`` is not positive.
+        ValueError: If ``backend`` is not a valid :class:`Backend`.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive", max_workers)
+
+    if backend == Backend.THREAD:
+        map_func = _map_in_threads
+        funcs = (batch_func,)
+    elif backend == Backend.PROCESS:
+        map_func = _map_in_processes
+        funcs = (process_funcs,)
+    else:
+        raise ValueError("Unexpected backend.", backend)
+
+    if not pairs:
+        return []
+
+    bounds = _batch_bounds(len(pairs), max_workers)
+    return map_func(*funcs, pairs, max_workers, bounds)
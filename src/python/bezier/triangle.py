@@ -33,8 +33,10 @@ from bezier import curve as _curve_mod
 from bezier import curved_polygon
 from bezier.hazmat import helpers as _py_helpers
 from bezier.hazmat import intersection_helpers
+from bezier.hazmat import matrix_cache
 from bezier.hazmat import triangle_helpers as _py_triangle_helpers
 from bezier.hazmat import triangle_intersection as _py_triangle_intersection
+from bezier.hazmat import triangle_matrices
 
 
 _SIGN = np.sign  # pylint: disable=no-member
@@ -43,7 +45,15 @@ _LOCATE_ERROR_TEMPLATE = (
     "so the point should be a {:d} x 1 NumPy array. "
     "Instead the point {} has dimensions {}."
 )
+_LOCATE_MULTI_ERROR_TEMPLATE = (
+    "Dimension mismatch: This triangle is {:d}-dimensional, "
+    "so the points should be a {:d} x N NumPy array. "
+    "Instead the points have dimensions {}."
+)
 _STRATEGY = intersection_helpers.IntersectionStrategy
+_MAX_TESSELLATE_SUBDIVISIONS = 10
+_LOCATE_INDEX_DEPTH = 5
+_MAX_LOCATE_INDEX_DEPTH = 8
 
 
 class Triangle(_base.Base):
@@ -190,12 +200,18 @@ class Triangle(_base.Base):
         "_nodes",  # From base class
         "_degree",  # From constructor
         "_edges",  # Empty default
+        "_jacobian_nodes",  # Empty default
+        "_is_valid",  # Empty default
+        "_locate_index",  # Empty default
     )
 
     def __init__(self, nodes, degree, *, copy=True, verify=True):
         super(Triangle, self).__init__(nodes, copy=copy)
         self._degree = degree
         self._edges = None
+        self._jacobian_nodes = None
+        self._is_valid = None
+        self._locate_index = None
         self._verify_degree(verify)
 
     @classmethod
@@ -793,6 +809,92 @@ class Triangle(_base.Base):
             Triangle(nodes_d, self._degree, copy=False, verify=False),
         )
 
+    def tessellate(self, tolerance):
+        r"""Approximate the triangle by a mesh of flat triangles.
+
+        Adaptively subdivides the triangle (see :meth:`subdivide`) until
+        each sub-triangle is within ``tolerance`` of the flat triangle with
+        the same corners (see :func:`.triangle_matrices.linearization_error`).
+        Flat parts of the triangle use large mesh elements while tightly
+        curved parts use many small ones.
+
+        Neighboring sub-triangles may have been subdivided a different
+        number of times. In order to avoid cracks along the edges they
+        share, a sub-triangle with a neighbor's vertex along one of its
+        edges is split into a fan of triangles around its center, so the
+        mesh has no "hanging" vertices. The fan can be up to twice as far
+        from the triangle as the flat sub-triangle, so such sub-triangles
+        are subdivided until they are within ``tolerance / 2``.
+
+        .. doctest:: triangle-tessellate
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.5, 1.0 , 0.0, 0.5, 0.0],
+           ...     [0.0, 0.0, 0.25, 0.5, 0.5, 1.0],
+           ... ])
+           >>> triangle = bezier.Triangle(nodes, degree=2)
+           >>> points, param_vals, triangles = triangle.tessellate(0.0625)
+           >>> points
+           array([[0.    , 0.5   , 0.    , 0.5   , 1.    , 0.    ],
+                  [0.    , 0.0625, 0.5   , 0.5625, 0.25  , 1.    ]])
+           >>> param_vals
+           array([[0. , 0. ],
+                  [0.5, 0. ],
+                  [0. , 0.5],
+                  [0.5, 0.5],
+                  [1. , 0. ],
+                  [0. , 1. ]])
+           >>> triangles
+           array([[0, 1, 2],
+                  [3, 2, 1],
+                  [1, 4, 3],
+                  [2, 3, 5]], dtype=int32)
+
+        A piece is never subdivided more than 10 times, so the error bound
+        may not be met for a ``tolerance`` near the limits of floating point
+        precision.
+
+        Args:
+            tolerance (float): The maximum allowed distance between the
+                triangle and each element of the mesh.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+            * ``D x V`` array of the vertices of the mesh
+            * ``V x 2`` array of the parameters :math:`(s, t)` of each vertex
+            * ``T x 3`` array of the indices of the vertices in each
+              element of the mesh (each in counterclockwise order in
+              parameter space)
+
+        Raises:
+            ValueError: If ``tolerance`` is not positive.
+        """
+        if not tolerance > 0.0:
+            raise ValueError("Tolerance must be positive", tolerance)
+
+        leaves = _tessellate_leaves(self._nodes, self._degree, tolerance)
+        return _mesh_from_leaves(leaves, self._degree)
+
+    def _get_jacobian_nodes(self):
+        """Get the (cached) nodes of the Jacobian of the current triangle.
+
+        These are computed the first time they are needed and shared
+        by every later caller, so they must not be modified.
+
+        Returns:
+            numpy.ndarray: The nodes of :math:`B_s` stacked on top of the
+            nodes of :math:`B_t` (see
+            :func:`~bezier.hazmat.triangle_helpers.jacobian_both`).
+        """
+        if self._jacobian_nodes is None:
+            jac_nodes = _triangle_helpers.jacobian_both(
+                self._nodes, self._degree, self._dimension
+            )
+            self._jacobian_nodes = jac_nodes
+        return self._jacobian_nodes
+
     def _compute_valid(self):
         r"""Determines if the current triangle is "valid".
 
@@ -813,10 +915,10 @@ class Triangle(_base.Base):
         poly_sign = None
         if self._degree == 1:
             # In the linear case, we are only invalid if the points
-            # are collinear.
-            first_deriv = self._nodes[:, 1:] - self._nodes[:, :-1]
+            # are collinear, i.e. the (constant) Jacobian is singular.
+            jac_nodes = self._get_jacobian_nodes()
             # pylint: disable=assignment-from-no-return
-            poly_sign = _SIGN(np.linalg.det(first_deriv))
+            poly_sign = _SIGN(np.linalg.det(jac_nodes.reshape((2, 2))))
             # pylint: enable=assignment-from-no-return
         elif self._degree == 2:
             bernstein = _py_triangle_helpers.quadratic_jacobian_polynomial(
@@ -905,8 +1007,12 @@ class Triangle(_base.Base):
 
            import make_images
            make_images.triangle_is_valid3(triangle)
+
+        Since a triangle can't be modified, this is only computed once.
         """
-        return self._compute_valid()
+        if self._is_valid is None:
+            self._is_valid = self._compute_valid()
+        return self._is_valid
 
     @property
     def __dict__(self):
@@ -924,6 +1030,9 @@ class Triangle(_base.Base):
             "_nodes": self._nodes,
             "_degree": self._degree,
             "_edges": self._edges,
+            "_jacobian_nodes": self._jacobian_nodes,
+            "_is_valid": self._is_valid,
+            "_locate_index": self._locate_index,
         }
 
     def locate(self, point, _verify=True):
@@ -933,6 +1042,9 @@ class Triangle(_base.Base):
 
         This method acts as a (partial) inverse to :meth:`evaluate_cartesian`.
 
+        If an index has been built (see :meth:`build_locate_index`), it is
+        used to find a starting point for Newton's method.
+
         .. warning::
 
            A unique solution is only guaranteed if the current triangle is
@@ -993,11 +1105,152 @@ class Triangle(_base.Base):
                 )
                 raise ValueError(msg)
 
+        if self._locate_index is not None:
+            s, t = _py_triangle_intersection.locate_points(
+                self._nodes,
+                self._degree,
+                point[:, :1],
+                jac_nodes=self._get_jacobian_nodes(),
+                index=self._locate_index,
+            )[:, 0]
+            if np.isnan(s):
+                return None
+
+            return float(s), float(t)
+
+        if _triangle_intersection.CACHED_DERIVATIVES:
+            return _py_triangle_intersection.locate_point(
+                self._nodes,
+                self._degree,
+                point[0, 0],
+                point[1, 0],
+                jac_nodes=self._get_jacobian_nodes(),
+            )
+
         return _triangle_intersection.locate_point(
             self._nodes, self._degree, point[0, 0], point[1, 0]
         )
 
-    def intersect(self, other, strategy=_STRATEGY.GEOMETRIC, _verify=True):
+    def locate_multi(self, points, _verify=True):
+        r"""Find many points on the current triangle.
+
+        Solves for :math:`s` and :math:`t` in :math:`B(s, t) = p` for every
+        point :math:`p`. This is the same as calling :meth:`locate` for
+        each point, but the subdivision of the triangle is shared by all of
+        the points and the final Newton steps are vectorized. If an index
+        has been built (see :meth:`build_locate_index`), the subdivision is
+        skipped for most points.
+
+        .. warning::
+
+           A unique solution is only guaranteed if the current triangle is
+           valid. This code assumes a valid triangle, but doesn't check.
+
+        .. doctest:: triangle-locate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0,  0.5 , 1.0, 0.25, 0.75, 0.0],
+           ...     [0.0, -0.25, 0.0, 0.5 , 0.75, 1.0],
+           ... ])
+           >>> triangle = bezier.Triangle(nodes, degree=2)
+           >>> points = np.asfortranarray([
+           ...     [0.59375, 2.0, 0.375  ],
+           ...     [0.25   , 2.0, 0.53125],
+           ... ])
+           >>> triangle.locate_multi(points)
+           array([[0.5 , nan, 0.25],
+                  [0.25, nan, 0.5 ]])
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points, where
+                :math:`D` is the dimension of the triangle.
+            _verify (Optional[bool]): Indicates if extra caution should be
+                used to verify assumptions about the inputs. Can be
+                disabled to speed up execution time. Defaults to :data:`True`.
+
+        Returns:
+            numpy.ndarray: A ``2 x N`` array of the :math:`s` and :math:`t`
+            values corresponding to each point. If a point is not on the
+            triangle, both values are NaN.
+
+        Raises:
+            NotImplementedError: If the triangle isn't in :math:`\mathbf{R}^2`.
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current triangle.
+        """
+        if _verify:
+            if self._dimension != 2:
+                raise NotImplementedError("Only 2D triangles supported.")
+
+            if points.ndim != 2 or points.shape[0] != self._dimension:
+                point_dimensions = " x ".join(
+                    str(dimension) for dimension in points.shape
+                )
+                msg = _LOCATE_MULTI_ERROR_TEMPLATE.format(
+                    self._dimension, self._dimension, point_dimensions
+                )
+                raise ValueError(msg)
+
+        return _py_triangle_intersection.locate_points(
+            self._nodes,
+            self._degree,
+            points,
+            jac_nodes=self._get_jacobian_nodes(),
+            index=self._locate_index,
+        )
+
+    def build_locate_index(self, depth=_LOCATE_INDEX_DEPTH):
+        r"""Build an index to speed up locating points on this triangle.
+
+        The index is a quadtree of the sub-triangles produced by subdividing
+        the current triangle ``depth`` times. Once built, it is cached and
+        used by :meth:`locate` and :meth:`locate_multi` to start Newton's
+        method near the point without subdividing the triangle again.
+        This is worthwhile when many points will be located on the same
+        triangle.
+
+        .. doctest:: triangle-build-locate-index
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0,  0.5 , 1.0, 0.25, 0.75, 0.0],
+           ...     [0.0, -0.25, 0.0, 0.5 , 0.75, 1.0],
+           ... ])
+           >>> triangle = bezier.Triangle(nodes, degree=2)
+           >>> triangle.build_locate_index(depth=4)
+           >>> point = np.asfortranarray([
+           ...     [0.59375],
+           ...     [0.25   ],
+           ... ])
+           >>> triangle.locate(point)
+           (0.5, 0.25)
+
+        Args:
+            depth (Optional[int]): The number of times to subdivide the
+                triangle. The index has :math:`4^{\text{depth}}` leaves.
+
+        Raises:
+            NotImplementedError: If the triangle isn't in :math:`\mathbf{R}^2`.
+            ValueError: If ``depth`` is not between 1 and 8.
+        """
+        if self._dimension != 2:
+            raise NotImplementedError("Only 2D triangles supported.")
+
+        if not 1 <= depth <= _MAX_LOCATE_INDEX_DEPTH:
+            raise ValueError("Index depth must be between 1 and 8", depth)
+
+        self._locate_index = _py_triangle_intersection.LocateIndex(
+            self._nodes, self._degree, depth
+        )
+
+    def intersect(
+        self,
+        other,
+        strategy=_STRATEGY.GEOMETRIC,
+        _verify=True,
+        *,
+        workspace=None,
+    ):
         """Find the common intersection with another triangle.
 
         Args:
@@ -1009,6 +1262,11 @@ class Triangle(_base.Base):
                 used to verify assumptions about the algorithm as it
                 proceeds. Can be disabled to speed up execution time.
                 Defaults to :data:`True`.
+            workspace (Optional[~bezier.workspace.IntersectionWorkspace]):
+                Scratch buffers to re-use with the geometric strategy. If
+                not provided, the default workspace for the current thread
+                is used. Ignored for the other strategies and if the binary
+                extension is not available.
 
         Returns:
             List[Union[~bezier.curved_polygon.CurvedPolygon, \
@@ -1035,15 +1293,25 @@ class Triangle(_base.Base):
                     "Intersection only implemented in 2D"
                 )
 
+        extra_kwargs = {}
         if strategy == _STRATEGY.GEOMETRIC:
             do_intersect = _triangle_intersection.geometric_intersect
+            if _triangle_intersection.ACCEPTS_WORKSPACE:
+                extra_kwargs["workspace"] = workspace
         elif strategy == _STRATEGY.ALGEBRAIC:
             do_intersect = _py_triangle_intersection.algebraic_intersect
+        elif strategy == _STRATEGY.CLIPPING:
+            do_intersect = _py_triangle_intersection.clipping_intersect
         else:
             raise ValueError("Unexpected strategy.", strategy)
 
         edge_infos, contained, all_edge_nodes = do_intersect(
-            self._nodes, self._degree, other._nodes, other._degree, _verify
+            self._nodes,
+            self._degree,
+            other._nodes,
+            other._degree,
+            _verify,
+            **extra_kwargs,
         )
         if edge_infos is None:
             if contained:
@@ -1117,34 +1385,12 @@ class Triangle(_base.Base):
         Returns:
             Triangle: The degree-elevated triangle.
         """
-        _, num_nodes = self._nodes.shape
-        # (d + 1)(d + 2)/2 --> (d + 2)(d + 3)/2
-        num_new = num_nodes + self._degree + 2
-        new_nodes = np.zeros((self._dimension, num_new), order="F")
-        # NOTE: We start from the index triples (i, j, k) for the current
-        #       nodes and map them onto (i + 1, j, k), etc. This index
-        #       tracking is also done in :func:`.de_casteljau_one_round`.
-        index = 0
-        # parent_i1 = index + k
-        # parent_i2 = index + k + 1
-        # parent_i3 = index + degree + 2
-        parent_i1 = 0
-        parent_i2 = 1
-        parent_i3 = self._degree + 2
-        for k in range(self._degree + 1):
-            for j in range(self._degree + 1 - k):
-                i = self._degree - j - k
-                new_nodes[:, parent_i1] += (i + 1) * self._nodes[:, index]
-                new_nodes[:, parent_i2] += (j + 1) * self._nodes[:, index]
-                new_nodes[:, parent_i3] += (k + 1) * self._nodes[:, index]
-                # Update all the indices.
-                parent_i1 += 1
-                parent_i2 += 1
-                parent_i3 += 1
-                index += 1
-            # Update the indices that depend on k.
-            parent_i1 += 1
-            parent_i2 += 1
+        elevate_mat = matrix_cache.get_matrices(
+            "triangle-elevate",
+            self._degree,
+            triangle_matrices.make_elevation_matrix,
+        )
+        new_nodes = _py_helpers.matrix_product(self._nodes, elevate_mat)
         # Hold off on division until the end, to (attempt to) avoid round-off.
         denominator = self._degree + 1.0
         new_nodes /= denominator
@@ -1250,3 +1496,312 @@ def _make_intersection(edge_info, all_edge_nodes):
     return curved_polygon.CurvedPolygon(
         *edges, metadata=edge_info, _verify=False
     )
+
+
+def _split_piece(nodes, corners, size, degree):
+    """Subdivide a piece of a triangle into four.
+
+    .. note::
+
+       This is a helper for :func:`_subdivide_pieces` and
+       :func:`_tessellate_leaves`.
+
+    Args:
+        nodes (numpy.ndarray): Control points for the piece.
+        corners (Tuple[Tuple[int, int], ...]): The (scaled) corners of the
+            piece.
+        size (int): The (scaled) width of the piece in parameter space.
+        degree (int): The degree of the triangle.
+
+    Returns:
+        List[Tuple[numpy.ndarray, Tuple[Tuple[int, int], ...], int]]: The
+        nodes, (scaled) corners and (scaled) width of each sub-piece (in
+        the same order as :meth:`Triangle.subdivide`).
+    """
+    corner0, corner1, corner2 = corners
+    mid01 = _midpoint(corner0, corner1)
+    mid02 = _midpoint(corner0, corner2)
+    mid12 = _midpoint(corner1, corner2)
+    nodes_a, nodes_b, nodes_c, nodes_d = _triangle_helpers.subdivide_nodes(
+        nodes, degree
+    )
+    size //= 2
+    return [
+        (nodes_a, (corner0, mid01, mid02), size),
+        (nodes_b, (mid12, mid02, mid01), size),
+        (nodes_c, (mid01, corner1, mid12), size),
+        (nodes_d, (mid02, mid12, corner2), size),
+    ]
+
+
+def _subdivide_pieces(pieces, degree, tolerance):
+    """Subdivide pieces of a triangle until each is (nearly) flat.
+
+    .. note::
+
+       This is a helper for :func:`_tessellate_leaves`.
+
+    Args:
+        pieces (List[tuple]): The nodes, (scaled) corners and (scaled)
+            width of each piece (as in :func:`_split_piece`).
+        degree (int): The degree of the triangle.
+        tolerance (float): The maximum allowed linearization error for each
+            piece.
+
+    Returns:
+        List[tuple]: The nodes, (scaled) corners and (scaled) width of each
+        (nearly) flat piece, in order, along with a flag indicating if the
+        piece could still be subdivided to bring its linearization error
+        below half of ``tolerance``.
+    """
+    leaves = []
+    pieces = pieces[::-1]
+    while pieces:
+        nodes, corners, size = pieces.pop()
+        if size == 1:
+            leaves.append((nodes, corners, size, False))
+            continue
+
+        error = triangle_matrices.linearization_error(nodes, degree)
+        if error <= tolerance:
+            leaves.append((nodes, corners, size, error > 0.5 * tolerance))
+            continue
+
+        pieces.extend(_split_piece(nodes, corners, size, degree)[::-1])
+    return leaves
+
+
+def _has_hanging_vertex(corners, vertices):
+    """Check if a neighbor of a piece has a vertex along one of its edges.
+
+    .. note::
+
+       This is a helper for :func:`_tessellate_leaves`.
+
+    As in :func:`_add_hanging_vertices`, there is a vertex along an edge
+    exactly when the midpoint of the edge is a vertex.
+
+    Args:
+        corners (Tuple[Tuple[int, int], ...]): The (scaled) corners of the
+            piece.
+        vertices (Set[Tuple[int, int]]): The (scaled) corners of every
+            piece.
+
+    Returns:
+        bool: Indicates if there is a vertex along one of the edges.
+    """
+    return any(
+        _midpoint(start, end) in vertices
+        for start, end in zip(corners, corners[1:] + corners[:1])
+    )
+
+
+def _tessellate_leaves(nodes, degree, tolerance):
+    """Adaptively subdivide a triangle into (nearly) flat pieces.
+
+    .. note::
+
+       This is a helper for :meth:`Triangle.tessellate`.
+
+    The corners of each piece are tracked as integer :math:`(s, t)`
+    coordinates, scaled by :math:`2^{10}` (one factor of two for each
+    possible subdivision). This way corners shared by neighboring pieces
+    compare exactly.
+
+    A piece with a vertex of a neighbor along one of its edges is split
+    into a fan by :func:`_mesh_from_leaves`. The fan interpolates the
+    triangle at points on the triangle, so its distance from the triangle
+    is bounded by **twice** the linearization error of the piece. Hence
+    such pieces are subdivided until their linearization error is at most
+    half of ``tolerance``. This may put new vertices along the edges of
+    other pieces, so this is repeated until no piece needs to change.
+
+    Args:
+        nodes (numpy.ndarray): Control points for a triangle.
+        degree (int): The degree of the triangle.
+        tolerance (float): The maximum allowed linearization error for each
+            piece.
+
+    Returns:
+        List[Tuple[numpy.ndarray, Tuple[Tuple[int, int], ...]]]: The nodes
+        and (scaled) corners of each piece.
+    """
+    size = 2 ** _MAX_TESSELLATE_SUBDIVISIONS
+    leaves = _subdivide_pieces(
+        [(nodes, ((0, 0), (size, 0), (0, size)), size)], degree, tolerance
+    )
+    refined = True
+    while refined:
+        refined = False
+        vertices = set()
+        for _, corners, _, _ in leaves:
+            vertices.update(corners)
+        next_leaves = []
+        for leaf_nodes, corners, leaf_size, coarse in leaves:
+            if coarse and _has_hanging_vertex(corners, vertices):
+                refined = True
+                next_leaves.extend(
+                    _subdivide_pieces(
+                        _split_piece(leaf_nodes, corners, leaf_size, degree),
+                        degree,
+                        tolerance,
+                    )
+                )
+            else:
+                next_leaves.append((leaf_nodes, corners, leaf_size, coarse))
+        leaves = next_leaves
+    return [(leaf_nodes, corners) for leaf_nodes, corners, _, _ in leaves]
+
+
+def _midpoint(corner1, corner2):
+    """Compute the midpoint of two (scaled) corners.
+
+    .. note::
+
+       This is a helper for :func:`_split_piece`,
+       :func:`_has_hanging_vertex` and :func:`_add_hanging_vertices`.
+
+    Args:
+        corner1 (Tuple[int, int]): The first corner.
+        corner2 (Tuple[int, int]): The second corner.
+
+    Returns:
+        Optional[Tuple[int, int]]: The midpoint, or :data:`None` if it does
+        not have integer coordinates.
+    """
+    s_sum = corner1[0] + corner2[0]
+    t_sum = corner1[1] + corner2[1]
+    if s_sum % 2 == 1 or t_sum % 2 == 1:
+        return None
+
+    return s_sum // 2, t_sum // 2
+
+
+def _add_hanging_vertices(start, end, vertex_index, boundary):
+    """Add the vertices strictly inside an edge of a mesh element.
+
+    .. note::
+
+       This is a helper for :func:`_element_boundary`.
+
+    A vertex from a neighbor can only be on the edge if the midpoint of
+    the edge is a vertex (the neighbor must have been subdivided), so this
+    recursively checks the midpoints of each half.
+
+    Args:
+        start (Tuple[int, int]): The (scaled) start of the edge.
+        end (Tuple[int, int]): The (scaled) end of the edge.
+        vertex_index (Dict[Tuple[int, int], int]): Mapping from (scaled)
+            corners to the index of the corresponding vertex.
+        boundary (List[int]): The vertices along the boundary of the
+            element (will be modified).
+    """
+    midpoint = _midpoint(start, end)
+    index = vertex_index.get(midpoint)
+    if index is None:
+        return
+
+    _add_hanging_vertices(start, midpoint, vertex_index, boundary)
+    boundary.append(index)
+    _add_hanging_vertices(midpoint, end, vertex_index, boundary)
+
+
+def _mesh_vertices(leaves, degree):
+    """Collect the corners of the pieces of a subdivided triangle.
+
+    .. note::
+
+       This is a helper for :func:`_mesh_from_leaves`.
+
+    Args:
+        leaves (List[Tuple[numpy.ndarray, Tuple[Tuple[int, int], ...]]]):
+            The nodes and (scaled) corners of each piece.
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[Dict[Tuple[int, int], int], List[numpy.ndarray], List[tuple]]:
+        The mapping from (scaled) corners to the index of the corresponding
+        vertex, the vertices and the (scaled) parameters of each vertex.
+    """
+    vertex_index = {}
+    points = []
+    param_vals = []
+    for nodes, corners in leaves:
+        for corner, column in zip(corners, (0, degree, -1)):
+            if corner not in vertex_index:
+                vertex_index[corner] = len(points)
+                points.append(nodes[:, column])
+                param_vals.append(corner)
+    return vertex_index, points, param_vals
+
+
+def _element_boundary(corners, vertex_index):
+    """Find the vertices along the boundary of a mesh element.
+
+    .. note::
+
+       This is a helper for :func:`_mesh_from_leaves`.
+
+    Args:
+        corners (Tuple[Tuple[int, int], ...]): The (scaled) corners of the
+            element.
+        vertex_index (Dict[Tuple[int, int], int]): Mapping from (scaled)
+            corners to the index of the corresponding vertex.
+
+    Returns:
+        List[int]: The vertices along the boundary, in order. This includes
+        the corners and any vertex of a neighbor along an edge.
+    """
+    boundary = []
+    for start, end in zip(corners, corners[1:] + corners[:1]):
+        boundary.append(vertex_index[start])
+        _add_hanging_vertices(start, end, vertex_index, boundary)
+    return boundary
+
+
+def _mesh_from_leaves(leaves, degree):
+    """Convert the pieces of a subdivided triangle into a mesh.
+
+    .. note::
+
+       This is a helper for :meth:`Triangle.tessellate`.
+
+    Args:
+        leaves (List[Tuple[numpy.ndarray, Tuple[Tuple[int, int], ...]]]):
+            The nodes and (scaled) corners of each piece.
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The vertices,
+        the parameters of each vertex and the vertex indices of each
+        element of the mesh.
+    """
+    vertex_index, points, param_vals = _mesh_vertices(leaves, degree)
+    third = 1.0 / 3.0
+    triangles = []
+    for nodes, corners in leaves:
+        boundary = _element_boundary(corners, vertex_index)
+        if len(boundary) == 3:
+            triangles.append(boundary)
+            continue
+
+        # Fan out from the center to the vertices along the boundary.
+        center = len(points)
+        center_point = _triangle_helpers.evaluate_barycentric(
+            nodes, degree, third, third, third
+        )
+        points.append(center_point[:, 0])
+        param_vals.append(
+            tuple(third * sum(values) for values in zip(*corners))
+        )
+        triangles.extend(
+            (center, vertex, boundary[(index + 1) % len(boundary)])
+            for index, vertex in enumerate(boundary)
+        )
+
+    size = 2.0 ** _MAX_TESSELLATE_SUBDIVISIONS
+    return (
+        np.asfortranarray(np.column_stack(points)),
+        np.asfortranarray(param_vals, dtype=np.float64) / size,
+        np.asarray(triangles, dtype=np.intc),
+    )
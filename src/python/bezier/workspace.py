@@ -0,0 +1,198 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scratch space for intersecting B |eacute| zier curves and triangles.
+
+The binary extension writes the results of an intersection into
+pre-allocated buffers before copying them into the arrays that are
+returned. An intersection workspace owns those buffers so they can be
+re-used across many calls (and grown only when a result does not fit).
+
+A workspace **must not** be shared between threads, but each thread can
+use its own workspace. If no workspace is provided, a default workspace
+for the current thread is used.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import threading
+
+import numpy as np
+
+
+# NOTE: This must match ``CurvedPolygonSegment`` from
+#       ``triangle_intersection.f90``.
+SEGMENT_DTYPE = np.dtype(
+    [("start", np.double), ("end", np.double), ("edge_index", np.intc)],
+    align=True,
+)
+_LOCAL = threading.local()
+
+
+class IntersectionWorkspace:
+    """Scratch buffers used when intersecting curves and triangles.
+
+    A workspace can be passed to :meth:`.Curve.intersect` and
+    :meth:`.Triangle.intersect` (when using the geometric strategy). The
+    buffers are only used by the binary extension; if it is not
+    available, the workspace is ignored.
+
+    .. doctest:: intersection-workspace-constructor
+
+       >>> workspace = bezier.IntersectionWorkspace()
+       >>> workspace
+       <IntersectionWorkspace (intersections_size=2, segment_ends_size=3, \
+segments_size=6)>
+       >>> nodes1 = np.asfortranarray([
+       ...     [-3.0, 5.0],
+       ...     [ 0.0, 0.0],
+       ... ])
+       >>> curve1 = bezier.Curve(nodes1, degree=1)
+       >>> nodes2 = np.asfortranarray([
+       ...     [-7.0,  9.0, -7.0, 9.0],
+       ...     [-9.0, 13.0, -13.0, 9.0],
+       ... ])
+       >>> curve2 = bezier.Curve(nodes2, degree=3)
+       >>> intersections = curve1.intersect(curve2, workspace=workspace)
+       >>> intersections
+       array([[0.5 , 0.375, 0.625],
+              [0.5 , 0.25 , 0.75 ]])
+
+    Args:
+        intersections_size (Optional[int]): The number of curve-curve
+            intersections that fit in the workspace. Defaults to 2.
+        segment_ends_size (Optional[int]): The number of curved polygons
+            (from a triangle-triangle intersection) that fit in the
+            workspace. Defaults to 3.
+        segments_size (Optional[int]): The total number of edges in curved
+            polygons that fit in the workspace. Defaults to 6.
+    """
+
+    __slots__ = ("_intersections", "_segment_ends", "_segments")
+
+    def __init__(
+        self, intersections_size=2, segment_ends_size=3, segments_size=6
+    ):
+        self._intersections = np.empty((2, intersections_size), order="F")
+        self._segment_ends = np.empty(segment_ends_size, dtype=np.intc)
+        self._segments = np.empty(segments_size, dtype=SEGMENT_DTYPE)
+
+    @property
+    def intersections_size(self):
+        """int: The number of curve-curve intersections that fit."""
+        _, size = self._intersections.shape
+        return size
+
+    @property
+    def segment_ends_size(self):
+        """int: The number of curved polygons that fit."""
+        (size,) = self._segment_ends.shape
+        return size
+
+    @property
+    def segments_size(self):
+        """int: The total number of curved polygon edges that fit."""
+        (size,) = self._segments.shape
+        return size
+
+    @property
+    def __dict__(self):
+        """dict: Dictionary of current workspace's property namespace.
+
+        This is just a stand-in property for the usual ``__dict__``. This
+        class defines ``__slots__`` so by default would not provide a
+        ``__dict__``.
+
+        This also means that the current object can't be modified by the
+        returned dictionary.
+        """
+        return {
+            "_intersections": self._intersections,
+            "_segment_ends": self._segment_ends,
+            "_segments": self._segments,
+        }
+
+    def reset(
+        self,
+        intersections_size=None,
+        segment_ends_size=None,
+        segments_size=None,
+    ):
+        """Replace some (or all) of the buffers in the workspace.
+
+        This can be used to pre-allocate enough space for a large number of
+        intersections (and so avoid a retry when a result doesn't fit).
+
+        .. doctest:: intersection-workspace-reset
+
+           >>> workspace = bezier.IntersectionWorkspace()
+           >>> workspace.reset(intersections_size=9)
+           >>> workspace.intersections_size
+           9
+           >>> workspace.segments_size
+           6
+
+        Args:
+            intersections_size (Optional[int]): The new number of
+                curve-curve intersections that fit. If not provided, that
+                buffer is unchanged.
+            segment_ends_size (Optional[int]): The new number of curved
+                polygons that fit. If not provided, that buffer is
+                unchanged.
+            segments_size (Optional[int]): The new total number of curved
+                polygon edges that fit. If not provided, that buffer is
+                unchanged.
+        """
+        if intersections_size is not None:
+            self._intersections = np.empty((2, intersections_size), order="F")
+        if segment_ends_size is not None:
+            self._segment_ends = np.empty(segment_ends_size, dtype=np.intc)
+        if segments_size is not None:
+            self._segments = np.empty(segments_size, dtype=SEGMENT_DTYPE)
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return (
+            "<{} (intersections_size={:d}, segment_ends_size={:d}, "
+            "segments_size={:d})>"
+        ).format(
+            self.__class__.__name__,
+            self.intersections_size,
+            self.segment_ends_size,
+            self.segments_size,
+        )
+
+
+def thread_workspace():
+    """Get the default intersection workspace for the current thread.
+
+    The workspace is created the first time this is called in a given
+    thread.
+
+    Returns:
+        IntersectionWorkspace: The workspace for the current thread.
+    """
+    workspace = getattr(_LOCAL, "workspace", None)
+    if workspace is None:
+        workspace = IntersectionWorkspace()
+        _LOCAL.workspace = workspace
+    return workspace
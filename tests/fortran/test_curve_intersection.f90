@@ -33,7 +33,8 @@ module test_curve_intersection
        bbox_line_intersect, check_lines, add_intersection, &
        add_from_linearized, endpoint_check, tangent_bbox_intersection, &
        add_candidates, intersect_one_round, make_same_degree, &
-       add_coincident_parameters, all_intersections, all_intersections_abi
+       add_coincident_parameters, all_intersections_workspace, &
+       all_intersections, all_intersections_abi, all_intersections_batch_abi
   use types, only: dp
   use unit_test_helpers, only: print_status
   implicit none
@@ -48,8 +49,9 @@ module test_curve_intersection
        test_add_from_linearized, test_endpoint_check, &
        test_tangent_bbox_intersection, test_add_candidates, &
        test_intersect_one_round, test_make_same_degree, &
-       test_add_coincident_parameters, test_all_intersections, &
-       test_all_intersections_abi
+       test_add_coincident_parameters, test_all_intersections_workspace, &
+       test_all_intersections, test_all_intersections_abi, &
+       test_all_intersections_batch_abi
   public curve_intersection_all_tests
 
 contains
@@ -80,8 +82,10 @@ contains
     call test_intersect_one_round(success)
     call test_make_same_degree(success)
     call test_add_coincident_parameters(success)
+    call test_all_intersections_workspace(success)
     call test_all_intersections(success)
     call test_all_intersections_abi(success)
+    call test_all_intersections_batch_abi(success)
 
   end subroutine curve_intersection_all_tests
 
@@ -737,7 +741,6 @@ contains
     ! Variables outside of signature.
     logical :: case_success
     real(c_double) :: nodes1(2, 2), nodes2(2, 3)
-    real(c_double), allocatable :: polygon1(:, :), polygon2(:, :)
     logical(c_bool) :: collision
     integer :: case_id
     character(19) :: name
@@ -745,37 +748,28 @@ contains
     case_id = 1
     name = "convex_hull_collide"
 
-    ! CASE 1: Convex hulls are both lines (Also, both ``polygon1`` and
-    !         ``polygon2`` need to be allocated.)
+    ! CASE 1: Convex hulls are both lines.
     nodes2(:, 1) = 0
     nodes2(:, 2) = 1
     nodes2(:, 3) = 2
     nodes1(:, 1) = [0.0_dp, 1.0_dp]
     nodes1(:, 2) = [0.0_dp, 2.0_dp]
-    call convex_hull_collide( &
-         3, nodes2, polygon1, 2, nodes1, polygon2, collision)
+    call convex_hull_collide(3, nodes2, 2, nodes1, collision)
     case_success = (.NOT. collision)
     call print_status(name, case_id, case_success, success)
 
-    ! CASE 2: At least one of the convex hulls is not a line (Also,
-    !         ``polygon1`` does not need to be resized but ``polygon2``
-    !         does.)
+    ! CASE 2: At least one of the convex hulls is not a line.
     nodes1(:, 1) = 0
     nodes1(:, 2) = 1
     nodes2(:, 1) = [0.0_dp, 0.5_dp]
     nodes2(:, 2) = 1
     nodes2(:, 3) = [2.0_dp, 0.5_dp]
-    call convex_hull_collide( &
-         2, nodes1, polygon1, 3, nodes2, polygon2, collision)
+    call convex_hull_collide(2, nodes1, 3, nodes2, collision)
     case_success = (collision)
     call print_status(name, case_id, case_success, success)
 
-    ! CASE 3: Same as CASE 2 with inputs swapped (Also, ``polygon2`` does not
-    !         need to be resized but ``polygon1`` does.)
-    deallocate(polygon1)
-    allocate(polygon1(2, 2))
-    call convex_hull_collide( &
-         3, nodes2, polygon1, 2, nodes1, polygon2, collision)
+    ! CASE 3: Same as CASE 2 with inputs swapped.
+    call convex_hull_collide(3, nodes2, 2, nodes1, collision)
     case_success = (collision)
     call print_status(name, case_id, case_success, success)
 
@@ -3083,6 +3077,63 @@ contains
 
   end subroutine test_add_coincident_parameters
 
+  subroutine test_all_intersections_workspace(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    type(CurveData), allocatable :: candidates_odd(:, :)
+    type(CurveData), allocatable :: candidates_even(:, :)
+    real(c_double), allocatable :: intersections(:, :)
+    real(c_double) :: quadratic1(2, 3), quadratic2(2, 3)
+    integer(c_int) :: num_intersections, size_odd, size_even
+    logical(c_bool) :: coincident
+    integer(c_int) :: status
+    integer :: case_id
+    character(27) :: name
+
+    case_id = 1
+    name = "all_intersections_workspace"
+
+    ! CASE 1: Intersection of two quadratic curves (same as CASE 2 in
+    !         ``test_all_intersections``), with unallocated scratch space.
+    quadratic1(:, 1) = [0.25_dp, 0.4375_dp]
+    quadratic1(:, 2) = [0.625_dp, 1.0_dp]
+    quadratic1(:, 3) = 1
+    quadratic2(:, 1) = [0.0_dp, 1.0_dp]
+    quadratic2(:, 2) = [0.375_dp, 1.0_dp]
+    quadratic2(:, 3) = [0.75_dp, 0.4375_dp]
+    call all_intersections_workspace( &
+         3, quadratic1, 3, quadratic2, candidates_odd, candidates_even, &
+         intersections, num_intersections, coincident, status)
+    case_success = ( &
+         allocated(candidates_odd) .AND. &
+         allocated(candidates_even) .AND. &
+         num_intersections == 1 .AND. &
+         3 * intersections(1, 1) == 1.0_dp .AND. &
+         3 * intersections(2, 1) == 2.0_dp .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Re-use the scratch space from CASE 1 for a new pair (the
+    !         curves are swapped); the scratch space is not re-allocated.
+    size_odd = size(candidates_odd, 2)
+    size_even = size(candidates_even, 2)
+    call all_intersections_workspace( &
+         3, quadratic2, 3, quadratic1, candidates_odd, candidates_even, &
+         intersections, num_intersections, coincident, status)
+    case_success = ( &
+         size(candidates_odd, 2) == size_odd .AND. &
+         size(candidates_even, 2) == size_even .AND. &
+         num_intersections == 1 .AND. &
+         3 * intersections(1, 1) == 2.0_dp .AND. &
+         3 * intersections(2, 1) == 1.0_dp .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_all_intersections_workspace
+
   subroutine test_all_intersections(success)
     logical(c_bool), intent(inout) :: success
     ! Variables outside of signature.
@@ -3386,4 +3437,90 @@ contains
 
   end subroutine test_all_intersections_abi
 
+  subroutine test_all_intersections_batch_abi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    integer(c_int) :: offsets_first(3), offsets_second(3)
+    real(c_double) :: nodes_first(2, 4), nodes_second(2, 6)
+    real(c_double) :: nodes3(2, 5), nodes4(2, 5)
+    integer(c_int) :: num_intersections
+    logical(c_bool) :: coincident(2)
+    real(c_double) :: intersections1(2, 3), intersections2(2, 4)
+    integer(c_int) :: pair_indices1(3), pair_indices2(4)
+    integer(c_int) :: status
+    integer :: case_id
+    character(27) :: name
+
+    case_id = 1
+    name = "all_intersections_batch_abi"
+
+    ! The first pair is a line and a cubic that intersect 3 times and the
+    ! second pair is two lines that intersect once.
+    nodes_first(:, 1) = [-3.0_dp, 0.0_dp]
+    nodes_first(:, 2) = [5.0_dp, 0.0_dp]
+    nodes_first(:, 3) = 0
+    nodes_first(:, 4) = 2
+    offsets_first = [0, 2, 4]
+    nodes_second(:, 1) = [-7.0_dp, -9.0_dp]
+    nodes_second(:, 2) = [9.0_dp, 13.0_dp]
+    nodes_second(:, 3) = [-7.0_dp, -13.0_dp]
+    nodes_second(:, 4) = [9.0_dp, 9.0_dp]
+    nodes_second(:, 5) = [-1.0_dp, 2.0_dp]
+    nodes_second(:, 6) = [1.0_dp, 0.0_dp]
+    offsets_second = [0, 4, 6]
+
+    ! CASE 1: ``intersections`` is not large enough.
+    call all_intersections_batch_abi( &
+         2, offsets_first, nodes_first, offsets_second, nodes_second, &
+         3, intersections1, pair_indices1, num_intersections, &
+         coincident, status)
+    case_success = ( &
+         num_intersections == 4 .AND. &
+         all(pair_indices1 == [1, 1, 1]) .AND. &
+         .NOT. any(coincident) .AND. &
+         status == Status_INSUFFICIENT_SPACE)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Just case 1, but with large enough ``intersections``.
+    call all_intersections_batch_abi( &
+         2, offsets_first, nodes_first, offsets_second, nodes_second, &
+         4, intersections2, pair_indices2, num_intersections, &
+         coincident, status)
+    case_success = ( &
+         num_intersections == 4 .AND. &
+         all(pair_indices2 == [1, 1, 1, 2]) .AND. &
+         all(intersections2(1, :) == [0.5_dp, 0.375_dp, 0.625_dp, 0.25_dp]) &
+         .AND. &
+         all(intersections2(2, :) == [0.5_dp, 0.25_dp, 0.75_dp, 0.75_dp]) &
+         .AND. &
+         .NOT. any(coincident) .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: Failure in the second pair (tangent curves with the same
+    !         curvature).
+    nodes3(:, 1) = 0
+    nodes3(:, 2) = 1
+    nodes3(:, 3) = [12.0_dp, 4.0_dp]
+    nodes3(:, 4) = -4
+    nodes3(:, 5) = [-4.0_dp, 4.0_dp]
+    nodes4(:, 1) = [0.0_dp, 1.0_dp]
+    nodes4(:, 2) = [1.0_dp, 0.0_dp]
+    nodes4(:, 3) = [6.0_dp, 1.0_dp]
+    nodes4(:, 4) = [-2.0_dp, -1.0_dp]
+    nodes4(:, 5) = [-2.0_dp, 1.0_dp]
+    offsets_first = [0, 2, 5]
+    call all_intersections_batch_abi( &
+         2, offsets_first, nodes3, offsets_first, nodes4, &
+         4, intersections2, pair_indices2, num_intersections, &
+         coincident, status)
+    case_success = ( &
+         pair_indices2(1) == 1 .AND. &
+         all(intersections2(:, 1) == 0.5_dp) .AND. &
+         status == Status_BAD_MULTIPLICITY)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_all_intersections_batch_abi
+
 end module test_curve_intersection
@@ -350,6 +350,38 @@ class Test__to_power_basis33(utils.NumPyTestCase):
         self.assertLess(np.abs(result - expected).max(), 2.0 * LOCAL_EPS)
 
 
+class Test__interpolate_power_basis(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(values):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._interpolate_power_basis(values)
+
+    def _check_many(self, degree, scale):
+        from bezier.hazmat import algebraic_intersection
+
+        # The columns are 1 + 2 t, t^2 and (1 - t)^3.
+        coeffs = np.zeros((degree + 1, 3), order="F")
+        coeffs[:4, :] = [
+            [1.0, 0.0, 1.0],
+            [2.0, 0.0, -3.0],
+            [0.0, 1.0, 3.0],
+            [0.0, 0.0, -1.0],
+        ]
+        samples = algebraic_intersection._POWER_BASIS_SAMPLES[degree]
+        values = np.polynomial.polynomial.polyval(samples, coeffs).T
+        result = self._call_function_under_test(values)
+        self.assertEqual(result.shape, (degree + 1, 3))
+        self.assertTrue(np.allclose(result, scale * coeffs, atol=0.5 ** 40))
+
+    def test_many_exact(self):
+        # NOTE: The coefficients are scaled by 3 to avoid round-off.
+        self._check_many(3, 3.0)
+
+    def test_many_least_squares(self):
+        self._check_many(6, 1.0)
+
+
 class Test_to_power_basis(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes1, nodes2):
@@ -534,6 +566,73 @@ class Test_roots_in_unit_interval(utils.NumPyTestCase):
             self.assertAlmostEqual(all_roots[index], expected, delta=LOCAL_EPS)
 
 
+class Test__make_wiggle_bernstein_matrix(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._make_wiggle_bernstein_matrix(degree)
+
+    def test_constant(self):
+        result = self._call_function_under_test(0)
+        self.assertEqual(result, np.asfortranarray([[1.0]]))
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        start = algebraic_intersection._UNIT_INTERVAL_WIGGLE_START
+        end = algebraic_intersection._UNIT_INTERVAL_WIGGLE_END
+        # 1 - 2 s + s^2 / 2 + 3 s^3
+        power_coeffs = np.asfortranarray([1.0, -2.0, 0.5, 3.0])
+        to_bernstein = self._call_function_under_test(3)
+        bernstein = to_bernstein.dot(power_coeffs)
+        u_vals = np.asfortranarray([0.0, 0.25, 0.75, 1.0])
+        s_vals = start + (end - start) * u_vals
+        values, _ = algebraic_intersection._bernstein_value(
+            np.tile(bernstein[:, np.newaxis], (1, 4)), u_vals
+        )
+        expected = np.polynomial.polynomial.polyval(s_vals, power_coeffs)
+        self.assertTrue(np.allclose(values, expected, atol=0.0, rtol=1e-14))
+
+
+class Test_roots_in_unit_interval_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection.roots_in_unit_interval_multi(coeffs)
+
+    def test_it(self):
+        # P0(t) = (t^2 + 1) (2 t - 1) (3 t - 1) (3 t - 2)
+        # P1(t) = (t + 1)^5
+        # P2(t) = 8 (t - 1/4)^3 (t - 1/2)^2
+        coeffs = np.asfortranarray(
+            [
+                [-2.0, 1.0, -0.03125],
+                [13.0, 5.0, 0.5],
+                [-29.0, 10.0, -3.125],
+                [31.0, 10.0, 9.5],
+                [-27.0, 5.0, -14.0],
+                [18.0, 1.0, 8.0],
+            ]
+        )
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.tolist(), [0, 0, 0, 2, 2, 2, 2, 2])
+        roots0 = np.sort(roots[:3])
+        for index in (0, 1, 2):
+            expected = (index + 2.0) / 6.0
+            self.assertAlmostEqual(roots0[index], expected, delta=LOCAL_EPS)
+        roots2 = np.sort(roots[3:])
+        expected2 = [0.25, 0.25, 0.25, 0.5, 0.5]
+        self.assertTrue(np.allclose(roots2, expected2, atol=0.5 ** 14))
+
+    def test_constant(self):
+        coeffs = np.asfortranarray([[1.0, -2.0]])
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.shape, (0,))
+        self.assertEqual(roots.shape, (0,))
+
+
 class Test__strip_leading_zeros(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(coeffs, **kwargs):
@@ -716,6 +815,218 @@ class Test_intersect_curves(utils.NumPyTestCase):
             self._call_function_under_test(nodes1, nodes2)
 
 
+class Test_intersect_curves_many(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes_others, **kwargs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection.intersect_curves_many(
+            nodes1, nodes_others, **kwargs
+        )
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        # x1(s), y1(s) = 9 s, 18 s (1 - s)
+        nodes1 = np.asfortranarray([[0.0, 4.5, 9.0], [0.0, 9.0, 0.0]])
+        nodes_others = [
+            # x(t), y(t) = 6 t, 8 (1 - t)
+            np.asfortranarray([[0.0, 6.0], [8.0, 0.0]]),
+            np.asfortranarray([[10.0, 12.0], [0.0, 1.0]]),
+            np.asfortranarray([[0.0, 0.25, 0.75, 1.0], [0.5, 1.0, 1.5, 0.5]]),
+        ]
+        result = self._call_function_under_test(nodes1, nodes_others)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0].shape, (2, 1))
+        self.assertAlmostEqual(result[0][0, 0], 1.0 / 3.0, delta=LOCAL_EPS)
+        self.assertAlmostEqual(result[0][1, 0], 0.5, delta=LOCAL_EPS)
+        self.assertEqual(result[1].shape, (2, 0))
+        expected = algebraic_intersection.intersect_curves(
+            nodes1, nodes_others[2]
+        )
+        self.assertEqual(result[2].shape, expected.shape)
+        self.assertTrue(np.allclose(result[2], expected, atol=LOCAL_EPS))
+
+    def test_leading_zero(self):
+        # The intersection polynomial is degree 1 (rather than 2), so
+        # round-off in the interpolant leaves a tiny leading coefficient.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.5, 0.5], [0.0, 1.0]])
+        (result,) = self._call_function_under_test(nodes1, [nodes2])
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(result, expected)
+
+    def test_with_implicit(self):
+        from bezier.hazmat import algebraic_intersection
+
+        # This is a degree-elevated line, the implicit form is reduced.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.375, 0.375, 0.375]])
+        implicit = algebraic_intersection.ImplicitCurve(nodes1)
+        self.assertEqual(implicit.nodes.shape, (2, 2))
+        nodes2 = np.asfortranarray([[0.5, 0.5], [0.0, 0.75]])
+        patch = unittest.mock.patch.object(
+            algebraic_intersection, "ImplicitCurve"
+        )
+        with patch as mocked:
+            (result,) = self._call_function_under_test(
+                nodes1, [nodes2], implicit=implicit
+            )
+            mocked.assert_not_called()
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(result, expected)
+
+    def test_no_others(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        result = self._call_function_under_test(nodes1, [])
+        self.assertEqual(result, [])
+
+    def test_unsupported_degrees(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray(
+            [[0.0, 1.0, 1.0, 2.0], [0.0, 1.0, 0.0, 0.0]]
+        )
+        nodes2 = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, 0.0, 1.0, 0.0]]
+        )
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test(nodes1, [nodes2])
+        exc_args = exc_info.exception.args
+        expected = (
+            "Degree 1",
+            3,
+            "Degree 2",
+            4,
+            algebraic_intersection._POWER_BASIS_MANY_ERR,
+        )
+        self.assertEqual(exc_args, expected)
+
+    def test_coincident(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 4.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[2.625, 4.5, 7.5], [0.75, 0.0, -3.0]])
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes1, [nodes2])
+
+    def test_rejected(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes_others = [
+            # Far away from the first curve: the intersection polynomial
+            # has no sign changes.
+            np.asfortranarray([[10.0, 11.0], [10.0, 12.0]]),
+            np.asfortranarray([[0.5, 0.5], [0.0, 1.0]]),
+        ]
+        check_non_simple = unittest.mock.Mock(
+            wraps=algebraic_intersection._check_non_simple
+        )
+        patch = unittest.mock.patch.object(
+            algebraic_intersection, "_check_non_simple", new=check_non_simple
+        )
+        with patch:
+            first, second = self._call_function_under_test(
+                nodes1, nodes_others
+            )
+        self.assertEqual(first.shape, (2, 0))
+        self.assertEqual(second, np.asfortranarray([[0.5], [0.5]]))
+        check_non_simple.assert_called_once()
+
+    def test_non_simple(self):
+        from bezier.hazmat import algebraic_intersection
+
+        # The line is tangent to the curve at s = 1/2.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.5, 0.5]])
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test(nodes1, [nodes2])
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args[0], algebraic_intersection._NON_SIMPLE_ERR)
+
+
+class Test__sample_implicit_many(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(implicit, all_nodes2):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._sample_implicit_many(
+            implicit, all_nodes2
+        )
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        implicit = algebraic_intersection.ImplicitCurve(nodes1)
+        all_nodes2 = [
+            np.asfortranarray([[0.5, 0.5], [0.0, 1.0]]),
+            np.asfortranarray([[0.0, 0.5, 1.0], [1.0, 0.0, 1.0]]),
+        ]
+        result = self._call_function_under_test(implicit, all_nodes2)
+        self.assertEqual([values.shape for values in result], [(3,), (5,)])
+        for nodes2, values in zip(all_nodes2, result):
+            expected = algebraic_intersection._sample_values(
+                nodes1, nodes2, values.size - 1
+            )
+            self.assertTrue(np.allclose(values, expected, atol=0.5 ** 40))
+
+
+class Test__power_basis_many(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(all_values):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._power_basis_many(all_values)
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        samples = algebraic_intersection._POWER_BASIS_SAMPLES
+        # The polynomials are 2 s - 1, 4 s^2 - 1 and 1 - s.
+        all_values = [
+            2.0 * samples[1] - 1.0,
+            4.0 * samples[2] ** 2 - 1.0,
+            1.0 - samples[1],
+        ]
+        result = self._call_function_under_test(all_values)
+        expected = [[-1.0, 2.0], [-1.0, 0.0, 4.0], [1.0, -1.0]]
+        self.assertEqual(len(result), 3)
+        for coeffs, expected_coeffs in zip(result, expected):
+            expected_coeffs = algebraic_intersection.normalize_polynomial(
+                np.asfortranarray(expected_coeffs)
+            )
+            self.assertTrue(
+                np.allclose(coeffs, expected_coeffs, atol=0.5 ** 40)
+            )
+
+
+class Test__roots_many(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(all_coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._roots_many(all_coeffs)
+
+    def test_it(self):
+        all_coeffs = [
+            # 4 s^2 - 1 = (2 s - 1)(2 s + 1)
+            np.asfortranarray([-1.0, 0.0, 4.0]),
+            # 2 s - 1
+            np.asfortranarray([-1.0, 2.0]),
+            # s^2 + 1 has no (real) roots.
+            np.asfortranarray([1.0, 0.0, 1.0]),
+            # 16 s^2 - 12 s + 2 = 2 (4 s - 1)(2 s - 1)
+            np.asfortranarray([2.0, -12.0, 16.0]),
+        ]
+        result = self._call_function_under_test(all_coeffs)
+        self.assertEqual(len(result), 4)
+        expected = [[0.5], [0.5], [], [0.25, 0.5]]
+        for t_vals, expected_t_vals in zip(result, expected):
+            self.assertEqual(t_vals.shape, (len(expected_t_vals),))
+            self.assertTrue(
+                np.allclose(t_vals, expected_t_vals, atol=LOCAL_EPS)
+            )
+
+
 class Test_normalize_polynomial(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(coeffs, **kwargs):
@@ -869,10 +1180,10 @@ class Test_bernstein_companion(utils.NumPyTestCase):
 
 class Test_bezier_roots(utils.NumPyTestCase):
     @staticmethod
-    def _call_function_under_test(coeffs):
+    def _call_function_under_test(coeffs, **kwargs):
         from bezier.hazmat import algebraic_intersection
 
-        return algebraic_intersection.bezier_roots(coeffs)
+        return algebraic_intersection.bezier_roots(coeffs, **kwargs)
 
     def test_all_zero(self):
         for num_zeros in (1, 2, 3, 4):
@@ -977,6 +1288,309 @@ class Test_bezier_roots(utils.NumPyTestCase):
         self.assertLess(ulp_errs[0], 16384)
         self.assertLess(ulp_errs[1], 256)
 
+    def test_unit_interval(self):
+        # 6 s (2 s - 1) (s - 1)
+        coeffs = np.asfortranarray([0.0, 1.0, -1.0, 0.0])
+        roots = self._call_function_under_test(coeffs, unit_interval=True)
+        self.assertEqual(roots, np.asfortranarray([0.0, 0.5, 1.0]))
+
+    def test_unit_interval_no_roots(self):
+        # 3 (s^2 + 1)
+        coeffs = np.asfortranarray([3.0, 3.0, 4.0, 6.0])
+        roots = self._call_function_under_test(coeffs, unit_interval=True)
+        self.assertEqual(roots.shape, (0,))
+
+
+class Test_bezier_roots_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs, **kwargs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection.bezier_roots_multi(coeffs, **kwargs)
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        # The columns are 2 s (s + 1), 0, 2 (s - 2) (s - 1), 2, s^2 + 1,
+        # 2 (s + 1), 6 (1 - s)^2 and 4 (1 - s).
+        coeffs = np.asfortranarray(
+            [
+                [0.0, 0.0, 4.0, 2.0, 1.0, 2.0, 6.0, 4.0],
+                [1.0, 0.0, 1.0, 2.0, 1.0, 3.0, 0.0, 2.0],
+                [4.0, 0.0, 0.0, 2.0, 2.0, 4.0, 0.0, 0.0],
+            ]
+        )
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.tolist(), [0, 0, 2, 2, 4, 4, 5, 6, 6, 7])
+        for index in range(8):
+            expected = algebraic_intersection.bezier_roots(
+                np.asfortranarray(coeffs[:, index])
+            )
+            self.assertTrue(
+                np.allclose(roots[poly_ids == index], expected, atol=0.0)
+            )
+
+    def test_no_polynomials(self):
+        coeffs = np.empty((3, 0), order="F")
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.shape, (0,))
+        self.assertEqual(roots.shape, (0,))
+
+    def test_unit_interval(self):
+        # The columns are 2 s (s + 1), 0, 2 (s - 2) (s - 1), 2 and
+        # 6 (1 - s)^2 - 8 s (1 - s) + 2 s^2 = 16 (s - 1/2)(s - 3/4).
+        coeffs = np.asfortranarray(
+            [
+                [0.0, 0.0, 4.0, 2.0, 6.0],
+                [1.0, 0.0, 1.0, 2.0, -4.0],
+                [4.0, 0.0, 0.0, 2.0, 2.0],
+            ]
+        )
+        poly_ids, roots = self._call_function_under_test(
+            coeffs, unit_interval=True
+        )
+        self.assertEqual(poly_ids.tolist(), [0, 2, 4, 4])
+        expected = np.asfortranarray([0.0, 1.0, 0.5, 0.75])
+        self.assertEqual(roots, expected)
+
+
+class Test__effective_degrees(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._effective_degrees(coeffs)
+
+    def test_it(self):
+        coeffs = np.asfortranarray(
+            [[1.0, 0.0, 2.0, 3.0], [2.0, 0.0, 0.0, 1.0], [0.0, 0.0, 0.0, 1.0]]
+        )
+        effective_degrees, is_zero = self._call_function_under_test(coeffs)
+        self.assertEqual(effective_degrees.tolist(), [1, 2, 0, 2])
+        self.assertEqual(is_zero.tolist(), [False, True, False, False])
+
+
+class Test__sigma_coeffs_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs, effective_degree):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._sigma_coeffs_multi(
+            coeffs, effective_degree
+        )
+
+    def test_it(self):
+        from bezier.hazmat import algebraic_intersection
+
+        coeffs = np.asfortranarray(
+            [[1.0, 4.0], [-3.0, 2.0], [2.0, 1.0], [0.0, 0.0]]
+        )
+        result = self._call_function_under_test(coeffs, 2)
+        for index in range(2):
+            expected, _, _ = algebraic_intersection._get_sigma_coeffs(
+                np.asfortranarray(coeffs[:, index])
+            )
+            self.assertEqual(np.asfortranarray(result[:, index]), expected)
+
+
+class Test__finite_roots(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(poly_ids, sigma_roots):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._finite_roots(poly_ids, sigma_roots)
+
+    def test_it(self):
+        poly_ids = np.asfortranarray([3, 5])
+        sigma_roots = np.asfortranarray([[1.0, -1.0], [3.0, 0.0]])
+        ids, roots = self._call_function_under_test(poly_ids, sigma_roots)
+        self.assertEqual(ids.tolist(), [3, 5, 5])
+        self.assertEqual(roots.tolist(), [0.5, 0.75, 0.0])
+
+
+class Test__sign_variations(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._sign_variations(coeffs)
+
+    def test_it(self):
+        coeffs = np.asfortranarray(
+            [
+                [0.0, 1.0, 0.0, -1.0, 2.0],
+                [1.0, 2.0, 3.0, 4.0, 5.0],
+                [0.0, 0.0, 0.0, 0.0, -1.0],
+                [-1.0, 0.0, 0.0, -2.0, 3.0],
+            ]
+        )
+        result = self._call_function_under_test(coeffs)
+        self.assertEqual(result.tolist(), [2, 0, 0, 1])
+
+
+class Test__bernstein_value(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs, s_vals):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._bernstein_value(coeffs, s_vals)
+
+    def test_linear(self):
+        # 2 - 3 s and 4 s
+        coeffs = np.asfortranarray([[2.0, 0.0], [-1.0, 4.0]])
+        s_vals = np.asfortranarray([0.25, 0.5])
+        values, derivs = self._call_function_under_test(coeffs, s_vals)
+        self.assertEqual(values, np.asfortranarray([1.25, 2.0]))
+        self.assertEqual(derivs, np.asfortranarray([-3.0, 4.0]))
+
+    def test_quadratic(self):
+        # (2 s - 1)^2 and 4 s
+        coeffs = np.asfortranarray([[1.0, 0.0], [-1.0, 2.0], [1.0, 4.0]])
+        s_vals = np.asfortranarray([0.25, 0.5])
+        values, derivs = self._call_function_under_test(coeffs, s_vals)
+        self.assertEqual(values, np.asfortranarray([0.25, 2.0]))
+        self.assertEqual(derivs, np.asfortranarray([-2.0, 4.0]))
+
+
+class Test__polish_roots(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs, starts, ends):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._polish_roots(coeffs, starts, ends)
+
+    def test_it(self):
+        # 2 s - 1 and -4 s^2 + 8 s - 1
+        coeffs = np.asfortranarray([[-1.0, -1.0], [0.0, 3.0], [1.0, 3.0]])
+        starts = np.asfortranarray([0.0, 0.0])
+        ends = np.asfortranarray([1.0, 1.0])
+        result = self._call_function_under_test(coeffs, starts, ends)
+        expected = np.asfortranarray([0.5, 1.0 - 0.5 * np.sqrt(3.0)])
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-15))
+        # Make sure the brackets are not modified.
+        self.assertEqual(starts, np.asfortranarray([0.0, 0.0]))
+        self.assertEqual(ends, np.asfortranarray([1.0, 1.0]))
+
+    def test_bisection(self):
+        # The Newton step from s = 1/2 leaves the bracket for
+        # 5 (s - 1)^3 + 4, so bisection is used.
+        coeffs = np.asfortranarray([[-1.0], [4.0], [4.0], [4.0]])
+        starts = np.asfortranarray([0.0])
+        ends = np.asfortranarray([1.0])
+        (result,) = self._call_function_under_test(coeffs, starts, ends)
+        expected = 1.0 - np.cbrt(0.8)
+        self.assertAlmostEqual(result, expected, delta=LOCAL_EPS)
+
+    def test_max_steps(self):
+        from bezier.hazmat import algebraic_intersection
+
+        coeffs = np.asfortranarray([[-1.0], [3.0], [3.0]])
+        starts = np.asfortranarray([0.0])
+        ends = np.asfortranarray([1.0])
+        patch = unittest.mock.patch.object(
+            algebraic_intersection, "_POLISH_MAX_STEPS", new=1
+        )
+        with patch:
+            result = self._call_function_under_test(coeffs, starts, ends)
+        # After one step, only the bracket has changed.
+        self.assertEqual(result, np.asfortranarray([0.25]))
+
+
+class Test__subdivision_roots(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._subdivision_roots(coeffs)
+
+    def test_constant(self):
+        coeffs = np.asfortranarray([[0.0, 2.0, -1.0]])
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.shape, (0,))
+        self.assertEqual(roots.shape, (0,))
+
+    def test_it(self):
+        # The columns are (2 s - 1)^2, 0, 7 s^2 - 6 s + 2,
+        # 3 s^2 - 3 s + 1/2 and s (1 - s).
+        coeffs = np.asfortranarray(
+            [
+                [1.0, 0.0, 2.0, 0.5, 0.0],
+                [-1.0, 0.0, -1.0, -1.0, 0.5],
+                [1.0, 0.0, 3.0, 0.5, 0.0],
+            ]
+        )
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.tolist(), [0, 3, 3, 4, 4])
+        sqrt3 = np.sqrt(3.0)
+        expected = np.asfortranarray(
+            [0.5, 0.5 - sqrt3 / 6.0, 0.5 + sqrt3 / 6.0, 0.0, 1.0]
+        )
+        self.assertTrue(np.allclose(roots, expected, atol=0.0, rtol=1e-15))
+
+    def test_cluster(self):
+        # (s - 1/3)^2
+        coeffs = np.asfortranarray([[1.0], [-2.0], [4.0]]) / 9.0
+        poly_ids, roots = self._call_function_under_test(coeffs)
+        self.assertEqual(poly_ids.tolist(), [0])
+        self.assertAlmostEqual(roots[0], 1.0 / 3.0, delta=0.5 ** 30)
+
+
+class Test__isolate_roots(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(coeffs, poly_ids):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._isolate_roots(coeffs, poly_ids)
+
+    def test_it(self):
+        # The columns are 16 (s - 1/4) (s - 5/8) and (2 s - 1)^2.
+        coeffs = np.asfortranarray([[2.5, 1.0], [-4.5, -1.0], [4.5, 1.0]])
+        brackets, found = self._call_function_under_test(
+            coeffs, np.asfortranarray([0, 1])
+        )
+        bracket_ids, starts, ends = brackets
+        self.assertEqual(bracket_ids.tolist(), [0, 0])
+        self.assertEqual(starts.tolist(), [0.0, 0.5])
+        self.assertEqual(ends.tolist(), [0.5, 1.0])
+        # The double root is found at the midpoint of the first split.
+        found_ids = np.concatenate([ids for ids, _ in found])
+        found_roots = np.concatenate([roots for _, roots in found])
+        self.assertEqual(found_ids.tolist(), [1])
+        self.assertEqual(found_roots.tolist(), [0.5])
+
+
+class Test__classify_intervals(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(sub_coeffs, final):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._classify_intervals(sub_coeffs, final)
+
+    def test_subdivide(self):
+        sub_coeffs = np.asfortranarray(
+            [
+                [1.0, 2.0, 3.0],
+                [1.0, -2.0, -3.0],
+                [1.0, -2.0, 3.0],
+                [-1.0, 2.0, -3.0],
+            ]
+        )
+        isolated, remaining = self._call_function_under_test(sub_coeffs, False)
+        self.assertEqual(isolated.tolist(), [False, True, False, False])
+        self.assertEqual(remaining.tolist(), [False, False, True, True])
+
+    def test_final(self):
+        sub_coeffs = np.asfortranarray(
+            [
+                [1.0, 2.0, 3.0, 4.0],
+                [1.0, -2.0, 3.0, 4.0],
+                [1.0, -2.0, 3.0, -4.0],
+            ]
+        )
+        isolated, remaining = self._call_function_under_test(sub_coeffs, True)
+        self.assertEqual(isolated.tolist(), [False, False, True])
+        self.assertEqual(remaining.tolist(), [False, True, False])
+
 
 class Test_lu_companion(utils.NumPyTestCase):
     @staticmethod
@@ -1394,3 +2008,89 @@ class Test_all_intersections(utils.NumPyTestCase):
         expected = np.asfortranarray([[s_val], [t_val]])
         self.assertEqual(intersections, expected)
         self.assertFalse(coincident)
+
+
+class TestImplicitCurve(utils.NumPyTestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection.ImplicitCurve
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _check_evaluate(self, nodes):
+        from bezier.hazmat import algebraic_intersection
+
+        implicit = self._make_one(nodes)
+        points = np.asfortranarray(
+            [[0.0, 1.0, 0.5, 2.0, -3.0], [0.0, 1.0, 2.0, -1.0, 0.25]]
+        )
+        result = implicit.evaluate_multi(points)
+        self.assertEqual(result.shape, (5,))
+        expected = [
+            algebraic_intersection.evaluate(nodes, x_val, y_val)
+            for x_val, y_val in points.T
+        ]
+        self.assertTrue(np.allclose(result, expected, atol=0.5 ** 40))
+
+    def test_linear(self):
+        nodes = np.asfortranarray([[1.0, 2.0], [0.0, 3.0]])
+        self._check_evaluate(nodes)
+
+    def test_quadratic(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 1.0], [2.0, 0.0, 1.0]])
+        self._check_evaluate(nodes)
+
+    def test_cubic(self):
+        nodes = np.asfortranarray(
+            [[0.0, 0.25, 0.75, 1.0], [0.5, 1.0, 1.5, 0.5]]
+        )
+        self._check_evaluate(nodes)
+
+    def test___dict__(self):
+        nodes = np.asfortranarray([[1.0, 2.0], [0.0, 3.0]])
+        implicit = self._make_one(nodes)
+        props_dict = implicit.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()), ["center", "coeffs", "nodes", "radius"]
+        )
+        self.assertIs(props_dict["nodes"], implicit.nodes)
+        self.assertEqual(
+            props_dict["center"], np.asfortranarray([[1.5], [1.5]])
+        )
+        self.assertEqual(props_dict["radius"], 1.5)
+        self.assertIs(props_dict["coeffs"], implicit.coeffs)
+
+    def test_point(self):
+        nodes = np.asfortranarray([[1.0, 1.0], [2.0, 2.0]])
+        with self.assertRaises(ValueError):
+            self._make_one(nodes)
+
+    def test_unsupported_degree(self):
+        from bezier.hazmat import helpers as _py_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, 0.0, 1.0, 0.0]]
+        )
+        with self.assertRaises(_py_helpers.UnsupportedDegree):
+            self._make_one(nodes)
+
+
+class Test__evaluate_grid(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, x_vals, y_vals):
+        from bezier.hazmat import algebraic_intersection
+
+        return algebraic_intersection._evaluate_grid(nodes, x_vals, y_vals)
+
+    def test_it(self):
+        # f(x, y) = 3 - 3 x + y for the line from (1, 0) to (2, 3).
+        nodes = np.asfortranarray([[1.0, 2.0], [0.0, 3.0]])
+        x_vals = np.asfortranarray([0.0, 1.0])
+        y_vals = np.asfortranarray([0.0, 1.0, 2.0])
+        result = self._call_function_under_test(nodes, x_vals, y_vals)
+        expected = np.asfortranarray([[3.0, 4.0, 5.0], [0.0, 1.0, 2.0]])
+        self.assertEqual(result, expected)
@@ -11,9 +11,12 @@
 # limitations under the License.
 
 import unittest
+import unittest.mock
 
 import numpy as np
 
+from tests.unit import utils
+
 
 SPACING = np.spacing  # pylint: disable=no-member
 
@@ -204,3 +207,434 @@ class Test_clip_range(unittest.TestCase):
             self._call_function_under_test(nodes1, nodes2)
         expected_args = (clipping.NO_PARALLEL,)
         self.assertEqual(exc_info.exception.args, expected_args)
+
+
+class Test__clip_interval(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_fat, nodes_clipped, fuzz):
+        from bezier.hazmat import clipping
+
+        return clipping._clip_interval(nodes_fat, nodes_clipped, fuzz)
+
+    def test_whole_interval(self):
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertEqual(result, (0.0, 1.0))
+
+    def test_clipped(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        nodes2 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertEqual(result, (0.1875, 0.8125))
+
+    def test_disjoint(self):
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [2.0, 2.0]])
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertIsNone(result)
+
+    def test_parallel(self):
+        # NOTE: These are the curves that cause ``clip_range()`` to fail.
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, 3.0, 1.0]])
+        nodes2 = np.asfortranarray(
+            [[0.0, 0.5, 1.0, 1.5, 2.0], [0.0, 4.0, 4.0, 4.0, 0.0]]
+        )
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertEqual(result, (0.0625, 0.9375))
+
+    def test_control_points_inside(self):
+        nodes1 = np.asfortranarray([[0.0, 4.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 4.0]])
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertEqual(result, (0.0, 0.0))
+        result = self._call_function_under_test(nodes1, nodes2, 0.5)
+        self.assertEqual(result, (0.0, 0.125))
+
+    def test_point(self):
+        nodes1 = np.asfortranarray([[0.5, 0.5], [0.5, 0.5]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        result = self._call_function_under_test(nodes1, nodes2, 0.0)
+        self.assertEqual(result, (0.5, 0.5))
+
+    def test_both_points(self):
+        nodes = np.asfortranarray([[0.5, 0.5], [0.5, 0.5]])
+        result = self._call_function_under_test(nodes, nodes, 0.0)
+        self.assertEqual(result, (0.0, 1.0))
+
+
+class Test__merge_candidates(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(candidates):
+        from bezier.hazmat import clipping
+
+        return clipping._merge_candidates(candidates)
+
+    def test_it(self):
+        candidates = [
+            (0.5, 0.75, 0.0, 0.25),
+            (0.0, 0.25, 0.0, 0.25),
+            (0.25, 0.5, 0.0, 0.25),
+            (0.0, 0.25, 0.5, 0.75),
+        ]
+        merged = self._call_function_under_test(candidates)
+        expected = [(0.0, 0.75, 0.0, 0.25), (0.0, 0.25, 0.5, 0.75)]
+        self.assertEqual(merged, expected)
+
+
+class Test__converge_clusters(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(candidates, converged):
+        from bezier.hazmat import clipping
+
+        return clipping._converge_clusters(candidates, converged)
+
+    def test_it(self):
+        width = 0.5 ** 20
+        candidates = [
+            (0.5, 0.5 + width, 0.25, 0.25 + width),
+            (0.5 + width, 0.5 + 2 * width, 0.25, 0.25 + width),
+            (0.0, 0.25, 0.0, 0.25),
+        ]
+        converged = []
+        remaining = self._call_function_under_test(candidates, converged)
+        self.assertEqual(remaining, [(0.0, 0.25, 0.0, 0.25)])
+        self.assertEqual(
+            converged, [(0.5, 0.5 + 2 * width, 0.25, 0.25 + width)]
+        )
+
+
+class Test__polish_tangent(unittest.TestCase):
+    NODES1 = np.asfortranarray([[4.0, 2.0, 0.0], [0.0, 4.0, 0.0]])
+    NODES2 = np.asfortranarray([[0.0, 2.0, 4.0], [4.0, 0.0, 4.0]])
+
+    @staticmethod
+    def _call_function_under_test(s, nodes1, t, nodes2):
+        from bezier.hazmat import clipping
+
+        return clipping._polish_tangent(s, nodes1, t, nodes2)
+
+    def test_not_tangent(self):
+        nodes2 = np.asfortranarray([[0.0, 4.0], [1.0, 3.0]])
+        s = 0.5 + 0.5 ** 30
+        result = self._call_function_under_test(s, self.NODES1, 0.5, nodes2)
+        self.assertEqual(result, (s, 0.5))
+
+    def test_tangent(self):
+        # B1(s) = B2(t) (in floating point) near the tangent intersection
+        # at ``s = t = 1/2``.
+        delta = 0.5 ** 28
+        s, t = self._call_function_under_test(
+            0.5 + delta, self.NODES1, 0.5 - delta, self.NODES2
+        )
+        self.assertEqual(s, 0.5)
+        self.assertEqual(t, 0.5)
+
+    def test_tangent_line(self):
+        nodes2 = np.asfortranarray([[0.0, 4.0], [2.0, 2.0]])
+        delta = 0.5 ** 28
+        s, t = self._call_function_under_test(
+            0.5 + delta, self.NODES1, 0.5 - delta, nodes2
+        )
+        self.assertEqual(s, 0.5)
+        self.assertEqual(t, 0.5)
+
+    def test_no_converge(self):
+        delta = 0.5 ** 28
+        s = 0.5 + delta
+        t = 0.5 - delta
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.newton_iterate",
+            return_value=(False, 0.5, 0.5),
+        ) as newton_iterate:
+            result = self._call_function_under_test(
+                s, self.NODES1, t, self.NODES2
+            )
+        self.assertEqual(result, (s, t))
+        newton_iterate.assert_called_once()
+
+
+class Test__hodographs(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier.hazmat import clipping
+
+        return clipping._hodographs(nodes)
+
+    def test_line(self):
+        nodes = np.asfortranarray([[0.0, 2.0], [1.0, 4.0]])
+        first_deriv, second_deriv = self._call_function_under_test(nodes)
+        self.assertEqual(first_deriv, np.asfortranarray([[2.0], [3.0]]))
+        self.assertEqual(second_deriv, np.zeros((2, 1), order="F"))
+
+    def test_cubic(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0, 6.0], [0.0, 1.0, 1.0, 0.0]])
+        first_deriv, second_deriv = self._call_function_under_test(nodes)
+        expected1 = np.asfortranarray([[3.0, 6.0, 9.0], [3.0, 0.0, -3.0]])
+        self.assertEqual(first_deriv, expected1)
+        expected2 = np.asfortranarray([[6.0, 6.0], [-6.0, -6.0]])
+        self.assertEqual(second_deriv, expected2)
+
+
+class Test__add_converged(unittest.TestCase):
+    NODES1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+
+    @staticmethod
+    def _call_function_under_test(
+        candidate, nodes_first, nodes_second, fuzz, intersections
+    ):
+        from bezier.hazmat import clipping
+
+        return clipping._add_converged(
+            candidate, nodes_first, nodes_second, fuzz, intersections
+        )
+
+    def test_it(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        width = 0.5 ** 30
+        candidate = (0.25 - width, 0.25 + 2 * width, 0.25 - width, 0.25)
+        intersections = []
+        self._call_function_under_test(
+            candidate, self.NODES1, nodes2, 0.5 ** 40, intersections
+        )
+        self.assertEqual(intersections, [(0.25, 0.25)])
+
+    def test_disjoint(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.5, 0.5]])
+        width = 0.5 ** 30
+        candidate = (0.25, 0.25 + width, 0.25, 0.25 + width)
+        intersections = []
+        self._call_function_under_test(
+            candidate, self.NODES1, nodes2, 0.5 ** 40, intersections
+        )
+        self.assertEqual(intersections, [])
+
+    def test_newton_fallback(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        width = 0.5 ** 30
+        candidate = (0.25 - width, 0.25 + 2 * width, 0.25 - width, 0.25)
+        intersections = []
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.full_newton",
+            side_effect=[NotImplementedError, (0.25, 0.25)],
+        ) as full_newton:
+            self._call_function_under_test(
+                candidate, self.NODES1, nodes2, 0.5 ** 40, intersections
+            )
+        self.assertEqual(intersections, [(0.25, 0.25)])
+        self.assertEqual(full_newton.call_count, 2)
+        # The second attempt starts from the midpoints.
+        call = full_newton.mock_calls[1]
+        self.assertEqual(call[1][0], 0.25 + 0.5 * width)
+        self.assertEqual(call[1][2], 0.25 - 0.5 * width)
+
+    def test_outside_unit_square(self):
+        # These lines are collinear, so they "meet" at every parameter
+        # returned by the mocked Newton's method.
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 2.0], [0.0, 0.0]])
+        width = 0.5 ** 30
+        candidate = (1.0 - width, 1.0, 0.0, width)
+        intersections = []
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.full_newton",
+            side_effect=[(1.5, 0.5), (0.5, -0.5)],
+        ):
+            self._call_function_under_test(
+                candidate, nodes1, nodes2, 0.5 ** 40, intersections
+            )
+            self._call_function_under_test(
+                candidate, nodes1, nodes2, 0.5 ** 40, intersections
+            )
+        self.assertEqual(intersections, [])
+
+    def test_too_far(self):
+        # Newton's method converges to an intersection that is outside of
+        # the unit square.
+        nodes2 = np.asfortranarray([[1.0, 2.0], [0.0, 0.0]])
+        width = 0.5 ** 30
+        candidate = (1.0 - width, 1.0, 0.0, width)
+        intersections = []
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.full_newton",
+            return_value=(1.0, -0.5),
+        ):
+            self._call_function_under_test(
+                candidate, self.NODES1, nodes2, 0.5 ** 40, intersections
+            )
+        self.assertEqual(intersections, [])
+
+
+class Test__clip_candidate(unittest.TestCase):
+    NODES1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, candidate, fuzz):
+        from bezier.hazmat import clipping
+
+        return clipping._clip_candidate(
+            nodes_first, nodes_second, candidate, fuzz
+        )
+
+    def test_disjoint_bbox(self):
+        nodes2 = np.asfortranarray([[2.0, 3.0], [0.0, 1.0]])
+        result = self._call_function_under_test(
+            self.NODES1, nodes2, (0.0, 1.0, 0.0, 1.0), 0.0
+        )
+        self.assertEqual(result, [])
+
+    def test_disjoint_fat_line(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.75, 0.0]])
+        result = self._call_function_under_test(
+            self.NODES1, nodes2, (0.5, 1.0, 0.0, 0.5), 0.0
+        )
+        self.assertEqual(result, [])
+
+    def test_disjoint_second_fat_line(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.5, 2.0, 2.0], [1.0, 1.0, -1.0]])
+        result = self._call_function_under_test(
+            nodes1, nodes2, (0.0, 1.0, 0.0, 1.0), 0.0
+        )
+        self.assertEqual(result, [])
+
+    def test_clipped(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        result = self._call_function_under_test(
+            self.NODES1, nodes2, (0.0, 0.5, 0.0, 0.5), 0.0
+        )
+        self.assertEqual(len(result), 1)
+        s_start, s_end, t_start, t_end = result[0]
+        self.assertLess(s_start, 0.25)
+        self.assertLess(0.25, s_end)
+        self.assertLess(s_end - s_start, 0.5 * 0.8)
+        self.assertLess(t_start, 0.25)
+        self.assertLess(0.25, t_end)
+        self.assertLess(t_end - t_start, 0.5 * 0.8)
+
+    def test_split(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        result = self._call_function_under_test(
+            self.NODES1, nodes2, (0.0, 1.0, 0.0, 1.0), 0.0
+        )
+        expected = [(0.1875, 0.8125, 0.0, 0.5), (0.1875, 0.8125, 0.5, 1.0)]
+        self.assertEqual(result, expected)
+
+
+class Test__finalize(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, converged, fuzz):
+        from bezier.hazmat import clipping
+
+        return clipping._finalize(nodes_first, nodes_second, converged, fuzz)
+
+    def test_empty(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        st_vals, coincident = self._call_function_under_test(
+            nodes1, nodes2, [], 0.0
+        )
+        self.assertEqual(st_vals.shape, (2, 0))
+        self.assertFalse(coincident)
+
+    def test_coincident(self):
+        nodes1 = np.asfortranarray([[0.0, 2.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 3.0], [0.0, 0.0]])
+        converged = [(0.75, 0.75, 0.25, 0.25)]
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.full_newton",
+            side_effect=NotImplementedError,
+        ):
+            st_vals, coincident = self._call_function_under_test(
+                nodes1, nodes2, converged, 0.0
+            )
+        expected = np.asfortranarray([[0.5, 1.0], [0.0, 0.5]])
+        self.assertTrue(np.all(st_vals == expected))
+        self.assertTrue(coincident)
+
+    def test_failure(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        converged = [(0.25, 0.25, 0.25, 0.25)]
+        with unittest.mock.patch(
+            "bezier.hazmat.intersection_helpers.full_newton",
+            side_effect=NotImplementedError,
+        ):
+            with self.assertRaises(NotImplementedError):
+                self._call_function_under_test(nodes1, nodes2, converged, 0.0)
+
+
+class Test_all_intersections(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second):
+        from bezier.hazmat import clipping
+
+        return clipping.all_intersections(nodes_first, nodes_second)
+
+    def test_no_intersections(self):
+        nodes1 = np.asfortranarray([[0.0, 2.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray([[5.0, 6.0], [0.0, 1.0]])
+        st_vals, coincident = self._call_function_under_test(nodes1, nodes2)
+        self.assertEqual(st_vals.shape, (2, 0))
+        self.assertFalse(coincident)
+
+    def test_quadratics(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, -1.0, 1.0]])
+        st_vals, coincident = self._call_function_under_test(nodes1, nodes2)
+        # B1(s) = B2(t) when s = t and 8 s (1 - s) = 1.
+        root = 0.5 - 0.25 * np.sqrt(2.0)
+        expected = np.asfortranarray([[root, 1.0 - root], [root, 1.0 - root]])
+        self.assertTrue(
+            np.allclose(st_vals, expected, atol=0.0, rtol=0.5 ** 50)
+        )
+        self.assertFalse(coincident)
+
+    def test_tangent(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, 1.0, 1.0]])
+        st_vals, coincident = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertTrue(np.all(st_vals == expected))
+        self.assertFalse(coincident)
+
+    def test_lines(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        st_vals, coincident = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertTrue(np.all(st_vals == expected))
+        self.assertFalse(coincident)
+
+    def test_coincident(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        # The segment of ``nodes1`` on ``[0.5, 1.5]``.
+        nodes2 = np.asfortranarray([[1.0, 2.0, 3.0], [1.0, 1.0, -3.0]])
+        st_vals, coincident = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asfortranarray([[0.5, 1.0], [0.0, 0.5]])
+        self.assertTrue(np.all(st_vals == expected))
+        self.assertTrue(coincident)
+
+    def test_too_many_candidates(self):
+        from bezier.hazmat import clipping
+
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, -1.0, 1.0]])
+        with unittest.mock.patch.object(clipping, "_MAX_CANDIDATES", new=0):
+            with self.assertRaises(NotImplementedError) as exc_info:
+                self._call_function_under_test(nodes1, nodes2)
+        expected = (clipping._TOO_MANY_TEMPLATE.format(2),)
+        self.assertEqual(exc_info.exception.args, expected)
+
+    def test_no_converge(self):
+        from bezier.hazmat import clipping
+
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, -1.0, 1.0]])
+        with unittest.mock.patch.object(
+            clipping, "_MAX_CLIP_ITERATIONS", new=1
+        ):
+            with self.assertRaises(ValueError) as exc_info:
+                self._call_function_under_test(nodes1, nodes2)
+        expected = (clipping._NO_CONVERGE_TEMPLATE.format(1),)
+        self.assertEqual(exc_info.exception.args, expected)
@@ -15,11 +15,6 @@ import unittest.mock
 
 import numpy as np
 
-try:
-    import scipy.integrate as SCIPY_INT
-except ImportError:  # pragma: NO COVER
-    SCIPY_INT = None
-
 from tests import utils as base_utils
 from tests.unit import utils
 
@@ -343,6 +338,22 @@ class Test_evaluate_multi(utils.NumPyTestCase):
         self.assertEqual(expected, binomial_coefficients)
 
 
+class Test_flatten_batch_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.flatten_batch_nodes(nodes)
+
+    def test_it(self):
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0, 3.0], [1.0, 2.0, 1.0]])
+        nodes = np.asfortranarray(np.stack([nodes1, nodes2], axis=2))
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result, np.vstack([nodes1, nodes2]))
+        self.assertTrue(result.flags.f_contiguous)
+
+
 class Test_vec_size(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(nodes, s_val):
@@ -363,14 +374,10 @@ class Test_vec_size(unittest.TestCase):
 
 class Test_compute_length(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes):
+    def _call_function_under_test(nodes, **kwargs):
         from bezier.hazmat import curve_helpers
 
-        return curve_helpers.compute_length(nodes)
-
-    def _scipy_skip(self):
-        if SCIPY_INT is None:  # pragma: NO COVER
-            self.skipTest("SciPy not installed")
+        return curve_helpers.compute_length(nodes, **kwargs)
 
     def test_invalid_size(self):
         nodes = np.empty((2, 0), order="F")
@@ -391,7 +398,6 @@ class Test_compute_length(unittest.TestCase):
         self.assertEqual(length, 5.0)
 
     def test_quadratic(self):
-        self._scipy_skip()
         nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
         length = self._call_function_under_test(nodes)
         # pylint: disable=no-member,assignment-from-no-return
@@ -402,8 +408,16 @@ class Test_compute_length(unittest.TestCase):
         local_eps = abs(SPACING(expected))
         self.assertAlmostEqual(length, expected, delta=local_eps)
 
+    def test_first_deriv(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        # The nodes of the hodograph are used as given (i.e. these are
+        # the nodes of 2 B'(s)).
+        first_deriv = np.asfortranarray([[4.0, 4.0], [8.0, -8.0]])
+        length = self._call_function_under_test(nodes, first_deriv=first_deriv)
+        expected = 2.0 * np.sqrt(5.0) + np.arcsinh(2.0)
+        self.assertAlmostEqual(length, expected, delta=SPACING(expected))
+
     def test_cubic(self):
-        self._scipy_skip()
         nodes = np.asfortranarray([[0.0, 1.0, 2.0, 3.5], [0.0, 2.0, 0.0, 0.0]])
         length = self._call_function_under_test(nodes)
         # x(s) = s (s^2 + 6) / 2
@@ -414,6 +428,284 @@ class Test_compute_length(unittest.TestCase):
         self.assertAlmostEqual(length, expected, delta=local_eps)
 
 
+class Test_compute_lengths(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, **kwargs):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.compute_lengths(nodes, **kwargs)
+
+    def test_invalid_size(self):
+        nodes = np.empty((2, 0, 3), order="F")
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes)
+
+    def test_degree_zero(self):
+        nodes = np.ones((2, 1, 3), order="F")
+        lengths = self._call_function_under_test(nodes)
+        self.assertEqual(lengths.tolist(), [0.0, 0.0, 0.0])
+
+    def test_linear(self):
+        nodes = np.asfortranarray(
+            [[[0.0, 1.0], [3.0, 1.0]], [[0.0, 0.0], [4.0, 1.0]]]
+        )
+        lengths = self._call_function_under_test(nodes)
+        self.assertEqual(lengths.tolist(), [5.0, 1.0])
+
+    def test_many(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [
+                [[0.0, 0.0, 1.0], [1.0, 2.0, 1.0], [2.0, -1.0, 1.0]],
+                [[0.0, 0.0, 2.0], [2.0, 1.0, 2.0], [0.0, 1.0, 2.0]],
+            ]
+        )
+        lengths = self._call_function_under_test(nodes)
+        self.assertEqual(lengths.shape, (3,))
+        for index in range(3):
+            expected = curve_helpers.compute_length(
+                np.asfortranarray(nodes[:, :, index])
+            )
+            self.assertEqual(lengths[index], expected)
+        # 2 INT_0^1 SQRT(16 s^2  - 16 s + 5) ds = SQRT(5) + sinh^{-1}(2)/2
+        expected = np.sqrt(5.0) + 0.5 * np.arcsinh(2.0)
+        self.assertAlmostEqual(lengths[0], expected, delta=SPACING(expected))
+        # The last curve is a single point.
+        self.assertEqual(lengths[2], 0.0)
+
+    def test_first_deriv(self):
+        nodes = np.asfortranarray(
+            [
+                [[0.0, 0.0], [1.5, 3.0], [3.0, 6.0]],
+                [[0.0, 0.0], [2.0, 0.0], [4.0, 0.0]],
+            ]
+        )
+        # The nodes of the hodographs are used as given (i.e. these are
+        # the nodes of 2 B'(s) for each curve).
+        first_deriv = np.asfortranarray(
+            [[[6.0, 12.0], [6.0, 12.0]], [[8.0, 0.0], [8.0, 0.0]]]
+        )
+        lengths = self._call_function_under_test(
+            nodes, first_deriv=first_deriv
+        )
+        self.assertTrue(
+            np.allclose(lengths, [10.0, 12.0], atol=0.5 ** 48, rtol=0.0)
+        )
+
+    def test_max_subdivisions(self):
+        from bezier.hazmat import curve_helpers
+
+        # The speed |2 - 5s| has a cusp at s = 2/5, which is never an
+        # endpoint of a subinterval.
+        nodes = np.asfortranarray([[[0.0], [1.0], [-0.5]]])
+        patch = unittest.mock.patch.object(
+            curve_helpers, "_MAX_LENGTH_SUBDIVISIONS", new=2
+        )
+        with patch:
+            (length,) = self._call_function_under_test(nodes)
+        self.assertNotAlmostEqual(length, 1.3, delta=0.5 ** 30)
+        self.assertAlmostEqual(length, 1.3, delta=0.5 ** 6)
+        (length,) = self._call_function_under_test(nodes)
+        self.assertAlmostEqual(length, 1.3, delta=0.5 ** 30)
+
+
+class Test__bisect_intervals(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(curves, starts, widths):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers._bisect_intervals(curves, starts, widths)
+
+    def test_it(self):
+        curves = np.asfortranarray([0, 3])
+        starts = np.asfortranarray([0.0, 0.5])
+        widths = np.asfortranarray([1.0, 0.25])
+        new_curves, new_starts, new_widths = self._call_function_under_test(
+            curves, starts, widths
+        )
+        self.assertEqual(new_curves, np.asfortranarray([0, 0, 3, 3]))
+        expected = np.asfortranarray([0.0, 0.5, 0.5, 0.625])
+        self.assertEqual(new_starts, expected)
+        expected = np.asfortranarray([0.5, 0.5, 0.125, 0.125])
+        self.assertEqual(new_widths, expected)
+
+
+class Test_arc_length_table(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(first_deriv):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.arc_length_table(first_deriv)
+
+    def test_degree_zero(self):
+        first_deriv = np.zeros((2, 1), order="F")
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertEqual(breakpoints.tolist(), [0.0, 1.0])
+        self.assertEqual(cumulative.tolist(), [0.0, 0.0])
+
+    def test_linear(self):
+        first_deriv = np.asfortranarray([[3.0], [4.0]])
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertEqual(breakpoints.tolist(), [0.0, 1.0])
+        self.assertEqual(cumulative[0], 0.0)
+        self.assertAlmostEqual(cumulative[1], 5.0, delta=SPACING(5.0))
+
+    def test_cusp(self):
+        # The speed |2 - 5s| has a cusp at s = 2/5, which is never a
+        # breakpoint, so the table is refined there.
+        first_deriv = np.asfortranarray([[2.0, -3.0]])
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertEqual(breakpoints[0], 0.0)
+        self.assertEqual(breakpoints[-1], 1.0)
+        self.assertTrue(np.all(np.diff(breakpoints) > 0.0))
+        widths = np.diff(breakpoints)
+        index = np.searchsorted(breakpoints, 0.4) - 1
+        self.assertLess(widths[index], 0.5 ** 20)
+        self.assertEqual(np.max(widths), 0.5)
+        # The length up to s <= 2/5 is 2s - 5s^2 / 2.
+        expected = 2.0 * breakpoints - 2.5 * breakpoints * breakpoints
+        mask = breakpoints <= 0.4
+        self.assertTrue(
+            np.allclose(
+                cumulative[mask], expected[mask], atol=0.5 ** 40, rtol=0.0
+            )
+        )
+        self.assertAlmostEqual(cumulative[-1], 1.3, delta=0.5 ** 40)
+
+
+class Test_partial_lengths(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(first_deriv, starts, ends):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.partial_lengths(first_deriv, starts, ends)
+
+    def test_it(self):
+        # B(s) = [2s + s^2, 0], so the speed is 2 + 2s.
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        starts = np.asfortranarray([0.0, 0.25, 1.0])
+        ends = np.asfortranarray([0.5, 1.0, 0.0])
+        lengths = self._call_function_under_test(first_deriv, starts, ends)
+        expected = np.asfortranarray([1.25, 2.4375, -3.0])
+        self.assertTrue(
+            np.allclose(lengths, expected, atol=0.5 ** 50, rtol=0.0)
+        )
+
+
+class Test_arc_lengths_from_table(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        first_deriv, breakpoints, cumulative, s_vals
+    ):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.arc_lengths_from_table(
+            first_deriv, breakpoints, cumulative, s_vals
+        )
+
+    def test_it(self):
+        # B(s) = [2s + s^2, 0], so the length up to ``s`` is 2s + s^2.
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        breakpoints = np.asfortranarray([0.0, 0.5, 1.0])
+        cumulative = np.asfortranarray([0.0, 1.25, 3.0])
+        s_vals = np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0])
+        lengths = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, s_vals
+        )
+        expected = np.asfortranarray([0.0, 0.5625, 1.25, 2.0625, 3.0])
+        self.assertTrue(
+            np.allclose(lengths, expected, atol=0.5 ** 50, rtol=0.0)
+        )
+
+
+class Test_params_from_table(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        first_deriv, breakpoints, cumulative, lengths
+    ):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.params_from_table(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+
+    def test_it(self):
+        # B(s) = [2s + s^2, 0], so the length up to ``s`` is 2s + s^2.
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        breakpoints = np.asfortranarray([0.0, 0.5, 1.0])
+        cumulative = np.asfortranarray([0.0, 1.25, 3.0])
+        lengths = np.asfortranarray([0.0, 0.5625, 1.25, 2.0625, 3.0])
+        s_vals = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+        expected = np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0])
+        self.assertTrue(
+            np.allclose(s_vals, expected, atol=0.5 ** 50, rtol=0.0)
+        )
+
+    def test_zero_length(self):
+        first_deriv = np.zeros((2, 1), order="F")
+        breakpoints = np.asfortranarray([0.0, 1.0])
+        cumulative = np.asfortranarray([0.0, 0.0])
+        lengths = np.asfortranarray([0.0])
+        s_vals = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+        self.assertEqual(s_vals.tolist(), [0.0])
+
+
+class Test__arc_length_step(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        first_deriv, anchors, targets, brackets, current
+    ):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers._arc_length_step(
+            first_deriv, anchors, targets, brackets, current
+        )
+
+    def test_newton(self):
+        # B(s) = [2s + s^2, 0], so the length up to ``s`` is 2s + s^2.
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        anchors = np.asfortranarray([0.0])
+        targets = np.asfortranarray([1.25])
+        brackets = np.asfortranarray([[0.0], [1.0]])
+        current = np.asfortranarray([1.0])
+        updated, new_brackets = self._call_function_under_test(
+            first_deriv, anchors, targets, brackets, current
+        )
+        # L(1) - 1.25 = 1.75 and L'(1) = 4.
+        self.assertEqual(updated.shape, (1,))
+        self.assertAlmostEqual(updated[0], 0.5625, delta=0.5 ** 50)
+        self.assertEqual(new_brackets.tolist(), [[0.0], [1.0]])
+
+    def test_bisection(self):
+        # B(s) = [s^3, 0], so the speed is zero at ``s = 0``.
+        first_deriv = np.asfortranarray([[0.0, 0.0, 3.0], [0.0, 0.0, 0.0]])
+        anchors = np.asfortranarray([0.0])
+        targets = np.asfortranarray([0.125])
+        brackets = np.asfortranarray([[0.0], [1.0]])
+        current = np.asfortranarray([0.0])
+        updated, new_brackets = self._call_function_under_test(
+            first_deriv, anchors, targets, brackets, current
+        )
+        self.assertEqual(updated.tolist(), [0.5])
+        self.assertEqual(new_brackets.tolist(), [[0.0], [1.0]])
+
+    def test_converged(self):
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        anchors = np.asfortranarray([0.0])
+        targets = np.asfortranarray([0.0])
+        brackets = np.asfortranarray([[0.0], [1.0]])
+        current = np.asfortranarray([0.0])
+        updated, _ = self._call_function_under_test(
+            first_deriv, anchors, targets, brackets, current
+        )
+        self.assertEqual(updated.tolist(), [0.0])
+
+
 class Test_elevate_nodes(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes):
@@ -506,6 +798,45 @@ class Test_specialize_curve(utils.NumPyTestCase):
         self.assertEqual(result, expected)
 
 
+class Test_specialize_curve_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, starts, ends):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.specialize_curve_multi(nodes, starts, ends)
+
+    def test_matches_specialize_curve(self):
+        from bezier.hazmat import curve_helpers
+
+        starts = np.asfortranarray([0.0, 0.25, -0.5, 0.75])
+        ends = np.asfortranarray([1.0, 0.625, 0.5, 0.25])
+        for num_nodes in (2, 3, 4, 6):
+            nodes = np.asfortranarray(
+                np.arange(3.0 * num_nodes).reshape((3, num_nodes)) ** 2
+            )
+            result = self._call_function_under_test(nodes, starts, ends)
+            self.assertEqual(result.shape, (3, num_nodes, 4))
+            self.assertTrue(result.flags.f_contiguous)
+            for index in range(4):
+                expected = curve_helpers.specialize_curve(
+                    nodes, starts[index], ends[index]
+                )
+                self.assertEqual(result[:, :, index], expected)
+
+    def test_constant(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        starts = np.asfortranarray([0.0, 0.5])
+        ends = np.asfortranarray([0.5, 1.0])
+        result = self._call_function_under_test(nodes, starts, ends)
+        self.assertEqual(result.tolist(), [[[1.0, 1.0]], [[2.0, 2.0]]])
+
+    def test_no_intervals(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        empty = np.empty(0)
+        result = self._call_function_under_test(nodes, empty, empty)
+        self.assertEqual(result.shape, (2, 2, 0))
+
+
 class Test_evaluate_hodograph(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(s, nodes):
@@ -550,12 +881,31 @@ class Test_evaluate_hodograph(utils.NumPyTestCase):
             self.assertEqual(first_deriv[1, 0], y_prime)
 
 
+class Test_hodograph_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.hodograph_nodes(nodes)
+
+    def test_quadratic(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.25], [0.0, 1.0, 0.25]])
+        result = self._call_function_under_test(nodes)
+        expected = np.asfortranarray([[1.0, 1.5], [2.0, -1.5]])
+        self.assertEqual(result, expected)
+
+    def test_constant(self):
+        nodes = np.asfortranarray([[1.0], [2.0], [3.0]])
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result, np.zeros((3, 1), order="F"))
+
+
 class Test_get_curvature(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes, tangent_vec, s):
+    def _call_function_under_test(nodes, tangent_vec, s, **kwargs):
         from bezier.hazmat import curve_helpers
 
-        return curve_helpers.get_curvature(nodes, tangent_vec, s)
+        return curve_helpers.get_curvature(nodes, tangent_vec, s, **kwargs)
 
     @staticmethod
     def _get_tangent_vec(s, nodes):
@@ -584,13 +934,25 @@ class Test_get_curvature(unittest.TestCase):
         result = self._call_function_under_test(nodes, tangent_vec, s)
         self.assertEqual(result, -4.0)
 
+    def test_second_deriv(self):
+        s = 0.5
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        tangent_vec = self._get_tangent_vec(s, nodes)
+        # The nodes of the second derivative are used as given (i.e. these
+        # are the nodes of 2 B''(s)).
+        second_deriv = np.asfortranarray([[0.0], [-8.0]])
+        result = self._call_function_under_test(
+            nodes, tangent_vec, s, second_deriv=second_deriv
+        )
+        self.assertEqual(result, -8.0)
+
 
 class Test_newton_refine(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes, point, s):
+    def _call_function_under_test(nodes, point, s, **kwargs):
         from bezier.hazmat import curve_helpers
 
-        return curve_helpers.newton_refine(nodes, point, s)
+        return curve_helpers.newton_refine(nodes, point, s, **kwargs)
 
     def test_it(self):
         nodes = np.asfortranarray(
@@ -601,13 +963,27 @@ class Test_newton_refine(unittest.TestCase):
         new_s = self._call_function_under_test(nodes, point, 0.25)
         self.assertEqual(110.0 * new_s, 57.0)
 
+    def test_first_deriv(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 3.0, 2.0], [0.0, -1.0, 2.0, 2.0], [0.0, 1.0, 2.0, 4.0]]
+        )
+        first_deriv = curve_helpers.hodograph_nodes(nodes)
+        # curve(1/2) = p
+        point = np.asfortranarray([[1.75], [0.625], [1.625]])
+        new_s = self._call_function_under_test(
+            nodes, point, 0.25, first_deriv=first_deriv
+        )
+        self.assertEqual(110.0 * new_s, 57.0)
+
 
 class Test_locate_point(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes, point):
+    def _call_function_under_test(nodes, point, **kwargs):
         from bezier.hazmat import curve_helpers
 
-        return curve_helpers.locate_point(nodes, point)
+        return curve_helpers.locate_point(nodes, point, **kwargs)
 
     def test_it(self):
         nodes = np.asfortranarray(
@@ -618,6 +994,20 @@ class Test_locate_point(unittest.TestCase):
         result = self._call_function_under_test(nodes, point)
         self.assertEqual(result, 0.125)
 
+    def test_first_deriv(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 3.0, 1.0], [0.0, 0.0, 1.0], [0.0, -1.0, 3.0]]
+        )
+        first_deriv = curve_helpers.hodograph_nodes(nodes)
+        # C(1/8) = p
+        point = np.asfortranarray([[43.0], [1.0], [-11.0]]) / 64
+        result = self._call_function_under_test(
+            nodes, point, first_deriv=first_deriv
+        )
+        self.assertEqual(result, 0.125)
+
     def test_no_match(self):
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
         point = np.asfortranarray([[0.5], [2.0]])
@@ -646,6 +1036,261 @@ class Test_locate_point(unittest.TestCase):
         self.assertEqual(result, 1.0)
 
 
+class Test_locate_points(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, points):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.locate_points(nodes, points)
+
+    def test_it(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 3.0, 1.0], [0.0, 0.0, 1.0], [0.0, -1.0, 3.0]]
+        )
+        s_vals = np.asfortranarray([0.0, 0.125, 0.5, 0.75, 1.0])
+        points = curve_helpers.evaluate_multi(nodes, s_vals)
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result, s_vals)
+        for index in range(s_vals.size):
+            point = points[:, [index]]
+            self.assertEqual(
+                curve_helpers.locate_point(nodes, point), result[index]
+            )
+
+    def test_no_match(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        points = np.asfortranarray([[0.5, 0.5, 3.0], [2.0, 0.5, 0.0]])
+        result = self._call_function_under_test(nodes, points)
+        self.assertTrue(np.isnan(result[0]))
+        self.assertEqual(result[1], 0.5)
+        self.assertTrue(np.isnan(result[2]))
+
+    def test_no_points(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        points = np.empty((2, 0), order="F")
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result.shape, (0,))
+
+    def test_failure_on_invalid(self):
+        nodes = np.asfortranarray(
+            [[0.0, -1.0, 1.0, -0.75], [2.0, 0.0, 1.0, 1.625]]
+        )
+        points = np.asfortranarray([[0.0, -0.25], [2.0, 1.375]])
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, points)
+        exc_args = exc_info.exception.args
+        self.assertEqual(len(exc_args), 2)
+        self.assertEqual(
+            exc_args[0], "Parameters not close enough to one another"
+        )
+        self.assertEqual(exc_args[1].tolist(), [1])
+
+    def test_zero_derivative(self):
+        # The hodograph vanishes at s = 1/2 (a cusp).
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0]])
+        points = np.asfortranarray([[0.5]])
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result.tolist(), [0.5])
+
+    def test_outside_interval(self):
+        # Newton's method pushes the values slightly outside of ``[0, 1]``.
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        points = np.asfortranarray([[0.0, 2.0], [0.0, 0.0]])
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result.tolist(), [0.0, 1.0])
+
+    def test_with_first_deriv(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 2.0, 1.0]])
+        points = curve_helpers.evaluate_multi(
+            nodes, np.asfortranarray([0.25, 0.75])
+        )
+        first_deriv = curve_helpers.hodograph_nodes(nodes)
+        result = curve_helpers.locate_points(
+            nodes, points, first_deriv=first_deriv
+        )
+        self.assertEqual(result, self._call_function_under_test(nodes, points))
+
+
+class Test__split_frontier(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(segments, starts, width, pairs, matrices):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers._split_frontier(
+            segments, starts, width, pairs, matrices
+        )
+
+    def test_it(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes1 = np.asfortranarray([[0.0, 2.0], [0.0, 2.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0], [2.0, 4.0]])
+        segments = np.asfortranarray(np.stack([nodes1, nodes2], axis=2))
+        starts = np.asfortranarray([0.0, 0.5])
+        pairs = (np.asfortranarray([0, 2, 1]), np.asfortranarray([0, 0, 1]))
+        matrices = curve_helpers.make_subdivision_matrices(1)
+        (
+            new_segments,
+            new_starts,
+            new_point_ids,
+            new_segment_ids,
+        ) = self._call_function_under_test(
+            segments, starts, 0.25, pairs, matrices
+        )
+        # NOTE: All of the left halves come before all of the right halves.
+        halves = [curve_helpers.subdivide_nodes(nodes1)]
+        halves.append(curve_helpers.subdivide_nodes(nodes2))
+        expected = np.stack(
+            [halves[0][0], halves[1][0], halves[0][1], halves[1][1]], axis=2
+        )
+        self.assertTrue(np.all(new_segments == expected))
+        self.assertEqual(new_starts, np.asfortranarray([0.0, 0.5, 0.25, 0.75]))
+        self.assertEqual(new_point_ids.tolist(), [0, 2, 1, 0, 2, 1])
+        self.assertEqual(new_segment_ids.tolist(), [0, 0, 1, 2, 2, 3])
+
+
+class Test__locate_newton(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, first_deriv, points, s_vals):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers._locate_newton(nodes, first_deriv, points, s_vals)
+
+    def test_it(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 2.0, 1.0]])
+        points = np.asfortranarray([[0.5625, 0.0], [0.8125, 0.0]])
+        s_vals = np.asfortranarray([0.75, 0.0])
+        result = self._call_function_under_test(nodes, None, points, s_vals)
+        # NOTE: This matches the example in ``newton_refine()``.
+        self.assertEqual(result, np.asfortranarray([0.35, 0.0]))
+
+    def test_clipped(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 0.0]])
+        first_deriv = np.asfortranarray([[1.0], [0.0]])
+        points = np.asfortranarray([[-0.5, 1.5], [0.0, 0.0]])
+        s_vals = np.asfortranarray([0.0, 1.0])
+        result = self._call_function_under_test(
+            nodes, first_deriv, points, s_vals
+        )
+        self.assertEqual(result, np.asfortranarray([0.0, 1.0]))
+
+
+class Test_project_points(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, points):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers.project_points(nodes, points)
+
+    def test_on_curve(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 3.0, 1.0], [0.0, 0.0, 1.0], [0.0, -1.0, 3.0]]
+        )
+        s_vals = np.asfortranarray([0.0, 0.125, 0.5, 1.0])
+        points = curve_helpers.evaluate_multi(nodes, s_vals)
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result[0], s_vals)
+        self.assertEqual(result[1], points)
+        self.assertEqual(result[2], np.zeros(4))
+
+    def test_off_curve(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        # The last point is beyond the center of curvature at ``s = 1/2``,
+        # so it has two closest points.
+        points = np.asfortranarray(
+            [[-1.0, 0.5, 3.0, 1.0], [0.5, 0.0, 1.0, -1.0]]
+        )
+        s_vals, projected, distances = self._call_function_under_test(
+            nodes, points
+        )
+        self.assertEqual(
+            projected, curve_helpers.evaluate_multi(nodes, s_vals)
+        )
+        deltas = projected - points
+        self.assertEqual(distances, np.sqrt(np.sum(deltas * deltas, axis=0)))
+        # Compare to the closest point on a fine grid.
+        grid = curve_helpers.evaluate_multi(nodes, np.linspace(0.0, 1.0, 4097))
+        grid_deltas = grid[:, :, np.newaxis] - points[:, np.newaxis, :]
+        grid_distances = np.sqrt(np.sum(grid_deltas * grid_deltas, axis=0))
+        expected = np.min(grid_distances, axis=0)
+        self.assertTrue(np.all(distances <= expected))
+        self.assertTrue(np.allclose(distances, expected, atol=0.5 ** 20))
+
+    def test_linear(self):
+        nodes = np.asfortranarray([[0.0, 2.0], [0.0, 0.0]])
+        points = np.asfortranarray([[0.5, -1.0, 3.0], [1.0, 1.0, 1.0]])
+        s_vals, projected, distances = self._call_function_under_test(
+            nodes, points
+        )
+        self.assertEqual(s_vals.tolist(), [0.25, 0.0, 1.0])
+        expected = np.asfortranarray([[0.5, 0.0, 2.0], [0.0, 0.0, 0.0]])
+        self.assertEqual(projected, expected)
+        self.assertEqual(distances.tolist(), [1.0, np.sqrt(2.0), np.sqrt(2.0)])
+
+    def test_degree_zero(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        points = np.asfortranarray([[4.0], [6.0]])
+        _, projected, distances = self._call_function_under_test(nodes, points)
+        self.assertEqual(projected, nodes)
+        self.assertEqual(distances.tolist(), [5.0])
+
+    def test_no_points(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        points = np.empty((2, 0), order="F")
+        s_vals, projected, distances = self._call_function_under_test(
+            nodes, points
+        )
+        self.assertEqual(s_vals.shape, (0,))
+        self.assertEqual(projected.shape, (2, 0))
+        self.assertEqual(distances.shape, (0,))
+
+    def test_with_derivatives(self):
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        points = np.asfortranarray([[-1.0, 0.5, 3.0], [0.5, 0.0, 1.0]])
+        first_deriv = curve_helpers.hodograph_nodes(nodes)
+        second_deriv = curve_helpers.hodograph_nodes(first_deriv)
+        result = curve_helpers.project_points(
+            nodes, points, derivatives=(first_deriv, second_deriv)
+        )
+        expected = self._call_function_under_test(nodes, points)
+        self.assertEqual(len(result), 3)
+        for value, expected_value in zip(result, expected):
+            self.assertEqual(value, expected_value)
+
+
+class Test__closest_candidates(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, points, point_ids, s_vals):
+        from bezier.hazmat import curve_helpers
+
+        return curve_helpers._closest_candidates(
+            nodes, points, point_ids, s_vals
+        )
+
+    def test_it(self):
+        nodes = np.asfortranarray([[0.0, 4.0], [0.0, 0.0]])
+        points = np.asfortranarray([[1.0, 3.0], [1.0, -2.0]])
+        point_ids = np.asfortranarray([1, 0, 1, 0])
+        s_vals = np.asfortranarray([0.5, 0.0, 0.75, 0.5])
+        s_closest, closest, distances = self._call_function_under_test(
+            nodes, points, point_ids, s_vals
+        )
+        self.assertEqual(s_closest, np.asfortranarray([0.0, 0.75]))
+        expected = np.asfortranarray([[0.0, 3.0], [0.0, 0.0]])
+        self.assertEqual(closest, expected)
+        self.assertEqual(distances, np.asfortranarray([np.sqrt(2.0), 2.0]))
+
+
 class Test_reduce_pseudo_inverse(utils.NumPyTestCase):
     EPS = 0.5 ** 52
 
@@ -1476,6 +1476,203 @@ class Test_all_intersections(utils.NumPyTestCase):
         self.assertEqual(exc_info.exception.args, expected)
 
 
+class Test_all_intersections_batch(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_first, offsets_first, nodes_second, offsets_second, **kwargs
+    ):
+        from bezier.hazmat import geometric_intersection
+
+        return geometric_intersection.all_intersections_batch(
+            nodes_first, offsets_first, nodes_second, offsets_second, **kwargs
+        )
+
+    def test_no_pairs(self):
+        nodes = np.empty((2, 0), order="F")
+        offsets = np.asarray([0], dtype=np.intc)
+        (
+            pair_indices,
+            intersections,
+            coincident,
+        ) = self._call_function_under_test(nodes, offsets, nodes, offsets)
+        self.assertEqual(pair_indices.shape, (0,))
+        self.assertEqual(intersections.shape, (2, 0))
+        self.assertEqual(coincident.shape, (0,))
+
+    def test_no_intersections(self):
+        nodes_first = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes_second = np.asfortranarray([[3.0, 4.0], [3.0, 3.0]])
+        offsets = np.asarray([0, 2], dtype=np.intc)
+        (
+            pair_indices,
+            intersections,
+            coincident,
+        ) = self._call_function_under_test(
+            nodes_first, offsets, nodes_second, offsets
+        )
+        self.assertEqual(pair_indices.shape, (0,))
+        self.assertEqual(intersections.shape, (2, 0))
+        self.assertEqual(coincident, np.asarray([False]))
+
+    def test_many_pairs(self):
+        nodes_first = np.asfortranarray(
+            [
+                [0.0, 0.5, 1.0, 0.0, 1.0, 0.0, 0.5, 1.0],
+                [0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.25, 0.0],
+            ]
+        )
+        offsets_first = np.asarray([0, 3, 5, 8], dtype=np.intc)
+        nodes_second = np.asfortranarray(
+            [
+                [0.0, 0.5, 1.0, 3.0, 4.0, 0.5, 0.75, 1.0],
+                [0.75, -0.25, 0.75, 3.0, 3.0, 0.125, 0.125, 0.0],
+            ]
+        )
+        offsets_second = np.asarray([0, 3, 5, 8], dtype=np.intc)
+        (
+            pair_indices,
+            intersections,
+            coincident,
+        ) = self._call_function_under_test(
+            nodes_first, offsets_first, nodes_second, offsets_second
+        )
+        expected_indices = np.asarray([0, 0, 2, 2], dtype=np.intc)
+        self.assertEqual(pair_indices, expected_indices)
+        expected = np.asfortranarray(
+            [[0.25, 0.75, 0.5, 1.0], [0.25, 0.75, 0.0, 1.0]]
+        )
+        self.assertEqual(intersections, expected)
+        self.assertEqual(coincident, np.asarray([False, False, True]))
+
+    def test_failure(self):
+        from bezier.hazmat import intersection_helpers
+
+        # The second pair is tangent with the same curvature.
+        nodes_first = np.asfortranarray(
+            [[0.0, 1.0, 12.0, -4.0, -4.0], [0.0, 1.0, 4.0, -4.0, 4.0]]
+        )
+        nodes_second = np.asfortranarray(
+            [[1.0, 0.0, 6.0, -2.0, -2.0], [0.0, 1.0, 1.0, -1.0, 1.0]]
+        )
+        offsets = np.asarray([0, 2, 5], dtype=np.intc)
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test(
+                nodes_first, offsets, nodes_second, offsets
+            )
+        expected = (intersection_helpers.NEWTON_NO_CONVERGE,)
+        self.assertEqual(exc_info.exception.args, expected)
+
+
+class Test_bbox_candidates(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(boxes_first, boxes_second=None):
+        from bezier.hazmat import geometric_intersection
+
+        return geometric_intersection.bbox_candidates(
+            boxes_first, boxes_second
+        )
+
+    def _check(self, result, expected_first, expected_second):
+        first, second = result
+        self.assertEqual(first, np.asarray(expected_first, dtype=np.intc))
+        self.assertEqual(second, np.asarray(expected_second, dtype=np.intc))
+
+    def test_empty(self):
+        boxes = np.empty((4, 0), order="F")
+        self._check(self._call_function_under_test(boxes), [], [])
+        other = np.asfortranarray([[0.0], [1.0], [0.0], [1.0]])
+        self._check(self._call_function_under_test(boxes, other), [], [])
+        self._check(self._call_function_under_test(other, boxes), [], [])
+
+    def test_self(self):
+        boxes = np.asfortranarray(
+            [
+                [2.0, 0.0, 0.5, 3.0, 1.0, 0.0],
+                [3.0, 1.0, 1.5, 4.0, 2.0, 1.0],
+                [0.0, 0.0, 0.5, 0.0, 1.0, 5.0],
+                [1.0, 1.0, 1.5, 1.0, 2.0, 6.0],
+            ]
+        )
+        result = self._call_function_under_test(boxes)
+        # Boxes 0 and 3 share an edge and boxes 1 and 4 share a corner.
+        self._check(result, [0, 0, 1, 1, 2], [3, 4, 2, 4, 4])
+
+    def test_self_equal_left(self):
+        boxes = np.asfortranarray(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 2.0, 1.0],
+                [0.0, 0.5, 3.0],
+                [1.0, 1.0, 4.0],
+            ]
+        )
+        result = self._call_function_under_test(boxes)
+        self._check(result, [0], [1])
+
+    def test_pairs(self):
+        boxes_first = np.asfortranarray(
+            [
+                [0.0, 4.0, 1.0],
+                [2.0, 5.0, 3.0],
+                [0.0, 0.0, 3.0],
+                [2.0, 1.0, 4.0],
+            ]
+        )
+        boxes_second = np.asfortranarray(
+            [
+                [1.0, 0.0, -1.0, 5.0, 0.0],
+                [1.5, 1.0, 0.0, 6.0, 0.5],
+                [1.0, 2.0, 0.0, 0.0, 10.0],
+                [3.0, 3.0, 1.0, 1.0, 11.0],
+            ]
+        )
+        result = self._call_function_under_test(boxes_first, boxes_second)
+        # Each direction of the sweep picks up some of the pairs and the
+        # pair with equal left edges is only reported once.
+        self._check(result, [0, 0, 0, 1, 2, 2], [0, 1, 2, 3, 0, 1])
+
+    def test_matches_brute_force(self):
+        from bezier.hazmat import geometric_intersection
+
+        rng = np.random.RandomState(seed=2718)
+        lower1 = rng.randint(0, 20, size=(2, 40)).astype(np.float64)
+        lower2 = rng.randint(0, 20, size=(2, 30)).astype(np.float64)
+        upper1 = lower1 + rng.randint(0, 4, size=lower1.shape)
+        upper2 = lower2 + rng.randint(0, 4, size=lower2.shape)
+        boxes1 = np.asfortranarray(
+            [lower1[0, :], upper1[0, :], lower1[1, :], upper1[1, :]]
+        )
+        boxes2 = np.asfortranarray(
+            [lower2[0, :], upper2[0, :], lower2[1, :], upper2[1, :]]
+        )
+
+        def overlaps(box1, box2):
+            nodes1 = np.asfortranarray([box1[:2], box1[2:]])
+            nodes2 = np.asfortranarray([box2[:2], box2[2:]])
+            return (
+                geometric_intersection.bbox_intersect(nodes1, nodes2)
+                != geometric_intersection.BoxIntersectionType.DISJOINT
+            )
+
+        expected_self = [
+            (index1, index2)
+            for index1 in range(40)
+            for index2 in range(index1 + 1, 40)
+            if overlaps(boxes1[:, index1], boxes1[:, index2])
+        ]
+        first, second = self._call_function_under_test(boxes1)
+        self.assertEqual(list(zip(first, second)), expected_self)
+
+        expected_pairs = [
+            (index1, index2)
+            for index1 in range(40)
+            for index2 in range(30)
+            if overlaps(boxes1[:, index1], boxes2[:, index2])
+        ]
+        first, second = self._call_function_under_test(boxes1, boxes2)
+        self.assertEqual(list(zip(first, second)), expected_pairs)
+
+
 class TestSubdividedCurve(utils.NumPyTestCase):
     @staticmethod
     def _get_target_class():
@@ -1650,6 +1847,267 @@ class TestLinearization(utils.NumPyTestCase):
         self.assertEqual(new_shape.error, error)
 
 
+class Test__bbox_line_intersect_many(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(boxes, line_start, line_end):
+        from bezier.hazmat import geometric_intersection
+
+        return geometric_intersection._bbox_line_intersect_many(
+            boxes, line_start, line_end
+        )
+
+    def test_matches_bbox_line_intersect(self):
+        from bezier.hazmat import geometric_intersection
+
+        # Lines that (in order) start in the box, end in the box, cross the
+        # box, pass above the box, miss a corner, run along an edge and
+        # end in the box.
+        line_start = np.asfortranarray(
+            [
+                [0.5, -1.0, -1.0, -1.0, 2.0, -1.0, -1.0],
+                [0.5, 0.5, 0.5, 2.0, 1.0, 0.0, 0.25],
+            ]
+        )
+        line_end = np.asfortranarray(
+            [
+                [3.0, 0.5, 2.0, 3.0, 0.0, 2.0, 0.5],
+                [3.0, 0.5, 0.5, 2.0, 3.0, 0.0, 0.25],
+            ]
+        )
+        _, num_lines = line_start.shape
+        boxes = (
+            np.zeros(num_lines),
+            np.ones(num_lines),
+            np.zeros(num_lines),
+            np.ones(num_lines),
+        )
+        result = self._call_function_under_test(boxes, line_start, line_end)
+        self.assertEqual(
+            result.tolist(), [True, True, True, False, False, True, True]
+        )
+        for index in range(num_lines):
+            expected = geometric_intersection.bbox_line_intersect(
+                UNIT_SQUARE, line_start[:, index], line_end[:, index]
+            )
+            self.assertEqual(
+                result[index],
+                expected
+                == geometric_intersection.BoxIntersectionType.INTERSECTION,
+            )
+
+
+class Test__convex_hulls_collide_many(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier.hazmat import geometric_intersection
+
+        return geometric_intersection._convex_hulls_collide_many(
+            nodes1, nodes2
+        )
+
+    def test_matches_convex_hull_collide(self):
+        from bezier.hazmat import geometric_intersection
+
+        nodes1 = np.array(
+            [
+                [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+                [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+                [[0.0, 1.0, 2.0], [0.0, 1.0, 2.0]],
+                [[0.0, 1.0, 2.0], [0.0, 1.0, 2.0]],
+            ]
+        )
+        nodes2 = np.array(
+            [[[0.0, 2.0], [1.5, 1.5]], [[0.0, 2.0], [1.75, 1.25]]] * 2
+        )
+        # NOTE: The third and fourth pairs are collinear (i.e. the convex
+        #       hulls are both line segments).
+        nodes2[2] = [[3.0, 4.0], [3.0, 4.0]]
+        nodes2[3] = [[2.0, 4.0], [2.0, 4.0]]
+        result = self._call_function_under_test(nodes1, nodes2)
+        self.assertEqual(result.tolist(), [True, True, False, True])
+        for index, value in enumerate(result):
+            expected = geometric_intersection.convex_hull_collide(
+                np.asfortranarray(nodes1[index]),
+                np.asfortranarray(nodes2[index]),
+            )
+            self.assertEqual(value, expected)
+
+    def test_polygons(self):
+        from bezier.hazmat import geometric_intersection
+
+        nodes1 = np.array([[[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]]] * 3)
+        nodes2 = np.array(
+            [
+                # Separated by an edge of the first convex hull.
+                [[2.0, 3.0, 2.0], [2.0, 2.0, 3.0]],
+                # Overlapping.
+                [[1.0, 3.0, 3.0], [1.0, 1.0, 3.0]],
+                # Separated, though the bounding boxes touch.
+                [[2.0, 2.25, 3.0], [1.0, 0.5, 1.0]],
+            ]
+        )
+        result = self._call_function_under_test(nodes1, nodes2)
+        self.assertEqual(result.tolist(), [False, True, False])
+        for index, value in enumerate(result):
+            expected = geometric_intersection.convex_hull_collide(
+                np.asfortranarray(nodes1[index]),
+                np.asfortranarray(nodes2[index]),
+            )
+            self.assertEqual(value, expected)
+
+
+class TestCandidateFrontier(utils.NumPyTestCase):
+    NODES1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+    NODES2 = np.asfortranarray([[0.0, 1.0], [0.25, 0.25]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier.hazmat import geometric_intersection
+
+        return geometric_intersection.CandidateFrontier
+
+    def _make_pair(self, nodes1, nodes2):
+        from bezier.hazmat import geometric_intersection
+
+        first = geometric_intersection.Linearization.from_shape(
+            subdivided_curve(nodes1)
+        )
+        second = geometric_intersection.Linearization.from_shape(
+            subdivided_curve(nodes2)
+        )
+        return first, second
+
+    def _make_default(self):
+        klass = self._get_target_class()
+        return klass.from_pair(*self._make_pair(self.NODES1, self.NODES2))
+
+    def test_from_pair(self):
+        frontier = self._make_default()
+        self.assertEqual(len(frontier), 1)
+        self.assertIs(frontier.original_first, self.NODES1)
+        self.assertIs(frontier.original_second, self.NODES2)
+        self.assertTrue(
+            np.array_equal(frontier.nodes_first, np.array([self.NODES1]))
+        )
+        self.assertTrue(
+            np.array_equal(frontier.nodes_second, np.array([self.NODES2]))
+        )
+        self.assertEqual(frontier.params, np.array([[0.0, 1.0, 0.0, 1.0]]))
+        self.assertEqual(frontier.errors, np.array([[np.inf, 0.0]]))
+
+    def test___dict___property(self):
+        frontier = self._make_default()
+        props_dict = frontier.__dict__
+        self.assertEqual(len(props_dict), 6)
+        self.assertIs(props_dict["params"], frontier.params)
+        self.assertIs(props_dict["errors"], frontier.errors)
+        # Check that modifying ``props_dict`` won't modify ``frontier``.
+        props_dict["params"] = None
+        self.assertIsNotNone(frontier.params)
+
+    def test_candidate(self):
+        from bezier.hazmat import geometric_intersection
+
+        frontier = self._make_default()
+        first, second = frontier.candidate(0)
+        self.assertIsInstance(first, geometric_intersection.SubdividedCurve)
+        self.assertEqual(first.nodes, self.NODES1)
+        self.assertIs(first.original_nodes, self.NODES1)
+        self.assertIsInstance(second, geometric_intersection.Linearization)
+        self.assertEqual(second.error, 0.0)
+        self.assertEqual(second.curve.nodes, self.NODES2)
+        self.assertEqual(second.curve.start, 0.0)
+        self.assertEqual(second.curve.end, 1.0)
+
+    def test_take(self):
+        frontier = self._make_default()
+        empty = frontier.take(slice(0, 0))
+        self.assertEqual(len(empty), 0)
+        self.assertIs(empty.original_first, self.NODES1)
+        self.assertEqual(empty.nodes_first.shape, (0, 2, 3))
+        self.assertEqual(empty.nodes_second.shape, (0, 2, 2))
+
+    def _check_round(self, nodes1, nodes2, num_rounds):
+        from bezier.hazmat import geometric_intersection
+
+        first, second = self._make_pair(nodes1, nodes2)
+        candidates = [(first, second)]
+        frontier = self._get_target_class().from_pair(first, second)
+        intersections = []
+        frontier_intersections = []
+        for _ in range(num_rounds):
+            candidates = geometric_intersection.intersect_one_round(
+                candidates, intersections
+            )
+            frontier = frontier.intersect_one_round(frontier_intersections)
+            self.assertEqual(len(frontier), len(candidates))
+            for index, (expected1, expected2) in enumerate(candidates):
+                first, second = frontier.candidate(index)
+                for shape, expected in (
+                    (first, expected1),
+                    (second, expected2),
+                ):
+                    self.assertIs(shape.__class__, expected.__class__)
+                    if (
+                        expected.__class__
+                        is geometric_intersection.Linearization
+                    ):
+                        self.assertEqual(shape.error, expected.error)
+                        shape = shape.curve
+                        expected = expected.curve
+                    self.assertEqual(shape.nodes, expected.nodes)
+                    self.assertEqual(shape.start, expected.start)
+                    self.assertEqual(shape.end, expected.end)
+        self.assertEqual(frontier_intersections, intersections)
+        return frontier, frontier_intersections
+
+    def test_intersect_one_round_line_and_curve(self):
+        # NOTE: The curve is not linearized until the 13th subdivision.
+        frontier, intersections = self._check_round(
+            self.NODES1, self.NODES2, 14
+        )
+        self.assertEqual(len(frontier), 0)
+        self.assertEqual(len(intersections), 2)
+
+    def test_intersect_one_round_tangent(self):
+        # The bounding boxes touch at the corner after the first round.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 0.5, 1.0], [0.75, -0.25, 0.75]])
+        frontier, intersections = self._check_round(nodes1, nodes2, 4)
+        self.assertEqual(len(frontier), 0)
+        self.assertEqual(intersections, [(0.25, 0.25), (0.75, 0.75)])
+
+    def test_intersect_one_round_disjoint(self):
+        nodes2 = np.asfortranarray([[0.0, 1.0], [2.0, 2.0]])
+        frontier, intersections = self._check_round(self.NODES1, nodes2, 1)
+        self.assertEqual(len(frontier), 0)
+        self.assertEqual(intersections, [])
+
+    def test_prune(self):
+        from bezier.hazmat import geometric_intersection
+
+        # Mirrors ``Test_prune_candidates``.
+        nodes1 = np.asfortranarray([[0.0, -0.5, 1.0], [0.0, 1.5, 1.0]])
+        nodes2 = np.asfortranarray([[-1.0, 0.5, 0.0], [1.0, 0.5, 2.0]])
+        frontier = self._get_target_class().from_pair(
+            *self._make_pair(nodes1, nodes2)
+        )
+        candidates = [self._make_pair(nodes1, nodes2)]
+        for _ in range(5):
+            frontier = frontier.intersect_one_round([])
+            candidates = geometric_intersection.intersect_one_round(
+                candidates, []
+            )
+        pruned = frontier.prune()
+        expected = geometric_intersection.prune_candidates(candidates)
+        self.assertLess(len(pruned), len(frontier))
+        self.assertEqual(len(pruned), len(expected))
+        for index, (expected1, expected2) in enumerate(expected):
+            first, second = pruned.candidate(index)
+            self.assertEqual(first.nodes, expected1.nodes)
+            self.assertEqual(second.nodes, expected2.nodes)
+
+
 def subdivided_curve(nodes, **kwargs):
     from bezier.hazmat import geometric_intersection
 
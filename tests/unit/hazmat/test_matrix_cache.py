@@ -0,0 +1,161 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import unittest.mock
+
+import numpy as np
+
+
+class TestMatrixCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier.hazmat import matrix_cache
+
+        return matrix_cache.MatrixCache
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        cache = self._make_one()
+        self.assertEqual(cache.maxsize, 128)
+        self.assertEqual(len(cache._entries), 0)
+        self.assertEqual(cache._hits, 0)
+        self.assertEqual(cache._misses, 0)
+
+    def test_constructor_bad_maxsize(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(maxsize=-1)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Cache size must be non-negative", -1))
+
+    def test___dict___property(self):
+        cache = self._make_one(maxsize=3)
+        props_dict = cache.__dict__
+        expected = {
+            "_maxsize": 3,
+            "_entries": cache._entries,
+            "_hits": 0,
+            "_misses": 0,
+        }
+        self.assertEqual(props_dict, expected)
+        # Check that modifying ``props_dict`` won't modify ``cache``.
+        props_dict["_maxsize"] = 4
+        self.assertEqual(cache.maxsize, 3)
+
+    def test_get(self):
+        cache = self._make_one()
+        matrix = np.eye(2, order="F")
+        factory = unittest.mock.Mock(return_value=matrix, spec=())
+        self.assertIs(cache.get("kind", 1, factory), matrix)
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(cache.get("kind", 1, factory), matrix)
+        factory.assert_called_once_with(1)
+        self.assertEqual(cache.info(), (1, 1, 128, 1))
+
+    def test_get_tuple(self):
+        cache = self._make_one()
+        value = (np.eye(2, order="F"), np.eye(3, order="F"))
+        factory = unittest.mock.Mock(return_value=value, spec=())
+        self.assertIs(cache.get("kind", 2, factory), value)
+        self.assertFalse(value[0].flags.writeable)
+        self.assertFalse(value[1].flags.writeable)
+
+    def test_get_evicts(self):
+        cache = self._make_one(maxsize=2)
+        cache.get("kind", 1, np.eye)
+        cache.get("kind", 2, np.eye)
+        # Make degree 1 the most recently used.
+        cache.get("kind", 1, np.eye)
+        cache.get("other", 2, np.eye)
+        self.assertEqual(
+            list(cache._entries.keys()), [("kind", 1), ("other", 2)]
+        )
+        self.assertEqual(cache.info(), (1, 3, 2, 2))
+
+    def test_get_size_zero(self):
+        cache = self._make_one(maxsize=0)
+        matrix = cache.get("kind", 3, np.eye)
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertEqual(cache.info(), (0, 1, 0, 0))
+
+    def test_resize(self):
+        cache = self._make_one()
+        cache.get("kind", 1, np.eye)
+        cache.get("kind", 2, np.eye)
+        cache.resize(1)
+        self.assertEqual(cache.maxsize, 1)
+        self.assertEqual(list(cache._entries.keys()), [("kind", 2)])
+
+    def test_resize_bad_maxsize(self):
+        cache = self._make_one(maxsize=5)
+        with self.assertRaises(ValueError):
+            cache.resize(-2)
+        self.assertEqual(cache.maxsize, 5)
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.get("kind", 1, np.eye)
+        cache.get("kind", 1, np.eye)
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 128, 0))
+
+    def test___repr__(self):
+        cache = self._make_one(maxsize=7)
+        cache.get("kind", 1, np.eye)
+        self.assertEqual(repr(cache), "<MatrixCache (maxsize=7, currsize=1)>")
+
+
+class Test_shared_cache(unittest.TestCase):
+    def setUp(self):
+        from bezier.hazmat import matrix_cache
+
+        patch = unittest.mock.patch.object(
+            matrix_cache, "_CACHE", new=matrix_cache.MatrixCache(maxsize=4)
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_get_matrices(self):
+        from bezier.hazmat import matrix_cache
+
+        matrix = matrix_cache.get_matrices("kind", 2, np.eye)
+        self.assertIs(matrix_cache.get_matrices("kind", 2, np.eye), matrix)
+        info = matrix_cache.cache_info()
+        self.assertIsInstance(info, matrix_cache.CacheInfo)
+        self.assertEqual(info, (1, 1, 4, 1))
+
+    def test_cache_clear(self):
+        from bezier.hazmat import matrix_cache
+
+        matrix_cache.get_matrices("kind", 2, np.eye)
+        matrix_cache.cache_clear()
+        self.assertEqual(matrix_cache.cache_info(), (0, 0, 4, 0))
+
+    def test_cache_resize(self):
+        from bezier.hazmat import matrix_cache
+
+        matrix_cache.cache_resize(0)
+        self.assertEqual(matrix_cache.cache_info().maxsize, 0)
+
+    def test_subdivide_curve(self):
+        from bezier.hazmat import curve_helpers
+        from bezier.hazmat import matrix_cache
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0, 3.0, 4.0, 5.0]])
+        for _ in range(3):
+            left, right = curve_helpers.subdivide_nodes(nodes)
+        self.assertEqual(matrix_cache.cache_info(), (2, 1, 4, 1))
+        self.assertEqual(left.tolist(), [[0.0, 0.5, 1.0, 1.5, 2.0, 2.5]])
+        self.assertEqual(right.tolist(), [[2.5, 3.0, 3.5, 4.0, 4.5, 5.0]])
@@ -44,11 +44,11 @@ class Test_newton_refine_solve(unittest.TestCase):
 
 class Test_newton_refine(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes, degree, x_val, y_val, s, t):
+    def _call_function_under_test(nodes, degree, x_val, y_val, s, t, **kwargs):
         from bezier.hazmat import triangle_intersection
 
         return triangle_intersection.newton_refine(
-            nodes, degree, x_val, y_val, s, t
+            nodes, degree, x_val, y_val, s, t, **kwargs
         )
 
     def test_improvement(self):
@@ -75,6 +75,23 @@ class Test_newton_refine(unittest.TestCase):
         self.assertEqual(new_s, 247.0 / 512.0)
         self.assertEqual(new_t, 31.0 / 128.0)
 
+    def test_jac_nodes(self):
+        from bezier.hazmat import triangle_helpers
+
+        # Same triangle and point as ``test_improvement``.
+        nodes = np.asfortranarray(
+            [
+                [0.0, 0.5, 1.0, 0.0, 0.5, -0.25],
+                [0.0, -0.25, 0.0, 0.5, 0.5, 0.875],
+            ]
+        )
+        jac_nodes = triangle_helpers.jacobian_both(nodes, 2, 2)
+        new_s, new_t = self._call_function_under_test(
+            nodes, 2, 0.484375, 0.1796875, 0.25, 0.5, jac_nodes=jac_nodes
+        )
+        self.assertEqual(new_s, 247.0 / 512.0)
+        self.assertEqual(new_t, 31.0 / 128.0)
+
     def test_at_solution(self):
         nodes = np.asfortranarray(
             [[0.0, 0.5, 1.0, 0.0, 0.5, 0.0], [0.0, 0.0, 0.0, 0.5, 0.5, 1.0]]
@@ -162,10 +179,12 @@ class Test_mean_centroid(unittest.TestCase):
 
 class Test_locate_point(unittest.TestCase):
     @staticmethod
-    def _call_function_under_test(nodes, degree, x_val, y_val):
+    def _call_function_under_test(nodes, degree, x_val, y_val, **kwargs):
         from bezier.hazmat import triangle_intersection
 
-        return triangle_intersection.locate_point(nodes, degree, x_val, y_val)
+        return triangle_intersection.locate_point(
+            nodes, degree, x_val, y_val, **kwargs
+        )
 
     def test_it(self):
         nodes = UNIT_TRIANGLE.copy(order="F")
@@ -197,6 +216,22 @@ class Test_locate_point(unittest.TestCase):
         expected_t = 0.11269475204698919699
         self.assertAlmostEqual(t, expected_t, delta=SPACING(expected_t))
 
+    def test_jac_nodes(self):
+        from bezier.hazmat import triangle_helpers
+
+        # Same triangle and point as ``test_extra_newton_step``.
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 2.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0, 2.0, 2.0]]
+        )
+        jac_nodes = triangle_helpers.jacobian_both(nodes, 2, 2)
+        s, t = self._call_function_under_test(
+            nodes, 2, 0.59375, 0.25, jac_nodes=jac_nodes
+        )
+        expected_s = 0.109190958136897160638
+        self.assertAlmostEqual(s, expected_s, delta=6 * SPACING(expected_s))
+        expected_t = 0.11269475204698919699
+        self.assertAlmostEqual(t, expected_t, delta=SPACING(expected_t))
+
     def test_no_match(self):
         nodes = UNIT_TRIANGLE.copy(order="F")
         degree = 1
@@ -207,6 +242,235 @@ class Test_locate_point(unittest.TestCase):
         )
 
 
+class Test_locate_points(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points, **kwargs):
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection.locate_points(
+            nodes, degree, points, **kwargs
+        )
+
+    def test_it(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        points = np.asfortranarray([[0.25, -0.125, 0.5], [0.625, 0.25, 0.0]])
+        result = self._call_function_under_test(nodes, 1, points)
+        expected = np.asfortranarray(
+            [[0.25, np.nan, 0.5], [0.625, np.nan, 0.0]]
+        )
+        self.assertTrue(np.array_equal(result, expected, equal_nan=True))
+
+    def test_matches_locate_point(self):
+        from bezier.hazmat import triangle_helpers
+        from bezier.hazmat import triangle_intersection
+
+        # x(s, t) = -2 (s + 2 t) (t - 1)
+        # y(s, t) =  2 (s + 1) t
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 2.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0, 2.0, 2.0]]
+        )
+        points = np.asfortranarray(
+            [[0.59375, 1.25, 0.0, 3.0], [0.25, 1.25, 0.0, 0.0]]
+        )
+        jac_nodes = triangle_helpers.jacobian_both(nodes, 2, 2)
+        result = self._call_function_under_test(
+            nodes, 2, points, jac_nodes=jac_nodes
+        )
+        self.assertEqual(result.shape, (2, 4))
+        for index in range(3):
+            s, t = triangle_intersection.locate_point(
+                nodes, 2, points[0, index], points[1, index]
+            )
+            self.assertEqual(result[0, index], s)
+            self.assertEqual(result[1, index], t)
+        self.assertTrue(np.all(np.isnan(result[:, 3])))
+
+    def test_no_match(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        points = np.asfortranarray([[-0.125, 2.0], [0.25, 2.0]])
+        result = self._call_function_under_test(nodes, 1, points)
+        self.assertTrue(np.all(np.isnan(result)))
+
+    def test_no_points(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        points = np.empty((2, 0), order="F")
+        result = self._call_function_under_test(nodes, 1, points)
+        self.assertEqual(result.shape, (2, 0))
+
+    def test_with_index(self):
+        from bezier.hazmat import triangle_intersection
+
+        # x(s, t) = -2 (s + 2 t) (t - 1)
+        # y(s, t) =  2 (s + 1) t
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 2.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0, 2.0, 2.0]]
+        )
+        index = triangle_intersection.LocateIndex(nodes, 2, 3)
+        points = np.asfortranarray(
+            [[0.59375, 1.25, 0.0, 3.0, -1.0], [0.25, 1.25, 0.0, 0.0, -1.0]]
+        )
+        expected = self._call_function_under_test(nodes, 2, points)
+        result = self._call_function_under_test(nodes, 2, points, index=index)
+        self.assertTrue(np.allclose(result, expected, equal_nan=True))
+        self.assertTrue(np.all(np.isnan(result[:, 3:])))
+
+    def test_with_index_outside_domain(self):
+        from bezier.hazmat import triangle_intersection
+
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        index = triangle_intersection.LocateIndex(nodes, 1, 2)
+        # The first point is in the bounding box of a leaf, but not on the
+        # triangle, so Newton's method converges outside of the domain.
+        points = np.asfortranarray([[0.5625, 0.25], [0.5, 0.5]])
+        with unittest.mock.patch.object(
+            triangle_intersection,
+            "locate_points",
+            wraps=triangle_intersection.locate_points,
+        ) as locate_points:
+            result = self._call_function_under_test(
+                nodes, 1, points, index=index
+            )
+        expected = np.asfortranarray([[np.nan, 0.25], [np.nan, 0.5]])
+        self.assertTrue(np.array_equal(result, expected, equal_nan=True))
+        # The second call is the fallback for the first point.
+        self.assertEqual(locate_points.call_count, 2)
+        call_points = locate_points.mock_calls[1][1][2]
+        self.assertEqual(call_points, points[:, :1])
+
+    def test_with_index_not_converged(self):
+        from bezier.hazmat import triangle_intersection
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 2.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0, 2.0, 2.0]]
+        )
+        index = triangle_intersection.LocateIndex(nodes, 2, 1)
+        points = np.asfortranarray([[0.59375], [0.25]])
+        with unittest.mock.patch.object(
+            triangle_intersection, "LOCATE_INDEX_NEWTON_STEPS", new=1
+        ):
+            result = self._call_function_under_test(
+                nodes, 2, points, index=index
+            )
+        expected = self._call_function_under_test(nodes, 2, points)
+        self.assertEqual(result, expected)
+
+
+class Test__newton_solve_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(jac_vals, pt_delta):
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection._newton_solve_multi(jac_vals, pt_delta)
+
+    def test_it(self):
+        # The first column matches ``Test_newton_refine_solve`` and the
+        # second column is hit exactly.
+        jac_vals = np.asfortranarray(
+            [[1.0, 1.0], [1.0, 0.0], [-2.0, 0.0], [2.0, 0.0]]
+        )
+        pt_delta = np.asfortranarray([[0.25, 0.0], [-0.5, 0.0]])
+        delta_s, delta_t = self._call_function_under_test(jac_vals, pt_delta)
+        self.assertEqual(delta_s.tolist(), [-0.125, 0.0])
+        self.assertEqual(delta_t.tolist(), [-0.1875, 0.0])
+
+
+class Test__inside_boxes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(min_vals, max_vals, points):
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection._inside_boxes(min_vals, max_vals, points)
+
+    def test_it(self):
+        min_vals = np.asfortranarray([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+        max_vals = np.asfortranarray([[1.0, 1.0, 2.0], [1.0, 1.0, 2.0]])
+        points = np.asfortranarray([[1.0, 0.5, 0.5], [0.0, 1.5, 1.5]])
+        result = self._call_function_under_test(min_vals, max_vals, points)
+        self.assertEqual(result.tolist(), [True, False, False])
+
+
+class Test__mean_centroids(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(
+        point_ids, cell_ids, centroids_x, centroids_y, num_points
+    ):
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection._mean_centroids(
+            point_ids, cell_ids, centroids_x, centroids_y, num_points
+        )
+
+    def test_it(self):
+        point_ids = np.asfortranarray([2, 0, 2])
+        cell_ids = np.asfortranarray([0, 1, 2])
+        centroids_x = np.asfortranarray([0.75, 1.5, 2.25])
+        centroids_y = np.asfortranarray([3.0, 0.0, 1.5])
+        found, s_vals, t_vals = self._call_function_under_test(
+            point_ids, cell_ids, centroids_x, centroids_y, 3
+        )
+        self.assertEqual(found.tolist(), [0, 2])
+        self.assertEqual(s_vals.tolist(), [0.5, 0.5])
+        self.assertEqual(t_vals.tolist(), [0.0, 0.75])
+
+
+class TestLocateIndex(utils.NumPyTestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection.LocateIndex
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        index = self._make_one(nodes, 1, 1)
+        self.assertEqual(index.depth, 1)
+        # Leaves are in the same order as ``subdivide_nodes()``.
+        self.assertEqual(
+            index.centroids_x, np.asfortranarray([0.5, 1.0, 2.0, 0.5])
+        )
+        self.assertEqual(
+            index.centroids_y, np.asfortranarray([0.5, 1.0, 0.5, 2.0])
+        )
+        self.assertEqual(len(index._min_vals), 2)
+        self.assertEqual(len(index._max_vals), 2)
+        self.assertEqual(index._min_vals[0], np.asfortranarray([[0.0], [0.0]]))
+        self.assertEqual(index._max_vals[0], np.asfortranarray([[1.0], [1.0]]))
+        expected_max = np.asfortranarray(
+            [[0.5, 0.5, 1.0, 0.5], [0.5, 0.5, 0.5, 1.0]]
+        )
+        self.assertTrue(np.array_equal(index._max_vals[1], expected_max))
+
+    def test___dict___property(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        index = self._make_one(nodes, 1, 2)
+        props_dict = index.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()),
+            ["_max_vals", "_min_vals", "centroids_x", "centroids_y", "depth"],
+        )
+        self.assertEqual(props_dict["depth"], 2)
+        self.assertIs(props_dict["_min_vals"], index._min_vals)
+        # Check that modifying ``props_dict`` won't modify ``index``.
+        props_dict["depth"] = 3
+        self.assertEqual(index.depth, 2)
+
+    def test_candidates(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        index = self._make_one(nodes, 1, 2)
+        points = np.asfortranarray([[0.125, 2.0, 0.375], [0.125, 2.0, 0.375]])
+        point_ids, leaf_ids = index.candidates(points)
+        pairs = sorted(zip(point_ids.tolist(), leaf_ids.tolist()))
+        # Leaf ``k + 4 j`` is child ``j`` of sub-triangle ``k``. The first
+        # point is in the bounding boxes of the "a" and "b" children of the
+        # "a" sub-triangle and the last point is in the bounding boxes of
+        # the "a" and "b" children of the "b" sub-triangle.
+        self.assertEqual(pairs, [(0, 0), (0, 4), (2, 1), (2, 5)])
+
+
 class Test_same_intersection(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(intersection1, intersection2, **kwargs):
@@ -992,6 +1256,37 @@ class Test_algebraic_intersect(Test_geometric_intersect):
         self.assertEqual(exc_args[1].shape, (5,))
 
 
+class Test_clipping_intersect(Test_geometric_intersect):
+    @staticmethod
+    def _call_function_under_test(nodes1, degree1, nodes2, degree2, **kwargs):
+        from bezier.hazmat import triangle_intersection
+
+        return triangle_intersection.clipping_intersect(
+            nodes1, degree1, nodes2, degree2, **kwargs
+        )
+
+    def test_opposed_tangencies(self):
+        from bezier.hazmat import clipping
+
+        # NOTE: Clipping only locates the tangent intersection up to
+        #       round-off, which is not enough to (reliably) classify
+        #       it as ``OPPOSED``. So we just check the tangent edges.
+        nodes1 = np.asfortranarray([[4.0, 2.0, 0.0], [0.0, 4.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0, 4.0], [4.0, 0.0, 4.0]])
+        st_vals, coincident = clipping.all_intersections(nodes1, nodes2)
+        self.assertEqual(st_vals.shape, (2, 1))
+        delta = 2 * SPACING(0.5)  # pylint: disable=assignment-from-no-return
+        self.assertAlmostEqual(st_vals[0, 0], 0.5, delta=delta)
+        self.assertAlmostEqual(st_vals[1, 0], 0.5, delta=delta)
+        self.assertFalse(coincident)
+
+    def _check_triple_root_err(self, exception):
+        from bezier.hazmat import clipping
+
+        expected = (clipping._TOO_MANY_TEMPLATE.format(69),)
+        self.assertEqual(exception.args, expected)
+
+
 def make_intersect(*args, **kwargs):
     from bezier.hazmat import intersection_helpers
 
@@ -0,0 +1,149 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class Test_make_subdivision_matrices(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier.hazmat import triangle_matrices
+
+        return triangle_matrices.make_subdivision_matrices(degree)
+
+    def test_linear(self):
+        from bezier.hazmat import triangle_helpers
+
+        mat_a, mat_b, mat_c, mat_d = self._call_function_under_test(1)
+        self.assertEqual(mat_a, triangle_helpers.LINEAR_SUBDIVIDE_A)
+        self.assertEqual(mat_b, triangle_helpers.LINEAR_SUBDIVIDE_B)
+        self.assertEqual(mat_c, triangle_helpers.LINEAR_SUBDIVIDE_C)
+        self.assertEqual(mat_d, triangle_helpers.LINEAR_SUBDIVIDE_D)
+
+    def test_quartic(self):
+        from bezier.hazmat import triangle_helpers
+
+        mat_a, mat_b, mat_c, mat_d = self._call_function_under_test(4)
+        self.assertEqual(mat_a, triangle_helpers.QUARTIC_SUBDIVIDE_A)
+        self.assertEqual(mat_b, triangle_helpers.QUARTIC_SUBDIVIDE_B)
+        self.assertEqual(mat_c, triangle_helpers.QUARTIC_SUBDIVIDE_C)
+        self.assertEqual(mat_d, triangle_helpers.QUARTIC_SUBDIVIDE_D)
+
+
+class Test_make_jacobian_matrices(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier.hazmat import triangle_matrices
+
+        return triangle_matrices.make_jacobian_matrices(degree)
+
+    def test_linear(self):
+        jac_s, jac_t = self._call_function_under_test(1)
+        self.assertEqual(jac_s, np.asfortranarray([[-1.0], [1.0], [0.0]]))
+        self.assertEqual(jac_t, np.asfortranarray([[-1.0], [0.0], [1.0]]))
+
+    def test_quadratic(self):
+        from bezier.hazmat import triangle_helpers
+
+        nodes = np.asfortranarray(
+            [[3.0, 2.0, 1.0, 0.0, 1.0, 2.0], [0.0, 0.0, -1.0, 0.0, 1.0, 0.0],]
+        )
+        jac_s, jac_t = self._call_function_under_test(2)
+        self.assertEqual(jac_s.shape, (6, 3))
+        expected_s = triangle_helpers.jacobian_s(nodes, 2, 2)
+        self.assertEqual(np.asfortranarray(nodes.dot(jac_s)), expected_s)
+        expected_t = triangle_helpers.jacobian_t(nodes, 2, 2)
+        self.assertEqual(np.asfortranarray(nodes.dot(jac_t)), expected_t)
+
+
+class Test_make_linearization_matrix(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier.hazmat import triangle_matrices
+
+        return triangle_matrices.make_linearization_matrix(degree)
+
+    def test_linear(self):
+        result = self._call_function_under_test(1)
+        self.assertEqual(result, np.zeros((3, 3), order="F"))
+
+    def test_quadratic(self):
+        result = self._call_function_under_test(2)
+        expected = np.asfortranarray(
+            [
+                [0.0, -0.5, 0.0, -0.5, 0.0, 0.0],
+                [0.0, 1.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, -0.5, 0.0, 0.0, -0.5, 0.0],
+                [0.0, 0.0, 0.0, 1.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, -0.5, -0.5, 0.0],
+            ]
+        )
+        self.assertEqual(result, expected)
+
+
+class Test_linearization_error(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier.hazmat import triangle_matrices
+
+        return triangle_matrices.linearization_error(nodes, degree)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 3.0, 1.0]])
+        self.assertEqual(self._call_function_under_test(nodes, 1), 0.0)
+
+    def test_elevated_linear(self):
+        nodes = np.asfortranarray(
+            [[0.0, 0.5, 1.0, 0.0, 0.5, 0.0], [0.0, 0.0, 0.0, 0.5, 0.5, 1.0]]
+        )
+        self.assertEqual(self._call_function_under_test(nodes, 2), 0.0)
+
+    def test_cubic(self):
+        # NOTE: The linear part is the identity on ``(s, t)`` (scaled by 3).
+        nodes = np.asfortranarray(
+            [
+                [0.0, 1.0, 2.0, 3.0, 0.0, 1.0, 2.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 2.0, 2.0, 3.0],
+                [0.0, 0.0, 0.0, 0.0, 3.0, -4.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+        self.assertEqual(self._call_function_under_test(nodes, 3), 4.0)
+
+
+class Test_make_elevation_matrix(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier.hazmat import triangle_matrices
+
+        return triangle_matrices.make_elevation_matrix(degree)
+
+    def test_linear(self):
+        result = self._call_function_under_test(1)
+        expected = np.asfortranarray(
+            [
+                [2.0, 1.0, 0.0, 1.0, 0.0, 0.0],
+                [0.0, 1.0, 2.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0, 1.0, 2.0],
+            ]
+        )
+        self.assertEqual(result, expected)
+
+    def test_quadratic(self):
+        result = self._call_function_under_test(2)
+        self.assertEqual(result.shape, (6, 10))
+        # The weights for each new node sum to ``d + 1``.
+        self.assertEqual(result.sum(axis=0).tolist(), [3.0] * 10)
@@ -61,6 +61,10 @@ class Test_speedup_compute_length(test_curve_helpers.Test_compute_length):
         # or absence of SciPy is irrelevant.
         pass
 
+    def test_first_deriv(self):
+        # The Fortran implementation computes the hodograph itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_elevate_nodes(test_curve_helpers.Test_elevate_nodes):
@@ -99,6 +103,10 @@ class Test_speedup_get_curvature(test_curve_helpers.Test_get_curvature):
 
         return _speedup.get_curvature(nodes, tangent_vec, s)
 
+    def test_second_deriv(self):
+        # The Fortran implementation computes the second derivative itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_newton_refine(test_curve_helpers.Test_newton_refine):
@@ -108,6 +116,10 @@ class Test_speedup_newton_refine(test_curve_helpers.Test_newton_refine):
 
         return _speedup.newton_refine_curve(nodes, point, s)
 
+    def test_first_deriv(self):
+        # The Fortran implementation computes the hodograph itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_locate_point(test_curve_helpers.Test_locate_point):
@@ -117,6 +129,10 @@ class Test_speedup_locate_point(test_curve_helpers.Test_locate_point):
 
         return _speedup.locate_point_curve(nodes, point)
 
+    def test_first_deriv(self):
+        # The Fortran implementation computes the hodograph itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_reduce_pseudo_inverse(
@@ -89,6 +89,86 @@ class Test_speedup_all_intersections(
         # Make sure the workspace was **not** resized.
         self.assertEqual(self.curves_workspace_size(), 2)
 
+    def test_explicit_workspace(self):
+        from bezier import workspace
+
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        self.reset_curves_workspace(2)
+        scratch = workspace.IntersectionWorkspace(intersections_size=1)
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2, workspace=scratch
+        )
+        expected = np.asfortranarray([[0.5, 0.375, 0.625], [0.5, 0.25, 0.75]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+        # Make sure only the explicit workspace was resized.
+        self.assertEqual(scratch.intersections_size, 3)
+        self.assertEqual(self.curves_workspace_size(), 2)
+
+
+@utils.needs_speedup
+class Test_speedup_all_intersections_batch(
+    test_geometric_intersection.Test_all_intersections_batch
+):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_first, offsets_first, nodes_second, offsets_second, **kwargs
+    ):
+        from bezier import _speedup
+
+        return _speedup.curve_intersections_batch(
+            nodes_first, offsets_first, nodes_second, offsets_second, **kwargs
+        )
+
+    def _make_pairs(self):
+        # NOTE: Each pair is a line and a cubic that intersect 3 times.
+        nodes_first = np.asfortranarray(
+            [[-3.0, 5.0, -3.0, 5.0], [0.0, 0.0, 0.0, 0.0]]
+        )
+        nodes_second = np.asfortranarray(
+            [
+                [-7.0, 9.0, -7.0, 9.0, -7.0, 9.0, -7.0, 9.0],
+                [-9.0, 13.0, -13.0, 9.0, -9.0, 13.0, -13.0, 9.0],
+            ]
+        )
+        offsets_first = np.asarray([0, 2, 4], dtype=np.intc)
+        offsets_second = np.asarray([0, 4, 8], dtype=np.intc)
+        return nodes_first, offsets_first, nodes_second, offsets_second
+
+    def test_workspace_resize(self):
+        # NOTE: The curves intersect 6 times, so 5 is not large enough.
+        (
+            pair_indices,
+            intersections,
+            coincident,
+        ) = self._call_function_under_test(
+            *self._make_pairs(), intersections_size=5
+        )
+        expected_indices = np.asarray([0, 0, 0, 1, 1, 1], dtype=np.intc)
+        self.assertEqual(pair_indices, expected_indices)
+        expected = np.asfortranarray(
+            [
+                [0.5, 0.375, 0.625, 0.5, 0.375, 0.625],
+                [0.5, 0.25, 0.75, 0.5, 0.25, 0.75],
+            ]
+        )
+        self.assertEqual(intersections, expected)
+        self.assertEqual(coincident, np.asarray([False, False]))
+
+    def test_workspace_too_small(self):
+        from bezier import _speedup
+
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                *self._make_pairs(), intersections_size=5, allow_resize=False
+            )
+        exc_args = exc_info.exception.args
+        expected = _speedup.TOO_SMALL_TEMPLATE.format(6, 5)
+        self.assertEqual(exc_args, (expected,))
+
 
 @utils.needs_speedup
 class Test_reset_curves_workspace(unittest.TestCase):
@@ -106,7 +186,6 @@ class Test_reset_curves_workspace(unittest.TestCase):
         self.assertIsNone(return_value)
         self.assertEqual(_speedup.curves_workspace_size(), size)
 
-    @unittest.expectedFailure
     def test_threadsafe(self):
         from bezier import _speedup
 
@@ -123,12 +202,11 @@ class Test_reset_curves_workspace(unittest.TestCase):
         thread2.start()
         thread1.join()
         thread2.join()
-        # This check demonstrates the **broken-ness** of the implementation.
-        # The sizes for each thread should be the sizes actually **set** in
-        # the given thread and the workspace in the main thread should be
-        # unchanged (i.e. should have ``size_main``). What we'll actually
-        # observe is ``(size2, size1, size2)``.
-        expected = (size1, size2, size_main)
+        # Each thread has its own workspace: the first thread observes the
+        # size it **set**, the second thread reads its (default) size before
+        # setting ``size2`` and the workspace in the main thread is
+        # unchanged (i.e. still has ``size_main``).
+        expected = (size1, 2, size_main)
         actual = (worker.size1, worker.size2, _speedup.curves_workspace_size())
         self.assertEqual(actual, expected)
 
@@ -30,6 +30,10 @@ class Test_speedup_newton_refine(
             nodes, degree, x_val, y_val, s, t
         )
 
+    def test_jac_nodes(self):
+        # The Fortran implementation computes the Jacobian itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_locate_point(test_triangle_intersection.Test_locate_point):
@@ -39,6 +43,10 @@ class Test_speedup_locate_point(test_triangle_intersection.Test_locate_point):
 
         return _speedup.locate_point_triangle(nodes, degree, x_val, y_val)
 
+    def test_jac_nodes(self):
+        # The Fortran implementation computes the Jacobian itself.
+        pass
+
 
 @utils.needs_speedup
 class Test_speedup_geometric_intersect(
@@ -100,6 +108,23 @@ class Test_speedup_geometric_intersect(
         # Make sure the workspace was **not** resized.
         self.assertEqual(triangle_workspace_sizes(), sizes)
 
+    def test_explicit_workspace(self):
+        from bezier import workspace
+
+        reset_triangle_workspaces(segment_ends_size=1, segments_size=1)
+        scratch = workspace.IntersectionWorkspace(
+            segment_ends_size=1, segments_size=1
+        )
+        result, expected = self._two_curved_polygons(workspace=scratch)
+        curved_polygons, contained, _ = result
+        self.assertEqual(curved_polygons, expected)
+        self.assertIsNone(contained)
+        # Make sure only the explicit workspace was resized.
+        self.assertEqual(
+            (scratch.segment_ends_size, scratch.segments_size), (2, 6)
+        )
+        self.assertEqual(triangle_workspace_sizes(), (1, 1))
+
 
 @utils.needs_speedup
 class Test_speedup__type_info(unittest.TestCase):
@@ -135,7 +160,6 @@ class Test_reset_triangle_workspaces(unittest.TestCase):
         self.assertIsNone(return_value)
         self.assertEqual(triangle_workspace_sizes(), (1, 2))
 
-    @unittest.expectedFailure
     def test_threadsafe(self):
         sizes_main = (4, 3)
         self._call_function_under_test(
@@ -152,12 +176,11 @@ class Test_reset_triangle_workspaces(unittest.TestCase):
         thread2.start()
         thread1.join()
         thread2.join()
-        # This check demonstrates the **broken-ness** of the implementation.
-        # The sizes for each thread should be the sizes actually **set** in
-        # the given thread and the workspace in the main thread should be
-        # unchanged (i.e. should have ``sizes_main``). What we'll actually
-        # observe is ``(sizes2, sizes1, sizes2)``.
-        expected = (sizes1, sizes2, sizes_main)
+        # Each thread has its own workspace: the first thread observes the
+        # sizes it **set**, the second thread reads its (default) sizes
+        # before setting ``sizes2`` and the workspace in the main thread is
+        # unchanged (i.e. still has ``sizes_main``).
+        expected = (sizes1, (3, 6), sizes_main)
         actual = (worker.sizes1, worker.sizes2, triangle_workspace_sizes())
         self.assertEqual(actual, expected)
 
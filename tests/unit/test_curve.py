@@ -90,10 +90,55 @@ class TestCurve(utils.NumPyTestCase):
         curve = self._make_one(nodes, 1)
         self.assertEqual(curve.length, 5.0)
 
+    def test_length_cached_derivatives(self):
+        from bezier import _curve_helpers
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray([[0.0, 1.5, 3.0], [0.0, 2.0, 4.0]])
+        curve = self._make_one(nodes, 2)
+        compute_length = unittest.mock.Mock(wraps=curve_helpers.compute_length)
+        patch1 = unittest.mock.patch.object(
+            _curve_helpers, "CACHED_DERIVATIVES", new=True
+        )
+        patch2 = unittest.mock.patch.object(
+            curve_helpers, "compute_length", new=compute_length
+        )
+        with patch1, patch2:
+            self.assertAlmostEqual(curve.length, 5.0, delta=0.5 ** 50)
+        compute_length.assert_called_once()
+        first_deriv, _ = curve._hodographs
+        self.assertIs(compute_length.call_args[1]["first_deriv"], first_deriv)
+
+    def test_length_cached_derivatives_unused(self):
+        from bezier import _curve_helpers
+
+        nodes = np.asfortranarray([[0.0, 1.5, 3.0], [0.0, 2.0, 4.0]])
+        curve = self._make_one(nodes, 2)
+        compute_length = unittest.mock.Mock(
+            wraps=_curve_helpers.compute_length
+        )
+        patch1 = unittest.mock.patch.object(
+            _curve_helpers, "CACHED_DERIVATIVES", new=False
+        )
+        patch2 = unittest.mock.patch.object(
+            _curve_helpers, "compute_length", new=compute_length
+        )
+        with patch1, patch2:
+            self.assertAlmostEqual(curve.length, 5.0, delta=0.5 ** 50)
+        compute_length.assert_called_once_with(curve._nodes)
+        self.assertIsNone(curve._hodographs)
+
     def test___dict___property(self):
         curve = self._make_one(self.ZEROS, 1, copy=False)
         props_dict = curve.__dict__
-        expected = {"_nodes": self.ZEROS, "_dimension": 2, "_degree": 1}
+        expected = {
+            "_nodes": self.ZEROS,
+            "_dimension": 2,
+            "_degree": 1,
+            "_arc_length_table": None,
+            "_hodographs": None,
+            "_implicit_curve": None,
+        }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``curve``.
         expected["_dimension"] = 47
@@ -138,6 +183,160 @@ class TestCurve(utils.NumPyTestCase):
         result = curve.evaluate_hodograph(s)
         self.assertEqual(expected, result)
 
+    def test_evaluate_hodograph_constant(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        curve = self._make_one(nodes, 0)
+        result = curve.evaluate_hodograph(0.5)
+        self.assertEqual(result, np.zeros((2, 1), order="F"))
+
+    def test__get_hodographs(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 2.0, 1.0]])
+        curve = self._make_one(nodes, 2)
+        self.assertIsNone(curve._hodographs)
+        first_deriv, second_deriv = curve._get_hodographs()
+        expected1 = np.asfortranarray([[2.0, 4.0], [4.0, -2.0]])
+        self.assertEqual(first_deriv, expected1)
+        expected2 = np.asfortranarray([[2.0], [-6.0]])
+        self.assertEqual(second_deriv, expected2)
+        # A second call re-uses the cached nodes.
+        result = curve._get_hodographs()
+        self.assertIs(result[0], first_deriv)
+        self.assertIs(result[1], second_deriv)
+
+    def test_arc_length(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        self.assertIsNone(curve._arc_length_table)
+        result = curve.arc_length(0.375)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, 0.890625)
+        table = curve._arc_length_table
+        self.assertIsNotNone(table)
+        # B(s) = 2s + s^2, so the length is exact (up to round-off).
+        s_vals = np.asfortranarray([[0.0, 0.125], [0.75, 1.0]])
+        result = curve.arc_length(s_vals)
+        self.assertEqual(result.shape, (2, 2))
+        expected = 2.0 * s_vals + s_vals * s_vals
+        self.assertTrue(
+            np.allclose(result, expected, atol=0.0, rtol=0.5 ** 50)
+        )
+        # The table is re-used.
+        self.assertIs(curve._arc_length_table, table)
+
+    def test_arc_length_matches_length(self):
+        nodes = np.asfortranarray(
+            [[0.0, 2.0, -1.0, 1.0], [0.0, 1.0, 1.0, 0.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        self.assertAlmostEqual(curve.arc_length(1.0), curve.length, places=12)
+
+    def test_arc_length_point(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        curve = self._make_one(nodes, 0)
+        self.assertEqual(curve.arc_length(0.25), 0.0)
+        self.assertEqual(curve.param_at_length(0.0), 0.0)
+
+    def test_param_at_length(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        result = curve.param_at_length(0.890625)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, 0.375)
+        lengths = np.asfortranarray([0.0, 0.5, 1.0, 2.0, 3.0])
+        s_vals = curve.param_at_length(lengths)
+        expected = np.sqrt(1.0 + lengths) - 1.0
+        self.assertTrue(
+            np.allclose(s_vals, expected, atol=0.5 ** 50, rtol=0.0)
+        )
+
+    def test_param_at_length_inverse(self):
+        nodes = np.asfortranarray(
+            [[0.0, 2.0, -1.0, 1.0], [0.0, 1.0, 1.0, 0.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        lengths = np.linspace(0.0, curve.arc_length(1.0), 101)
+        s_vals = curve.param_at_length(lengths)
+        self.assertTrue(np.all(np.diff(s_vals) > 0.0))
+        self.assertTrue(
+            np.allclose(
+                curve.arc_length(s_vals), lengths, atol=0.5 ** 30, rtol=0.0
+            )
+        )
+
+    def test_param_at_length_zero_speed(self):
+        # B'(1/2) = 0 and 1/2 is a breakpoint of the arc-length table.
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        self.assertEqual(curve.param_at_length(0.5), 0.5)
+        s_vals = curve.param_at_length(np.asfortranarray([0.25, 0.75]))
+        expected = np.asfortranarray(
+            [0.5 - np.sqrt(0.125), 0.5 + np.sqrt(0.125)]
+        )
+        self.assertTrue(
+            np.allclose(s_vals, expected, atol=0.5 ** 40, rtol=0.0)
+        )
+
+    def test_arc_length_thin(self):
+        # The curve turns back on itself at s = 5/9, where the speed is
+        # nearly zero.
+        nodes = np.asfortranarray([[0.0, 1.0, 0.2], [0.0, 0.001, 0.0]])
+        curve = self._make_one(nodes, 2)
+        expected = float.fromhex("0x1.d27d3e763937dp-1")
+        self.assertAlmostEqual(
+            curve.arc_length(1.0), expected, delta=0.5 ** 50
+        )
+
+    def test_param_at_length_cusp(self):
+        # B'(s) = 3 (1 - 2s) [1 - 2s, 1], so the curve has a cusp at s = 1/2
+        # and the length up to s <= 1/2 is (2^{3/2} - (u^2 + 1)^{3/2}) / 2
+        # for u = 1 - 2s.
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0, 1.0], [0.0, 1.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 3)
+        s_vals = np.asfortranarray([0.125, 0.375, 0.49, 0.51, 0.625])
+        u_vals = np.abs(1.0 - 2.0 * s_vals)
+        half_length = 0.5 * (np.sqrt(8.0) - 1.0)
+        lengths = 0.5 * (np.sqrt(8.0) - (u_vals * u_vals + 1.0) ** 1.5)
+        lengths[s_vals > 0.5] = 2.0 * half_length - lengths[s_vals > 0.5]
+        self.assertTrue(
+            np.allclose(
+                curve.arc_length(s_vals), lengths, atol=0.5 ** 50, rtol=0.0
+            )
+        )
+        result = curve.param_at_length(lengths)
+        self.assertTrue(np.allclose(result, s_vals, atol=0.5 ** 40, rtol=0.0))
+        # At the cusp, the length only determines s to about the square
+        # root of machine precision.
+        result = curve.param_at_length(half_length)
+        self.assertAlmostEqual(result, 0.5, delta=0.5 ** 26)
+
+    def test_param_at_length_clamped(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        s_vals = curve.param_at_length(np.asfortranarray([-1.0, 4.0]))
+        self.assertEqual(s_vals.tolist(), [0.0, 1.0])
+
+    def test_sample_by_length(self):
+        nodes = np.asfortranarray(
+            [[0.0, 2.0, -1.0, 1.0], [0.0, 1.0, 1.0, 0.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        points, s_vals = curve.sample_by_length(9)
+        self.assertEqual(points.shape, (2, 9))
+        self.assertEqual(s_vals[0], 0.0)
+        self.assertEqual(s_vals[-1], 1.0)
+        self.assertEqual(points, curve.evaluate_multi(s_vals))
+        lengths = np.diff(curve.arc_length(s_vals))
+        self.assertTrue(
+            np.allclose(lengths, curve.length / 8.0, atol=0.5 ** 30, rtol=0.0)
+        )
+
+    def test_sample_by_length_too_few(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            curve.sample_by_length(1)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("At least two points are required", 1))
+
     def test_plot_wrong_dimension(self):
         nodes = np.asfortranarray([[0.0, 1.0], [0.0, 3.0], [0.0, 4.0]])
         curve = self._make_one(nodes, 1)
@@ -195,6 +394,69 @@ class TestCurve(utils.NumPyTestCase):
         expected_r = np.asfortranarray([[2.0, 4.0], [3.5, 6.0]])
         self.assertEqual(right._nodes, expected_r)
 
+    def test_flatten_line(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, 2.0, 3.0]])
+        curve = self._make_one(nodes, 2)
+        points, s_vals = curve.flatten(0.5 ** 20)
+        expected = np.asfortranarray([[0.0, 2.0], [1.0, 3.0]])
+        self.assertEqual(points, expected)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 1.0]))
+
+    def test_flatten_within_tolerance(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 1.0, 5.0], [0.0, 4.0, -4.0, 0.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        tolerance = 0.5 ** 10
+        points, s_vals = curve.flatten(tolerance)
+        (num_points,) = s_vals.shape
+        self.assertEqual(points.shape, (2, num_points))
+        self.assertTrue(points.flags.f_contiguous)
+        self.assertEqual(s_vals[0], 0.0)
+        self.assertEqual(s_vals[-1], 1.0)
+        self.assertTrue(np.all(np.diff(s_vals) > 0.0))
+        self.assertTrue(
+            np.allclose(
+                points, curve.evaluate_multi(s_vals), atol=0.5 ** 50, rtol=0.0
+            )
+        )
+        # Check the distance to each chord at some interior points.
+        for start, end in zip(s_vals[:-1], s_vals[1:]):
+            lambda_ = np.linspace(0.0, 1.0, 9)
+            on_curve = curve.evaluate_multi(start + lambda_ * (end - start))
+            chord_start = curve.evaluate(start)
+            chord_end = curve.evaluate(end)
+            on_chord = chord_start + lambda_ * (chord_end - chord_start)
+            distances = np.linalg.norm(on_curve - on_chord, axis=0)
+            self.assertTrue(np.all(distances <= tolerance))
+
+    def test_flatten_max_subdivisions(self):
+        from bezier import curve as curve_mod
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        patch = unittest.mock.patch.object(
+            curve_mod, "_MAX_FLATTEN_SUBDIVISIONS", new=1
+        )
+        with patch:
+            _, s_vals = curve.flatten(0.5 ** 40)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 0.5, 1.0]))
+
+    def test_flatten_point(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        curve = self._make_one(nodes, 0)
+        points, s_vals = curve.flatten(0.125)
+        self.assertEqual(points, nodes)
+        self.assertEqual(s_vals.tolist(), [0.0])
+
+    def test_flatten_bad_tolerance(self):
+        curve = self._make_one(self.ZEROS, 1)
+        for tolerance in (0.0, -1.0, np.nan):
+            with self.assertRaises(ValueError) as exc_info:
+                curve.flatten(tolerance)
+            exc_args = exc_info.exception.args
+            self.assertEqual(exc_args[0], "Tolerance must be positive")
+
     def test_intersect_bad_strategy(self):
         curve = self._make_one(self.ZEROS, 1)
         strategy = unittest.mock.sentinel.bad_strategy
@@ -215,6 +477,18 @@ class TestCurve(utils.NumPyTestCase):
         expected = np.asfortranarray([[0.5], [0.5]])
         self.assertEqual(intersections, expected)
 
+    def test_intersect_clipping(self):
+        from bezier.hazmat import intersection_helpers
+
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve1 = self._make_one(nodes1, 2)
+        nodes2 = np.asfortranarray([[0.0, 1.0], [0.375, 0.375]])
+        curve2 = self._make_one(nodes2, 1)
+        strategy = intersection_helpers.IntersectionStrategy.CLIPPING
+        intersections = curve1.intersect(curve2, strategy=strategy)
+        expected = np.asfortranarray([[0.25, 0.75], [0.25, 0.75]])
+        self.assertEqual(intersections, expected)
+
     def test_intersect_empty(self):
         nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
         curve1 = self._make_one(nodes1, 1)
@@ -257,6 +531,48 @@ class TestCurve(utils.NumPyTestCase):
     def test_intersect_no_verify(self):
         self._intersect_helper(_verify=False)
 
+    def test_intersect_with_workspace(self):
+        import bezier
+
+        workspace = bezier.IntersectionWorkspace()
+        self._intersect_helper(workspace=workspace)
+
+    def _intersect_workspace_helper(self, accepts_workspace):
+        from bezier import _geometric_intersection
+
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve = self._make_one(nodes, 1)
+        st_vals = np.empty((2, 0), order="F")
+        all_intersections = unittest.mock.Mock(return_value=(st_vals, False))
+        patch1 = unittest.mock.patch.object(
+            _geometric_intersection,
+            "ACCEPTS_WORKSPACE",
+            new=accepts_workspace,
+        )
+        patch2 = unittest.mock.patch.object(
+            _geometric_intersection,
+            "all_intersections",
+            new=all_intersections,
+        )
+        workspace = unittest.mock.sentinel.workspace
+        with patch1, patch2:
+            result = curve.intersect(curve, workspace=workspace)
+        self.assertIs(result, st_vals)
+        return all_intersections
+
+    def test_intersect_workspace_accepted(self):
+        all_intersections = self._intersect_workspace_helper(True)
+        workspace = unittest.mock.sentinel.workspace
+        all_intersections.assert_called_once_with(
+            unittest.mock.ANY, unittest.mock.ANY, workspace=workspace
+        )
+
+    def test_intersect_workspace_ignored(self):
+        all_intersections = self._intersect_workspace_helper(False)
+        all_intersections.assert_called_once_with(
+            unittest.mock.ANY, unittest.mock.ANY
+        )
+
     def test_intersect_non_curve(self):
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, -0.25, 0.0]])
         curve = self._make_one(nodes, 2)
@@ -274,6 +590,98 @@ class TestCurve(utils.NumPyTestCase):
         with self.assertRaises(NotImplementedError):
             curve2.intersect(curve1)
 
+    def _intersect_many_others(self):
+        return [
+            self._make_one(np.asfortranarray([[0.0, 1.0], [0.375, 0.375]]), 1),
+            self._make_one(np.asfortranarray([[2.0, 3.0], [0.0, 1.0]]), 1),
+            self._make_one(np.asfortranarray([[0.0, 1.0], [0.5, 1.0]]), 1),
+            self._make_one(np.asfortranarray([[0.5, 0.5], [0.0, 1.0]]), 1),
+        ]
+
+    def _check_intersect_many(self, curve, **kwargs):
+        others = self._intersect_many_others()
+        partner_indices, st_vals = curve.intersect_many(others, **kwargs)
+        self.assertEqual(partner_indices.dtype, np.intc)
+        self.assertEqual(partner_indices.tolist(), [0, 0, 3])
+        expected = np.asfortranarray([[0.25, 0.75, 0.5], [0.25, 0.75, 0.5]])
+        self.assertEqual(st_vals, expected)
+
+    def test_intersect_many(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        self._check_intersect_many(curve)
+        self._check_intersect_many(curve, _verify=False)
+
+    def test_intersect_many_algebraic(self):
+        from bezier.hazmat import intersection_helpers
+
+        strategy = intersection_helpers.IntersectionStrategy.ALGEBRAIC
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        self.assertIsNone(curve._implicit_curve)
+        self._check_intersect_many(curve, strategy=strategy)
+        implicit = curve._implicit_curve
+        self.assertIsNotNone(implicit)
+        # The implicit form is re-used.
+        self._check_intersect_many(curve, strategy=strategy)
+        self.assertIs(curve._implicit_curve, implicit)
+
+    def test_intersect_many_algebraic_one_partner_fails(self):
+        from bezier.hazmat import intersection_helpers
+
+        strategy = intersection_helpers.IntersectionStrategy.ALGEBRAIC
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        others = [
+            self._make_one(np.asfortranarray([[0.5, 0.5], [0.0, 1.0]]), 1),
+            # Tangent to ``curve`` at s = 1/2.
+            self._make_one(np.asfortranarray([[0.0, 1.0], [0.5, 0.5]]), 1),
+        ]
+        with self.assertRaises(NotImplementedError):
+            curve.intersect_many(others, strategy=strategy)
+
+    def test_intersect_many_clipping(self):
+        from bezier.hazmat import intersection_helpers
+
+        strategy = intersection_helpers.IntersectionStrategy.CLIPPING
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        self._check_intersect_many(curve, strategy=strategy)
+
+    def test_intersect_many_bad_strategy(self):
+        curve = self._make_one(self.ZEROS, 1)
+        strategy = unittest.mock.sentinel.bad_strategy
+        with self.assertRaises(ValueError) as exc_info:
+            curve.intersect_many([curve], strategy=strategy)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Unexpected strategy.", strategy))
+
+    def test_intersect_many_no_partners(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        others = self._intersect_many_others()[1:2]
+        for partners in ([], others):
+            partner_indices, st_vals = curve.intersect_many(partners)
+            self.assertEqual(partner_indices.shape, (0,))
+            self.assertEqual(partner_indices.dtype, np.intc)
+            self.assertEqual(st_vals.shape, (2, 0))
+
+    def test_intersect_many_non_curve(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(TypeError):
+            curve.intersect_many([curve, object()])
+
+    def test_intersect_many_unsupported_dimension(self):
+        nodes = np.asfortranarray(
+            [[0.0, 0.5, 1.0], [0.0, -0.25, 0.0], [0.0, 0.75, 1.25]]
+        )
+        curve1 = self._make_one(nodes, 2)
+        curve2 = self._make_one(nodes[:2, :], 2)
+        with self.assertRaises(NotImplementedError):
+            curve1.intersect_many([curve2])
+        with self.assertRaises(NotImplementedError):
+            curve2.intersect_many([curve1])
+
     def test_elevate(self):
         nodes = np.asfortranarray([[0.0, 1.0, 3.0, 3.5], [0.5, 1.0, 2.0, 4.0]])
         curve = self._make_one(nodes, 3)
@@ -306,6 +714,48 @@ class TestCurve(utils.NumPyTestCase):
         )
         self.assertEqual(new_curve.nodes, expected)
 
+    def test_split_at(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 3.0, 4.0], [0.0, 2.0, -1.0, 1.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        pieces = curve.split_at([0.75, 0.125, 0.5])
+        self.assertEqual(pieces.shape, (2, 4, 4))
+        self.assertTrue(pieces.flags.f_contiguous)
+        breaks = [0.0, 0.125, 0.5, 0.75, 1.0]
+        for index, (start, end) in enumerate(zip(breaks[:-1], breaks[1:])):
+            expected = curve.specialize(start, end).nodes
+            self.assertEqual(pieces[:, :, index], expected)
+
+    def test_split_at_as_curves(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        left, right = curve.split_at([0.5], as_curves=True)
+        expected_left, expected_right = curve.subdivide()
+        self.assertEqual(left.degree, 2)
+        self.assertEqual(left.nodes, expected_left.nodes)
+        self.assertEqual(right.nodes, expected_right.nodes)
+
+    def test_split_at_no_params(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        pieces = curve.split_at([])
+        self.assertEqual(pieces[:, :, 0], nodes)
+
+    def test_split_at_invalid(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            curve.split_at([[0.5]])
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Parameters must be 1D array", (1, 1)))
+        with self.assertRaises(ValueError) as exc_info:
+            curve.split_at([0.5, 1.25])
+        exc_args = exc_info.exception.args
+        self.assertEqual(len(exc_args), 2)
+        self.assertEqual(
+            exc_args[0], "Parameters must be in the unit interval"
+        )
+
     def test_locate_wrong_shape(self):
         nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
         curve = self._make_one(nodes, 1)
@@ -323,6 +773,84 @@ class TestCurve(utils.NumPyTestCase):
         result = curve.locate(point)
         self.assertEqual(result, s_val)
 
+    def test_locate_cached_derivatives(self):
+        from bezier import _curve_helpers
+        from bezier.hazmat import curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 5.0], [0.0, 1.0, -1.0, 1.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        point = curve.evaluate(0.75)
+        for cached in (True, False):
+            curve._hodographs = None
+            locate_point = unittest.mock.Mock(wraps=curve_helpers.locate_point)
+            patch1 = unittest.mock.patch.object(
+                _curve_helpers, "CACHED_DERIVATIVES", new=cached
+            )
+            patch2 = unittest.mock.patch.object(
+                curve_helpers, "locate_point", new=locate_point
+            )
+            patch3 = unittest.mock.patch.object(
+                _curve_helpers, "locate_point", new=locate_point
+            )
+            with patch1, patch2, patch3:
+                self.assertEqual(curve.locate(point), 0.75)
+            locate_point.assert_called_once()
+            if cached:
+                first_deriv, _ = curve._hodographs
+                self.assertIs(
+                    locate_point.call_args[1]["first_deriv"], first_deriv
+                )
+            else:
+                self.assertEqual(locate_point.call_args[1], {})
+                self.assertIsNone(curve._hodographs)
+
+    def test_locate_multi_wrong_shape(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve = self._make_one(nodes, 1)
+        for points in (
+            np.asfortranarray([0.0, 1.0]),
+            np.asfortranarray([[0.0, 1.0, 2.0]]),
+        ):
+            with self.assertRaises(ValueError):
+                curve.locate_multi(points)
+
+    def test_locate_multi(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 5.0], [0.0, 1.0, -1.0, 1.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        s_vals = np.asfortranarray([0.25, 0.75])
+        points = np.asfortranarray(
+            np.hstack(
+                [
+                    curve.evaluate_multi(s_vals),
+                    np.asfortranarray([[5.0], [5.0]]),
+                ]
+            )
+        )
+        result = curve.locate_multi(points)
+        self.assertEqual(result[:2], s_vals)
+        self.assertTrue(np.isnan(result[2]))
+
+    def test_project_wrong_shape(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve = self._make_one(nodes, 1)
+        points = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            curve.project(points)
+
+    def test_project(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        points = np.asfortranarray([[1.0, 1.0, 3.0], [2.0, 0.5, 0.0]])
+        s_vals, projected, distances = curve.project(points)
+        self.assertEqual(s_vals.tolist(), [0.5, 0.5, 1.0])
+        expected = np.asfortranarray([[1.0, 1.0, 2.0], [1.0, 1.0, 0.0]])
+        self.assertEqual(projected, expected)
+        self.assertEqual(distances.tolist(), [1.0, 0.5, 1.0])
+
     @unittest.skipIf(sympy is None, "SymPy not installed")
     def test_to_symbolic(self):
         nodes = np.asfortranarray([[3, 3, 4, 6], [3, 3, 3, 0]])
@@ -368,3 +896,64 @@ class TestCurve(utils.NumPyTestCase):
                 1,
             ),
         )
+
+
+class Test_intersect_curve_pairs(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(*args):
+        from bezier import curve
+
+        return curve.intersect_curve_pairs(*args)
+
+    def test_it(self):
+        nodes_first = [
+            [0.0, 0.375, 0.75, 0.0, 2.0],
+            [0.0, 0.75, 0.375, 0.0, 2.0],
+        ]
+        nodes_second = [[0.5, 0.5, -1.0, 1.0], [0.0, 0.75, 2.0, 0.0]]
+        pair_indices, st_vals, coincident = self._call_function_under_test(
+            nodes_first, [0, 3, 5], nodes_second, [0, 2, 4]
+        )
+        expected_indices = np.asarray([0, 1], dtype=np.intc)
+        self.assertEqual(pair_indices, expected_indices)
+        expected = np.asfortranarray([[8.0, 3.0], [8.0, 9.0]])
+        self.assertTrue(np.allclose(12.0 * st_vals, expected))
+        self.assertEqual(coincident, np.asarray([False, False]))
+
+    def test_matches_intersect(self):
+        from bezier import curve
+
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 0.5, 1.0], [0.75, -0.25, 0.75]])
+        expected = curve.Curve(nodes1, 2).intersect(curve.Curve(nodes2, 2))
+        pair_indices, st_vals, _ = self._call_function_under_test(
+            np.hstack([nodes1, nodes2]),
+            [0, 3, 6],
+            np.hstack([nodes2, nodes1]),
+            [0, 3, 6],
+        )
+        expected_indices = np.asarray([0, 0, 1, 1], dtype=np.intc)
+        self.assertEqual(pair_indices, expected_indices)
+        self.assertEqual(st_vals[:, :2], expected)
+        self.assertEqual(st_vals[:, 2:], np.asfortranarray(expected[::-1, :]))
+
+    def test_unsupported_dimension(self):
+        nodes = np.zeros((3, 2), order="F")
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(nodes, [0, 2], nodes, [0, 2])
+
+    def test_bad_offsets(self):
+        nodes = np.zeros((2, 4), order="F")
+        for offsets in ([0, 4, 4], [1, 4], [0, 3], [[0, 4]], []):
+            with self.assertRaises(ValueError):
+                self._call_function_under_test(
+                    nodes, offsets, nodes, [0, 2, 4]
+                )
+
+    def test_mismatched_pairs(self):
+        nodes = np.zeros((2, 4), order="F")
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, [0, 4], nodes, [0, 2, 4])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Mismatched number of curves", 1, 2))
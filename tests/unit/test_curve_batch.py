@@ -0,0 +1,224 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestCurveBatch(utils.NumPyTestCase):
+    NODES0 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+    NODES1 = np.asfortranarray([[1.0, 1.0, 3.0], [1.0, 2.0, 1.0]])
+    NODES2 = np.asfortranarray([[-1.0, 2.0, 0.0], [4.0, 0.0, 3.0]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve_batch
+
+        return curve_batch.CurveBatch
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_default(self):
+        nodes = np.stack([self.NODES0, self.NODES1, self.NODES2], axis=2)
+        return self._make_one(nodes)
+
+    def _make_curves(self):
+        import bezier
+
+        return [
+            bezier.Curve(self.NODES0, 2),
+            bezier.Curve(self.NODES1, 2),
+            bezier.Curve(self.NODES2, 2),
+        ]
+
+    def test_constructor(self):
+        nodes = np.stack([self.NODES0, self.NODES1], axis=2)
+        batch = self._make_one(nodes)
+        self.assertEqual(batch.degree, 2)
+        self.assertEqual(batch.dimension, 2)
+        self.assertEqual(batch.num_curves, 2)
+        self.assertEqual(len(batch), 2)
+        self.assertTrue(batch._nodes.flags.f_contiguous)
+        self.assertIsNot(batch._nodes, nodes)
+        self.assertEqual(batch._nodes.tolist(), nodes.tolist())
+
+    def test_constructor_no_copy(self):
+        nodes = np.zeros((3, 2, 4), order="F")
+        batch = self._make_one(nodes, copy=False)
+        self.assertIs(batch._nodes, nodes)
+        self.assertEqual(batch.degree, 1)
+        self.assertEqual(batch.dimension, 3)
+
+    def test_constructor_integer_nodes(self):
+        nodes = [[[0, 1], [2, 3]]]
+        batch = self._make_one(nodes)
+        self.assertEqual(batch._nodes.dtype, np.float64)
+        self.assertEqual(batch._nodes.tolist(), [[[0.0, 1.0], [2.0, 3.0]]])
+
+    def test_constructor_wrong_dimension(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(self.NODES0)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Nodes must be 3-dimensional, not", 2))
+
+    def test_from_curves(self):
+        klass = self._get_target_class()
+        curves = self._make_curves()
+        batch = klass.from_curves(curves)
+        self.assertIsInstance(batch, klass)
+        self.assertEqual(batch.num_curves, 3)
+        for index, item in enumerate(curves):
+            self.assertEqual(batch[index].nodes, item.nodes)
+
+    def test_from_curves_empty(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError):
+            klass.from_curves([])
+
+    def test_from_curves_non_curve(self):
+        klass = self._get_target_class()
+        with self.assertRaises(TypeError) as exc_info:
+            klass.from_curves([self.NODES0])
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args[:2], ("Batches can only contain curves", "Received")
+        )
+
+    def test_from_curves_mismatch(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curves = [
+            bezier.Curve(self.NODES0, 2),
+            bezier.Curve.from_nodes([[0.0, 1.0], [0.0, 1.0]]),
+        ]
+        with self.assertRaises(ValueError) as exc_info:
+            klass.from_curves(curves)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args[1:], ((2, 3), (2, 2)))
+
+    def test_nodes_property(self):
+        batch = self._make_default()
+        nodes = batch.nodes
+        self.assertIsNot(nodes, batch._nodes)
+        self.assertTrue(nodes.flags.f_contiguous)
+        self.assertEqual(nodes.tolist(), batch._nodes.tolist())
+
+    def test___dict___property(self):
+        batch = self._make_default()
+        props_dict = batch.__dict__
+        expected = {
+            "_dimension": 2,
+            "_degree": 2,
+            "_nodes": batch._nodes,
+        }
+        self.assertEqual(props_dict, expected)
+        # Check that modifying ``props_dict`` won't modify ``batch``.
+        props_dict["_degree"] = 3
+        self.assertEqual(batch.degree, 2)
+
+    def test___getitem__(self):
+        import bezier
+
+        batch = self._make_default()
+        item = batch[1]
+        self.assertIsInstance(item, bezier.Curve)
+        self.assertEqual(item.degree, 2)
+        self.assertEqual(item.nodes, self.NODES1)
+        # The curve is a view on the nodes in the batch.
+        self.assertTrue(np.shares_memory(item._nodes, batch._nodes))
+        item._nodes[0, 0] = 7.0
+        self.assertEqual(batch._nodes[0, 0, 1], 7.0)
+        self.assertEqual(batch[-1].nodes, self.NODES2)
+
+    def test_evaluate_multi(self):
+        batch = self._make_default()
+        s_vals = np.asfortranarray([0.0, 0.25, 0.75, 1.0])
+        result = batch.evaluate_multi(s_vals)
+        self.assertEqual(result.shape, (2, 4, 3))
+        self.assertTrue(result.flags.f_contiguous)
+        for index, item in enumerate(self._make_curves()):
+            expected = item.evaluate_multi(s_vals)
+            self.assertEqual(result[:, :, index], expected)
+
+    def test_evaluate_hodograph(self):
+        batch = self._make_default()
+        result = batch.evaluate_hodograph(0.25)
+        self.assertEqual(result.shape, (2, 3))
+        for index, item in enumerate(self._make_curves()):
+            expected = item.evaluate_hodograph(0.25)
+            self.assertEqual(result[:, [index]], expected)
+
+    def test_evaluate_hodograph_constant(self):
+        nodes = np.ones((3, 1, 2), order="F")
+        batch = self._make_one(nodes)
+        result = batch.evaluate_hodograph(0.5)
+        expected = np.zeros((3, 2), order="F")
+        self.assertEqual(result, expected)
+
+    def test_lengths(self):
+        batch = self._make_default()
+        result = batch.lengths()
+        # NOTE: ``Curve.length`` may use QUADPACK (if the Fortran speedup
+        #       is available), which has a larger tolerance.
+        expected = [item.length for item in self._make_curves()]
+        self.assertTrue(
+            np.allclose(result, expected, atol=0.0, rtol=0.5 ** 26)
+        )
+
+    def test_subdivide(self):
+        batch = self._make_default()
+        left, right = batch.subdivide()
+        self.assertEqual(left.degree, 2)
+        self.assertEqual(right.num_curves, 3)
+        for index, item in enumerate(self._make_curves()):
+            expected_left, expected_right = item.subdivide()
+            self.assertEqual(left[index].nodes, expected_left.nodes)
+            self.assertEqual(right[index].nodes, expected_right.nodes)
+
+    def test_subdivide_high_degree(self):
+        nodes = np.arange(24, dtype=np.float64).reshape((2, 6, 2), order="F")
+        batch = self._make_one(nodes)
+        left, _ = batch.subdivide()
+        for index in range(2):
+            expected, _ = batch[index].subdivide()
+            self.assertEqual(left[index].nodes, expected.nodes)
+
+    def test_specialize(self):
+        batch = self._make_default()
+        result = batch.specialize(-0.25, 0.75)
+        for index, item in enumerate(self._make_curves()):
+            expected = item.specialize(-0.25, 0.75)
+            self.assertTrue(
+                np.allclose(
+                    result[index].nodes,
+                    expected.nodes,
+                    rtol=0.0,
+                    atol=0.5 ** 50,
+                )
+            )
+
+    def test_elevate(self):
+        batch = self._make_default()
+        result = batch.elevate()
+        self.assertEqual(result.degree, 3)
+        for index, item in enumerate(self._make_curves()):
+            expected = item.elevate()
+            self.assertEqual(result[index].nodes, expected.nodes)
+
+    def test___repr__(self):
+        batch = self._make_default()
+        expected = "<CurveBatch (num_curves=3, degree=2, dimension=2)>"
+        self.assertEqual(repr(batch), expected)
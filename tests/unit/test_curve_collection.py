@@ -0,0 +1,263 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestCurveCollection(utils.NumPyTestCase):
+    NODES0 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+    NODES1 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+    NODES2 = np.asfortranarray([[3.0, 4.0, 5.0], [0.0, 1.0, 0.0]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve_collection
+
+        return curve_collection.CurveCollection
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_default(self):
+        import bezier
+
+        return self._make_one(
+            [
+                bezier.Curve(self.NODES0, 1),
+                bezier.Curve(self.NODES1, 1),
+                bezier.Curve(self.NODES2, 2),
+            ]
+        )
+
+    def test_constructor(self):
+        collection = self._make_default()
+        self.assertEqual(collection.num_curves, 3)
+        expected_nodes = np.asfortranarray(
+            [
+                [0.0, 1.0, 0.0, 1.0, 3.0, 4.0, 5.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0],
+            ]
+        )
+        self.assertEqual(collection._nodes, expected_nodes)
+        expected_offsets = np.asarray([0, 2, 4, 7], dtype=np.intc)
+        self.assertEqual(collection._offsets, expected_offsets)
+        expected_boxes = np.asfortranarray(
+            [
+                [0.0, 0.0, 3.0],
+                [1.0, 1.0, 5.0],
+                [0.0, 0.0, 0.0],
+                [1.0, 1.0, 1.0],
+            ]
+        )
+        self.assertEqual(collection._boxes, expected_boxes)
+
+    def test_constructor_empty(self):
+        collection = self._make_one([])
+        self.assertEqual(collection.num_curves, 0)
+        self.assertEqual(collection._nodes.shape, (2, 0))
+        self.assertEqual(collection._boxes.shape, (4, 0))
+        curve_indices, st_vals, coincident = collection.self_intersections()
+        self.assertEqual(curve_indices.shape, (2, 0))
+        self.assertEqual(st_vals.shape, (2, 0))
+        self.assertEqual(coincident.shape, (0,))
+
+    def test_constructor_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self._make_one([self.NODES0])
+
+    def test_constructor_wrong_dimension(self):
+        import bezier
+
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]])
+        curve = bezier.Curve(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            self._make_one([curve])
+
+    def test_curves_property(self):
+        collection = self._make_default()
+        curves = collection.curves
+        self.assertIsInstance(curves, tuple)
+        self.assertEqual(len(curves), 3)
+        self.assertEqual(curves[2].nodes, self.NODES2)
+
+    def test___dict___property(self):
+        collection = self._make_default()
+        props_dict = collection.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()),
+            ["_boxes", "_curves", "_nodes", "_offsets"],
+        )
+        self.assertIs(props_dict["_curves"], collection._curves)
+        # Check that modifying ``props_dict`` won't modify ``collection``.
+        props_dict["_curves"] = ()
+        self.assertNotEqual(collection._curves, props_dict["_curves"])
+
+    def test_self_intersections(self):
+        collection = self._make_default()
+        curve_indices, st_vals, coincident = collection.self_intersections()
+        expected_indices = np.asfortranarray([[0], [1]], dtype=np.intc)
+        self.assertEqual(curve_indices, expected_indices)
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(coincident, np.asarray([False]))
+
+    def test_self_intersections_shared_endpoints(self):
+        import bezier
+
+        # A closed "triangle" made of three lines, plus a disjoint line.
+        nodes = [
+            np.asfortranarray([[0.0, 1.0], [0.0, 0.0]]),
+            np.asfortranarray([[1.0, 0.0], [0.0, 1.0]]),
+            np.asfortranarray([[0.0, 0.0], [1.0, 0.0]]),
+            np.asfortranarray([[5.0, 6.0], [5.0, 6.0]]),
+        ]
+        collection = self._make_one(
+            [bezier.Curve(value, 1) for value in nodes]
+        )
+        curve_indices, st_vals, coincident = collection.self_intersections()
+        expected_indices = np.asfortranarray(
+            [[0, 0, 1], [1, 2, 2]], dtype=np.intc
+        )
+        self.assertEqual(curve_indices, expected_indices)
+        expected = np.asfortranarray([[1.0, 0.0, 1.0], [0.0, 1.0, 0.0]])
+        self.assertEqual(st_vals, expected)
+        self.assertFalse(np.any(coincident))
+
+    def test_self_intersections_matches_intersect(self):
+        import bezier
+
+        rng = np.random.RandomState(seed=314)
+        curves = [
+            bezier.Curve(rng.random_sample((2, 3)) * 4.0 + index % 5, 2)
+            for index in range(20)
+        ]
+        collection = self._make_one(curves)
+        curve_indices, st_vals, coincident = collection.self_intersections()
+        expected_pairs = []
+        for index1, curve1 in enumerate(curves):
+            for index2 in range(index1 + 1, len(curves)):
+                intersections = curve1.intersect(curves[index2])
+                expected_pairs.extend(
+                    [(index1, index2)] * intersections.shape[1]
+                )
+        self.assertEqual(list(zip(*curve_indices)), expected_pairs)
+        self.assertFalse(np.any(coincident))
+        for (index1, index2), (s_val, t_val) in zip(
+            curve_indices.T, st_vals.T
+        ):
+            self.assertTrue(
+                np.allclose(
+                    curves[index1].evaluate(s_val),
+                    curves[index2].evaluate(t_val),
+                )
+            )
+
+    def test___repr__(self):
+        collection = self._make_default()
+        self.assertEqual(repr(collection), "<CurveCollection (num_curves=3)>")
+
+
+class Test__packed_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, offsets, indices):
+        from bezier import curve_collection
+
+        return curve_collection._packed_nodes(nodes, offsets, indices)
+
+    def test_it(self):
+        nodes = np.asfortranarray(
+            [
+                [0.0, 1.0, 0.0, 1.0, 3.0, 4.0, 5.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0],
+            ]
+        )
+        offsets = np.asarray([0, 2, 4, 7], dtype=np.intc)
+        indices = np.asarray([2, 0, 2], dtype=np.intc)
+        nodes, offsets = self._call_function_under_test(
+            nodes, offsets, indices
+        )
+        expected_nodes = np.asfortranarray(
+            [
+                [3.0, 4.0, 5.0, 0.0, 1.0, 3.0, 4.0, 5.0],
+                [0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0],
+            ]
+        )
+        self.assertEqual(nodes, expected_nodes)
+        expected_offsets = np.asarray([0, 3, 5, 8], dtype=np.intc)
+        self.assertEqual(offsets, expected_offsets)
+
+
+class Test_intersect_collections(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(collection1, collection2):
+        from bezier import curve_collection
+
+        return curve_collection.intersect_collections(collection1, collection2)
+
+    def test_it(self):
+        import bezier
+
+        nodes1 = np.asfortranarray([[0.0, 0.375, 0.75], [0.0, 0.75, 0.375]])
+        nodes2 = np.asfortranarray([[4.0, 5.0], [0.0, 1.0]])
+        nodes3 = np.asfortranarray([[0.5, 0.5], [0.0, 0.75]])
+        nodes4 = np.asfortranarray([[4.0, 5.0], [1.0, 0.0]])
+        collection1 = bezier.CurveCollection(
+            [bezier.Curve(nodes1, 2), bezier.Curve(nodes2, 1)]
+        )
+        collection2 = bezier.CurveCollection(
+            [
+                bezier.Curve(nodes4, 1),
+                bezier.Curve(nodes3, 1),
+                bezier.Curve(nodes1, 2),
+            ]
+        )
+        curve_indices, st_vals, coincident = self._call_function_under_test(
+            collection1, collection2
+        )
+        expected_indices = np.asfortranarray(
+            [[0, 0, 0, 1], [1, 2, 2, 0]], dtype=np.intc
+        )
+        self.assertEqual(curve_indices, expected_indices)
+        self.assertTrue(np.allclose(st_vals[:, 0], [2.0 / 3.0, 2.0 / 3.0]))
+        expected = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        self.assertEqual(st_vals[:, 1:3], expected)
+        self.assertEqual(st_vals[:, 3], np.asarray([0.5, 0.5]))
+        # The first curve in each collection is the same.
+        self.assertEqual(coincident, np.asarray([False, True, True, False]))
+
+    def test_disjoint(self):
+        import bezier
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[2.0, 3.0], [0.0, 1.0]])
+        collection1 = bezier.CurveCollection([bezier.Curve(nodes1, 1)])
+        collection2 = bezier.CurveCollection([bezier.Curve(nodes2, 1)])
+        curve_indices, st_vals, coincident = self._call_function_under_test(
+            collection1, collection2
+        )
+        self.assertEqual(
+            curve_indices, np.empty((2, 0), dtype=np.intc, order="F")
+        )
+        self.assertEqual(st_vals, np.empty((2, 0), order="F"))
+        self.assertEqual(coincident, np.empty(0, dtype=bool))
+
+    def test_wrong_type(self):
+        import bezier
+
+        collection = bezier.CurveCollection([])
+        with self.assertRaises(TypeError):
+            self._call_function_under_test(collection, None)
+        with self.assertRaises(TypeError):
+            self._call_function_under_test([], collection)
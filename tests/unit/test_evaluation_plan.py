@@ -0,0 +1,223 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestEvaluationPlan(utils.NumPyTestCase):
+    NODES = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+    S_VALS = np.asfortranarray([0.0, 0.25, 0.5, 1.0])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import evaluation_plan
+
+        return evaluation_plan.EvaluationPlan
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        plan = self._make_one(2, [0.0, 0.5, 1.0])
+        self.assertEqual(plan.degree, 2)
+        self.assertEqual(plan.num_vals, 3)
+        self.assertEqual(plan.s_vals, np.asfortranarray([0.0, 0.5, 1.0]))
+        expected = np.asfortranarray(
+            [[1.0, 0.25, 0.0], [0.0, 0.5, 0.0], [0.0, 0.25, 1.0]]
+        )
+        self.assertEqual(plan.basis, expected)
+        self.assertFalse(plan.s_vals.flags.writeable)
+        self.assertFalse(plan.basis.flags.writeable)
+
+    def test_constructor_copies(self):
+        s_vals = np.asfortranarray([0.5])
+        plan = self._make_one(1, s_vals)
+        self.assertIsNot(plan.s_vals, s_vals)
+        self.assertTrue(s_vals.flags.writeable)
+
+    def test_constructor_bad_s_vals(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(1, [[0.5]])
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Parameter values must be 1D array",))
+
+    def test___dict___property(self):
+        plan = self._make_one(1, [0.5])
+        props_dict = plan.__dict__
+        expected = {
+            "_degree": 1,
+            "_s_vals": plan._s_vals,
+            "_basis": plan._basis,
+        }
+        self.assertEqual(props_dict, expected)
+        # Check that modifying ``props_dict`` won't modify ``plan``.
+        props_dict["_degree"] = 2
+        self.assertEqual(plan.degree, 1)
+
+    def test_evaluate(self):
+        import bezier
+
+        curve = bezier.Curve(self.NODES, 2)
+        plan = self._make_one(2, self.S_VALS)
+        result = plan.evaluate(curve)
+        self.assertTrue(result.flags.f_contiguous)
+        self.assertEqual(result, curve.evaluate_multi(self.S_VALS))
+
+    def test_evaluate_bad_degree(self):
+        import bezier
+
+        curve = bezier.Curve(self.NODES, 2)
+        plan = self._make_one(3, self.S_VALS)
+        with self.assertRaises(ValueError) as exc_info:
+            plan.evaluate(curve)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Degree does not match plan", 2, 3))
+
+    def test_evaluate_batch(self):
+        import bezier
+
+        nodes = np.stack(
+            [self.NODES, 2.0 * self.NODES, self.NODES[::-1, :]], axis=2
+        )
+        batch = bezier.CurveBatch(nodes)
+        plan = self._make_one(2, self.S_VALS)
+        result = plan.evaluate_batch(batch)
+        self.assertEqual(result.shape, (2, 4, 3))
+        self.assertTrue(result.flags.f_contiguous)
+        expected = batch.evaluate_multi(self.S_VALS)
+        self.assertTrue(
+            np.allclose(result, expected, atol=0.0, rtol=0.5 ** 50)
+        )
+
+    def test_evaluate_batch_bad_degree(self):
+        import bezier
+
+        batch = bezier.CurveBatch(np.zeros((2, 2, 5), order="F"))
+        plan = self._make_one(2, self.S_VALS)
+        with self.assertRaises(ValueError):
+            plan.evaluate_batch(batch)
+
+    def test___repr__(self):
+        plan = self._make_one(4, self.S_VALS)
+        expected = "<EvaluationPlan (degree=4, num_vals=4)>"
+        self.assertEqual(repr(plan), expected)
+
+
+class TestTriangleEvaluationPlan(utils.NumPyTestCase):
+    NODES = np.asfortranarray(
+        [
+            [0.0, 0.5, 1.0, 0.125, 0.375, 0.25],
+            [0.0, 0.0, 0.25, 0.5, 0.375, 1.0],
+        ]
+    )
+    PARAM_VALS = np.asfortranarray(
+        [[0.0, 0.0], [0.25, 0.5], [0.5, 0.125], [0.0, 1.0]]
+    )
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import evaluation_plan
+
+        return evaluation_plan.TriangleEvaluationPlan
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        plan = self._make_one(1, [[0.25, 0.5]])
+        self.assertEqual(plan.degree, 1)
+        self.assertEqual(plan.num_vals, 1)
+        self.assertEqual(plan.param_vals, np.asfortranarray([[0.25, 0.5]]))
+        expected = np.asfortranarray([[0.25], [0.25], [0.5]])
+        self.assertEqual(plan.basis, expected)
+        self.assertFalse(plan.param_vals.flags.writeable)
+        self.assertFalse(plan.basis.flags.writeable)
+
+    def test_constructor_bad_param_vals(self):
+        for param_vals in ([0.25, 0.5], [[0.25, 0.5, 0.25]]):
+            with self.assertRaises(ValueError) as exc_info:
+                self._make_one(1, param_vals)
+            exc_args = exc_info.exception.args
+            self.assertEqual(
+                exc_args, ("Parameter values must be N x 2 array",)
+            )
+
+    def test___dict___property(self):
+        plan = self._make_one(1, [[0.25, 0.5]])
+        props_dict = plan.__dict__
+        expected = {
+            "_degree": 1,
+            "_param_vals": plan._param_vals,
+            "_basis": plan._basis,
+        }
+        self.assertEqual(props_dict, expected)
+        # Check that modifying ``props_dict`` won't modify ``plan``.
+        props_dict["_degree"] = 2
+        self.assertEqual(plan.degree, 1)
+
+    def test_evaluate(self):
+        import bezier
+
+        triangle = bezier.Triangle(self.NODES, 2)
+        plan = self._make_one(2, self.PARAM_VALS)
+        result = plan.evaluate(triangle)
+        self.assertTrue(result.flags.f_contiguous)
+        expected = triangle.evaluate_cartesian_multi(self.PARAM_VALS)
+        self.assertTrue(
+            np.allclose(result, expected, atol=0.5 ** 52, rtol=0.0)
+        )
+
+    def test_evaluate_bad_degree(self):
+        import bezier
+
+        triangle = bezier.Triangle(self.NODES, 2)
+        plan = self._make_one(1, self.PARAM_VALS)
+        with self.assertRaises(ValueError) as exc_info:
+            plan.evaluate(triangle)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Degree does not match plan", 2, 1))
+
+    def test_evaluate_many(self):
+        import bezier
+
+        triangle1 = bezier.Triangle(self.NODES, 2)
+        triangle2 = bezier.Triangle(self.NODES[[1], :], 2)
+        plan = self._make_one(2, self.PARAM_VALS)
+        result = plan.evaluate_many([triangle1, triangle2, triangle1])
+        self.assertEqual(len(result), 3)
+        for points, triangle in zip(result, [triangle1, triangle2, triangle1]):
+            self.assertTrue(points.flags.f_contiguous)
+            expected = triangle.evaluate_cartesian_multi(self.PARAM_VALS)
+            self.assertTrue(
+                np.allclose(points, expected, atol=0.5 ** 52, rtol=0.0)
+            )
+
+    def test_evaluate_many_empty(self):
+        plan = self._make_one(2, self.PARAM_VALS)
+        self.assertEqual(plan.evaluate_many([]), [])
+
+    def test_evaluate_many_bad_degree(self):
+        import bezier
+
+        triangle = bezier.Triangle(self.NODES, 2)
+        plan = self._make_one(3, self.PARAM_VALS)
+        with self.assertRaises(ValueError):
+            plan.evaluate_many([triangle])
+
+    def test___repr__(self):
+        plan = self._make_one(2, self.PARAM_VALS)
+        expected = "<TriangleEvaluationPlan (degree=2, num_vals=4)>"
+        self.assertEqual(repr(plan), expected)
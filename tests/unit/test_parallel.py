@@ -0,0 +1,435 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import unittest.mock
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class Test__pack_batch(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(pairs):
+        from bezier import parallel
+
+        return parallel._pack_batch(pairs)
+
+    def test_it(self):
+        import bezier
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, 0.0, 1.0]])
+        curve1 = bezier.Curve(nodes1, 1)
+        curve2 = bezier.Curve(nodes2, 2)
+        result = self._call_function_under_test(
+            [(curve1, curve2), (curve2, curve1)]
+        )
+        nodes_first, offsets_first, nodes_second, offsets_second = result
+        self.assertEqual(nodes_first, np.hstack([nodes1, nodes2]))
+        self.assertTrue(nodes_first.flags.f_contiguous)
+        self.assertEqual(offsets_first, np.asarray([0, 2, 5], dtype=np.intc))
+        self.assertEqual(nodes_second, np.hstack([nodes2, nodes1]))
+        self.assertEqual(offsets_second, np.asarray([0, 3, 5], dtype=np.intc))
+
+
+class Test__intersect_batch(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(pairs):
+        from bezier import parallel
+
+        return parallel._intersect_batch(pairs)
+
+    def test_it(self):
+        import bezier
+
+        line = bezier.Curve(np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]]), 1)
+        cubic = bezier.Curve(
+            np.asfortranarray(
+                [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+            ),
+            3,
+        )
+        far_line = bezier.Curve(
+            np.asfortranarray([[-3.0, 5.0], [50.0, 50.0]]), 1
+        )
+        result = self._call_function_under_test(
+            [(line, cubic), (far_line, cubic), (cubic, line)]
+        )
+        self.assertEqual(len(result), 3)
+        expected = np.asfortranarray([[0.5, 0.375, 0.625], [0.5, 0.25, 0.75]])
+        self.assertEqual(result[0], expected)
+        self.assertEqual(result[1].shape, (2, 0))
+        self.assertEqual(result[2], np.asfortranarray(expected[::-1, :]))
+
+
+class Test_map_intersections(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(pairs, **kwargs):
+        from bezier import parallel
+
+        return parallel.map_intersections(pairs, **kwargs)
+
+    def test_empty(self):
+        self.assertEqual(self._call_function_under_test([]), [])
+
+    def test_matches_intersect(self):
+        import bezier
+
+        rng = np.random.RandomState(seed=217)
+        curves = [
+            bezier.Curve(rng.random_sample((2, 3)), 2) for _ in range(12)
+        ]
+        pairs = [
+            (curves[index1], curves[index2])
+            for index1 in range(len(curves))
+            for index2 in range(index1 + 1, len(curves))
+        ]
+        result = self._call_function_under_test(iter(pairs), max_workers=3)
+        self.assertEqual(len(result), len(pairs))
+        for (curve1, curve2), st_vals in zip(pairs, result):
+            self.assertEqual(st_vals, curve1.intersect(curve2))
+
+    def test_default_workers(self):
+        import bezier
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        pair = (bezier.Curve(nodes1, 1), bezier.Curve(nodes2, 1))
+        patch = unittest.mock.patch("os.cpu_count", return_value=None)
+        with patch as cpu_count:
+            result = self._call_function_under_test([pair, pair[::-1]])
+        cpu_count.assert_called_once_with()
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0], expected)
+        self.assertEqual(result[1], expected)
+
+    def test_bad_max_workers(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test([], max_workers=0)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("max_workers must be positive", 0))
+
+    def test_not_pair(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([[0.0, 1.0], [0.0, 1.0]]), 1)
+        with self.assertRaises(TypeError):
+            self._call_function_under_test([(curve, curve, curve)])
+
+    def test_non_curve(self):
+        import bezier
+
+        curve = bezier.Curve(np.asfortranarray([[0.0, 1.0], [0.0, 1.0]]), 1)
+        with self.assertRaises(TypeError):
+            self._call_function_under_test([(curve, object())])
+
+    def test_unsupported_dimension(self):
+        import bezier
+
+        curve1 = bezier.Curve(
+            np.asfortranarray([[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]]), 1
+        )
+        curve2 = bezier.Curve(np.asfortranarray([[0.0, 1.0], [0.0, 1.0]]), 1)
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test([(curve2, curve1)])
+
+    def test_bad_backend(self):
+        backend = unittest.mock.sentinel.bad_backend
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test([], backend=backend)
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Unexpected backend.", backend))
+
+    def test_process_backend(self):
+        from bezier import parallel
+
+        curves = _random_curves(8)
+        pairs = [
+            (curves[index1], curves[index2])
+            for index1 in range(len(curves))
+            for index2 in range(index1, len(curves))
+        ]
+        result = self._call_function_under_test(
+            pairs, max_workers=2, backend=parallel.Backend.PROCESS
+        )
+        self.assertEqual(len(result), len(pairs))
+        for (curve1, curve2), st_vals in zip(pairs, result):
+            self.assertEqual(st_vals, curve1.intersect(curve2))
+
+
+class Test_map_triangle_intersections(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(pairs, **kwargs):
+        from bezier import parallel
+
+        return parallel.map_triangle_intersections(pairs, **kwargs)
+
+    def _check_result(self, pairs, result):
+        import bezier
+
+        self.assertEqual(len(result), len(pairs))
+        for (triangle1, triangle2), intersections in zip(pairs, result):
+            expected = triangle1.intersect(triangle2)
+            self.assertEqual(len(intersections), len(expected))
+            for intersection, value in zip(intersections, expected):
+                if isinstance(value, bezier.Triangle):
+                    self.assertIs(intersection, value)
+                else:
+                    self.assertIsInstance(intersection, bezier.CurvedPolygon)
+                    self.assertEqual(intersection._metadata, value._metadata)
+
+    def test_thread_backend(self):
+        pairs = _triangle_pairs()
+        result = self._call_function_under_test(pairs, max_workers=2)
+        self._check_result(pairs, result)
+
+    def test_process_backend(self):
+        from bezier import parallel
+
+        pairs = _triangle_pairs()
+        result = self._call_function_under_test(
+            pairs, max_workers=2, backend=parallel.Backend.PROCESS
+        )
+        self._check_result(pairs, result)
+
+    def test_non_triangle(self):
+        import bezier
+
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        triangle = bezier.Triangle(nodes, 1)
+        with self.assertRaises(TypeError) as exc_info:
+            self._call_function_under_test([(triangle, None)])
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            ("Can only intersect pairs of Triangle", "Received", None),
+        )
+
+
+class Test__curve_shard(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(arrays, start, end):
+        from bezier import parallel
+
+        return parallel._curve_shard(arrays, start, end)
+
+    def test_it(self):
+        from bezier import parallel
+
+        line, cubic, far_line = _line_and_cubic()
+        pairs = [(line, cubic), (far_line, cubic)]
+        arrays = _pack_copies(parallel._pack_curves, pairs)
+        # NOTE: Only compute the first pair.
+        return_value = self._call_function_under_test(arrays, 0, 1)
+        self.assertIsNone(return_value)
+        _, _, _, _, counts, st_vals = arrays
+        self.assertEqual(counts[0], 3)
+        expected = np.asfortranarray([[0.5, 0.375, 0.625], [0.5, 0.25, 0.75]])
+        self.assertEqual(st_vals[:, :3], expected)
+
+    def test_too_many_intersections(self):
+        from bezier import parallel
+
+        line, cubic, _ = _line_and_cubic()
+        arrays = _pack_copies(parallel._pack_curves, [(line, cubic)])
+        # NOTE: Make it seem like only 2 intersections can fit.
+        arrays[3][1] = 2
+        arrays[5][:, :] = 0.0
+        self._call_function_under_test(arrays, 0, 1)
+        self.assertEqual(arrays[4][0], 3)
+        self.assertEqual(arrays[5], np.zeros((2, 3), order="F"))
+        # Make sure the pair is computed again when unpacking.
+        result = parallel._unpack_curves([(line, cubic)], arrays)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0], line.intersect(cubic))
+
+
+class Test__triangle_shard(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(arrays, start, end):
+        from bezier import parallel
+
+        return parallel._triangle_shard(arrays, start, end)
+
+    def _make_arrays(self, pairs):
+        from bezier import parallel
+
+        return _pack_copies(parallel._pack_triangles, pairs)
+
+    def test_it(self):
+        from bezier import parallel
+
+        pairs = _triangle_pairs()
+        arrays = self._make_arrays(pairs)
+        return_value = self._call_function_under_test(arrays, 0, len(pairs))
+        self.assertIsNone(return_value)
+        statuses = arrays[5]
+        expected = [
+            parallel._STATUS_POLYGONS,
+            parallel._STATUS_SECOND_CONTAINED,
+            parallel._STATUS_FIRST_CONTAINED,
+            parallel._STATUS_POLYGONS,
+            parallel._STATUS_POLYGONS,
+        ]
+        self.assertEqual(statuses.tolist(), expected)
+        num_polygons = arrays[6]
+        self.assertEqual(num_polygons[[0, 3, 4]].tolist(), [1, 0, 1])
+
+    def test_too_many_segments(self):
+        from bezier import parallel
+
+        pairs = _triangle_pairs()[:1]
+        arrays = self._make_arrays(pairs)
+        # NOTE: Make it seem like only 2 segments can fit.
+        arrays[4][1] = 2
+        arrays[8][:] = -1
+        self._call_function_under_test(arrays, 0, 1)
+        self.assertEqual(arrays[7][0], 4)
+        self.assertTrue(np.all(arrays[8] == -1))
+        # Make sure the pair is computed again when unpacking.
+        result = parallel._unpack_triangles(pairs, arrays)
+        self.assertEqual(len(result), 1)
+        (intersection,) = result[0]
+        (expected,) = pairs[0][0].intersect(pairs[0][1])
+        self.assertEqual(intersection._metadata, expected._metadata)
+
+
+class Test__run_shard(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(shard_func, specs, start, end):
+        from bezier import parallel
+
+        return parallel._run_shard(shard_func, specs, start, end)
+
+    def test_it(self):
+        from bezier import parallel
+
+        blocks = []
+        specs = []
+        try:
+            values = np.asfortranarray([[1.0, 2.0], [3.0, 4.0]])
+            shared = parallel._share(blocks, specs, (2, 2), np.double, values)
+            return_value = self._call_function_under_test(
+                _double_shard, tuple(specs), 0, 2
+            )
+            self.assertIsNone(return_value)
+            self.assertEqual(np.array(shared, order="F"), 2.0 * values)
+        finally:
+            # NOTE: The view into shared memory must be released before the
+            #       block is closed.
+            shared = None
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def test_failure(self):
+        from bezier import parallel
+
+        blocks = []
+        specs = []
+        try:
+            parallel._share(blocks, specs, (3,), np.intc)
+            shard_func = _failing_shard
+            with self.assertRaises(RuntimeError):
+                self._call_function_under_test(shard_func, tuple(specs), 0, 3)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+
+class Test__map_in_processes(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(*args):
+        from bezier import parallel
+
+        return parallel._map_in_processes(*args)
+
+    def test_pack_failure(self):
+        from bezier import parallel
+
+        def pack_func(pairs, blocks, specs):
+            parallel._share(blocks, specs, (4,), np.double)
+            raise RuntimeError(pairs)
+
+        bounds = np.asarray([0, 1])
+        with self.assertRaises(RuntimeError):
+            self._call_function_under_test(
+                (pack_func, None, None), [None], 1, bounds
+            )
+
+
+def _double_shard(arrays, start, end):
+    (array,) = arrays
+    array[:, start:end] *= 2.0
+
+
+def _failing_shard(arrays, start, end):
+    raise RuntimeError(len(arrays), start, end)
+
+
+def _pack_copies(pack_func, pairs):
+    blocks = []
+    try:
+        arrays = pack_func(pairs, blocks, [])
+        return [np.array(value, order="F") for value in arrays]
+    finally:
+        # NOTE: The views into shared memory must be released before the
+        #       blocks are closed.
+        arrays = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _line_and_cubic():
+    import bezier
+
+    line = bezier.Curve(np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]]), 1)
+    cubic = bezier.Curve(
+        np.asfortranarray([[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]),
+        3,
+    )
+    far_line = bezier.Curve(np.asfortranarray([[-3.0, 5.0], [50.0, 50.0]]), 1)
+    return line, cubic, far_line
+
+
+def _random_curves(num_curves):
+    import bezier
+
+    rng = np.random.RandomState(seed=217)
+    return [
+        bezier.Curve(rng.random_sample((2, 3)), 2) for _ in range(num_curves)
+    ]
+
+
+def _triangle_pairs():
+    import bezier
+
+    nodes1 = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    triangle1 = bezier.Triangle(nodes1, 1)
+    nodes2 = np.asfortranarray([[0.5, 0.5, -0.5], [0.0, 1.0, 1.0]])
+    triangle2 = bezier.Triangle(nodes2, 1).elevate()
+    nodes3 = np.asfortranarray([[-1.0, 3.0, -1.0], [-1.0, -1.0, 3.0]])
+    triangle3 = bezier.Triangle(nodes3, 1)
+    nodes4 = np.asfortranarray([[4.0, 5.0, 4.0], [0.0, 0.0, 1.0]])
+    triangle4 = bezier.Triangle(nodes4, 1)
+    return [
+        (triangle1, triangle2),
+        (triangle3, triangle1),
+        (triangle1, triangle3),
+        (triangle1, triangle4),
+        (triangle2, triangle1),
+    ]
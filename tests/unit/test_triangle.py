@@ -519,6 +519,153 @@ class TestTriangle(utils.NumPyTestCase):
         expected_d = np.asfortranarray([[0.0, 0.5, 0.0], [0.5, 0.5, 1.0]])
         self.assertEqual(triangle_d._nodes, expected_d)
 
+    def test_tessellate_linear(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        points, param_vals, triangles = triangle.tessellate(0.5 ** 20)
+        self.assertEqual(points, self.UNIT_TRIANGLE)
+        self.assertEqual(param_vals.tolist(), [[0, 0], [1, 0], [0, 1]])
+        self.assertTrue(param_vals.flags.f_contiguous)
+        self.assertEqual(triangles.tolist(), [[0, 1, 2]])
+        self.assertEqual(triangles.dtype, np.intc)
+
+    def _check_mesh(self, triangle, points, param_vals, triangles):
+        num_vertices, _ = np.unique(param_vals, axis=0).shape
+        self.assertEqual(num_vertices, param_vals.shape[0])
+        self.assertTrue(
+            np.allclose(
+                points,
+                triangle.evaluate_cartesian_multi(param_vals),
+                atol=0.5 ** 48,
+                rtol=0.0,
+            )
+        )
+        # Every element must be counterclockwise in parameter space.
+        corners = param_vals[triangles]
+        edge1 = corners[:, 1] - corners[:, 0]
+        edge2 = corners[:, 2] - corners[:, 0]
+        cross = edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]
+        self.assertTrue(np.all(cross > 0.0))
+        # The elements must cover the reference triangle.
+        self.assertAlmostEqual(0.5 * np.sum(cross), 0.5)
+        self._check_no_cracks(param_vals, triangles)
+
+    def _check_no_cracks(self, param_vals, triangles):
+        # Without cracks, each (directed) edge is used at most once and
+        # every edge not on the boundary is shared by two elements.
+        edges = set()
+        for element in triangles.tolist():
+            for start, end in zip(element, element[1:] + element[:1]):
+                self.assertNotIn((start, end), edges)
+                edges.add((start, end))
+        for start, end in edges:
+            if (end, start) not in edges:
+                s_start, t_start = param_vals[start]
+                s_end, t_end = param_vals[end]
+                on_boundary = (
+                    (t_start == 0.0 and t_end == 0.0)
+                    or (s_start == 0.0 and s_end == 0.0)
+                    or (s_start + t_start == 1.0 and s_end + t_end == 1.0)
+                )
+                self.assertTrue(on_boundary)
+
+    def test_tessellate_uniform(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        result = triangle.tessellate(0.5 ** 4)
+        self._check_mesh(triangle, *result)
+        points, _, triangles = result
+        self.assertEqual(points.shape, (2, 15))
+        self.assertEqual(triangles.shape, (16, 3))
+
+    def test_tessellate_hanging_vertices(self):
+        third = 1.0 / 3.0
+        nodes = np.asfortranarray(
+            [
+                [0.0, third, 2 * third, 1.0, 0.0]
+                + [third, 2 * third, 0.0, third, 0.0],
+                [0.0, 0.0, 0.0, 0.0, third]
+                + [third, third, 2 * third, 2 * third, 1.0],
+                [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+        triangle = self._make_one(nodes, 3)
+        result = triangle.tessellate(0.05)
+        self._check_mesh(triangle, *result)
+        _, param_vals, triangles = result
+        # The center of an element with hanging vertices is not a corner
+        # from the subdivision.
+        scaled = param_vals * 2.0 ** 10
+        self.assertTrue(np.any(scaled != np.round(scaled)))
+        self.assertEqual(triangles.shape, (52, 3))
+
+    def test_tessellate_mixed_depth(self):
+        third = 1.0 / 3.0
+        nodes = np.asfortranarray(
+            [
+                [0.0, third, 2 * third, 1.0, 0.0]
+                + [third, 2 * third, 0.0, third, 0.0],
+                [0.0, 0.0, 0.0, 0.0, third]
+                + [third, third, 2 * third, 2 * third, 1.0],
+                [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+        tolerance = 0.05
+        self._check_leaf_errors(nodes, tolerance)
+        # Compare each element of the mesh to the triangle.
+        triangle = self._make_one(nodes, 3)
+        points, param_vals, triangles = triangle.tessellate(tolerance)
+        self._check_mesh(triangle, points, param_vals, triangles)
+        weights = np.asfortranarray(
+            [[1.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.25, 0.25]]
+            + [[third, third, third], [0.125, 0.25, 0.625]]
+        )
+        for element in triangles:
+            expected = triangle.evaluate_cartesian_multi(
+                np.asfortranarray(weights.dot(param_vals[element]))
+            )
+            flat = points[:, element].dot(weights.T)
+            distances = np.linalg.norm(expected - flat, ord=2, axis=0)
+            self.assertLessEqual(np.max(distances), tolerance)
+
+    def _check_leaf_errors(self, nodes, tolerance):
+        from bezier import triangle as triangle_mod
+        from bezier.hazmat import triangle_matrices
+
+        leaves = triangle_mod._tessellate_leaves(nodes, 3, tolerance)
+        vertices = set()
+        for _, corners in leaves:
+            vertices.update(corners)
+        num_fans = 0
+        for leaf_nodes, corners in leaves:
+            error = triangle_matrices.linearization_error(leaf_nodes, 3)
+            if triangle_mod._has_hanging_vertex(corners, vertices):
+                # A fan is within twice the error of the piece.
+                self.assertLessEqual(error, 0.5 * tolerance)
+                num_fans += 1
+            else:
+                self.assertLessEqual(error, tolerance)
+        self.assertEqual(num_fans, 3)
+
+    def test_tessellate_max_subdivisions(self):
+        from bezier import triangle as triangle_mod
+
+        triangle = self._make_one(self.QUADRATIC, 2)
+        patch = unittest.mock.patch.object(
+            triangle_mod, "_MAX_TESSELLATE_SUBDIVISIONS", new=1
+        )
+        with patch:
+            result = triangle.tessellate(0.5 ** 40)
+            self._check_mesh(triangle, *result)
+        _, _, triangles = result
+        self.assertEqual(triangles.shape, (4, 3))
+
+    def test_tessellate_bad_tolerance(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        for tolerance in (0.0, -1.0, np.nan):
+            with self.assertRaises(ValueError) as exc_info:
+                triangle.tessellate(tolerance)
+            exc_args = exc_info.exception.args
+            self.assertEqual(exc_args[0], "Tolerance must be positive")
+
     def test__compute_valid_bad_dimension(self):
         nodes = np.zeros((3, 6), order="F")
         triangle = self._make_one(nodes, 2)
@@ -601,7 +748,22 @@ class TestTriangle(utils.NumPyTestCase):
 
     def test_is_valid_property(self):
         triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        self.assertIsNone(triangle._is_valid)
         self.assertTrue(triangle.is_valid)
+        self.assertTrue(triangle._is_valid)
+        # The cached value is re-used.
+        triangle._is_valid = False
+        self.assertFalse(triangle.is_valid)
+
+    def test__get_jacobian_nodes(self):
+        from bezier import _triangle_helpers
+
+        triangle = self._make_one(self.QUADRATIC, 2)
+        self.assertIsNone(triangle._jacobian_nodes)
+        jac_nodes = triangle._get_jacobian_nodes()
+        expected = _triangle_helpers.jacobian_both(self.QUADRATIC, 2, 2)
+        self.assertEqual(jac_nodes, expected)
+        self.assertIs(triangle._get_jacobian_nodes(), jac_nodes)
 
     def test___dict___property(self):
         triangle = self._make_one(self.UNIT_TRIANGLE, 1, copy=False)
@@ -611,6 +773,9 @@ class TestTriangle(utils.NumPyTestCase):
             "_dimension": 2,
             "_degree": 1,
             "_edges": None,
+            "_jacobian_nodes": None,
+            "_is_valid": None,
+            "_locate_index": None,
         }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``triangle``.
@@ -624,6 +789,48 @@ class TestTriangle(utils.NumPyTestCase):
         self.assertEqual(s, 0.5)
         self.assertEqual(t, 0.25)
 
+    def test_locate_cached_derivatives(self):
+        from bezier import _triangle_intersection
+        from bezier.hazmat import triangle_intersection
+
+        triangle = self._make_one(self.QUADRATIC, 2)
+        point = triangle.evaluate_cartesian(0.5, 0.25)
+        for cached in (True, False):
+            triangle._jacobian_nodes = None
+            locate_point = unittest.mock.Mock(
+                wraps=triangle_intersection.locate_point
+            )
+            patch1 = unittest.mock.patch.object(
+                _triangle_intersection, "CACHED_DERIVATIVES", new=cached
+            )
+            patch2 = unittest.mock.patch.object(
+                triangle_intersection, "locate_point", new=locate_point
+            )
+            patch3 = unittest.mock.patch.object(
+                _triangle_intersection, "locate_point", new=locate_point
+            )
+            with patch1, patch2, patch3:
+                self.assertEqual(triangle.locate(point), (0.5, 0.25))
+            locate_point.assert_called_once()
+            if cached:
+                self.assertIs(
+                    locate_point.call_args[1]["jac_nodes"],
+                    triangle._jacobian_nodes,
+                )
+            else:
+                self.assertEqual(locate_point.call_args[1], {})
+                self.assertIsNone(triangle._jacobian_nodes)
+
+    def test_locate_with_index(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        triangle.build_locate_index(depth=3)
+        point = triangle.evaluate_cartesian(0.5, 0.25)
+        result = triangle.locate(point)
+        self.assertEqual(result, (0.5, 0.25))
+        self.assertIsInstance(result[0], float)
+        point = np.asfortranarray([[-1.0], [-1.0]])
+        self.assertIsNone(triangle.locate(point))
+
     def test_locate_no_verify(self):
         triangle = self._make_one(self.QUADRATIC, 2)
         s = 0.125
@@ -653,6 +860,97 @@ class TestTriangle(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             triangle.locate(point2)
 
+    def test_locate_multi(self):
+        from bezier.hazmat import triangle_intersection
+
+        triangle = self._make_one(self.QUADRATIC, 2)
+        points = np.hstack(
+            [
+                triangle.evaluate_cartesian(0.5, 0.25),
+                triangle.evaluate_cartesian(0.125, 0.75),
+                np.asfortranarray([[-1.0], [-1.0]]),
+            ]
+        )
+        jac_nodes = triangle._get_jacobian_nodes()
+        locate_points = unittest.mock.Mock(
+            wraps=triangle_intersection.locate_points
+        )
+        patch = unittest.mock.patch.object(
+            triangle_intersection, "locate_points", new=locate_points
+        )
+        with patch:
+            result = triangle.locate_multi(points)
+        self.assertIs(locate_points.call_args[1]["jac_nodes"], jac_nodes)
+        expected = np.asfortranarray(
+            [[0.5, 0.125, np.nan], [0.25, 0.75, np.nan]]
+        )
+        self.assertTrue(np.array_equal(result, expected, equal_nan=True))
+
+    def test_locate_multi_with_index(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        triangle.build_locate_index(depth=3)
+        points = np.hstack(
+            [
+                triangle.evaluate_cartesian(0.5, 0.25),
+                np.asfortranarray([[-1.0], [-1.0]]),
+            ]
+        )
+        result = triangle.locate_multi(points)
+        expected = np.asfortranarray([[0.5, np.nan], [0.25, np.nan]])
+        self.assertTrue(np.array_equal(result, expected, equal_nan=True))
+
+    def test_locate_multi_no_verify(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        points = triangle.evaluate_cartesian(0.125, 0.125)
+        result = triangle.locate_multi(points, _verify=False)
+        self.assertEqual(result, np.asfortranarray([[0.125], [0.125]]))
+
+    def test_locate_multi_bad_points(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        points1 = np.asfortranarray([0.0, 1.0])
+        points2 = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            triangle.locate_multi(points1)
+        with self.assertRaises(ValueError):
+            triangle.locate_multi(points2)
+
+    def test_locate_multi_bad_dimension(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0]])
+        triangle = self._make_one(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            triangle.locate_multi(None)
+
+    def test_build_locate_index(self):
+        from bezier.hazmat import triangle_intersection
+
+        triangle = self._make_one(self.QUADRATIC, 2)
+        self.assertIsNone(triangle._locate_index)
+        self.assertIsNone(triangle.build_locate_index())
+        index = triangle._locate_index
+        self.assertIsInstance(index, triangle_intersection.LocateIndex)
+        self.assertEqual(index.depth, 5)
+        triangle.build_locate_index(depth=2)
+        self.assertIsNot(triangle._locate_index, index)
+        self.assertEqual(triangle._locate_index.depth, 2)
+
+    def test_build_locate_index_bad_depth(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        for depth in (0, 9):
+            with self.assertRaises(ValueError) as exc_info:
+                triangle.build_locate_index(depth=depth)
+
+            exc_args = exc_info.exception.args
+            self.assertEqual(
+                exc_args, ("Index depth must be between 1 and 8", depth)
+            )
+        self.assertIsNone(triangle._locate_index)
+
+    def test_build_locate_index_bad_dimension(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0]])
+        triangle = self._make_one(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            triangle.build_locate_index()
+
     def _basic_intersect_helper(self, **kwargs):
         import bezier
 
@@ -689,6 +987,42 @@ class TestTriangle(utils.NumPyTestCase):
     def test_intersect_no_verify(self):
         self._basic_intersect_helper(_verify=False)
 
+    def test_intersect_with_workspace(self):
+        import bezier
+
+        workspace = bezier.IntersectionWorkspace()
+        self._basic_intersect_helper(workspace=workspace)
+
+    def _intersect_workspace_helper(self, accepts_workspace):
+        from bezier import _triangle_intersection
+
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        geometric_intersect = unittest.mock.Mock(return_value=([], None, ()))
+        patch1 = unittest.mock.patch.object(
+            _triangle_intersection, "ACCEPTS_WORKSPACE", new=accepts_workspace,
+        )
+        patch2 = unittest.mock.patch.object(
+            _triangle_intersection,
+            "geometric_intersect",
+            new=geometric_intersect,
+        )
+        workspace = unittest.mock.sentinel.workspace
+        with patch1, patch2:
+            result = triangle.intersect(triangle, workspace=workspace)
+        self.assertEqual(result, [])
+        return geometric_intersect
+
+    def test_intersect_workspace_accepted(self):
+        geometric_intersect = self._intersect_workspace_helper(True)
+        call_kwargs = geometric_intersect.call_args[1]
+        workspace = unittest.mock.sentinel.workspace
+        self.assertIs(call_kwargs["workspace"], workspace)
+
+    def test_intersect_workspace_ignored(self):
+        geometric_intersect = self._intersect_workspace_helper(False)
+        call_kwargs = geometric_intersect.call_args[1]
+        self.assertNotIn("workspace", call_kwargs)
+
     def test_intersect_bad_strategy(self):
         triangle = self._make_one(self.UNIT_TRIANGLE, 1)
         strategy = unittest.mock.sentinel.bad_strategy
@@ -703,6 +1037,12 @@ class TestTriangle(utils.NumPyTestCase):
         strategy = intersection_helpers.IntersectionStrategy.ALGEBRAIC
         self._basic_intersect_helper(strategy=strategy)
 
+    def test_intersect_clipping(self):
+        from bezier.hazmat import intersection_helpers
+
+        strategy = intersection_helpers.IntersectionStrategy.CLIPPING
+        self._basic_intersect_helper(strategy=strategy)
+
     def test_intersect_disjoint_bbox(self):
         triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
         nodes = np.asfortranarray([[4.0, 5.0, 4.0], [0.0, 0.0, 1.0]])
@@ -0,0 +1,110 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import numpy as np
+
+
+class TestIntersectionWorkspace(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier import workspace
+
+        return workspace.IntersectionWorkspace
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        workspace = self._make_one()
+        self.assertEqual(workspace.intersections_size, 2)
+        self.assertEqual(workspace.segment_ends_size, 3)
+        self.assertEqual(workspace.segments_size, 6)
+        self.assertTrue(workspace._intersections.flags.f_contiguous)
+        self.assertEqual(workspace._segment_ends.dtype, np.intc)
+
+    def test_constructor(self):
+        from bezier import workspace as workspace_mod
+
+        workspace = self._make_one(
+            intersections_size=4, segment_ends_size=1, segments_size=5
+        )
+        self.assertEqual(workspace._intersections.shape, (2, 4))
+        self.assertEqual(workspace._segment_ends.shape, (1,))
+        self.assertEqual(workspace._segments.shape, (5,))
+        self.assertEqual(
+            workspace._segments.dtype, workspace_mod.SEGMENT_DTYPE
+        )
+
+    def test___dict___property(self):
+        workspace = self._make_one()
+        props_dict = workspace.__dict__
+        self.assertEqual(
+            sorted(props_dict.keys()),
+            ["_intersections", "_segment_ends", "_segments"],
+        )
+        self.assertIs(props_dict["_segments"], workspace._segments)
+        # Check that modifying ``props_dict`` won't modify ``workspace``.
+        props_dict["_segments"] = None
+        self.assertIsNotNone(workspace._segments)
+
+    def test_reset(self):
+        workspace = self._make_one()
+        segment_ends = workspace._segment_ends
+        workspace.reset(intersections_size=7, segments_size=1)
+        self.assertEqual(workspace.intersections_size, 7)
+        self.assertEqual(workspace.segments_size, 1)
+        self.assertIs(workspace._segment_ends, segment_ends)
+        workspace.reset(segment_ends_size=4)
+        self.assertEqual(workspace.segment_ends_size, 4)
+        self.assertEqual(workspace.intersections_size, 7)
+
+    def test___repr__(self):
+        workspace = self._make_one(
+            intersections_size=5, segment_ends_size=2, segments_size=8
+        )
+        expected = (
+            "<IntersectionWorkspace (intersections_size=5, "
+            "segment_ends_size=2, segments_size=8)>"
+        )
+        self.assertEqual(repr(workspace), expected)
+
+
+class Test_thread_workspace(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test():
+        from bezier import workspace
+
+        return workspace.thread_workspace()
+
+    def test_it(self):
+        from bezier import workspace as workspace_mod
+
+        workspace = self._call_function_under_test()
+        self.assertIsInstance(workspace, workspace_mod.IntersectionWorkspace)
+        self.assertIs(self._call_function_under_test(), workspace)
+
+    def test_per_thread(self):
+        main_workspace = self._call_function_under_test()
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self._call_function_under_test())
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(len(results), 1)
+        thread_workspace = results[0]
+        self.assertIsNot(thread_workspace, main_workspace)
+        self.assertIs(self._call_function_under_test(), main_workspace)